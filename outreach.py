@@ -17,23 +17,31 @@ Workflow:
 
 Usage:
     python outreach.py search <campaign> [--max 10]
-    python outreach.py analyze <campaign>
-    python outreach.py contacts <campaign>
-    python outreach.py draft <campaign>
+    python outreach.py analyze <campaign> [--workers 4]
+    python outreach.py contacts <campaign> [--workers 4]
+    python outreach.py draft <campaign> [--workers 4]
     python outreach.py review <campaign>
     python outreach.py show <outreach_id>
     python outreach.py approve <outreach_id>
     python outreach.py reject <outreach_id> --reason "..."
     python outreach.py send <outreach_id>
     python outreach.py send-all <campaign>
-    python outreach.py status <campaign>
+    python outreach.py status <campaign> [--rebuild]
     python outreach.py campaigns
+
+analyze, contacts and draft are resumable: each article's result is appended
+to data/outreach/<campaign>/article_results.jsonl as soon as it completes, so
+an interrupted run picks up where it stopped.
 """
 
 import argparse
+import contextvars
 import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
@@ -44,6 +52,33 @@ sys.path.insert(0, str(Path(__file__).parent))
 CAMPAIGNS_DIR = "campaigns"
 DATA_DIR = "data/outreach"
 
+# Per-article results of analyze/contacts/draft, merged into articles.jsonl on read
+ARTICLE_RESULTS_FILE = "article_results.jsonl"
+
+# Progress of in-flight jobs, one JSON file per stage (read by outreach_ui)
+JOBS_DIR = "jobs"
+
+# A running job with no progress update for this long probably died
+JOB_STALE_SECONDS = 900
+
+DEFAULT_WORKERS = 4
+
+# Serializes appends to the campaign JSONL files across worker threads
+_write_lock = threading.Lock()
+
+# Article listings (outreach_ui): filter name -> predicate on a merged article
+ARTICLE_FILTERS = {
+    "all": lambda a: True,
+    "not_analyzed": lambda a: not a.get("analyzed"),
+    "good_fit": lambda a: a.get("relevance_score", 0) >= 0.5,
+    "contacts": lambda a: bool(a.get("author_email")),
+    "drafted": lambda a: bool(a.get("email_drafted")),
+}
+
+# Per-process caches keyed by file signature (size, mtime): path -> (signature, value)
+_article_results_cache = {}
+_summary_cache = {}
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -75,15 +110,18 @@ Workflow example:
     analyze_p = subparsers.add_parser("analyze", help="Analyze found articles for fit")
     analyze_p.add_argument("campaign", help="Campaign ID")
     analyze_p.add_argument("--min-score", type=float, default=0.5, help="Min relevance score")
+    analyze_p.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS, help="Articles analyzed concurrently")
 
     # 3. Contacts
     contacts_p = subparsers.add_parser("contacts", help="Extract author contacts")
     contacts_p.add_argument("campaign", help="Campaign ID")
+    contacts_p.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS, help="Concurrent contact lookups")
 
     # 4. Draft
     draft_p = subparsers.add_parser("draft", help="Generate email drafts")
     draft_p.add_argument("campaign", help="Campaign ID")
     draft_p.add_argument("--max", "-m", type=int, default=5, help="Max emails to draft")
+    draft_p.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS, help="Emails drafted concurrently")
 
     # 5. Review
     review_p = subparsers.add_parser("review", help="List emails pending review")
@@ -112,12 +150,16 @@ Workflow example:
     sendall_p = subparsers.add_parser("send-all", help="Send all approved emails")
     sendall_p.add_argument("campaign", help="Campaign ID")
     sendall_p.add_argument("--force", "-f", action="store_true", help="Skip confirmation")
+    sendall_p.add_argument("--workers", "-w", type=int, default=4, help="Concurrent sender threads")
 
     # --- INFO COMMANDS ---
 
     # Status
     status_p = subparsers.add_parser("status", help="Show campaign status and stats")
     status_p.add_argument("campaign", help="Campaign ID")
+    status_p.add_argument("--rebuild", action="store_true",
+                          help="Recompute the datastore's engagement counters from its records "
+                               "(outreach.jsonl records are always counted directly)")
 
     # Campaigns list
     subparsers.add_parser("campaigns", help="List all campaigns")
@@ -139,6 +181,8 @@ Workflow example:
     run_p.add_argument("--dry-run", action="store_true", help="Preview without saving")
     run_p.add_argument("--force-search", "-f", action="store_true",
                        help="Force new search even if unanalyzed articles exist")
+    run_p.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS,
+                       help="Concurrent articles per stage")
 
     args = parser.parse_args()
 
@@ -244,57 +288,55 @@ def cmd_analyze(args):
         print(f"No articles found. Run 'search' first.")
         return
 
-    print(f"\n📊 Analyzing {len(articles)} articles...")
+    pending = [a for a in articles if not a.get("analyzed")]
+
+    print(f"\n📊 Analyzing {len(pending)} articles...")
     print(f"   Min relevance score: {args.min_score}")
+    if len(pending) < len(articles):
+        print(f"   Already analyzed: {len(articles) - len(pending)}")
     print()
 
     from pr_outreach.agents.article_analyzer import analyze_article
     from pr_outreach.core.schemas import ArticleCandidate
 
-    analyzed = []
-    for i, article in enumerate(articles):
-        if article.get("analyzed"):
-            print(f"   [{i+1}/{len(articles)}] Already analyzed: {article.get('title', 'N/A')[:40]}...")
-            analyzed.append(article)
-            continue
-
-        print(f"   [{i+1}/{len(articles)}] Analyzing: {article.get('title', 'N/A')[:40]}...")
-
+    def analyze(article):
         try:
             # Convert dict to ArticleCandidate if needed
             article_obj = ArticleCandidate(**{k: v for k, v in article.items() if k in ArticleCandidate.model_fields})
             result = analyze_article(article_obj, config.product)
 
-            # Update article dict with results
             if hasattr(result, 'model_dump'):
                 result_dict = result.model_dump()
             else:
                 result_dict = result if isinstance(result, dict) else {}
 
-            article["analyzed"] = True
-            article["relevance_score"] = getattr(result, 'opportunity_score', 0) or result_dict.get("opportunity_score", 0)
-            article["fit_reasoning"] = result_dict.get("fit_reasoning", "")
-            article["positioning_angle"] = result_dict.get("positioning_angle", "")
-            article["insertion_type"] = getattr(result, 'insertion_type', None) or result_dict.get("insertion_type")
-            article["insertion_opportunities"] = result_dict.get("insertion_opportunities", [])
-
-            score = article["relevance_score"]
-            status = "✓" if score >= args.min_score else "✗"
-            print(f"      {status} Score: {score:.2f}")
-
+            return {
+                "analyzed": True,
+                "relevance_score": getattr(result, 'opportunity_score', 0) or result_dict.get("opportunity_score", 0),
+                "fit_reasoning": result_dict.get("fit_reasoning", ""),
+                "positioning_angle": result_dict.get("positioning_angle", ""),
+                "insertion_type": getattr(result, 'insertion_type', None) or result_dict.get("insertion_type"),
+                "insertion_opportunities": result_dict.get("insertion_opportunities", []),
+            }
         except Exception as e:
-            print(f"      ✗ Error analyzing: {e}")
-            article["analyzed"] = True
-            article["relevance_score"] = 0.0
-            article["analysis_error"] = str(e)
+            return {"analyzed": True, "relevance_score": 0.0, "analysis_error": str(e)}
 
-        analyzed.append(article)
+    completed = iter(range(1, len(pending) + 1))
 
-    # Save updated articles
-    save_articles(args.campaign, analyzed)
+    def report(article, updates, error):
+        prefix = f"   [{next(completed)}/{len(pending)}] {article.get('title', 'N/A')[:40]}..."
+        if error or updates.get("analysis_error"):
+            print(f"{prefix}\n      ✗ Error analyzing: {error or updates['analysis_error']}")
+        else:
+            score = updates["relevance_score"]
+            status = "✓" if score >= args.min_score else "✗"
+            print(f"{prefix}\n      {status} Score: {score:.2f}")
 
-    good = [a for a in analyzed if a.get("relevance_score", 0) >= args.min_score]
-    print(f"\n✓ Analyzed {len(analyzed)} articles")
+    run_article_job(args.campaign, "analyze", pending, analyze,
+                    workers=getattr(args, 'workers', DEFAULT_WORKERS), on_result=report)
+
+    good = [a for a in articles if a.get("relevance_score", 0) >= args.min_score]
+    print(f"\n✓ Analyzed {len([a for a in articles if a.get('analyzed')])} articles")
     print(f"  {len(good)} meet minimum score ({args.min_score})")
     print(f"\nNext: python outreach.py contacts {args.campaign}")
 
@@ -313,43 +355,45 @@ def cmd_contacts(args):
         print("No analyzed articles with good scores. Run 'analyze' first.")
         return
 
-    print(f"\n👤 Extracting contacts from {len(good_articles)} articles...")
+    pending = [a for a in good_articles if not a.get("author_email")]
+
+    print(f"\n👤 Extracting contacts from {len(pending)} articles...")
+    if len(pending) < len(good_articles):
+        print(f"   Already have: {len(good_articles) - len(pending)}")
     print()
 
     from pr_outreach.services.author_finder import find_author_contacts
 
-    contacts_found = 0
-    for i, article in enumerate(good_articles):
-        if article.get("author_email"):
-            print(f"   [{i+1}/{len(good_articles)}] Already have: {article.get('author_name', 'Unknown')}")
-            contacts_found += 1
-            continue
-
-        print(f"   [{i+1}/{len(good_articles)}] Finding: {article.get('author_name', 'Unknown')}...")
-
+    def find_contact(article):
         contact = find_author_contacts(
             author_name=article.get("author_name", ""),
             domain=article.get("domain", ""),
             article_url=article.get("url", "")
         )
-
-        if contact:
-            article["author_email"] = contact.get("email")
-            article["author_linkedin"] = contact.get("linkedin_url")
-            article["author_twitter"] = contact.get("twitter_handle")
-            article["contact_confidence"] = contact.get("email_confidence", 0)
-
-            if contact.get("email"):
-                contacts_found += 1
-                print(f"      ✓ Found: {contact['email']}")
-            else:
-                print(f"      ✗ No email found")
-        else:
+        if not contact:
+            return None
+        return {
+            "author_email": contact.get("email"),
+            "author_linkedin": contact.get("linkedin_url"),
+            "author_twitter": contact.get("twitter_handle"),
+            "contact_confidence": contact.get("email_confidence", 0),
+        }
+
+    completed = iter(range(1, len(pending) + 1))
+
+    def report(article, updates, error):
+        print(f"   [{next(completed)}/{len(pending)}] {article.get('author_name', 'Unknown')}...")
+        if error or not updates:
             print(f"      ✗ Contact lookup failed")
+        elif updates["author_email"]:
+            print(f"      ✓ Found: {updates['author_email']}")
+        else:
+            print(f"      ✗ No email found")
 
-    # Save updated
-    save_articles(args.campaign, articles)
+    run_article_job(args.campaign, "contacts", pending, find_contact,
+                    workers=getattr(args, 'workers', DEFAULT_WORKERS), on_result=report)
 
+    contacts_found = len([a for a in good_articles if a.get("author_email")])
     print(f"\n✓ Found {contacts_found} contacts")
     print(f"\nNext: python outreach.py draft {args.campaign}")
 
@@ -378,30 +422,32 @@ def cmd_draft(args):
 
     from pr_outreach.agents.email_writer import write_outreach_email
 
-    drafted = 0
-    for i, article in enumerate(to_draft):
-        print(f"   [{i+1}/{len(to_draft)}] {article['author_name']}...")
-
+    def draft(article):
         email = write_outreach_email(
             article=article,
             product=config.product,
             sender=config.sender_persona,
             campaign_config=config
         )
-
-        if email:
-            # Save as outreach record
-            outreach_id = save_outreach(args.campaign, article, email, config)
-            article["email_drafted"] = True
-            article["outreach_id"] = outreach_id
-            drafted += 1
-            print(f"      ✓ Draft saved: {outreach_id[:8]}...")
+        if not email:
+            return None
+        # Save as outreach record
+        outreach_id = save_outreach(args.campaign, article, email, config)
+        return {"email_drafted": True, "outreach_id": outreach_id}
+
+    completed = iter(range(1, len(to_draft) + 1))
+
+    def report(article, updates, error):
+        print(f"   [{next(completed)}/{len(to_draft)}] {article['author_name']}...")
+        if updates:
+            print(f"      ✓ Draft saved: {updates['outreach_id'][:8]}...")
         else:
-            print(f"      ✗ Failed to generate")
+            print(f"      ✗ Failed to generate{f': {error}' if error else ''}")
 
-    # Update articles
-    save_articles(args.campaign, articles)
+    run_article_job(args.campaign, "draft", to_draft, draft,
+                    workers=getattr(args, 'workers', DEFAULT_WORKERS), on_result=report)
 
+    drafted = len([a for a in to_draft if a.get("email_drafted")])
     print(f"\n✓ Drafted {drafted} emails")
     print(f"\nNext: python outreach.py review {args.campaign}")
 
@@ -533,25 +579,20 @@ def cmd_send(args):
             print("Cancelled.")
             return
 
-    from pr_outreach.services.email_sender import send_email
-
-    success, result, provider = send_email(
-        to_email=email['author_email'],
-        subject=email['subject'],
-        body=email['body']
-    )
-
-    if success:
-        email['status'] = 'sent'
-        email['sent_at'] = datetime.now().isoformat()
-        email['message_id'] = result
-        email['sent_via'] = provider
-        update_outreach(email)
+    def report(record, success, result, provider):
+        if success:
+            print(f"✓ Sent via {provider}")
+            print(f"   Message ID: {result}")
+        elif success is None:
+            print(f"⚠️  {provider}: {result} - check the provider's logs before resending")
+        else:
+            print(f"✗ Failed: {result}")
 
-        print(f"✓ Sent via {provider}")
-        print(f"   Message ID: {result}")
-    else:
-        print(f"✗ Failed: {result}")
+    counts = send_outreach_records([email], workers=1, on_result=report)
+    if counts['already_sent']:
+        print("✓ Already sent by an earlier run (record updated)")
+    if counts['uncertain']:
+        print("⚠️  Delivery of this email is unknown (interrupted or timed out) - not resending.")
 
 
 def cmd_send_all(args):
@@ -570,30 +611,21 @@ def cmd_send_all(args):
             print("Cancelled.")
             return
 
-    from pr_outreach.services.email_sender import send_email
-
-    sent = 0
-    failed = 0
-
-    for email in emails:
-        success, result, provider = send_email(
-            to_email=email['author_email'],
-            subject=email['subject'],
-            body=email['body']
-        )
-
+    def report(record, success, result, provider):
         if success:
-            email['status'] = 'sent'
-            email['sent_at'] = datetime.now().isoformat()
-            email['message_id'] = result
-            update_outreach(email)
-            sent += 1
-            print(f"✓ {email['author_email']}")
+            print(f"✓ {record['author_email']}")
+        elif success is None:
+            print(f"⚠️  {record['author_email']}: {result}")
         else:
-            failed += 1
-            print(f"✗ {email['author_email']}: {result}")
+            print(f"✗ {record['author_email']}: {result}")
 
-    print(f"\nSent: {sent}, Failed: {failed}")
+    counts = send_outreach_records(emails, workers=args.workers, on_result=report)
+
+    print(f"\nSent: {counts['sent']}, Failed: {counts['failed']}")
+    if counts['already_sent']:
+        print(f"Already sent earlier (records updated): {counts['already_sent']}")
+    if counts['uncertain']:
+        print(f"⚠️  Delivery unknown (interrupted or timed out), not resent: {counts['uncertain']}")
 
 
 def cmd_run(args):
@@ -629,11 +661,13 @@ def cmd_run(args):
     analyze_args = Args()
     analyze_args.campaign = args.campaign
     analyze_args.min_score = 0.5
+    analyze_args.workers = args.workers
     cmd_analyze(analyze_args)
 
     # Contacts
     contacts_args = Args()
     contacts_args.campaign = args.campaign
+    contacts_args.workers = args.workers
     cmd_contacts(contacts_args)
 
     # Draft
@@ -641,6 +675,7 @@ def cmd_run(args):
         draft_args = Args()
         draft_args.campaign = args.campaign
         draft_args.max = args.max
+        draft_args.workers = args.workers
         cmd_draft(draft_args)
 
     print(f"\n✓ Pipeline complete!")
@@ -685,6 +720,23 @@ def cmd_status(args):
     print(f"  Rejected:          {len(rejected)}")
     print()
 
+    from pr_outreach.io.outreach_datastore import tally_campaign_counters
+    from pr_outreach.services.response_tracker import get_engagement_stats
+    if args.rebuild:
+        from pr_outreach.io.outreach_datastore import rebuild_campaign_stats
+        rebuild_campaign_stats(args.campaign)
+
+    # CLI records live in outreach.jsonl, not in the datastore: count them here
+    engagement = get_engagement_stats(args.campaign, tally_campaign_counters(outreach))
+    if engagement["total_sent"]:
+        print(f"ENGAGEMENT")
+        print(f"  Sent:              {engagement['total_sent']}")
+        print(f"  Opened:            {engagement['total_opened']} ({engagement['open_rate']:.0%})")
+        print(f"  Replied:           {engagement['total_replied']} ({engagement['reply_rate']:.0%})")
+        print(f"    positive/neutral/negative: "
+              f"{engagement['positive_replies']}/{engagement['neutral_replies']}/{engagement['negative_replies']}")
+        print()
+
     if pending:
         print("Next: python outreach.py review", args.campaign)
     elif approved:
@@ -863,19 +915,32 @@ def get_data_path(campaign_id):
 
 
 def save_articles(campaign_id, articles):
-    """Save articles to JSONL."""
+    """
+    Save articles to JSONL.
+
+    articles must be the merged view from load_articles(): the result log is
+    folded into articles.jsonl and cleared, unless a job is still appending
+    to it.
+    """
     path = os.path.join(get_data_path(campaign_id), "articles.jsonl")
-    with open(path, 'w') as f:
-        for a in articles:
-            if hasattr(a, 'model_dump'):
-                a = a.model_dump()
-            elif hasattr(a, '__dict__'):
-                a = {k: v for k, v in a.__dict__.items() if not k.startswith('_')}
-            f.write(json.dumps(a, default=str) + '\n')
+    tmp_path = path + ".tmp"
+    with _write_lock:
+        with open(tmp_path, 'w') as f:
+            for a in articles:
+                if hasattr(a, 'model_dump'):
+                    a = a.model_dump()
+                elif hasattr(a, '__dict__'):
+                    a = {k: v for k, v in a.__dict__.items() if not k.startswith('_')}
+                f.write(json.dumps(a, default=str) + '\n')
+        os.replace(tmp_path, path)
+
+        results_path = _article_results_path(campaign_id)
+        if os.path.exists(results_path) and not running_jobs(campaign_id):
+            os.remove(results_path)
 
 
 def load_articles(campaign_id):
-    """Load articles from JSONL."""
+    """Load articles from JSONL, with results of analyze/contacts/draft runs merged in."""
     path = os.path.join(get_data_path(campaign_id), "articles.jsonl")
     if not os.path.exists(path):
         return []
@@ -885,9 +950,312 @@ def load_articles(campaign_id):
         for line in f:
             if line.strip():
                 articles.append(json.loads(line))
+
+    _merge_article_results(campaign_id, articles)
     return articles
 
 
+def _article_key(article):
+    return article.get('url') or article.get('title', '')
+
+
+def _article_results_path(campaign_id):
+    return os.path.join(get_data_path(campaign_id), ARTICLE_RESULTS_FILE)
+
+
+def _file_signature(path):
+    """(size, mtime_ns) of a file, None if missing: changes whenever it is written."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _load_article_results(campaign_id):
+    """Merged updates per article key from the result log (re-read only when it changes)."""
+    path = _article_results_path(campaign_id)
+    signature = _file_signature(path)
+    if signature is None:
+        return {}
+
+    cached = _article_results_cache.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    results = {}
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Last line cut short by a crash
+            results.setdefault(entry.get('key'), {}).update(entry.get('updates') or {})
+
+    _article_results_cache[path] = (signature, results)
+    return results
+
+
+def _merge_article_results(campaign_id, articles):
+    """Apply logged per-article updates (later entries win)."""
+    results = _load_article_results(campaign_id)
+    if not results:
+        return
+    for article in articles:
+        updates = results.get(_article_key(article))
+        if updates:
+            article.update(updates)
+
+
+def _stream_articles(campaign_id, offset=0):
+    """Yields (offset after the line, merged article) from articles.jsonl without loading it whole."""
+    path = os.path.join(get_data_path(campaign_id), "articles.jsonl")
+    if not os.path.exists(path):
+        return
+
+    results = _load_article_results(campaign_id)
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            offset += len(line)
+            if not line.strip():
+                continue
+            article = json.loads(line)
+            updates = results.get(_article_key(article))
+            if updates:
+                article.update(updates)
+            yield offset, article
+
+
+def page_articles(campaign_id, article_filter="all", cursor=None, limit=20):
+    """
+    One page of articles matching a filter, streamed from articles.jsonl.
+
+    The cursor is the byte offset after the last article returned, tagged with
+    the file's mtime: if articles.jsonl was rewritten since (search, end of a
+    job), the listing starts over.
+
+    Args:
+        campaign_id: Campaign ID
+        article_filter: Key of ARTICLE_FILTERS
+        cursor: next_cursor of the previous page (None for the first page)
+        limit: Articles per page
+
+    Returns:
+        (articles, next_cursor); next_cursor is None once the file is exhausted
+    """
+    signature = _file_signature(os.path.join(get_data_path(campaign_id), "articles.jsonl"))
+    if signature is None:
+        return [], None
+
+    offset = 0
+    if cursor:
+        mtime_ns, _, position = cursor.partition(":")
+        if int(mtime_ns) == signature[1]:
+            offset = int(position)
+
+    predicate = ARTICLE_FILTERS[article_filter]
+    page = []
+    for offset, article in _stream_articles(campaign_id, offset):
+        if predicate(article):
+            page.append(article)
+            if len(page) == limit:
+                break
+
+    next_cursor = f"{signature[1]}:{offset}" if len(page) == limit and offset < signature[0] else None
+    return page, next_cursor
+
+
+def campaign_summary(campaign_id):
+    """
+    Article and email counts of a campaign.
+
+    Cached per process and recomputed only when articles.jsonl, the result
+    log or outreach.jsonl change (size/mtime), so outreach_ui can show it on
+    every menu loop.
+
+    Returns:
+        Dict with articles, analyzed, good_fit, contacts, drafted,
+        emails (count per status) and counters (engagement counters of
+        outreach.jsonl, see outreach_datastore.tally_campaign_counters)
+    """
+    from pr_outreach.io.outreach_datastore import tally_campaign_counters
+    from pr_outreach.io.outreach_index import count_by_status
+
+    data_path = get_data_path(campaign_id)
+    signature = tuple(
+        _file_signature(os.path.join(data_path, name))
+        for name in ("articles.jsonl", ARTICLE_RESULTS_FILE, "outreach.jsonl")
+    )
+    cached = _summary_cache.get(campaign_id)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    summary = {"articles": 0, "analyzed": 0, "good_fit": 0, "contacts": 0, "drafted": 0}
+    for _, article in _stream_articles(campaign_id):
+        summary["articles"] += 1
+        summary["analyzed"] += bool(article.get("analyzed"))
+        summary["good_fit"] += article.get("relevance_score", 0) >= 0.5
+        summary["contacts"] += bool(article.get("author_email"))
+        summary["drafted"] += bool(article.get("email_drafted"))
+    summary["emails"] = count_by_status(DATA_DIR, campaign_id)
+    summary["counters"] = tally_campaign_counters(load_outreach(campaign_id))
+
+    _summary_cache[campaign_id] = (signature, summary)
+    return summary
+
+
+def append_article_result(campaign_id, article, stage, updates):
+    """Durably record one article's updates from a pipeline stage."""
+    entry = {
+        'key': _article_key(article),
+        'stage': stage,
+        'updates': updates,
+        'at': datetime.now().isoformat(),
+    }
+    line = json.dumps(entry, default=str) + '\n'
+    with _write_lock:
+        with open(_article_results_path(campaign_id), 'a') as f:
+            f.write(line)
+
+
+def run_article_job(campaign_id, stage, articles, process, workers=DEFAULT_WORKERS, on_result=None):
+    """
+    Run one pipeline stage over articles with bounded concurrency.
+
+    The worker appends each article's updates to the result log as soon as
+    process() returns, so an interrupt of the calling thread cannot lose an
+    article whose side effects (e.g. a saved draft) already happened: a rerun
+    skips it and repeats only the articles still in flight. Progress is
+    published under data/outreach/<campaign>/jobs/ for outreach_ui. The log is folded into articles.jsonl when the job ends.
+
+    Args:
+        campaign_id: Campaign ID
+        stage: Stage name ("analyze", "contacts", "draft")
+        articles: Article dicts to process (updated in place)
+        process: Called as process(article) -> dict of article updates or None
+        workers: Articles processed concurrently
+        on_result: Called as on_result(article, updates, error) in the calling
+            thread as each article completes
+
+    Returns:
+        Dict with done and failed counts
+    """
+    progress = {
+        'stage': stage,
+        'state': 'running',
+        'pid': os.getpid(),
+        'total': len(articles),
+        'done': 0,
+        'failed': 0,
+        'current': [],
+        'started_at': datetime.now().isoformat(),
+    }
+    progress_lock = threading.Lock()
+
+    def run_one(article):
+        title = (article.get('title') or _article_key(article))[:60]
+        with progress_lock:
+            progress['current'].append(title)
+            _write_job_progress(campaign_id, progress)
+        try:
+            updates = process(article)
+            if updates:
+                append_article_result(campaign_id, article, stage, updates)
+            return updates
+        finally:
+            with progress_lock:
+                progress['current'].remove(title)
+
+    with progress_lock:
+        _write_job_progress(campaign_id, progress)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix=f"outreach-{stage}")
+    try:
+        # copy_context: each worker keeps the caller's LLM call scope
+        futures = {
+            executor.submit(contextvars.copy_context().run, run_one, article): article
+            for article in articles
+        }
+        for future in as_completed(futures):
+            article = futures[future]
+            try:
+                updates, error = future.result(), None
+            except Exception as e:
+                updates, error = None, e
+
+            if updates:
+                article.update(updates)
+
+            with progress_lock:
+                progress['failed' if error else 'done'] += 1
+                _write_job_progress(campaign_id, progress)
+
+            if on_result:
+                on_result(article, updates, error)
+    finally:
+        # Interrupted: drop queued articles, they are picked up by the next run
+        executor.shutdown(wait=False, cancel_futures=True)
+        with progress_lock:
+            finished = progress['done'] + progress['failed'] == progress['total']
+            progress['state'] = 'done' if finished else 'interrupted'
+            progress['current'] = []
+            _write_job_progress(campaign_id, progress)
+        save_articles(campaign_id, load_articles(campaign_id))
+
+    return {'done': progress['done'], 'failed': progress['failed']}
+
+
+def _job_progress_path(campaign_id, stage):
+    path = os.path.join(get_data_path(campaign_id), JOBS_DIR)
+    os.makedirs(path, exist_ok=True)
+    return os.path.join(path, f"{stage}.json")
+
+
+def _write_job_progress(campaign_id, progress):
+    """Atomically publish job progress (caller holds the job's progress lock)."""
+    progress['updated_at'] = time.time()
+    path = _job_progress_path(campaign_id, progress['stage'])
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(progress, f)
+    os.replace(tmp_path, path)
+
+
+def load_job_progress(campaign_id):
+    """
+    Progress of the campaign's latest analyze/contacts/draft jobs.
+
+    Returns:
+        List of dicts with stage, state, total, done, failed, current (titles
+        in flight), started_at and updated_at. state is "running", "done",
+        "interrupted" or "stale" (still running but silent for
+        JOB_STALE_SECONDS: the process probably died).
+    """
+    jobs_dir = os.path.join(DATA_DIR, campaign_id, JOBS_DIR)
+    if not os.path.isdir(jobs_dir):
+        return []
+
+    jobs = []
+    for name in sorted(os.listdir(jobs_dir)):
+        if not name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(jobs_dir, name)) as f:
+                progress = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        if progress.get('state') == 'running' and time.time() - progress.get('updated_at', 0) > JOB_STALE_SECONDS:
+            progress['state'] = 'stale'
+        jobs.append(progress)
+    return jobs
+
+
+def running_jobs(campaign_id):
+    """In-flight jobs of a campaign."""
+    return [job for job in load_job_progress(campaign_id) if job['state'] == 'running']
+
+
 def save_outreach(campaign_id, article, email, config):
     """Save outreach record."""
     import uuid
@@ -916,15 +1284,17 @@ def save_outreach(campaign_id, article, email, config):
         'quality_score': email.get('quality_score', 0),
     }
 
-    path = os.path.join(get_data_path(campaign_id), "outreach.jsonl")
-    with open(path, 'a') as f:
-        f.write(json.dumps(record, default=str) + '\n')
+    from pr_outreach.io.outreach_index import append_record
+
+    append_record(os.path.join(get_data_path(campaign_id), "outreach.jsonl"), campaign_id, record)
 
     return outreach_id
 
 
 def load_outreach(campaign_id=None, status=None):
-    """Load outreach records."""
+    """Load outreach records (latest version of each)."""
+    from pr_outreach.io.outreach_index import read_records
+
     records = []
 
     if campaign_id:
@@ -939,54 +1309,102 @@ def load_outreach(campaign_id=None, status=None):
                     paths.append(p)
 
     for path in paths:
-        if os.path.exists(path):
-            with open(path) as f:
-                for line in f:
-                    if line.strip():
-                        r = json.loads(line)
-                        if status is None or r.get('status') == status:
-                            records.append(r)
+        for r in read_records(path):
+            if status is None or r.get('status') == status:
+                records.append(r)
 
     return records
 
 
+def page_outreach(campaign_id, status=None, cursor=None, limit=20):
+    """
+    One page of a campaign's outreach records in creation order (indexed).
+
+    Returns:
+        (records, next_cursor); next_cursor is None on the last page
+    """
+    from pr_outreach.io.outreach_index import page_records
+
+    return page_records(DATA_DIR, campaign_id, status=status, cursor=cursor, limit=limit)
+
+
 def find_outreach(outreach_id):
-    """Find outreach by ID."""
-    if os.path.exists(DATA_DIR):
-        for d in os.listdir(DATA_DIR):
-            path = os.path.join(DATA_DIR, d, "outreach.jsonl")
-            if os.path.exists(path):
-                with open(path) as f:
-                    for line in f:
-                        if line.strip():
-                            r = json.loads(line)
-                            if r['outreach_id'] == outreach_id or r['outreach_id'].startswith(outreach_id):
-                                r['_file'] = path
-                                return r
-    return None
+    """Find outreach by ID or ID prefix (indexed, see pr_outreach.io.outreach_index)."""
+    from pr_outreach.io.outreach_index import find_record
+
+    return find_record(DATA_DIR, outreach_id)
+
+
+def send_outreach_records(records, workers=4, on_result=None):
+    """
+    Send approved outreach records through the durable send queue.
+
+    Each record is sent at most once (keyed by outreach_id). Records the queue
+    already sent in an earlier, interrupted run are marked sent without
+    sending again; emails interrupted mid-send are skipped. Emails whose
+    delivery is unknown (provider timeout or 5xx) are left uncertain in the
+    queue, not resent.
+
+    Args:
+        records: Outreach records to send
+        workers: Concurrent sender threads
+        on_result: Called as on_result(record, success, message_id_or_error, provider)
+
+    Returns:
+        Dict with sent, failed, already_sent and uncertain counts (uncertain
+        covers earlier interrupted sends and this run's unknown deliveries)
+    """
+    from pr_outreach.io.send_queue import enqueue_emails, get_queue_entries, QUEUED, SENT
+    from pr_outreach.services.email_sender import process_send_queue
+
+    by_id = {r['outreach_id']: r for r in records}
+    statuses = enqueue_emails(
+        {
+            'outreach_id': r['outreach_id'],
+            'campaign_id': r.get('campaign_id'),
+            'to_email': r['author_email'],
+            'subject': r['subject'],
+            'body': r['body'],
+        }
+        for r in records
+    )
+
+    # Sent by an earlier run that stopped before updating the record
+    already_sent = get_queue_entries(i for i, status in statuses.items() if status == SENT)
+    for outreach_id, entry in already_sent.items():
+        _mark_record_sent(by_id[outreach_id], entry['message_id'], entry['provider'], entry['sent_at'])
+
+    def record_result(entry, success, result, provider):
+        record = by_id[entry['outreach_id']]
+        if success:
+            _mark_record_sent(record, result, provider)
+        if on_result:
+            on_result(record, success, result, provider)
+
+    queued = [i for i, status in statuses.items() if status == QUEUED]
+    counts = process_send_queue(outreach_ids=queued, max_workers=workers, on_result=record_result)
+    counts['already_sent'] = len(already_sent)
+    counts['uncertain'] += len(statuses) - len(queued) - len(already_sent)
+    return counts
+
+
+def _mark_record_sent(record, message_id, provider, sent_at=None):
+    record['status'] = 'sent'
+    record['sent_at'] = sent_at or datetime.now().isoformat()
+    record['message_id'] = message_id
+    record['sent_via'] = provider
+    update_outreach(record)
 
 
 def update_outreach(record):
-    """Update outreach record."""
+    """Update outreach record (appends its new version; the file is never rewritten in full)."""
+    from pr_outreach.io.outreach_index import append_record
+
     path = record.pop('_file', None)
     if not path:
         path = os.path.join(get_data_path(record['campaign_id']), "outreach.jsonl")
 
-    # Read all, update matching, rewrite
-    records = []
-    if os.path.exists(path):
-        with open(path) as f:
-            for line in f:
-                if line.strip():
-                    r = json.loads(line)
-                    if r['outreach_id'] == record['outreach_id']:
-                        records.append(record)
-                    else:
-                        records.append(r)
-
-    with open(path, 'w') as f:
-        for r in records:
-            f.write(json.dumps(r, default=str) + '\n')
+    append_record(path, record['campaign_id'], record)
 
 
 if __name__ == "__main__":
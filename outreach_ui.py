@@ -8,6 +8,7 @@ Usage:
 
 import os
 import sys
+import time
 from datetime import datetime
 
 # Check for rich library
@@ -15,7 +16,7 @@ try:
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
     from rich import print as rprint
 except ImportError:
     print("Install rich: pip install rich")
@@ -25,12 +26,16 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from outreach import (
     load_campaign, list_campaigns, load_articles, load_outreach,
-    save_articles, save_outreach, find_outreach, update_outreach,
-    get_data_path
+    save_articles, save_outreach, update_outreach,
+    get_data_path, send_outreach_records, run_article_job, load_job_progress,
+    page_articles, page_outreach, campaign_summary, ARTICLE_FILTERS, DEFAULT_WORKERS
 )
 
 console = Console()
 
+# Rows per page in listings and review
+PAGE_SIZE = 20
+
 
 def main():
     """Main interactive loop."""
@@ -74,6 +79,8 @@ def main():
             show_full_status(campaign_id, config)
         elif cmd == 'r':
             run_full_pipeline(campaign_id, config)
+        elif cmd == 'w':
+            watch_jobs(campaign_id)
         elif cmd == 'c':
             console.clear()
             show_header(config)
@@ -119,25 +126,47 @@ def show_header(config):
 
 def show_status(campaign_id, config):
     """Show quick status bar."""
-    articles = load_articles(campaign_id)
-    outreach = load_outreach(campaign_id)
+    # Cached until the campaign files change: cheap enough for every menu loop
+    summary = campaign_summary(campaign_id)
+    emails = summary["emails"]
+
+    from pr_outreach.services.response_tracker import get_engagement_stats
 
-    analyzed = len([a for a in articles if a.get("analyzed")])
-    contacts = len([a for a in articles if a.get("author_email")])
-    pending = len([o for o in outreach if o['status'] == 'pending_review'])
-    approved = len([o for o in outreach if o['status'] == 'approved'])
-    sent = len([o for o in outreach if o['status'] == 'sent'])
+    # Materialized datastore counters plus the cached outreach.jsonl counts
+    engagement = get_engagement_stats(campaign_id, summary["counters"])
 
     status = (
-        f"[cyan]Articles:[/cyan] {len(articles)} │ "
-        f"[cyan]Analyzed:[/cyan] {analyzed} │ "
-        f"[cyan]Contacts:[/cyan] {contacts} │ "
-        f"[yellow]Pending:[/yellow] {pending} │ "
-        f"[green]Approved:[/green] {approved} │ "
-        f"[blue]Sent:[/blue] {sent}"
+        f"[cyan]Articles:[/cyan] {summary['articles']} │ "
+        f"[cyan]Analyzed:[/cyan] {summary['analyzed']} │ "
+        f"[cyan]Contacts:[/cyan] {summary['contacts']} │ "
+        f"[yellow]Pending:[/yellow] {emails.get('pending_review', 0)} │ "
+        f"[green]Approved:[/green] {emails.get('approved', 0)} │ "
+        f"[blue]Sent:[/blue] {emails.get('sent', 0)}"
     )
+    if engagement["total_sent"]:
+        status += (
+            f" │ [magenta]Opened:[/magenta] {engagement['total_opened']}"
+            f" │ [magenta]Replied:[/magenta] {engagement['total_replied']}"
+        )
+
+    console.print(f"\n{status}")
+    for job in load_job_progress(campaign_id):
+        line = _job_status_line(job)
+        if line:
+            console.print(line)
+    console.print()
+
 
-    console.print(f"\n{status}\n")
+def _job_status_line(job):
+    """One status line for an analyze/contacts/draft job (None once it is done)."""
+    counts = f"{job['done'] + job['failed']}/{job['total']}"
+    if job['failed']:
+        counts += f" ({job['failed']} failed)"
+    if job['state'] == 'running':
+        return f"[yellow]⏳ {job['stage']} running:[/yellow] {counts} [dim](w to watch)[/dim]"
+    if job['state'] in ('interrupted', 'stale'):
+        return f"[yellow]⚠ {job['stage']} interrupted at {counts}[/yellow] [dim](run it again to resume)[/dim]"
+    return None
 
 
 def show_menu():
@@ -148,7 +177,7 @@ def show_menu():
     console.print("  [cyan]3[/cyan]) Find contacts      [cyan]7[/cyan]) List data")
     console.print("  [cyan]4[/cyan]) Draft emails       [cyan]8[/cyan]) Full status")
     console.print()
-    console.print("  [green]r[/green]) Run full pipeline  [dim]c[/dim]) Clear  [dim]q[/dim]) Quit")
+    console.print("  [green]r[/green]) Run full pipeline  [dim]w[/dim]) Watch jobs  [dim]c[/dim]) Clear  [dim]q[/dim]) Quit")
     console.print()
 
     return console.input("[bold]>[/bold] ").strip().lower()
@@ -220,37 +249,30 @@ def run_analyze(campaign_id, config):
     from pr_outreach.agents.article_analyzer import analyze_article
     from pr_outreach.core.schemas import ArticleCandidate
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        for article in to_analyze:
-            title = article.get('title', 'Unknown')[:35]
-            task = progress.add_task(f"Analyzing: {title}...", total=None)
-
-            try:
-                # Convert dict to ArticleCandidate
-                article_obj = ArticleCandidate(**{k: v for k, v in article.items() if k in ArticleCandidate.model_fields})
-                result = analyze_article(article_obj, config.product)
-
-                # Access attributes from ArticleCandidate object
-                article["analyzed"] = True
-                article["relevance_score"] = result.opportunity_score or 0
-                article["fit_reasoning"] = ""
-                article["positioning_angle"] = ""
-                article["insertion_type"] = str(result.insertion_type.value) if result.insertion_type else None
-                article["insertion_opportunities"] = result.insertion_opportunities or []
-
-                score = article["relevance_score"]
-                icon = "✓" if score >= 0.5 else "✗"
-                progress.update(task, description=f"[{'green' if score >= 0.5 else 'red'}]{icon}[/] {title}... ({score:.2f})")
-            except Exception as e:
-                progress.update(task, description=f"[red]✗[/red] Error: {str(e)[:40]}...")
-
-            progress.stop_task(task)
-
-    save_articles(campaign_id, articles)
+    def analyze(article):
+        # Convert dict to ArticleCandidate
+        article_obj = ArticleCandidate(**{k: v for k, v in article.items() if k in ArticleCandidate.model_fields})
+        result = analyze_article(article_obj, config.product)
+
+        # Access attributes from ArticleCandidate object
+        return {
+            "analyzed": True,
+            "relevance_score": result.opportunity_score or 0,
+            "fit_reasoning": "",
+            "positioning_angle": "",
+            "insertion_type": str(result.insertion_type.value) if result.insertion_type else None,
+            "insertion_opportunities": result.insertion_opportunities or [],
+        }
+
+    def describe(article, updates, error):
+        title = article.get('title', 'Unknown')[:35]
+        if error:
+            return f"[red]✗[/red] {title}: {str(error)[:40]}"
+        score = updates["relevance_score"]
+        icon = "✓" if score >= 0.5 else "✗"
+        return f"[{'green' if score >= 0.5 else 'red'}]{icon}[/] {title}... ({score:.2f})"
+
+    _run_job_with_progress(campaign_id, "analyze", "Analyzing", to_analyze, analyze, describe)
 
     good = len([a for a in articles if a.get("relevance_score", 0) >= 0.5])
     console.print(f"\n[green]✓ {good} articles with good fit[/green]")
@@ -273,44 +295,39 @@ def run_contacts(campaign_id, config):
 
     from pr_outreach.services.author_finder import find_author_contacts
 
-    found = 0
+    def find_contact(article):
+        contact = find_author_contacts(
+            author_name=article.get("author_name", ""),
+            domain=article.get("domain", ""),
+            article_url=article.get("url", "")
+        )
+
+        # Only save contacts with confidence >= 0.5 (skip pattern_guess fakes)
+        confidence = contact.get("email_confidence", 0) if contact else 0
+        if contact and contact.get("email") and confidence >= 0.5:
+            return {
+                "author_email": contact.get("email"),
+                "author_linkedin": contact.get("linkedin_url"),
+                "author_twitter": contact.get("twitter_handle"),
+                "contact_confidence": confidence,
+            }
+        if contact and contact.get("email"):
+            return {"contact_confidence": confidence}
+        return None
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        for article in to_find:
-            name = (article.get('author_name') or 'Unknown')[:25]
-            task = progress.add_task(f"Finding: {name}...", total=None)
-
-            try:
-                contact = find_author_contacts(
-                    author_name=article.get("author_name", ""),
-                    domain=article.get("domain", ""),
-                    article_url=article.get("url", "")
-                )
-
-                # Only save contacts with confidence >= 0.5 (skip pattern_guess fakes)
-                confidence = contact.get("email_confidence", 0) if contact else 0
-                if contact and contact.get("email") and confidence >= 0.5:
-                    article["author_email"] = contact.get("email")
-                    article["author_linkedin"] = contact.get("linkedin_url")
-                    article["author_twitter"] = contact.get("twitter_handle")
-                    article["contact_confidence"] = confidence
-                    found += 1
-                    progress.update(task, description=f"[green]✓[/green] {name}: {contact['email']}")
-                elif contact and contact.get("email") and confidence < 0.5:
-                    progress.update(task, description=f"[yellow]−[/yellow] {name}: low confidence ({confidence:.1f})")
-                else:
-                    progress.update(task, description=f"[yellow]−[/yellow] {name}: no email")
-            except Exception as e:
-                progress.update(task, description=f"[red]✗[/red] {name}: error")
-
-            progress.stop_task(task)
-
-    save_articles(campaign_id, articles)
+    def describe(article, updates, error):
+        name = (article.get('author_name') or 'Unknown')[:25]
+        if updates and updates.get("author_email"):
+            return f"[green]✓[/green] {name}: {updates['author_email']}"
+        if updates:
+            return f"[yellow]−[/yellow] {name}: low confidence ({updates['contact_confidence']:.1f})"
+        if error:
+            return f"[red]✗[/red] {name}: error"
+        return f"[yellow]−[/yellow] {name}: no email"
+
+    _run_job_with_progress(campaign_id, "contacts", "Finding contacts", to_find, find_contact, describe)
 
+    found = len([a for a in to_find if a.get("author_email")])
     console.print(f"\n[green]✓ Found {found} contacts[/green]")
     console.input("\n[dim]Press Enter to continue...[/dim]")
 
@@ -336,90 +353,139 @@ def run_draft(campaign_id, config):
 
     from pr_outreach.agents.email_writer import write_outreach_email
 
-    drafted = 0
+    def draft(article):
+        email = write_outreach_email(
+            article=article,
+            product=config.product,
+            sender=config.sender_persona,
+            campaign_config=config
+        )
+        if not email:
+            return None
+        outreach_id = save_outreach(campaign_id, article, email, config)
+        return {"email_drafted": True, "outreach_id": outreach_id}
+
+    def describe(article, updates, error):
+        name = (article.get('author_name') or 'Unknown')[:25]
+        if updates:
+            return f"[green]✓[/green] {name}"
+        if error:
+            return f"[red]✗[/red] {name}: {str(error)[:20]}"
+        return f"[red]✗[/red] {name}: failed"
+
+    _run_job_with_progress(campaign_id, "draft", "Drafting", to_draft, draft, describe)
+
+    drafted = len([a for a in to_draft if a.get("email_drafted")])
+    console.print(f"\n[green]✓ Drafted {drafted} emails[/green]")
+    console.input("\n[dim]Press Enter to continue...[/dim]")
+
 
+def _run_job_with_progress(campaign_id, stage, label, articles, process, describe):
+    """Run a resumable article job (outreach.run_article_job) under a progress bar."""
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
         console=console
     ) as progress:
-        for article in to_draft:
-            name = (article.get('author_name') or 'Unknown')[:25]
-            task = progress.add_task(f"Drafting: {name}...", total=None)
-
-            try:
-                email = write_outreach_email(
-                    article=article,
-                    product=config.product,
-                    sender=config.sender_persona,
-                    campaign_config=config
-                )
-
-                if email:
-                    outreach_id = save_outreach(campaign_id, article, email, config)
-                    article["email_drafted"] = True
-                    article["outreach_id"] = outreach_id
-                    drafted += 1
-                    progress.update(task, description=f"[green]✓[/green] {name}")
-                else:
-                    progress.update(task, description=f"[red]✗[/red] {name}: failed")
-            except Exception as e:
-                progress.update(task, description=f"[red]✗[/red] {name}: {str(e)[:20]}")
-
-            progress.stop_task(task)
-
-    save_articles(campaign_id, articles)
+        overall = progress.add_task(f"{label}...", total=len(articles))
+
+        def report(article, updates, error):
+            progress.console.print(f"  {describe(article, updates, error)}")
+            progress.advance(overall)
+
+        return run_article_job(campaign_id, stage, articles, process,
+                               workers=DEFAULT_WORKERS, on_result=report)
+
+
+def watch_jobs(campaign_id):
+    """Follow jobs running in other processes (e.g. outreach.py analyze) until they finish."""
+    if not any(job['state'] == 'running' for job in load_job_progress(campaign_id)):
+        console.print("\n[yellow]No jobs running.[/yellow]")
+        console.input("\n[dim]Press Enter to continue...[/dim]")
+        return
+
+    console.print("\n[dim]Watching jobs (Ctrl+C to stop watching)...[/dim]\n")
+    tasks = {}
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console
+        ) as progress:
+            while True:
+                jobs = load_job_progress(campaign_id)
+                for job in jobs:
+                    if job['stage'] not in tasks:
+                        if job['state'] != 'running':
+                            continue
+                        tasks[job['stage']] = progress.add_task("", total=job['total'])
+                    current = ", ".join(title[:25] for title in job.get('current', []))
+                    description = f"{job['stage']} [{job['state']}]"
+                    if current:
+                        description += f" [dim]{current}[/dim]"
+                    progress.update(tasks[job['stage']], description=description,
+                                    total=job['total'], completed=job['done'] + job['failed'])
+                if not any(job['state'] == 'running' for job in jobs):
+                    break
+                time.sleep(1)
+    except KeyboardInterrupt:
+        pass
 
-    console.print(f"\n[green]✓ Drafted {drafted} emails[/green]")
     console.input("\n[dim]Press Enter to continue...[/dim]")
 
 
 def review_emails(campaign_id):
-    """Interactive email review."""
-    emails = load_outreach(campaign_id, status="pending_review")
+    """Interactive email review (loads one page of pending emails at a time)."""
+    total = campaign_summary(campaign_id)["emails"].get("pending_review", 0)
 
-    if not emails:
+    if not total:
         console.print("\n[yellow]No emails pending review.[/yellow]")
         console.input("\n[dim]Press Enter to continue...[/dim]")
         return
 
-    console.print(f"\n[bold]📋 {len(emails)} emails pending review[/bold]\n")
-
-    for i, email in enumerate(emails):
-        console.print(Panel(
-            f"[bold]To:[/bold] {email['author_name']} <{email['author_email']}>\n"
-            f"[bold]Article:[/bold] {email['article_title'][:50]}...\n"
-            f"[bold]Subject:[/bold] {email['subject']}\n\n"
-            f"[dim]{email['body'][:300]}...[/dim]",
-            title=f"Email {i+1}/{len(emails)} - {email['outreach_id'][:8]}",
-            border_style="cyan"
-        ))
-
-        console.print("\n[green]a[/green]) Approve  [red]r[/red]) Reject  [cyan]s[/cyan]) Skip  [dim]q[/dim]) Back to menu")
-        action = console.input("\n[bold]>[/bold] ").strip().lower()
-
-        if action == 'a':
-            email['status'] = 'approved'
-            email['approved_at'] = datetime.now().isoformat()
-            email['_file'] = None  # Force lookup
-            full_email = find_outreach(email['outreach_id'])
-            if full_email:
-                full_email['status'] = 'approved'
-                full_email['approved_at'] = datetime.now().isoformat()
-                update_outreach(full_email)
-            console.print("[green]✓ Approved[/green]\n")
-        elif action == 'r':
-            reason = console.input("[dim]Reason:[/dim] ")
-            full_email = find_outreach(email['outreach_id'])
-            if full_email:
-                full_email['status'] = 'rejected'
-                full_email['rejection_reason'] = reason
-                update_outreach(full_email)
-            console.print("[red]✗ Rejected[/red]\n")
-        elif action == 'q':
-            break
-        else:
-            console.print("[dim]Skipped[/dim]\n")
+    console.print(f"\n[bold]📋 {total} emails pending review[/bold]\n")
+
+    i = 0
+    cursor = None
+    while True:
+        emails, cursor = page_outreach(campaign_id, "pending_review", cursor, PAGE_SIZE)
+        for email in emails:
+            console.print(Panel(
+                f"[bold]To:[/bold] {email['author_name']} <{email['author_email']}>\n"
+                f"[bold]Article:[/bold] {email['article_title'][:50]}...\n"
+                f"[bold]Subject:[/bold] {email['subject']}\n\n"
+                f"[dim]{email['body'][:300]}...[/dim]",
+                title=f"Email {i+1}/{total} - {email['outreach_id'][:8]}",
+                border_style="cyan"
+            ))
+            i += 1
+
+            console.print("\n[green]a[/green]) Approve  [red]r[/red]) Reject  [cyan]s[/cyan]) Skip  [dim]q[/dim]) Back to menu")
+            action = console.input("\n[bold]>[/bold] ").strip().lower()
+
+            # Page records are full records (with _file): update them directly
+            if action == 'a':
+                email['status'] = 'approved'
+                email['approved_at'] = datetime.now().isoformat()
+                update_outreach(email)
+                console.print("[green]✓ Approved[/green]\n")
+            elif action == 'r':
+                reason = console.input("[dim]Reason:[/dim] ")
+                email['status'] = 'rejected'
+                email['rejection_reason'] = reason
+                update_outreach(email)
+                console.print("[red]✗ Rejected[/red]\n")
+            elif action == 'q':
+                return
+            else:
+                console.print("[dim]Skipped[/dim]\n")
+
+        if cursor is None:
+            return
 
 
 def send_emails(campaign_id):
@@ -466,37 +532,29 @@ def send_emails(campaign_id):
         console.print("[dim]Cancelled[/dim]")
         return
 
-    from pr_outreach.services.email_sender import send_email
+    def report(record, success, result, provider):
+        if success:
+            console.print(f"[green]✓[/green] Sent to {record['author_email']}")
+        elif success is None:
+            console.print(f"[yellow]⚠️[/yellow]  Delivery unknown: {record['author_email']} - {result}")
+        else:
+            console.print(f"[red]✗[/red] Failed: {record['author_email']} - {result}")
 
-    sent = 0
-    for email in to_send:
-        try:
-            success, result, provider = send_email(
-                to_email=email['author_email'],
-                subject=email['subject'],
-                body=email['body']
-            )
-
-            if success:
-                full_email = find_outreach(email['outreach_id'])
-                if full_email:
-                    full_email['status'] = 'sent'
-                    full_email['sent_at'] = datetime.now().isoformat()
-                    full_email['message_id'] = result
-                    update_outreach(full_email)
-                sent += 1
-                console.print(f"[green]✓[/green] Sent to {email['author_email']}")
-            else:
-                console.print(f"[red]✗[/red] Failed: {email['author_email']} - {result}")
-        except Exception as e:
-            console.print(f"[red]✗[/red] Error: {email['author_email']} - {str(e)[:30]}")
+    try:
+        counts = send_outreach_records(to_send, on_result=report)
+        sent = counts['sent'] + counts['already_sent']
+        if counts['uncertain']:
+            console.print(f"[yellow]⚠️  {counts['uncertain']} with unknown delivery (interrupted or timed out) - not resent[/yellow]")
+    except Exception as e:
+        sent = 0
+        console.print(f"[red]✗[/red] Error: {str(e)[:60]}")
 
     console.print(f"\n[green]✓ Sent {sent}/{len(to_send)} emails[/green]")
     console.input("\n[dim]Press Enter to continue...[/dim]")
 
 
 def list_data(campaign_id):
-    """List articles, contacts, or emails."""
+    """List articles, contacts, or emails (one page at a time)."""
     console.print("\n[bold]List:[/bold]")
     console.print("  [cyan]1[/cyan]) Articles")
     console.print("  [cyan]2[/cyan]) Contacts")
@@ -506,84 +564,118 @@ def list_data(campaign_id):
     choice = console.input("[bold]>[/bold] ").strip()
 
     if choice == '1':
-        articles = load_articles(campaign_id)
-        if not articles:
-            console.print("\n[yellow]No articles found.[/yellow]")
-        else:
-            table = Table(title=f"Articles ({len(articles)})")
-            table.add_column("Score", justify="center", style="cyan")
-            table.add_column("Title")
-            table.add_column("Author")
-
-            for a in articles:
-                score = a.get('relevance_score')
-                score_str = f"{score:.2f}" if isinstance(score, float) else "-"
-                table.add_row(
-                    score_str,
-                    a.get('title', 'Unknown')[:45] + "...",
-                    a.get('author_name', '-')[:20]
-                )
-
-            console.print(table)
+        console.print(f"[dim]Filter: {', '.join(ARTICLE_FILTERS)} (default all)[/dim]")
+        article_filter = console.input("[bold]>[/bold] ").strip() or "all"
+        if article_filter not in ARTICLE_FILTERS:
+            console.print(f"[red]Unknown filter: {article_filter}[/red]")
+            article_filter = "all"
+        _browse(
+            lambda cursor: page_articles(campaign_id, article_filter, cursor, PAGE_SIZE),
+            _articles_table, empty="No articles found."
+        )
 
     elif choice == '2':
-        articles = load_articles(campaign_id)
-        contacts = [a for a in articles if a.get('author_email')]
+        _browse(
+            lambda cursor: page_articles(campaign_id, "contacts", cursor, PAGE_SIZE),
+            _contacts_table, empty="No contacts found."
+        )
 
-        if not contacts:
-            console.print("\n[yellow]No contacts found.[/yellow]")
-        else:
-            table = Table(title=f"Contacts ({len(contacts)})")
-            table.add_column("Name")
-            table.add_column("Email")
-            table.add_column("LinkedIn", style="dim")
+    elif choice == '3':
+        console.print("[dim]Status: pending_review, approved, sent, rejected (default all)[/dim]")
+        status = console.input("[bold]>[/bold] ").strip() or None
+        _browse(
+            lambda cursor: page_outreach(campaign_id, status, cursor, PAGE_SIZE),
+            _emails_table, empty="No emails found."
+        )
 
-            for a in contacts:
-                table.add_row(
-                    a.get('author_name', 'Unknown')[:25],
-                    a.get('author_email', '-'),
-                    "✓" if a.get('author_linkedin') else "-"
-                )
+    console.input("\n[dim]Press Enter to continue...[/dim]")
 
-            console.print(table)
 
-    elif choice == '3':
-        emails = load_outreach(campaign_id)
+def _browse(fetch_page, render, empty):
+    """
+    Show pages from fetch_page(cursor) -> (rows, next_cursor) until the user stops.
 
-        if not emails:
-            console.print("\n[yellow]No emails found.[/yellow]")
-        else:
-            table = Table(title=f"Emails ({len(emails)})")
-            table.add_column("ID", style="dim")
-            table.add_column("Status")
-            table.add_column("To")
-            table.add_column("Subject")
-
-            status_style = {
-                'pending_review': 'yellow',
-                'approved': 'green',
-                'sent': 'blue',
-                'rejected': 'red'
-            }
+    Only the rows of the current page are loaded and rendered.
+    """
+    cursor = None
+    page_number = 1
+    while True:
+        rows, cursor = fetch_page(cursor)
+        if not rows:
+            console.print(f"\n[yellow]{empty if page_number == 1 else 'No more results.'}[/yellow]")
+            return
 
-            for e in emails:
-                status = e['status']
-                table.add_row(
-                    e['outreach_id'][:8],
-                    f"[{status_style.get(status, 'white')}]{status}[/]",
-                    e.get('author_email', '-')[:25],
-                    e.get('subject', '-')[:35] + "..."
-                )
+        console.print(render(rows, page_number))
+        if cursor is None:
+            return
+
+        action = console.input("\n[dim]Enter) Next page  q) Back:[/dim] ").strip().lower()
+        if action == 'q':
+            return
+        page_number += 1
+
+
+def _articles_table(articles, page_number):
+    table = Table(title=f"Articles (page {page_number})")
+    table.add_column("Score", justify="center", style="cyan")
+    table.add_column("Title")
+    table.add_column("Author")
+
+    for a in articles:
+        score = a.get('relevance_score')
+        score_str = f"{score:.2f}" if isinstance(score, float) else "-"
+        table.add_row(
+            score_str,
+            (a.get('title') or 'Unknown')[:45] + "...",
+            (a.get('author_name') or '-')[:20]
+        )
+    return table
+
+
+def _contacts_table(articles, page_number):
+    table = Table(title=f"Contacts (page {page_number})")
+    table.add_column("Name")
+    table.add_column("Email")
+    table.add_column("LinkedIn", style="dim")
+
+    for a in articles:
+        table.add_row(
+            (a.get('author_name') or 'Unknown')[:25],
+            a.get('author_email', '-'),
+            "✓" if a.get('author_linkedin') else "-"
+        )
+    return table
+
+
+def _emails_table(emails, page_number):
+    table = Table(title=f"Emails (page {page_number})")
+    table.add_column("ID", style="dim")
+    table.add_column("Status")
+    table.add_column("To")
+    table.add_column("Subject")
 
-            console.print(table)
+    status_style = {
+        'pending_review': 'yellow',
+        'approved': 'green',
+        'sent': 'blue',
+        'rejected': 'red'
+    }
 
-    console.input("\n[dim]Press Enter to continue...[/dim]")
+    for e in emails:
+        status = e['status']
+        table.add_row(
+            e['outreach_id'][:8],
+            f"[{status_style.get(status, 'white')}]{status}[/]",
+            e.get('author_email', '-')[:25],
+            e.get('subject', '-')[:35] + "..."
+        )
+    return table
 
 
 def show_full_status(campaign_id, config):
     """Show detailed status table."""
-    articles = load_articles(campaign_id)
-    outreach = load_outreach(campaign_id)
+    summary = campaign_summary(campaign_id)
+    emails = summary["emails"]
 
     console.print("\n")
 
@@ -593,11 +685,11 @@ def show_full_status(campaign_id, config):
     table.add_column("Count", justify="right")
     table.add_column("Status", justify="center")
 
-    total = len(articles)
-    analyzed = len([a for a in articles if a.get("analyzed")])
-    good_fit = len([a for a in articles if a.get("relevance_score", 0) >= 0.5])
-    contacts = len([a for a in articles if a.get("author_email")])
-    drafted = len([a for a in articles if a.get("email_drafted")])
+    total = summary["articles"]
+    analyzed = summary["analyzed"]
+    good_fit = summary["good_fit"]
+    contacts = summary["contacts"]
+    drafted = summary["drafted"]
 
     table.add_row("Articles Found", str(total), "✓" if total > 0 else "−")
     table.add_row("Analyzed", str(analyzed), "✓" if analyzed == total else f"{analyzed}/{total}")
@@ -608,20 +700,15 @@ def show_full_status(campaign_id, config):
     console.print(table)
 
     # Email status table
-    if outreach:
+    if emails:
         table2 = Table(title="Email Status")
         table2.add_column("Status", style="cyan")
         table2.add_column("Count", justify="right")
 
-        pending = len([o for o in outreach if o['status'] == 'pending_review'])
-        approved = len([o for o in outreach if o['status'] == 'approved'])
-        sent = len([o for o in outreach if o['status'] == 'sent'])
-        rejected = len([o for o in outreach if o['status'] == 'rejected'])
-
-        table2.add_row("Pending Review", str(pending))
-        table2.add_row("Approved", str(approved))
-        table2.add_row("Sent", str(sent))
-        table2.add_row("Rejected", str(rejected))
+        table2.add_row("Pending Review", str(emails.get('pending_review', 0)))
+        table2.add_row("Approved", str(emails.get('approved', 0)))
+        table2.add_row("Sent", str(emails.get('sent', 0)))
+        table2.add_row("Rejected", str(emails.get('rejected', 0)))
 
         console.print(table2)
 
@@ -8,27 +8,41 @@ Search priority:
 1. OpenAI web search (if available) - FREE with OpenAI API
 2. Google Custom Search API
 3. SerpAPI (fallback)
+
+Relevance scoring packs many candidates into one LLM prompt (chunked by
+RELEVANCE_BATCH_TOKEN_BUDGET) and parses a JSON array of scores; only
+entries missing or malformed in the batch response are re-scored one by one.
 """
 
 import os
 import json
-from typing import List, Dict, Optional, Callable
+import math
+import re
+from typing import Iterable, List, Dict, Optional, Callable
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, quote_plus
 
 from pr_outreach.core.schemas import ArticleCandidate, ProductInfo, CampaignConfig
-from pr_outreach.services.domain_analyzer import analyze_domain
+from pr_outreach.io.contacted_urls import ContactedURLSet, normalize_url
+from pr_outreach.services.domain_analyzer import analyze_domains
 from yt_autopilot.core.logger import logger, log_fallback
+from yt_autopilot.core.prompt_prefix import estimate_tokens
 
 import requests
 
 
+# Batched relevance scoring: prompt token budget and max articles per LLM call
+RELEVANCE_BATCH_TOKEN_BUDGET = 3000
+RELEVANCE_BATCH_MAX_ARTICLES = 20
+RELEVANCE_BATCH_EXCERPT_CHARS = 300
+
+
 def hunt_articles(
     search_queries: List[str],
     product: ProductInfo,
     campaign_config: CampaignConfig,
     max_results: int = 50,
-    contacted_articles: List[str] = None,
+    contacted_articles: Optional[Iterable[str]] = None,
     llm_generate_fn: Optional[Callable] = None,
     use_openai_search: bool = True
 ) -> List[ArticleCandidate]:
@@ -40,7 +54,10 @@ def hunt_articles(
         product: Product information
         campaign_config: Campaign configuration
         max_results: Maximum articles to return
-        contacted_articles: URLs already contacted (to skip)
+        contacted_articles: URLs this campaign already contacted (to skip); with
+            a ContactedURLSet from get_contacted_articles, articles and domains
+            probably pitched by other campaigns are counted in the log (Bloom
+            filter hits can be false positives, so they are not skipped)
         llm_generate_fn: LLM function for relevance scoring
         use_openai_search: Use OpenAI's built-in web search (recommended)
 
@@ -50,7 +67,10 @@ def hunt_articles(
     logger.info(f"Hunting articles for: {product.name}")
     logger.info(f"  Queries: {search_queries}")
 
-    contacted_articles = contacted_articles or []
+    if not isinstance(contacted_articles, ContactedURLSet):
+        contacted_articles = ContactedURLSet.from_urls(
+            campaign_config.campaign_id, contacted_articles or []
+        )
     all_articles = []
 
     # Search each query
@@ -80,19 +100,40 @@ def hunt_articles(
         fallback_results = _search_fallback(query, max_results=15)
         all_articles.extend(fallback_results)
 
-    # Deduplicate by URL
-    seen_urls = set()
+    # Deduplicate by canonical URL (O(1) per article)
+    seen_keys = set()
     unique_articles = []
+    skipped_contacted = 0
+    other_campaigns = 0
+    known_domains = 0
     for article in all_articles:
-        if article.url not in seen_urls and article.url not in contacted_articles:
-            seen_urls.add(article.url)
-            unique_articles.append(article)
+        key = normalize_url(article.url)
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
 
-    logger.info(f"  Found {len(unique_articles)} unique articles")
+        if article.url in contacted_articles:
+            skipped_contacted += 1
+            continue
 
-    # Enrich with domain analysis
+        if contacted_articles.contacted_in_any_campaign(article.url):
+            other_campaigns += 1
+        elif contacted_articles.domain_contacted(article.url):
+            known_domains += 1
+        unique_articles.append(article)
+
+    logger.info(f"  Found {len(unique_articles)} unique articles")
+    if skipped_contacted:
+        logger.info(f"  Skipped {skipped_contacted} already contacted article(s)")
+    if other_campaigns:
+        logger.info(f"  {other_campaigns} article(s) probably pitched by another campaign")
+    if known_domains:
+        logger.info(f"  {known_domains} article(s) on domains pitched before")
+
+    # Enrich with domain analysis (one lookup per distinct domain)
+    domain_infos = analyze_domains(article.url for article in unique_articles)
     for article in unique_articles:
-        domain_info = analyze_domain(article.url)
+        domain_info = domain_infos[article.url]
         article.domain_authority = domain_info.get("domain_authority", 0)
 
     # Score articles
@@ -187,7 +228,6 @@ Return ONLY the JSON array, no other text.""",
 
         # First try to parse JSON from response
         try:
-            import re
             # Match JSON array - greedy to get full array
             json_match = re.search(r'\[\s*\{[\s\S]*\}\s*\]', result_text)
             if json_match:
@@ -433,7 +473,12 @@ def _score_articles(
     - Relevance to product (LLM-scored if available)
     - Insertion opportunity (listicle format = better)
     """
-    for article in articles:
+    if llm_generate_fn:
+        relevance_scores = _batch_relevance_scores(articles, product, llm_generate_fn)
+    else:
+        relevance_scores = [_keyword_relevance_score(a, product) for a in articles]
+
+    for article, relevance_score in zip(articles, relevance_scores):
         # Domain authority score (0-1)
         da_score = min(article.domain_authority / 100.0, 1.0)
 
@@ -442,9 +487,6 @@ def _score_articles(
         article.recency_score = recency_score
 
         # Relevance score (0-1)
-        relevance_score = _calculate_relevance_score(
-            article, product, llm_generate_fn
-        )
         article.relevance_score = relevance_score
 
         # Opportunity score (0-1)
@@ -483,16 +525,135 @@ def _calculate_recency_score(publication_date: Optional[datetime]) -> float:
         return 0.1
 
 
-def _calculate_relevance_score(
-    article: ArticleCandidate,
+def _batch_relevance_scores(
+    articles: List[ArticleCandidate],
     product: ProductInfo,
-    llm_generate_fn: Optional[Callable]
-) -> float:
-    """Calculate relevance score using LLM or keywords."""
-    if llm_generate_fn:
-        return _llm_relevance_score(article, product, llm_generate_fn)
-    else:
-        return _keyword_relevance_score(article, product)
+    llm_generate_fn: Callable
+) -> List[float]:
+    """
+    Score relevance for many articles with one LLM call per chunk.
+
+    Chunks are filled up to RELEVANCE_BATCH_TOKEN_BUDGET prompt tokens (and
+    RELEVANCE_BATCH_MAX_ARTICLES). Entries the response omits or gets wrong
+    fall back to _llm_relevance_score for that article only.
+
+    Returns:
+        Relevance score (0-1) per article, in order
+    """
+    scores: List[Optional[float]] = [None] * len(articles)
+    chunks = _relevance_chunks(articles, product)
+
+    for chunk in chunks:
+        batch_scores = _llm_relevance_batch([articles[i] for i in chunk], product, llm_generate_fn)
+        for i, score in zip(chunk, batch_scores):
+            scores[i] = score
+
+    fallbacks = [i for i, score in enumerate(scores) if score is None]
+    for i in fallbacks:
+        scores[i] = _llm_relevance_score(articles[i], product, llm_generate_fn)
+
+    if articles:
+        logger.info(f"  Scored relevance of {len(articles)} articles in {len(chunks)} LLM batch(es)"
+                    + (f", {len(fallbacks)} re-scored individually" if fallbacks else ""))
+    return scores
+
+
+def _relevance_chunks(articles: List[ArticleCandidate], product: ProductInfo) -> List[List[int]]:
+    """Groups article indexes so each batch prompt stays within the token budget."""
+    budget = RELEVANCE_BATCH_TOKEN_BUDGET - estimate_tokens(_relevance_batch_prompt([], product))
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for i, article in enumerate(articles):
+        cost = estimate_tokens(_relevance_batch_item(0, article))
+        if current and (used + cost > budget or len(current) >= RELEVANCE_BATCH_MAX_ARTICLES):
+            chunks.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _relevance_batch_item(item_id: int, article: ArticleCandidate) -> str:
+    excerpt = (article.content_excerpt or "")[:RELEVANCE_BATCH_EXCERPT_CHARS].replace("\n", " ")
+    return f"""[{item_id}] Title: {article.title}
+    Domain: {article.domain}
+    Excerpt: {excerpt}
+"""
+
+
+def _relevance_batch_prompt(articles: List[ArticleCandidate], product: ProductInfo) -> str:
+    items = "".join(_relevance_batch_item(i, a) for i, a in enumerate(articles))
+    return f"""Rate the relevance of each article for PR outreach promoting a product.
+
+PRODUCT:
+- Name: {product.name}
+- Category: {product.category}
+- Description: {product.tagline}
+- Key features: {', '.join(product.key_features[:3])}
+
+ARTICLES:
+{items}
+Rate each article's relevance from 0.0 to 1.0 where:
+- 0.0-0.3: Not relevant (different topic entirely)
+- 0.4-0.6: Somewhat relevant (related category)
+- 0.7-0.8: Relevant (good fit for mention)
+- 0.9-1.0: Highly relevant (perfect listicle opportunity)
+
+Respond with ONLY a JSON array, one object per article, e.g.:
+[{{"id": 0, "score": 0.8}}, {{"id": 1, "score": 0.3}}]"""
+
+
+def _llm_relevance_batch(
+    articles: List[ArticleCandidate],
+    product: ProductInfo,
+    llm_generate_fn: Callable
+) -> List[Optional[float]]:
+    """
+    One LLM call scoring several articles.
+
+    Returns:
+        Score per article, None where the response has no valid entry
+    """
+    scores: List[Optional[float]] = [None] * len(articles)
+    try:
+        response = llm_generate_fn(
+            role="article_analyst",
+            task=_relevance_batch_prompt(articles, product),
+            context="",
+            style_hints={"response_format": "json"}
+        )
+        items = _parse_score_array(response)
+    except Exception as e:
+        logger.debug(f"Batched LLM relevance scoring failed: {e}")
+        return scores
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        item_id = item.get("id")
+        score = item.get("score")
+        if isinstance(item_id, bool) or not isinstance(item_id, int) or not 0 <= item_id < len(articles):
+            continue
+        if isinstance(score, bool) or not isinstance(score, (int, float)) or not math.isfinite(score):
+            continue
+        if scores[item_id] is None:
+            scores[item_id] = max(0.0, min(1.0, float(score)))
+    return scores
+
+
+def _parse_score_array(response: str) -> List:
+    """Extracts the JSON array from an LLM response (tolerates code fences/prose)."""
+    match = re.search(r'\[[\s\S]*\]', response or "")
+    if not match:
+        return []
+    try:
+        parsed = json.loads(match.group())
+    except json.JSONDecodeError:
+        return []
+    return parsed if isinstance(parsed, list) else []
 
 
 def _keyword_relevance_score(article: ArticleCandidate, product: ProductInfo) -> float:
@@ -569,7 +730,6 @@ def _calculate_opportunity_score(article: ArticleCandidate, product: ProductInfo
             score += 0.1
 
     # Number in title indicates listicle
-    import re
     if re.search(r'\d+\s*(best|top|apps|tools)', title_lower):
         score += 0.2
 
@@ -474,6 +474,12 @@ class OutreachPackage(BaseModel):
         description="Reasoning for email content"
     )
 
+    # Profiling
+    stage_timings_ms: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Wall time per pipeline stage in ms (analysis, positioning, author, ...)"
+    )
+
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
     approved_at: Optional[datetime] = Field(None, description="Approval timestamp")
@@ -3,18 +3,32 @@ from .outreach_datastore import (
     save_outreach_draft,
     get_pending_emails,
     approve_email,
+    approve_emails,
     mark_as_sent,
+    mark_emails_as_sent,
     update_response_status,
     get_contacted_articles,
     get_campaign_stats,
+    rebuild_campaign_stats,
+)
+from .send_queue import (
+    enqueue_emails,
+    get_queue_counts,
+    requeue_uncertain,
 )
 
 __all__ = [
     "save_outreach_draft",
     "get_pending_emails",
     "approve_email",
+    "approve_emails",
     "mark_as_sent",
+    "mark_emails_as_sent",
     "update_response_status",
     "get_contacted_articles",
     "get_campaign_stats",
+    "rebuild_campaign_stats",
+    "enqueue_emails",
+    "get_queue_counts",
+    "requeue_uncertain",
 ]
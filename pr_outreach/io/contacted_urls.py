@@ -0,0 +1,191 @@
+"""
+Contacted URLs - Canonical URL keys, Bloom filters and per-campaign sets.
+
+Used by outreach_datastore to answer "was this article already pitched?"
+in O(1) during discovery:
+
+- normalize_url(): one canonical key per article regardless of scheme,
+  "www.", default ports, fragments, trailing slashes, tracking parameters
+  (utm_*, fbclid, ...) and query parameter order
+- ContactedURLSet: exact hash set of one campaign's keys (membership test
+  normalizes the candidate URL), plus access to the cross-campaign filters
+- BloomFilter: compact filters over ALL campaigns, one for URL keys and one
+  for domains, so cross-campaign and domain-level checks never keep other
+  campaigns' URL lists in memory. Answers are "definitely not" or "probably
+  yes" (false positive rate set by BLOOM_ERROR_RATE).
+
+Usage:
+    contacted = get_contacted_articles(campaign_id)   # outreach_datastore
+    if article.url in contacted: ...                  # exact, this campaign
+    if contacted.contacted_in_any_campaign(article.url): ...
+    if contacted.domain_contacted(article.url): ...
+"""
+
+import hashlib
+import math
+from typing import Iterable, Iterator, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Query parameters that never identify content
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "ref", "ref_src", "ref_url",
+    "_ga", "_gl", "amp", "output",
+}
+TRACKING_PARAM_PREFIXES = ("utm_", "hsa_", "pk_", "mtm_")
+
+# Bloom filter sizing (grown by doubling when the item count exceeds capacity)
+BLOOM_DEFAULT_CAPACITY = 100_000
+BLOOM_ERROR_RATE = 0.001
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical dedup key for an article URL.
+
+    http/https, "www." and default ports are ignored, host is lowercased,
+    fragments and tracking parameters are dropped, remaining query parameters
+    are sorted and trailing slashes / index pages are removed.
+
+    Example:
+        >>> normalize_url("HTTPS://www.Example.com/Post/?utm_source=x&b=2&a=1#top")
+        'example.com/Post?a=1&b=2'
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "http://" + url
+
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    for index_page in ("/index.html", "/index.htm", "/index.php"):
+        if path.endswith(index_page):
+            path = path[: -len(index_page)] or "/"
+    if path.endswith("/amp"):
+        path = path[:-4] or "/"
+    path = path.rstrip("/")
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ]
+    query.sort()
+
+    key = host + path
+    if query:
+        key += "?" + urlencode(query)
+    return key
+
+
+def url_domain(url: str) -> str:
+    """Domain of a URL (or of a normalized key), lowercased without "www."."""
+    key = normalize_url(url)
+    return key.split("/", 1)[0].split("?", 1)[0]
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter with double hashing over blake2b.
+    """
+
+    def __init__(self, capacity: int = BLOOM_DEFAULT_CAPACITY, error_rate: float = BLOOM_ERROR_RATE):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def is_full(self) -> bool:
+        """True once more items were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str], min_capacity: int = BLOOM_DEFAULT_CAPACITY) -> "BloomFilter":
+        """Builds a filter sized for at least twice the given keys."""
+        keys = list(keys)
+        bloom = cls(capacity=max(min_capacity, 2 * len(keys)))
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+
+class ContactedURLSet:
+    """
+    Contacted article URLs of one campaign.
+
+    `url in contacted` normalizes url and checks the campaign's exact key set.
+    Cross-campaign and domain checks go through the shared Bloom filters.
+    """
+
+    def __init__(
+        self,
+        campaign_id: str,
+        keys: Iterable[str] = (),
+        url_filter: Optional[BloomFilter] = None,
+        domain_filter: Optional[BloomFilter] = None
+    ):
+        self.campaign_id = campaign_id
+        self._keys: Set[str] = set(keys)
+        self.url_filter = url_filter
+        self.domain_filter = domain_filter
+
+    @classmethod
+    def from_urls(cls, campaign_id: str, urls: Iterable[str]) -> "ContactedURLSet":
+        """Wraps a plain URL list (no cross-campaign filters)."""
+        return cls(campaign_id, (normalize_url(url) for url in urls))
+
+    def __contains__(self, url: str) -> bool:
+        return normalize_url(url) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def replace_keys(self, keys: Iterable[str]) -> None:
+        """Replaces the key set (reload after another process changed it)."""
+        self._keys = set(keys)
+
+    def add_key(self, key: str) -> bool:
+        """Adds a normalized key; returns False if it was already present."""
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        return True
+
+    def contacted_in_any_campaign(self, url: str) -> bool:
+        """Probably contacted by some campaign (exact for this campaign)."""
+        if url in self:
+            return True
+        return self.url_filter is not None and normalize_url(url) in self.url_filter
+
+    def domain_contacted(self, url: str) -> bool:
+        """Probably pitched to this domain before, by any campaign."""
+        return self.domain_filter is not None and url_domain(url) in self.domain_filter
@@ -2,12 +2,44 @@
 Outreach Datastore - Persistence for PR outreach packages.
 
 Similar to datastore.py in youtube-autopilot.
-Uses JSONL format for simple, append-only storage.
+
+Records live in a SQLite database (data/outreach.db) keyed by outreach_id:
+- Status transitions (approve, reject, sent, response) update one row in place
+  instead of rewriting every record
+- Bulk transitions (approve_emails, reject_emails, mark_emails_as_sent) apply
+  to many records in a single transaction
+- Secondary indexes on (campaign_id, status) and (status) serve
+  get_pending_emails and get_all_outreach without scanning other campaigns
+- Per-campaign counters (drafted, per-status, sent, opened, replied, by
+  sentiment, score sums) are materialized in campaign_counters, updated in
+  the same transaction as every record change and served from memory by
+  get_campaign_stats / get_campaign_counters until the database files
+  change; rebuild_campaign_stats recomputes them from the records and
+  tally_campaign_counters computes the same counters for records kept
+  outside the datastore (outreach.py's per-campaign outreach.jsonl)
+- Contacted article URLs are kept per campaign under a canonical key
+  (contacted_urls.normalize_url); get_contacted_articles returns an
+  in-memory ContactedURLSet, reloaded when the database files change, and
+  two in-memory Bloom filters (URL keys, domains) answer cross-campaign and
+  domain-level checks. The filters are built from contacted_urls once per
+  process and then only fold in rows added since (by rowid), so adding a
+  URL never rewrites them. An existing data/contacted_articles.json is
+  imported once.
+
+Each row keeps the full record as JSON, so callers still receive the same
+dicts as with the former JSONL store. An existing data/outreach_records.jsonl
+is imported once on first use (later lines win for duplicate ids).
+
+All writes go through one process-wide lock so concurrent pipeline workers
+(build_outreach_package with max_workers > 1) never interleave or lose
+read-modify-write updates.
 """
 
 import json
 import os
-from typing import List, Optional, Dict
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Optional, Dict, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -16,27 +48,399 @@ from pr_outreach.core.schemas import (
     OutreachStatus,
     CampaignStats
 )
-from yt_autopilot.core.logger import logger
+from pr_outreach.io.contacted_urls import (
+    BloomFilter,
+    ContactedURLSet,
+    normalize_url,
+    url_domain
+)
+from yt_autopilot.core.logger import logger, log_fallback
+
+
+# Default datastore paths
+OUTREACH_DB_PATH = "data/outreach.db"
+OUTREACH_DATASTORE_PATH = "data/outreach_records.jsonl"  # Legacy JSONL store (imported once)
+CONTACTED_ARTICLES_PATH = "data/contacted_articles.json"  # Legacy contacted list (imported once)
+
+# Serializes every write and shares one connection per database file
+_write_lock = threading.RLock()
+_connections: Dict[str, sqlite3.Connection] = {}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outreach_records (
+    outreach_id TEXT PRIMARY KEY,
+    campaign_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outreach_campaign_status
+    ON outreach_records (campaign_id, status);
+CREATE INDEX IF NOT EXISTS idx_outreach_status
+    ON outreach_records (status);
+CREATE TABLE IF NOT EXISTS datastore_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS contacted_urls (
+    campaign_id TEXT NOT NULL,
+    url_key TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    url TEXT NOT NULL,
+    contacted_at TEXT,
+    PRIMARY KEY (campaign_id, url_key)
+);
+CREATE INDEX IF NOT EXISTS idx_contacted_domain
+    ON contacted_urls (domain);
+CREATE TABLE IF NOT EXISTS campaign_counters (
+    campaign_id TEXT NOT NULL,
+    counter TEXT NOT NULL,
+    value REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (campaign_id, counter)
+);
+"""
+
+# Materialized per-campaign counters (see _record_counters)
+CAMPAIGN_COUNTERS = (
+    "drafted",
+    "pending_review", "approved", "rejected",
+    "sent", "opened", "replied",
+    "replied_positive", "replied_neutral", "replied_negative",
+    "spam_score_sum", "personalization_score_sum", "quality_score_sum",
+)
 
+# In-memory copy of campaign_counters per database path, with the database
+# file signature it was read at (_db_signature)
+_counter_cache: Dict[str, Tuple[Tuple, Dict[str, Dict[str, float]]]] = {}
 
-# Default datastore path
-OUTREACH_DATASTORE_PATH = "data/outreach_records.jsonl"
-CONTACTED_ARTICLES_PATH = "data/contacted_articles.json"
+# Per database path: campaign -> (_db_signature it was loaded at, ContactedURLSet)
+_contacted_sets: Dict[str, Dict[str, Tuple[Tuple, ContactedURLSet]]] = {}
 
+# Per database path: (contacted generation, highest contacted_urls rowid folded
+# in, URL filter, domain filter). The generation is bumped whenever contacted
+# URLs are deleted, which a Bloom filter can only follow by a rebuild.
+_contacted_filters: Dict[str, Tuple[Optional[str], int, BloomFilter, BloomFilter]] = {}
 
-def _get_datastore_path() -> str:
-    """Get path to outreach datastore file."""
-    path = os.getenv("OUTREACH_DATASTORE_PATH", OUTREACH_DATASTORE_PATH)
+
+def _get_db_path() -> str:
+    """Get path to the outreach SQLite database."""
+    path = os.getenv("OUTREACH_DB_PATH", OUTREACH_DB_PATH)
     # Ensure directory exists
     Path(path).parent.mkdir(parents=True, exist_ok=True)
     return path
 
 
+def _get_datastore_path() -> str:
+    """Get path to the legacy JSONL datastore file."""
+    return os.getenv("OUTREACH_DATASTORE_PATH", OUTREACH_DATASTORE_PATH)
+
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    Returns the shared connection for the current database path.
+
+    Creates the schema and imports the legacy JSONL store on first use.
+    Callers must hold _write_lock while using the connection.
+    """
+    path = _get_db_path()
+    conn = _connections.get(path)
+    if conn is not None:
+        return conn
+
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    _import_legacy_jsonl(conn)
+    _import_legacy_contacted(conn)
+
+    counters_built = conn.execute(
+        "SELECT value FROM datastore_meta WHERE key = 'campaign_counters_built'"
+    ).fetchone()
+    if not counters_built:
+        # Database created before counters were materialized
+        _rebuild_counters(conn)
+
+    _connections[path] = conn
+    return conn
+
+
+def _import_legacy_jsonl(conn: sqlite3.Connection) -> None:
+    """One-time import of records from the former JSONL datastore."""
+    legacy_path = _get_datastore_path()
+    if not os.path.exists(legacy_path):
+        return
+
+    imported = conn.execute(
+        "SELECT value FROM datastore_meta WHERE key = 'legacy_jsonl_imported'"
+    ).fetchone()
+    if imported:
+        return
+
+    rows = []
+    with open(legacy_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line.strip())
+            except json.JSONDecodeError:
+                continue
+            if record.get("outreach_id"):
+                rows.append(_record_row(record))
+
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO outreach_records "
+            "(outreach_id, campaign_id, status, created_at, record) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO datastore_meta (key, value) VALUES ('legacy_jsonl_imported', ?)",
+            (datetime.now().isoformat(),)
+        )
+    _rebuild_counters(conn)
+
+    logger.info(f"Imported {len(rows)} outreach record(s) from {legacy_path}")
+
+
+def _import_legacy_contacted(conn: sqlite3.Connection) -> None:
+    """One-time import of the former contacted_articles.json lists."""
+    legacy_path = _get_contacted_path()
+    if not os.path.exists(legacy_path):
+        return
+
+    imported = conn.execute(
+        "SELECT value FROM datastore_meta WHERE key = 'legacy_contacted_imported'"
+    ).fetchone()
+    if imported:
+        return
+
+    try:
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        data = {}
+
+    rows = [
+        (campaign_id, normalize_url(url), url_domain(url), url, None)
+        for campaign_id, urls in data.items()
+        for url in urls
+        if normalize_url(url)
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO contacted_urls "
+            "(campaign_id, url_key, domain, url, contacted_at) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO datastore_meta (key, value) VALUES ('legacy_contacted_imported', ?)",
+            (datetime.now().isoformat(),)
+        )
+
+    logger.info(f"Imported {len(rows)} contacted URL(s) from {legacy_path}")
+
+
+def _record_row(record: Dict) -> tuple:
+    """Row values for one record (indexed columns + JSON document)."""
+    return (
+        record["outreach_id"],
+        record.get("campaign_id") or "",
+        record.get("status") or "",
+        record.get("created_at"),
+        json.dumps(record, default=str)
+    )
+
+
+def _record_counters(record: Optional[Dict]) -> Dict[str, float]:
+    """Contribution of one record to its campaign counters."""
+    if not record:
+        return {}
+
+    # Datastore records use OutreachStatus values (PENDING_REVIEW), outreach.py
+    # records lowercase names (pending_review)
+    status = (record.get("status") or "").lower()
+    replied = bool(record.get("replied")) or status == OutreachStatus.REPLIED.value.lower()
+    sent = bool(record.get("sent_at")) or status in (
+        OutreachStatus.SENT.value.lower(), OutreachStatus.REPLIED.value.lower()
+    )
+
+    counters = {
+        "drafted": 1,
+        "sent": int(sent),
+        "opened": int(bool(record.get("opened"))),
+        "replied": int(replied),
+        "spam_score_sum": record.get("spam_score", 0) or 0,
+        "personalization_score_sum": record.get("personalization_score", 0) or 0,
+        "quality_score_sum": record.get("overall_quality_score", 0) or 0,
+    }
+    if status in ("pending_review", "approved", "rejected"):
+        counters[status] = 1
+    if replied:
+        sentiment = record.get("reply_sentiment")
+        if sentiment not in ("positive", "negative"):
+            sentiment = "neutral"
+        counters[f"replied_{sentiment}"] = 1
+    return counters
+
+
+def _counter_delta(
+    deltas: Dict[str, Dict[str, float]],
+    old_record: Optional[Dict],
+    new_record: Optional[Dict]
+) -> None:
+    """Accumulates the counter change of replacing old_record by new_record."""
+    for record, sign in ((old_record, -1), (new_record, 1)):
+        if not record:
+            continue
+        campaign = deltas.setdefault(record.get("campaign_id") or "", {})
+        for counter, value in _record_counters(record).items():
+            campaign[counter] = campaign.get(counter, 0) + sign * value
+
+
+def _apply_counter_deltas(conn: sqlite3.Connection, deltas: Dict[str, Dict[str, float]]) -> None:
+    """Writes counter deltas inside the caller's transaction."""
+    rows = [
+        (campaign_id, counter, value)
+        for campaign_id, counters in deltas.items()
+        for counter, value in counters.items()
+        if value
+    ]
+    conn.executemany(
+        "INSERT INTO campaign_counters (campaign_id, counter, value) VALUES (?, ?, ?) "
+        "ON CONFLICT (campaign_id, counter) DO UPDATE SET value = value + excluded.value",
+        rows
+    )
+
+
+def _db_signature(path: str) -> Tuple:
+    """
+    (size, mtime) of the database and its WAL file.
+
+    Commits from this or any other process change it, so a cached copy of
+    campaign_counters is reloaded instead of going stale.
+    """
+    signature = []
+    for name in (path, f"{path}-wal"):
+        try:
+            stat = os.stat(name)
+            signature.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _rebuild_counters(conn: sqlite3.Connection, campaign_id: Optional[str] = None) -> None:
+    """Recomputes campaign_counters from the records (one transaction)."""
+    if campaign_id is None:
+        rows = conn.execute("SELECT record FROM outreach_records").fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT record FROM outreach_records WHERE campaign_id = ?", (campaign_id,)
+        ).fetchall()
+
+    deltas: Dict[str, Dict[str, float]] = {}
+    for (raw,) in rows:
+        try:
+            _counter_delta(deltas, None, json.loads(raw))
+        except json.JSONDecodeError:
+            continue
+
+    with conn:
+        if campaign_id is None:
+            conn.execute("DELETE FROM campaign_counters")
+        else:
+            conn.execute("DELETE FROM campaign_counters WHERE campaign_id = ?", (campaign_id,))
+        _apply_counter_deltas(conn, deltas)
+        conn.execute(
+            "INSERT OR REPLACE INTO datastore_meta (key, value) VALUES ('campaign_counters_built', ?)",
+            (datetime.now().isoformat(),)
+        )
+
+    _counter_cache.pop(_get_db_path(), None)
+
+
+def _query_records(where: str = "", params: Iterable[Any] = ()) -> List[Dict]:
+    """Returns decoded records matching a WHERE clause, in insertion order."""
+    sql = "SELECT record FROM outreach_records"
+    if where:
+        sql += f" WHERE {where}"
+    sql += " ORDER BY rowid"
+
+    with _write_lock:
+        rows = _get_connection().execute(sql, tuple(params)).fetchall()
+
+    records = []
+    for (raw,) in rows:
+        try:
+            records.append(json.loads(raw))
+        except json.JSONDecodeError:
+            continue
+    return records
+
+
 def _get_contacted_path() -> str:
-    """Get path to contacted articles file."""
-    path = os.getenv("CONTACTED_ARTICLES_PATH", CONTACTED_ARTICLES_PATH)
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    return path
+    """Get path to the legacy contacted articles file."""
+    return os.getenv("CONTACTED_ARTICLES_PATH", CONTACTED_ARTICLES_PATH)
+
+
+def _contacted_generation(conn: sqlite3.Connection) -> Optional[str]:
+    row = conn.execute(
+        "SELECT value FROM datastore_meta WHERE key = 'contacted_generation'"
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _get_contacted_filters() -> Tuple[BloomFilter, BloomFilter]:
+    """
+    Returns the cross-campaign (URL filter, domain filter).
+
+    Built from contacted_urls on first use; later calls only add the rows
+    inserted since (by this or any other process). Rebuilt when contacted
+    URLs were deleted or a filter outgrew its capacity. Callers must hold
+    _write_lock.
+    """
+    conn = _get_connection()
+    generation = _contacted_generation(conn)
+    state = _contacted_filters.get(_get_db_path())
+    if state is None or state[0] != generation:
+        return _rebuild_contacted_filters()
+
+    _, covered_rowid, url_filter, domain_filter = state
+    rows = conn.execute(
+        "SELECT rowid, url_key, domain FROM contacted_urls WHERE rowid > ? ORDER BY rowid",
+        (covered_rowid,)
+    ).fetchall()
+    if not rows:
+        return url_filter, domain_filter
+
+    for _, key, domain in rows:
+        if key not in url_filter:
+            url_filter.add(key)
+        if domain not in domain_filter:
+            domain_filter.add(domain)
+
+    if url_filter.is_full or domain_filter.is_full:
+        # Past the sized capacity the false positive rate climbs: regrow
+        return _rebuild_contacted_filters()
+
+    _contacted_filters[_get_db_path()] = (generation, rows[-1][0], url_filter, domain_filter)
+    return url_filter, domain_filter
+
+
+def _rebuild_contacted_filters() -> Tuple[BloomFilter, BloomFilter]:
+    """Rebuilds both Bloom filters from contacted_urls (callers must hold _write_lock)."""
+    conn = _get_connection()
+    generation = _contacted_generation(conn)
+    rows = conn.execute("SELECT rowid, url_key, domain FROM contacted_urls").fetchall()
+    url_filter = BloomFilter.from_keys({key for _, key, _ in rows})
+    domain_filter = BloomFilter.from_keys({domain for _, _, domain in rows})
+    covered_rowid = max((rowid for rowid, _, _ in rows), default=0)
+
+    _contacted_filters[_get_db_path()] = (generation, covered_rowid, url_filter, domain_filter)
+    for _, contacted in _contacted_sets.get(_get_db_path(), {}).values():
+        contacted.url_filter = url_filter
+        contacted.domain_filter = domain_filter
+    return url_filter, domain_filter
 
 
 def save_outreach_draft(package: OutreachPackage) -> str:
@@ -49,8 +453,6 @@ def save_outreach_draft(package: OutreachPackage) -> str:
     Returns:
         outreach_id of saved package
     """
-    path = _get_datastore_path()
-
     # Convert to dict for JSON serialization
     record = {
         "outreach_id": package.outreach_id,
@@ -85,6 +487,9 @@ def save_outreach_draft(package: OutreachPackage) -> str:
         "strategy_reasoning": package.strategy_reasoning,
         "email_generation_reasoning": package.email_generation_reasoning,
 
+        # Profiling
+        "stage_timings_ms": package.stage_timings_ms,
+
         # Timestamps
         "created_at": package.created_at.isoformat(),
         "approved_at": package.approved_at.isoformat() if package.approved_at else None,
@@ -107,9 +512,23 @@ def save_outreach_draft(package: OutreachPackage) -> str:
         "full_product": package.product.model_dump()
     }
 
-    # Append to JSONL file
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record, default=str) + "\n")
+    with _write_lock:
+        conn = _get_connection()
+        previous = conn.execute(
+            "SELECT record FROM outreach_records WHERE outreach_id = ?",
+            (package.outreach_id,)
+        ).fetchone()
+
+        deltas: Dict[str, Dict[str, float]] = {}
+        _counter_delta(deltas, json.loads(previous[0]) if previous else None, record)
+
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO outreach_records "
+                "(outreach_id, campaign_id, status, created_at, record) VALUES (?, ?, ?, ?, ?)",
+                _record_row(record)
+            )
+            _apply_counter_deltas(conn, deltas)
 
     logger.info(f"Saved outreach package: {package.outreach_id}")
     return package.outreach_id
@@ -125,42 +544,19 @@ def get_pending_emails(campaign_id: Optional[str] = None) -> List[Dict]:
     Returns:
         List of pending outreach records
     """
-    path = _get_datastore_path()
-    pending = []
-
-    if not os.path.exists(path):
-        return []
+    if campaign_id is None:
+        return _query_records("status = ?", (OutreachStatus.PENDING_REVIEW.value,))
 
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                record = json.loads(line.strip())
-                if record.get("status") == OutreachStatus.PENDING_REVIEW.value:
-                    if campaign_id is None or record.get("campaign_id") == campaign_id:
-                        pending.append(record)
-            except json.JSONDecodeError:
-                continue
-
-    return pending
+    return _query_records(
+        "campaign_id = ? AND status = ?",
+        (campaign_id, OutreachStatus.PENDING_REVIEW.value)
+    )
 
 
 def get_outreach_by_id(outreach_id: str) -> Optional[Dict]:
     """Get a specific outreach record by ID."""
-    path = _get_datastore_path()
-
-    if not os.path.exists(path):
-        return None
-
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                record = json.loads(line.strip())
-                if record.get("outreach_id") == outreach_id:
-                    return record
-            except json.JSONDecodeError:
-                continue
-
-    return None
+    records = _query_records("outreach_id = ?", (outreach_id,))
+    return records[0] if records else None
 
 
 def approve_email(outreach_id: str, approved_by: str) -> bool:
@@ -263,133 +659,270 @@ def update_response_status(
     return _update_record(outreach_id, updates)
 
 
-def _update_record(outreach_id: str, updates: Dict) -> bool:
-    """Update a record in the datastore."""
-    path = _get_datastore_path()
+def approve_emails(outreach_ids: List[str], approved_by: str) -> int:
+    """
+    Approve several emails in one transaction.
 
-    if not os.path.exists(path):
-        return False
+    Args:
+        outreach_ids: IDs of outreach to approve
+        approved_by: Who approved (email/name)
 
-    # Read all records
-    records = []
-    updated = False
+    Returns:
+        Number of records approved
+    """
+    approved_at = datetime.now().isoformat()
+    return _update_records({
+        outreach_id: {
+            "status": OutreachStatus.APPROVED.value,
+            "approved_at": approved_at,
+            "approved_by": approved_by
+        }
+        for outreach_id in outreach_ids
+    })
 
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                record = json.loads(line.strip())
-                if record.get("outreach_id") == outreach_id:
-                    record.update(updates)
-                    updated = True
-                records.append(record)
-            except json.JSONDecodeError:
-                continue
 
-    if not updated:
-        return False
+def reject_emails(outreach_ids: List[str], reason: str) -> int:
+    """
+    Reject several emails in one transaction.
 
-    # Write back
-    with open(path, "w", encoding="utf-8") as f:
-        for record in records:
-            f.write(json.dumps(record, default=str) + "\n")
+    Args:
+        outreach_ids: IDs of outreach to reject
+        reason: Rejection reason
 
-    return True
+    Returns:
+        Number of records rejected
+    """
+    return _update_records({
+        outreach_id: {
+            "status": OutreachStatus.REJECTED.value,
+            "rejection_reason": reason
+        }
+        for outreach_id in outreach_ids
+    })
 
 
-def get_contacted_articles(campaign_id: str) -> List[str]:
+def mark_emails_as_sent(message_ids: Dict[str, Optional[str]]) -> int:
     """
-    Get list of already contacted article URLs for a campaign.
+    Mark several emails as sent in one transaction.
+
+    Args:
+        message_ids: outreach_id -> provider message ID (or None)
 
-    Used for deduplication.
+    Returns:
+        Number of records updated
     """
-    path = _get_contacted_path()
+    sent_at = datetime.now().isoformat()
+    return _update_records({
+        outreach_id: {
+            "status": OutreachStatus.SENT.value,
+            "sent_at": sent_at,
+            "message_id": message_id
+        }
+        for outreach_id, message_id in message_ids.items()
+    })
 
-    if not os.path.exists(path):
-        return []
 
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get(campaign_id, [])
-    except (json.JSONDecodeError, IOError):
-        return []
+def _update_record(outreach_id: str, updates: Dict) -> bool:
+    """Update a record in the datastore."""
+    return _update_records({outreach_id: updates}) == 1
 
 
-def add_contacted_article(campaign_id: str, url: str) -> None:
-    """Add an article URL to the contacted list."""
-    path = _get_contacted_path()
+def _update_records(updates_by_id: Dict[str, Dict]) -> int:
+    """
+    Applies field updates to records by primary key in one transaction.
 
-    data = {}
-    if os.path.exists(path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            data = {}
+    Args:
+        updates_by_id: outreach_id -> fields to merge into the record
 
-    if campaign_id not in data:
-        data[campaign_id] = []
+    Returns:
+        Number of records found and updated
+    """
+    if not updates_by_id:
+        return 0
 
-    if url not in data[campaign_id]:
-        data[campaign_id].append(url)
+    updated = 0
+    deltas: Dict[str, Dict[str, float]] = {}
+    with _write_lock:
+        conn = _get_connection()
+        try:
+            with conn:
+                for outreach_id, updates in updates_by_id.items():
+                    row = conn.execute(
+                        "SELECT record FROM outreach_records WHERE outreach_id = ?",
+                        (outreach_id,)
+                    ).fetchone()
+                    if row is None:
+                        continue
+
+                    old_record = json.loads(row[0])
+                    record = {**old_record, **updates}
+                    conn.execute(
+                        "UPDATE outreach_records SET status = ?, record = ? WHERE outreach_id = ?",
+                        (record.get("status") or "", json.dumps(record, default=str), outreach_id)
+                    )
+                    _counter_delta(deltas, old_record, record)
+                    updated += 1
+
+                _apply_counter_deltas(conn, deltas)
+        except sqlite3.Error as e:
+            log_fallback(
+                component="OUTREACH_DATASTORE",
+                fallback_type="UPDATE_FAILED",
+                reason=f"{len(updates_by_id)} record update(s) rolled back: {e}",
+                impact="HIGH"
+            )
+            return 0
+
+    return updated
+
+
+def get_contacted_articles(campaign_id: str) -> ContactedURLSet:
+    """
+    Get the already contacted article URLs of a campaign.
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    Used for deduplication: `url in contacted` is an O(1) lookup of the
+    normalized URL. The returned set is cached, kept up to date by
+    add_contacted_article and reloaded in place when another process changed
+    the database; it also exposes the cross-campaign and domain Bloom
+    filters (contacted_in_any_campaign, domain_contacted).
+    """
+    path = _get_db_path()
+
+    with _write_lock:
+        conn = _get_connection()
+        signature = _db_signature(path)
+        sets = _contacted_sets.setdefault(path, {})
+        cached = sets.get(campaign_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        url_filter, domain_filter = _get_contacted_filters()
+        keys = [
+            row[0] for row in conn.execute(
+                "SELECT url_key FROM contacted_urls WHERE campaign_id = ?",
+                (campaign_id,)
+            )
+        ]
+        if cached is None:
+            contacted = ContactedURLSet(campaign_id, keys, url_filter, domain_filter)
+        else:
+            # Same object: callers holding it see the reloaded keys
+            contacted = cached[1]
+            contacted.replace_keys(keys)
+        sets[campaign_id] = (signature, contacted)
+
+    return contacted
 
 
-def get_campaign_stats(campaign_id: str) -> CampaignStats:
+def add_contacted_article(campaign_id: str, url: str) -> None:
+    """Add an article URL to the contacted set (no-op for known URL variants)."""
+    key = normalize_url(url)
+    if not key:
+        return
+    domain = url_domain(url)
+
+    with _write_lock:
+        conn = _get_connection()
+        with conn:
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO contacted_urls "
+                "(campaign_id, url_key, domain, url, contacted_at) VALUES (?, ?, ?, ?, ?)",
+                (campaign_id, key, domain, url, datetime.now().isoformat())
+            ).rowcount
+        if not inserted:
+            return
+
+        cached = _contacted_sets.get(_get_db_path(), {}).get(campaign_id)
+        if cached is not None:
+            cached[1].add_key(key)
+
+        if _get_db_path() in _contacted_filters:
+            # Folds in the new row (and any other process's) in memory
+            _get_contacted_filters()
+
+
+def get_campaign_counters(campaign_id: str) -> Dict[str, float]:
     """
-    Get statistics for a campaign.
+    Get the materialized counters of a campaign (served from memory).
 
-    Aggregates data from all outreach records.
-    """
-    path = _get_datastore_path()
+    The in-memory copy is reloaded whenever the database changes on disk.
 
-    stats = CampaignStats(campaign_id=campaign_id)
+    Args:
+        campaign_id: Campaign ID
 
-    if not os.path.exists(path):
-        return stats
+    Returns:
+        Dict with every CAMPAIGN_COUNTERS key (0 for campaigns without records)
+    """
+    path = _get_db_path()
+    with _write_lock:
+        conn = _get_connection()
+        signature = _db_signature(path)
+        cached = _counter_cache.get(path)
+        if cached is None or cached[0] != signature:
+            cache: Dict[str, Dict[str, float]] = {}
+            for cid, counter, value in conn.execute(
+                "SELECT campaign_id, counter, value FROM campaign_counters"
+            ):
+                cache.setdefault(cid, {})[counter] = value
+            cached = _counter_cache[path] = (signature, cache)
+
+        counters = dict.fromkeys(CAMPAIGN_COUNTERS, 0)
+        counters.update(cached[1].get(campaign_id, {}))
+    return counters
+
+
+def tally_campaign_counters(records: Iterable[Dict]) -> Dict[str, float]:
+    """
+    Compute campaign counters from records kept outside the datastore.
 
-    total_spam = 0.0
-    total_pers = 0.0
-    total_quality = 0.0
-    count = 0
+    Uses the same rules as the materialized counters, so the result can be
+    added to get_campaign_counters (e.g. for outreach.py campaigns, whose
+    records live in data/outreach/<campaign>/outreach.jsonl).
 
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                record = json.loads(line.strip())
-                if record.get("campaign_id") != campaign_id:
-                    continue
+    Args:
+        records: Latest version of each outreach record
 
-                count += 1
-                stats.total_emails_generated += 1
+    Returns:
+        Dict with every CAMPAIGN_COUNTERS key
+    """
+    counters = dict.fromkeys(CAMPAIGN_COUNTERS, 0)
+    for record in records:
+        for counter, value in _record_counters(record).items():
+            counters[counter] += value
+    return counters
 
-                status = record.get("status")
 
-                if status == OutreachStatus.SENT.value:
-                    stats.total_emails_sent += 1
+def rebuild_campaign_stats(campaign_id: Optional[str] = None) -> None:
+    """
+    Recompute materialized campaign counters from the outreach records.
 
-                if record.get("opened"):
-                    stats.total_opens += 1
+    Args:
+        campaign_id: Campaign to rebuild (None = all campaigns)
+    """
+    with _write_lock:
+        _rebuild_counters(_get_connection(), campaign_id)
+    logger.info(f"Rebuilt campaign stats for {campaign_id or 'all campaigns'}")
 
-                if record.get("replied"):
-                    stats.total_replies += 1
-                    sentiment = record.get("reply_sentiment")
-                    if sentiment == "positive":
-                        stats.positive_replies += 1
-                    elif sentiment == "negative":
-                        stats.negative_replies += 1
-                    else:
-                        stats.neutral_replies += 1
 
-                # Accumulate scores
-                total_spam += record.get("spam_score", 0)
-                total_pers += record.get("personalization_score", 0)
-                total_quality += record.get("overall_quality_score", 0)
+def get_campaign_stats(campaign_id: str) -> CampaignStats:
+    """
+    Get statistics for a campaign.
 
-            except json.JSONDecodeError:
-                continue
+    Built from the materialized campaign counters, no record scan.
+    """
+    counters = get_campaign_counters(campaign_id)
+    count = int(counters["drafted"])
+
+    stats = CampaignStats(
+        campaign_id=campaign_id,
+        total_emails_generated=count,
+        total_emails_sent=int(counters["sent"]),
+        total_opens=int(counters["opened"]),
+        total_replies=int(counters["replied"]),
+        positive_replies=int(counters["replied_positive"]),
+        neutral_replies=int(counters["replied_neutral"]),
+        negative_replies=int(counters["replied_negative"])
+    )
 
     # Calculate rates
     if stats.total_emails_sent > 0:
@@ -401,9 +934,9 @@ def get_campaign_stats(campaign_id: str) -> CampaignStats:
 
     # Calculate averages
     if count > 0:
-        stats.avg_spam_score = total_spam / count
-        stats.avg_personalization_score = total_pers / count
-        stats.avg_quality_score = total_quality / count
+        stats.avg_spam_score = counters["spam_score_sum"] / count
+        stats.avg_personalization_score = counters["personalization_score_sum"] / count
+        stats.avg_quality_score = counters["quality_score_sum"] / count
 
     return stats
 
@@ -422,29 +955,18 @@ def get_all_outreach(
     Returns:
         List of matching records
     """
-    path = _get_datastore_path()
-    results = []
-
-    if not os.path.exists(path):
-        return []
-
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                record = json.loads(line.strip())
-
-                if campaign_id and record.get("campaign_id") != campaign_id:
-                    continue
-
-                if status and record.get("status") != status.value:
-                    continue
+    clauses = []
+    params = []
 
-                results.append(record)
+    if campaign_id:
+        clauses.append("campaign_id = ?")
+        params.append(campaign_id)
 
-            except json.JSONDecodeError:
-                continue
+    if status:
+        clauses.append("status = ?")
+        params.append(status.value)
 
-    return results
+    return _query_records(" AND ".join(clauses), params)
 
 
 def reset_campaign_data(campaign_id: str, dry_run: bool = True) -> int:
@@ -458,40 +980,26 @@ def reset_campaign_data(campaign_id: str, dry_run: bool = True) -> int:
     Returns:
         Number of records that would be/were deleted
     """
-    path = _get_datastore_path()
-
-    if not os.path.exists(path):
-        return 0
-
-    records_to_keep = []
-    deleted_count = 0
-
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                record = json.loads(line.strip())
-                if record.get("campaign_id") == campaign_id:
-                    deleted_count += 1
-                else:
-                    records_to_keep.append(record)
-            except json.JSONDecodeError:
-                continue
-
-    if not dry_run:
-        with open(path, "w", encoding="utf-8") as f:
-            for record in records_to_keep:
-                f.write(json.dumps(record, default=str) + "\n")
-
-        # Also clear contacted articles
-        contacted_path = _get_contacted_path()
-        if os.path.exists(contacted_path):
-            with open(contacted_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if campaign_id in data:
-                del data[campaign_id]
-
-            with open(contacted_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+    with _write_lock:
+        conn = _get_connection()
+        deleted_count = conn.execute(
+            "SELECT COUNT(*) FROM outreach_records WHERE campaign_id = ?",
+            (campaign_id,)
+        ).fetchone()[0]
+
+        if not dry_run:
+            with conn:
+                conn.execute("DELETE FROM outreach_records WHERE campaign_id = ?", (campaign_id,))
+                conn.execute("DELETE FROM campaign_counters WHERE campaign_id = ?", (campaign_id,))
+                # Also clear contacted articles
+                conn.execute("DELETE FROM contacted_urls WHERE campaign_id = ?", (campaign_id,))
+                conn.execute(
+                    "INSERT INTO datastore_meta (key, value) VALUES ('contacted_generation', '1') "
+                    "ON CONFLICT (key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+                )
+            _counter_cache.pop(_get_db_path(), None)
+            _contacted_sets.get(_get_db_path(), {}).pop(campaign_id, None)
+            # Bloom filters cannot delete: rebuilt from the remaining URLs on next use
+            _contacted_filters.pop(_get_db_path(), None)
 
     return deleted_count
@@ -0,0 +1,427 @@
+"""
+Outreach Index - Global outreach_id index over the CLI's outreach.jsonl files.
+
+outreach.py keeps one outreach.jsonl per campaign (data/outreach/<campaign>/).
+This module makes those files cheap to query and update:
+
+- Updates are appended as a new version of the record, never rewritten in
+  place. Readers keep the last version of each outreach_id.
+- A SQLite table (data/outreach/outreach_index.db) maps every outreach_id to
+  its campaign, file and the byte offset of its latest version. Because it is
+  a sorted B-tree, an exact id or an id prefix (the 8-char ids printed by the
+  CLI) resolves in O(log n) and then takes a single seek and read.
+- Files changed behind the index's back (another process, a manual edit) are
+  detected by size/mtime and reindexed on the next lookup.
+- A file is compacted (rewritten with only the latest versions) once its
+  superseded lines outnumber its live records and exceed COMPACT_MIN_SUPERSEDED.
+- Appends and compactions run inside a BEGIN IMMEDIATE transaction, i.e.
+  under the database's write lock, so two processes (e.g. outreach_ui and a
+  CLI send job) never append to a file another one is replacing.
+- Status and created_at are indexed too, so per-status counts and paged
+  listings (keyset cursor on created_at, outreach_id) never read the files
+  beyond the rows shown.
+
+Usage:
+    append_record(path, campaign_id, record)   # create or update
+    record = find_record(data_dir, "ab12cd34")  # exact id or unique-ish prefix
+    records = read_records(path)                # latest version of each id
+    records, cursor = page_records(data_dir, campaign_id, status="approved")
+    counts = count_by_status(data_dir, campaign_id)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from yt_autopilot.core.logger import logger
+
+
+OUTREACH_INDEX_DB_PATH = "data/outreach/outreach_index.db"
+
+# Per-campaign record file name (data/outreach/<campaign>/outreach.jsonl)
+OUTREACH_FILE = "outreach.jsonl"
+
+# Compact once at least this many superseded versions pile up in a file
+COMPACT_MIN_SUPERSEDED = 200
+
+# Bumped when the tables change; the index is rebuilt from the files
+SCHEMA_VERSION = 2
+
+_lock = threading.RLock()
+_connections: Dict[str, sqlite3.Connection] = {}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outreach_ids (
+    outreach_id TEXT PRIMARY KEY,
+    campaign_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    status TEXT,
+    created_at TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_outreach_ids_path ON outreach_ids (path);
+CREATE INDEX IF NOT EXISTS idx_outreach_ids_listing
+    ON outreach_ids (campaign_id, status, created_at, outreach_id);
+CREATE TABLE IF NOT EXISTS indexed_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    lines INTEGER NOT NULL
+);
+"""
+
+
+def _get_db_path() -> str:
+    """Get path to the outreach index SQLite database."""
+    path = os.getenv("OUTREACH_INDEX_DB_PATH", OUTREACH_INDEX_DB_PATH)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Returns the shared connection (callers must hold _lock)."""
+    path = _get_db_path()
+    conn = _connections.get(path)
+    if conn is None:
+        conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            # Derived data: drop and let sync_index() rebuild it from the files
+            conn.executescript("DROP TABLE IF EXISTS outreach_ids; DROP TABLE IF EXISTS indexed_files;")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        _connections[path] = conn
+    return conn
+
+
+def _file_key(path: str) -> str:
+    return os.path.abspath(path)
+
+
+def _encode(record: Dict) -> bytes:
+    return (json.dumps(record, default=str) + "\n").encode("utf-8")
+
+
+def _index_row(record: Dict, campaign_id: str, path: str, offset: int, length: int) -> tuple:
+    return (record["outreach_id"], campaign_id, _file_key(path), offset, length,
+            record.get("status"), str(record.get("created_at") or ""))
+
+
+_INSERT_ROW = (
+    "INSERT OR REPLACE INTO outreach_ids "
+    "(outreach_id, campaign_id, path, offset, length, status, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _record_file_state(conn: sqlite3.Connection, path: str, lines: int) -> None:
+    stat = os.stat(path)
+    conn.execute(
+        "INSERT OR REPLACE INTO indexed_files (path, size, mtime_ns, lines) VALUES (?, ?, ?, ?)",
+        (_file_key(path), stat.st_size, stat.st_mtime_ns, lines)
+    )
+
+
+def _scan_file(path: str) -> tuple:
+    """Returns ({outreach_id: (record, offset, length)} for the latest versions, line count)."""
+    latest = {}
+    lines = 0
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            length = len(line)
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                    outreach_id = record["outreach_id"]
+                except (ValueError, KeyError, TypeError):
+                    # Unparseable (e.g. cut short by a crash): skip, keep offsets right
+                    outreach_id = None
+                if outreach_id:
+                    latest[outreach_id] = (record, offset, length)
+                    lines += 1
+            offset += length
+    return latest, lines
+
+
+def _reindex_file(conn: sqlite3.Connection, path: str, campaign_id: str) -> None:
+    """Rebuilds one file's entries (callers must hold _lock and a transaction)."""
+    latest, lines = _scan_file(path)
+    conn.execute("DELETE FROM outreach_ids WHERE path = ?", (_file_key(path),))
+    conn.executemany(
+        _INSERT_ROW,
+        [_index_row(record, campaign_id, path, offset, length)
+         for record, offset, length in latest.values()]
+    )
+    _record_file_state(conn, path, lines)
+
+
+def _is_current(conn: sqlite3.Connection, path: str) -> bool:
+    row = conn.execute(
+        "SELECT size, mtime_ns FROM indexed_files WHERE path = ?", (_file_key(path),)
+    ).fetchone()
+    if row is None:
+        return False
+    stat = os.stat(path)
+    return row == (stat.st_size, stat.st_mtime_ns)
+
+
+def sync_index(data_dir: str) -> int:
+    """
+    Reindex campaign files that changed outside this module.
+
+    Costs one stat() per campaign when nothing changed.
+
+    Args:
+        data_dir: Directory holding one subdirectory per campaign
+
+    Returns:
+        Number of files reindexed
+    """
+    if not os.path.isdir(data_dir):
+        return 0
+
+    reindexed = 0
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            present = set()
+            for campaign_id in os.listdir(data_dir):
+                path = os.path.join(data_dir, campaign_id, OUTREACH_FILE)
+                if not os.path.isfile(path):
+                    continue
+                present.add(_file_key(path))
+                if not _is_current(conn, path):
+                    _reindex_file(conn, path, campaign_id)
+                    reindexed += 1
+
+            # Campaign directories that were deleted
+            for (path,) in conn.execute("SELECT path FROM indexed_files").fetchall():
+                if path not in present and os.path.dirname(os.path.dirname(path)) == os.path.abspath(data_dir):
+                    conn.execute("DELETE FROM outreach_ids WHERE path = ?", (path,))
+                    conn.execute("DELETE FROM indexed_files WHERE path = ?", (path,))
+
+    if reindexed:
+        logger.debug(f"Outreach index: reindexed {reindexed} file(s)")
+    return reindexed
+
+
+def append_record(path: str, campaign_id: str, record: Dict) -> None:
+    """
+    Append a record (new, or a new version of an existing one) and index it.
+
+    Args:
+        path: Campaign outreach.jsonl
+        campaign_id: Campaign the file belongs to
+        record: Outreach record with outreach_id
+    """
+    line = _encode(record)
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            # Cross-process write lock, held until commit: covers the file
+            # append and a possible compaction (which replaces the file)
+            conn.execute("BEGIN IMMEDIATE")
+            existed = os.path.exists(path)
+            if not existed:
+                conn.execute("DELETE FROM outreach_ids WHERE path = ?", (_file_key(path),))
+            elif not _is_current(conn, path):
+                _reindex_file(conn, path, campaign_id)
+
+            with open(path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(line)
+
+            conn.execute(_INSERT_ROW, _index_row(record, campaign_id, path, offset, len(line)))
+            row = conn.execute(
+                "SELECT lines FROM indexed_files WHERE path = ?", (_file_key(path),)
+            ).fetchone()
+            lines = (row[0] if row and existed else 0) + 1
+            _record_file_state(conn, path, lines)
+
+            live = conn.execute(
+                "SELECT COUNT(*) FROM outreach_ids WHERE path = ?", (_file_key(path),)
+            ).fetchone()[0]
+            if lines - live >= max(COMPACT_MIN_SUPERSEDED, live):
+                _compact_file(conn, path, campaign_id)
+
+
+def _compact_file(conn: sqlite3.Connection, path: str, campaign_id: str) -> None:
+    """
+    Rewrites a file with only the latest version of each record.
+
+    Callers must hold the BEGIN IMMEDIATE transaction of append_record(), so
+    no other process appends between read_records() and os.replace().
+    """
+    records = read_records(path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        for record in records:
+            f.write(_encode(record))
+    os.replace(tmp_path, path)
+    _reindex_file(conn, path, campaign_id)
+    logger.debug(f"Outreach index: compacted {path} to {len(records)} records")
+
+
+def _read_at(path: str, offset: int, length: int) -> Optional[Dict]:
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            record = json.loads(f.read(length))
+    except (OSError, ValueError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _lookup(outreach_id: str) -> Optional[tuple]:
+    """(outreach_id, path, offset, length) for an exact id, else the smallest id with that prefix."""
+    with _lock:
+        conn = _get_connection()
+        row = conn.execute(
+            "SELECT outreach_id, path, offset, length FROM outreach_ids WHERE outreach_id = ?",
+            (outreach_id,)
+        ).fetchone()
+        if row is None:
+            # Range scan on the primary key: ids with this prefix sort in [prefix, prefix + U+FFFF)
+            row = conn.execute(
+                "SELECT outreach_id, path, offset, length FROM outreach_ids "
+                "WHERE outreach_id >= ? AND outreach_id < ? ORDER BY outreach_id LIMIT 1",
+                (outreach_id, outreach_id + "\uffff")
+            ).fetchone()
+    return row
+
+
+def find_record(data_dir: str, outreach_id: str) -> Optional[Dict]:
+    """
+    Latest version of a record by exact id or id prefix.
+
+    An exact match wins; otherwise the smallest id starting with the prefix
+    is returned.
+
+    Args:
+        data_dir: Directory holding one subdirectory per campaign
+        outreach_id: Full id or prefix
+
+    Returns:
+        Record with "_file" set to its outreach.jsonl, or None
+    """
+    if not outreach_id:
+        return None
+
+    for _ in range(2):
+        sync_index(data_dir)
+        row = _lookup(outreach_id)
+        if row is None:
+            return None
+
+        indexed_id, path, offset, length = row
+        record = _read_at(path, offset, length)
+        if record is not None and record.get("outreach_id") == indexed_id:
+            record["_file"] = path
+            return record
+
+        # Offsets went stale (concurrent writer in another process): reindex and retry
+        with _lock:
+            conn = _get_connection()
+            with conn:
+                conn.execute("DELETE FROM indexed_files WHERE path = ?", (path,))
+
+    return None
+
+
+def read_records(path: str) -> List[Dict]:
+    """
+    All records of one outreach.jsonl, latest version of each id.
+
+    Records keep the position of their first version (creation order).
+    """
+    records: Dict[str, Dict] = {}
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get("outreach_id"):
+                records[record["outreach_id"]] = record
+    return list(records.values())
+
+
+def page_records(
+    data_dir: str,
+    campaign_id: str,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of a campaign's records in creation order.
+
+    Keyset pagination on (created_at, outreach_id): a cursor stays valid when
+    records are added or change status while the listing is open.
+
+    Args:
+        data_dir: Directory holding one subdirectory per campaign
+        campaign_id: Campaign ID
+        status: Only records with this status
+        cursor: next_cursor of the previous page (None for the first page)
+        limit: Records per page
+
+    Returns:
+        (records, next_cursor); next_cursor is None on the last page
+    """
+    where = ["campaign_id = ?"]
+    params: List = [campaign_id]
+    if status:
+        where.append("status = ?")
+        params.append(status)
+    if cursor:
+        created_at, _, outreach_id = cursor.partition("|")
+        where.append("(created_at, outreach_id) > (?, ?)")
+        params.extend([created_at, outreach_id])
+
+    sync_index(data_dir)
+    with _lock:
+        rows = _get_connection().execute(
+            f"SELECT outreach_id, path, offset, length, created_at FROM outreach_ids "
+            f"WHERE {' AND '.join(where)} ORDER BY created_at, outreach_id LIMIT ?",
+            params + [limit + 1]
+        ).fetchall()
+
+    records = []
+    for outreach_id, path, offset, length, _ in rows[:limit]:
+        record = _read_at(path, offset, length)
+        if record is None or record.get("outreach_id") != outreach_id:
+            # Offsets went stale: take the slow but exact path for this one
+            record = find_record(data_dir, outreach_id)
+            if record is None:
+                continue
+        record["_file"] = path
+        records.append(record)
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = f"{last[4]}|{last[0]}"
+    return records, next_cursor
+
+
+def count_by_status(data_dir: str, campaign_id: Optional[str] = None) -> Dict[str, int]:
+    """Number of records per status (all campaigns if campaign_id is None)."""
+    sql = "SELECT status, COUNT(*) FROM outreach_ids"
+    params: List = []
+    if campaign_id:
+        sql += " WHERE campaign_id = ?"
+        params.append(campaign_id)
+    sql += " GROUP BY status"
+
+    sync_index(data_dir)
+    with _lock:
+        return dict(_get_connection().execute(sql, params).fetchall())
@@ -0,0 +1,307 @@
+"""
+Send Queue - Durable outbound email queue keyed by outreach_id.
+
+Rows live in a SQLite database (data/send_queue.db) and move through:
+
+    queued -> sending -> sent
+                      -> failed     (provider rejected it; re-enqueue retries)
+                      -> uncertain  (process died mid-send, or the provider
+                                     timed out / returned 5xx after the
+                                     request went out; never retried
+                                     automatically)
+
+outreach_id is the primary key, so enqueueing the same email twice is a
+no-op once it is queued, in flight or sent. A row is claimed (status
+"sending") before any provider is called and only a claim older than
+SENDING_STALE_SECONDS is declared "uncertain", so a crash can lose a send
+but never repeat it. requeue_uncertain() is the explicit way to retry those
+after checking the provider's logs.
+
+Workers live in services/email_sender.process_send_queue().
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from yt_autopilot.core.logger import logger
+
+
+SEND_QUEUE_DB_PATH = "data/send_queue.db"
+
+# Claims older than this were left behind by a dead process
+SENDING_STALE_SECONDS = 600
+
+QUEUED = "queued"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+UNCERTAIN = "uncertain"
+
+# Payload fields stored per email (beyond outreach_id / campaign_id)
+PAYLOAD_FIELDS = (
+    "to_email", "subject", "body",
+    "from_email", "from_name", "reply_to",
+    "track_opens", "track_clicks",
+)
+
+_lock = threading.RLock()
+_connections: Dict[str, sqlite3.Connection] = {}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS send_queue (
+    outreach_id TEXT PRIMARY KEY,
+    campaign_id TEXT,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    message_id TEXT,
+    provider TEXT,
+    last_error TEXT,
+    enqueued_at TEXT,
+    claimed_at REAL,
+    sent_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_send_queue_status
+    ON send_queue (status, campaign_id);
+"""
+
+
+def _get_db_path() -> str:
+    """Get path to the send queue SQLite database."""
+    path = os.getenv("SEND_QUEUE_DB_PATH", SEND_QUEUE_DB_PATH)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Returns the shared connection (callers must hold _lock)."""
+    path = _get_db_path()
+    conn = _connections.get(path)
+    if conn is None:
+        # timeout: another process may hold the write lock while claiming
+        conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _connections[path] = conn
+    return conn
+
+
+def _entry(row: Tuple) -> Dict:
+    outreach_id, campaign_id, status, payload, attempts, message_id, provider, last_error, sent_at = row
+    entry = json.loads(payload)
+    entry.update({
+        "outreach_id": outreach_id,
+        "campaign_id": campaign_id,
+        "status": status,
+        "attempts": attempts,
+        "message_id": message_id,
+        "provider": provider,
+        "last_error": last_error,
+        "sent_at": sent_at,
+    })
+    return entry
+
+
+# Ids per IN (...) query (SQLite limits bound variables per statement)
+ID_CHUNK_SIZE = 500
+
+_ENTRY_COLUMNS = "outreach_id, campaign_id, status, payload, attempts, message_id, provider, last_error, sent_at"
+
+
+def enqueue_emails(emails: Iterable[Dict]) -> Dict[str, str]:
+    """
+    Queue emails for sending (idempotent per outreach_id).
+
+    New ids are queued and failed ones are re-queued. Ids that are queued,
+    in flight, sent or uncertain are left untouched.
+
+    Args:
+        emails: Dicts with outreach_id, campaign_id, to_email, subject, body
+            and optionally from_email, from_name, reply_to, track_opens,
+            track_clicks
+
+    Returns:
+        Dict outreach_id -> queue status after the call
+    """
+    now = datetime.now().isoformat()
+    statuses = {}
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            for email in emails:
+                outreach_id = email["outreach_id"]
+                payload = json.dumps({k: email.get(k) for k in PAYLOAD_FIELDS if email.get(k) is not None})
+                conn.execute(
+                    "INSERT OR IGNORE INTO send_queue "
+                    "(outreach_id, campaign_id, status, payload, enqueued_at) VALUES (?, ?, ?, ?, ?)",
+                    (outreach_id, email.get("campaign_id"), QUEUED, payload, now)
+                )
+                conn.execute(
+                    "UPDATE send_queue SET status = ?, payload = ?, last_error = NULL "
+                    "WHERE outreach_id = ? AND status = ?",
+                    (QUEUED, payload, outreach_id, FAILED)
+                )
+                statuses[outreach_id] = conn.execute(
+                    "SELECT status FROM send_queue WHERE outreach_id = ?", (outreach_id,)
+                ).fetchone()[0]
+    return statuses
+
+
+def claim_emails(
+    limit: int,
+    campaign_id: Optional[str] = None,
+    outreach_ids: Optional[List[str]] = None
+) -> List[Dict]:
+    """
+    Atomically move up to `limit` queued emails to "sending".
+
+    Args:
+        limit: Max emails to claim
+        campaign_id: Only claim this campaign's emails
+        outreach_ids: Only claim these ids
+
+    Returns:
+        Claimed queue entries (payload fields plus outreach_id, campaign_id)
+    """
+    where = ["status = ?"]
+    params: List = [QUEUED]
+    if campaign_id:
+        where.append("campaign_id = ?")
+        params.append(campaign_id)
+
+    # Id filters are chunked below SQLite's bound-variable limit
+    id_chunks: List[List[str]] = [[]]
+    if outreach_ids is not None:
+        if not outreach_ids:
+            return []
+        id_chunks = [outreach_ids[start:start + ID_CHUNK_SIZE]
+                     for start in range(0, len(outreach_ids), ID_CHUNK_SIZE)]
+
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            # BEGIN IMMEDIATE: other processes cannot claim the same rows
+            conn.execute("BEGIN IMMEDIATE")
+            candidates = []
+            for chunk in id_chunks:
+                chunk_where = where + [f"outreach_id IN ({','.join('?' * len(chunk))})"] if chunk else where
+                candidates.extend(conn.execute(
+                    f"SELECT rowid, {_ENTRY_COLUMNS} FROM send_queue WHERE {' AND '.join(chunk_where)} "
+                    f"ORDER BY rowid LIMIT ?",
+                    params + chunk + [limit]
+                ).fetchall())
+            # Oldest first across chunks
+            rows = [row[1:] for row in sorted(candidates)[:limit]]
+            conn.executemany(
+                "UPDATE send_queue SET status = ?, claimed_at = ?, attempts = attempts + 1 "
+                "WHERE outreach_id = ?",
+                [(SENDING, time.time(), row[0]) for row in rows]
+            )
+    return [_entry(row) for row in rows]
+
+
+def complete_emails(results: Dict[str, Tuple[bool, str, Optional[str]]]) -> None:
+    """
+    Record send results for claimed emails.
+
+    Args:
+        results: outreach_id -> (success, message_id_or_error, provider);
+            success None marks the email uncertain
+    """
+    now = datetime.now().isoformat()
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            for outreach_id, (success, result, provider) in results.items():
+                if success:
+                    conn.execute(
+                        "UPDATE send_queue SET status = ?, message_id = ?, provider = ?, "
+                        "sent_at = ?, last_error = NULL WHERE outreach_id = ?",
+                        (SENT, result, provider, now, outreach_id)
+                    )
+                elif success is None:
+                    # Provider may have delivered it: reconcile before requeue_uncertain()
+                    conn.execute(
+                        "UPDATE send_queue SET status = ?, provider = ?, last_error = ? WHERE outreach_id = ?",
+                        (UNCERTAIN, provider, result, outreach_id)
+                    )
+                else:
+                    conn.execute(
+                        "UPDATE send_queue SET status = ?, last_error = ? WHERE outreach_id = ?",
+                        (FAILED, result, outreach_id)
+                    )
+
+
+def recover_interrupted(stale_seconds: int = SENDING_STALE_SECONDS) -> int:
+    """
+    Mark emails stuck in "sending" (claimed by a dead process) as uncertain.
+
+    Returns:
+        Number of emails marked uncertain
+    """
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE send_queue SET status = ?, last_error = ? WHERE status = ? AND claimed_at < ?",
+                (UNCERTAIN, "Interrupted while sending", SENDING, time.time() - stale_seconds)
+            )
+    if cursor.rowcount:
+        logger.warning(f"{cursor.rowcount} email(s) were interrupted mid-send and may or may not have "
+                       f"been delivered - check provider logs, then requeue_uncertain()")
+    return cursor.rowcount
+
+
+def requeue_uncertain(campaign_id: Optional[str] = None) -> int:
+    """
+    Queue uncertain emails again (may double-send if they were delivered).
+
+    Returns:
+        Number of emails re-queued
+    """
+    sql = "UPDATE send_queue SET status = ?, last_error = NULL WHERE status = ?"
+    params: List = [QUEUED, UNCERTAIN]
+    if campaign_id:
+        sql += " AND campaign_id = ?"
+        params.append(campaign_id)
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            return conn.execute(sql, params).rowcount
+
+
+def get_queue_entries(outreach_ids: Iterable[str]) -> Dict[str, Dict]:
+    """Queue entries for the given ids (ids never enqueued are omitted)."""
+    outreach_ids = list(outreach_ids)
+    entries = {}
+    with _lock:
+        conn = _get_connection()
+        for start in range(0, len(outreach_ids), ID_CHUNK_SIZE):
+            chunk = outreach_ids[start:start + ID_CHUNK_SIZE]
+            rows = conn.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM send_queue "
+                f"WHERE outreach_id IN ({','.join('?' * len(chunk))})",
+                chunk
+            ).fetchall()
+            for row in rows:
+                entries[row[0]] = _entry(row)
+    return entries
+
+
+def get_queue_counts(campaign_id: Optional[str] = None) -> Dict[str, int]:
+    """Number of queue entries per status."""
+    sql = "SELECT status, COUNT(*) FROM send_queue"
+    params: List = []
+    if campaign_id:
+        sql += " WHERE campaign_id = ?"
+        params.append(campaign_id)
+    sql += " GROUP BY status"
+    with _lock:
+        rows = _get_connection().execute(sql, params).fetchall()
+    return dict(rows)
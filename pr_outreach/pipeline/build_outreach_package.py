@@ -3,10 +3,23 @@ Build Outreach Package Pipeline - Main orchestrator for PR outreach.
 
 Similar to build_video_package.py in youtube-autopilot.
 Coordinates all agents to produce a complete outreach package.
+
+Articles can be processed concurrently (max_workers > 1). Each article runs in
+its own worker with isolated failure handling; all workers share one LLM rate
+limiter and the datastore's write lock, and packages are returned in the same
+order as the input articles regardless of completion order.
+
+Within an article, the steps run as a small stage graph (_run_stage_graph):
+independent stages (positioning ∥ author research, spam ∥ personalization
+checks) execute concurrently and per-stage timings are kept on the package.
 """
 
+import contextvars
+import threading
+import time
 import uuid
-from typing import Optional, List, Tuple, Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from pr_outreach.core.schemas import (
@@ -36,17 +49,63 @@ from pr_outreach.io.outreach_datastore import (
     get_contacted_articles,
     add_contacted_article
 )
+from pr_outreach.io.contacted_urls import ContactedURLSet
 
 from yt_autopilot.core.logger import logger, log_fallback
 from yt_autopilot.services.llm_router import generate_text
 
 
+# Upper bound on concurrent article workers (LLM calls are limited separately)
+MAX_ARTICLE_WORKERS = 20
+
+# Shared LLM limits across all article workers of the process
+LLM_MAX_CONCURRENT_CALLS = 6
+LLM_MIN_INTERVAL_SECONDS = 0.1
+
+
+class LLMRateLimiter:
+    """
+    Process-wide limiter for LLM calls made by concurrent article workers.
+
+    Caps in-flight calls (semaphore) and spaces call starts by a minimum
+    interval so a worker pool cannot burst past provider quotas.
+    """
+
+    def __init__(self, max_concurrent: int, min_interval_seconds: float):
+        self.max_concurrent = max_concurrent
+        self.min_interval_seconds = min_interval_seconds
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._spacing_lock = threading.Lock()
+        self._next_start = 0.0
+
+    def _wait_for_start_slot(self) -> None:
+        with self._spacing_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self.min_interval_seconds
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def wrap(self, llm_fn: Callable) -> Callable:
+        """Returns llm_fn gated by this limiter (same signature)."""
+        def limited(*args, **kwargs):
+            with self._slots:
+                self._wait_for_start_slot()
+                return llm_fn(*args, **kwargs)
+
+        return limited
+
+
+_llm_limiter = LLMRateLimiter(LLM_MAX_CONCURRENT_CALLS, LLM_MIN_INTERVAL_SECONDS)
+
+
 def build_outreach_package(
     campaign_config: CampaignConfig,
     article: Optional[ArticleCandidate] = None,
     max_articles_to_process: int = 1,
     use_llm: bool = True,
-    dry_run: bool = False
+    dry_run: bool = False,
+    max_workers: int = 1
 ) -> List[OutreachPackage]:
     """
     Build complete outreach packages for a campaign.
@@ -59,9 +118,12 @@ def build_outreach_package(
         max_articles_to_process: Max articles to process in this run
         use_llm: Whether to use LLM for intelligent processing
         dry_run: If True, don't save to datastore
+        max_workers: Articles processed concurrently (1 = sequential,
+            capped at MAX_ARTICLE_WORKERS)
 
     Returns:
-        List of OutreachPackage objects (may be empty if no good targets)
+        List of OutreachPackage objects in input article order
+        (may be empty if no good targets)
     """
     logger.info("=" * 60)
     logger.info(f"BUILDING OUTREACH PACKAGE")
@@ -69,15 +131,13 @@ def build_outreach_package(
     logger.info(f"Product: {campaign_config.product.name}")
     logger.info("=" * 60)
 
-    # Set up LLM function
-    llm_fn = generate_text if use_llm else None
+    # Set up LLM function (shared limiter across all article workers)
+    llm_fn = _llm_limiter.wrap(generate_text) if use_llm else None
 
     # Get already contacted articles
     contacted = get_contacted_articles(campaign_config.campaign_id)
     logger.info(f"Previously contacted: {len(contacted)} articles")
 
-    packages = []
-
     # STEP 1: Article Discovery (or use provided article)
     if article:
         articles = [article]
@@ -92,47 +152,91 @@ def build_outreach_package(
 
     # Process each article (up to max)
     articles_to_process = articles[:max_articles_to_process]
-    logger.info(f"Processing {len(articles_to_process)} article(s)")
+    workers = max(1, min(max_workers, len(articles_to_process), MAX_ARTICLE_WORKERS))
+    logger.info(f"Processing {len(articles_to_process)} article(s) with {workers} worker(s)")
 
-    for i, target_article in enumerate(articles_to_process):
-        logger.info(f"\n{'='*60}")
-        logger.info(f"PROCESSING ARTICLE {i+1}/{len(articles_to_process)}")
-        logger.info(f"Title: {target_article.title[:60]}")
-        logger.info(f"URL: {target_article.url}")
-        logger.info(f"{'='*60}")
+    started_at = time.monotonic()
+    total = len(articles_to_process)
 
-        try:
-            package = _process_single_article(
-                target_article,
-                campaign_config,
-                llm_fn,
-                dry_run
-            )
-            if package:
-                packages.append(package)
-                logger.info(f"✓ Package created: {package.outreach_id}")
-            else:
-                logger.warning(f"✗ Failed to create package for article")
-
-        except Exception as e:
-            logger.error(f"Error processing article: {e}")
-            log_fallback(
-                component="BUILD_OUTREACH_PACKAGE",
-                fallback_type="ARTICLE_PROCESSING_FAILED",
-                reason=str(e),
-                impact="MEDIUM"
-            )
+    if workers == 1:
+        results = [
+            _process_article_isolated(i, total, target_article, campaign_config, llm_fn, dry_run)
+            for i, target_article in enumerate(articles_to_process)
+        ]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="outreach-article") as executor:
+            # copy_context: each worker keeps the caller's LLM call scope
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _process_article_isolated,
+                    i, total, target_article, campaign_config, llm_fn, dry_run
+                )
+                for i, target_article in enumerate(articles_to_process)
+            ]
+            # Collected in submission order -> deterministic output ordering
+            results = [future.result() for future in futures]
+
+    packages = [package for package in results if package]
 
     logger.info(f"\n{'='*60}")
-    logger.info(f"COMPLETED: {len(packages)} package(s) created")
+    logger.info(
+        f"COMPLETED: {len(packages)} package(s) created "
+        f"in {time.monotonic() - started_at:.1f}s"
+    )
     logger.info(f"{'='*60}")
 
     return packages
 
 
+def _process_article_isolated(
+    index: int,
+    total: int,
+    target_article: ArticleCandidate,
+    campaign_config: CampaignConfig,
+    llm_fn: Optional[Callable],
+    dry_run: bool
+) -> Optional[OutreachPackage]:
+    """
+    Runs _process_single_article for one article, containing any failure.
+
+    An exception in one article is logged and yields None; it never affects
+    the other articles of the run.
+    """
+    label = f"[{index + 1}/{total}]"
+    logger.info(f"\n{'='*60}")
+    logger.info(f"PROCESSING ARTICLE {index + 1}/{total}")
+    logger.info(f"Title: {target_article.title[:60]}")
+    logger.info(f"URL: {target_article.url}")
+    logger.info(f"{'='*60}")
+
+    try:
+        package = _process_single_article(
+            target_article,
+            campaign_config,
+            llm_fn,
+            dry_run
+        )
+        if package:
+            logger.info(f"✓ {label} Package created: {package.outreach_id}")
+        else:
+            logger.warning(f"✗ {label} Failed to create package for article")
+        return package
+
+    except Exception as e:
+        logger.error(f"{label} Error processing article: {e}")
+        log_fallback(
+            component="BUILD_OUTREACH_PACKAGE",
+            fallback_type="ARTICLE_PROCESSING_FAILED",
+            reason=f"{target_article.url}: {e}",
+            impact="MEDIUM"
+        )
+        return None
+
+
 def _discover_articles(
     campaign_config: CampaignConfig,
-    contacted: List[str],
+    contacted: ContactedURLSet,
     llm_fn: Optional[Callable]
 ) -> List[ArticleCandidate]:
     """Discover and score articles for outreach."""
@@ -178,85 +282,207 @@ def _discover_articles(
     return top_articles
 
 
+class _ArticleRejected(Exception):
+    """Raised by a stage to stop processing an article (gate or missing data)."""
+
+
+class _Stage:
+    """One node of the per-article stage graph."""
+
+    def __init__(self, name: str, deps: Tuple[str, ...], fn: Callable[[Dict[str, Any]], Any]):
+        self.name = name
+        self.deps = deps
+        self.fn = fn
+
+
+# Widest level of the article stage graph (positioning ∥ author, spam ∥ personalization)
+MAX_STAGE_PARALLELISM = 2
+
+
+def _run_stage_graph(stages: List[_Stage], timings_ms: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Executes stages as soon as all their dependencies are done.
+
+    Each stage fn receives the dict of results produced so far. Independent
+    stages run concurrently; the first failing stage (including _ArticleRejected)
+    cancels pending stages and its exception is re-raised.
+
+    Args:
+        stages: Stages in any order (dependencies must name other stages)
+        timings_ms: Filled with wall time per finished stage
+
+    Returns:
+        Dict stage name -> stage result
+    """
+    results: Dict[str, Any] = {}
+    pending = {stage.name: stage for stage in stages}
+    running: Dict[Any, str] = {}
+
+    def timed(stage: _Stage, inputs: Dict[str, Any]) -> Any:
+        started_at = time.monotonic()
+        try:
+            return stage.fn(inputs)
+        finally:
+            timings_ms[stage.name] = round((time.monotonic() - started_at) * 1000, 1)
+
+    with ThreadPoolExecutor(max_workers=MAX_STAGE_PARALLELISM, thread_name_prefix="outreach-stage") as executor:
+        while pending or running:
+            ready = [s for s in pending.values() if all(d in results for d in s.deps)]
+            if not ready and not running:
+                raise RuntimeError(f"Unresolvable stage dependencies: {sorted(pending)}")
+
+            for stage in ready:
+                del pending[stage.name]
+                future = executor.submit(
+                    contextvars.copy_context().run, timed, stage, dict(results)
+                )
+                running[future] = stage.name
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    for other in running:
+                        other.cancel()
+                    raise error
+                results[name] = future.result()
+
+    return results
+
+
 def _process_single_article(
     article: ArticleCandidate,
     campaign_config: CampaignConfig,
     llm_fn: Optional[Callable],
     dry_run: bool
 ) -> Optional[OutreachPackage]:
-    """Process a single article through the full pipeline."""
+    """
+    Process a single article through the full pipeline.
+
+    The steps form a dependency graph executed by _run_stage_graph:
+
+        analysis ─┬─ positioning ─┬─ strategy ─ email ─┬─ spam_check ────────┬─ quality_gate
+                  └─ author ──────┘                    └─ personalization ──┘
+
+    Positioning and author research both only need the analyzed article; the
+    spam and personalization checks both only need the drafted email, so each
+    pair runs concurrently. Per-stage wall times end up in
+    OutreachPackage.stage_timings_ms.
+    """
 
     product = campaign_config.product
+    stage_timings_ms: Dict[str, float] = {}
 
     # STEP 2: Analyze Article
-    logger.info("\n--- STEP 2: Article Analysis ---")
-    analyzed_article = analyze_article(article, product, llm_fn)
+    def run_analysis(_: Dict[str, Any]) -> ArticleCandidate:
+        logger.info("\n--- STEP 2: Article Analysis ---")
+        analyzed = analyze_article(article, product, llm_fn)
 
-    # GATE 2: Post-Analysis Validation
-    if _is_gate_enabled(campaign_config, "post_analysis"):
-        if not _validate_analysis(analyzed_article, campaign_config):
-            logger.warning("Article failed post-analysis validation")
-            return None
+        # GATE 2: Post-Analysis Validation
+        if _is_gate_enabled(campaign_config, "post_analysis"):
+            if not _validate_analysis(analyzed, campaign_config):
+                raise _ArticleRejected("Article failed post-analysis validation")
+        return analyzed
 
     # STEP 3: Product Positioning
-    logger.info("\n--- STEP 3: Product Positioning ---")
-    positioning = position_product(analyzed_article, product, llm_fn)
+    def run_positioning(r: Dict[str, Any]) -> PositioningStrategy:
+        logger.info("\n--- STEP 3: Product Positioning ---")
+        return position_product(r["analysis"], product, llm_fn)
 
     # STEP 4: Author Research
-    logger.info("\n--- STEP 4: Author Research ---")
-    author = profile_author(analyzed_article, llm_fn)
+    def run_author(r: Dict[str, Any]) -> AuthorProfile:
+        logger.info("\n--- STEP 4: Author Research ---")
+        author = profile_author(r["analysis"], llm_fn)
 
-    if not author.email and not author.linkedin_url:
-        logger.warning("No contact information found for author")
-        # Could still proceed with publication contact
-        # For now, skip articles without author contact
-        return None
+        if not author.email and not author.linkedin_url:
+            # Could still proceed with publication contact
+            # For now, skip articles without author contact
+            raise _ArticleRejected("No contact information found for author")
+        return author
 
     # STEP 5: Outreach Strategy
-    logger.info("\n--- STEP 5: Outreach Strategy ---")
-    strategy = decide_outreach_strategy(
-        analyzed_article, author, product, positioning, campaign_config, llm_fn
-    )
+    def run_strategy(r: Dict[str, Any]) -> OutreachDecision:
+        logger.info("\n--- STEP 5: Outreach Strategy ---")
+        return decide_outreach_strategy(
+            r["analysis"], r["author"], product, r["positioning"], campaign_config, llm_fn
+        )
 
     # STEP 6: Email Generation
-    logger.info("\n--- STEP 6: Email Generation ---")
-    email = write_outreach_email(
-        analyzed_article, author, product, positioning, strategy, campaign_config, llm_fn
-    )
+    def run_email(r: Dict[str, Any]) -> OutreachEmail:
+        logger.info("\n--- STEP 6: Email Generation ---")
+        email = write_outreach_email(
+            r["analysis"], r["author"], product, r["positioning"], r["strategy"], campaign_config, llm_fn
+        )
+        logger.info("\n--- GATE: Post-Email Validation ---")
+        return email
 
     # GATE 3: Post-Email Validation
-    logger.info("\n--- GATE: Post-Email Validation ---")
+    def run_spam_check(r: Dict[str, Any]) -> Tuple[float, str, dict]:
+        spam_score, spam_summary, spam_details = check_spam_score(r["email"], llm_fn)
+        logger.info(f"Spam score: {spam_score:.2f} - {spam_summary}")
+        return spam_score, spam_summary, spam_details
+
+    def run_personalization(r: Dict[str, Any]) -> Tuple[float, str, dict]:
+        pers_score, pers_summary, pers_details = score_personalization(
+            r["email"], r["analysis"], r["author"], llm_fn
+        )
+        logger.info(f"Personalization: {pers_score:.2f} - {pers_summary}")
+        return pers_score, pers_summary, pers_details
+
+    def run_quality_gate(r: Dict[str, Any]) -> Tuple[OutreachEmail, float, float, float]:
+        email = r["email"]
+        spam_score, _, spam_details = r["spam_check"]
+        pers_score, _, pers_details = r["personalization"]
+
+        # Overall quality score
+        quality_score = _calculate_quality_score(spam_score, pers_score)
+        logger.info(f"Overall quality: {quality_score:.2f}")
+
+        # Check thresholds
+        if _is_gate_enabled(campaign_config, "post_email"):
+            gate_config = campaign_config.validation_gates.get("post_email")
+            threshold = gate_config.threshold if gate_config else 0.6
+
+            if quality_score < threshold:
+                logger.warning(f"Quality {quality_score:.2f} below threshold {threshold}")
+                if gate_config and gate_config.blocking:
+                    # Try to regenerate email
+                    email, quality_score = _attempt_email_improvement(
+                        email, spam_details, pers_details, r["analysis"], r["author"],
+                        product, r["positioning"], r["strategy"], campaign_config, llm_fn
+                    )
+                    if quality_score < threshold:
+                        raise _ArticleRejected("Email quality still below threshold after retry")
+
+        return email, spam_score, pers_score, quality_score
+
+    stages = [
+        _Stage("analysis", (), run_analysis),
+        _Stage("positioning", ("analysis",), run_positioning),
+        _Stage("author", ("analysis",), run_author),
+        _Stage("strategy", ("analysis", "author", "positioning"), run_strategy),
+        _Stage("email", ("strategy",), run_email),
+        _Stage("spam_check", ("email",), run_spam_check),
+        _Stage("personalization", ("email",), run_personalization),
+        _Stage("quality_gate", ("spam_check", "personalization"), run_quality_gate),
+    ]
+
+    try:
+        results = _run_stage_graph(stages, stage_timings_ms)
+    except _ArticleRejected as e:
+        logger.warning(str(e))
+        return None
 
-    # Spam check
-    spam_score, spam_summary, spam_details = check_spam_score(email, llm_fn)
-    logger.info(f"Spam score: {spam_score:.2f} - {spam_summary}")
+    analyzed_article = results["analysis"]
+    author = results["author"]
+    positioning = results["positioning"]
+    strategy = results["strategy"]
+    email, spam_score, pers_score, quality_score = results["quality_gate"]
 
-    # Personalization check
-    pers_score, pers_summary, pers_details = score_personalization(
-        email, analyzed_article, author, llm_fn
+    logger.info(
+        "Stage timings: " + ", ".join(f"{name}={ms:.0f}ms" for name, ms in stage_timings_ms.items())
     )
-    logger.info(f"Personalization: {pers_score:.2f} - {pers_summary}")
-
-    # Overall quality score
-    quality_score = _calculate_quality_score(spam_score, pers_score)
-    logger.info(f"Overall quality: {quality_score:.2f}")
-
-    # Check thresholds
-    if _is_gate_enabled(campaign_config, "post_email"):
-        gate_config = campaign_config.validation_gates.get("post_email")
-        threshold = gate_config.threshold if gate_config else 0.6
-
-        if quality_score < threshold:
-            logger.warning(f"Quality {quality_score:.2f} below threshold {threshold}")
-            if gate_config and gate_config.blocking:
-                # Try to regenerate email
-                email, quality_score = _attempt_email_improvement(
-                    email, spam_details, pers_details, analyzed_article, author,
-                    product, positioning, strategy, campaign_config, llm_fn
-                )
-                if quality_score < threshold:
-                    logger.warning("Email quality still below threshold after retry")
-                    return None
 
     # STEP 7: Create Outreach Package
     logger.info("\n--- STEP 7: Creating Package ---")
@@ -278,6 +504,7 @@ def _process_single_article(
         positioning_reasoning=positioning.reasoning,
         strategy_reasoning=strategy.reasoning,
         email_generation_reasoning=f"Angle: {strategy.email_angle.value}, Personalization: {strategy.personalization_level}",
+        stage_timings_ms=stage_timings_ms,
         created_at=datetime.now()
     )
 
@@ -384,31 +611,39 @@ def _attempt_email_improvement(
 def build_outreach_batch(
     campaign_config: CampaignConfig,
     max_packages: int = 5,
-    use_llm: bool = True
+    use_llm: bool = True,
+    max_workers: Optional[int] = None
 ) -> List[OutreachPackage]:
     """
     Build multiple outreach packages in batch.
 
-    Convenience function for processing multiple articles.
+    Convenience function for processing multiple articles concurrently.
+    By default every article gets its own worker (up to MAX_ARTICLE_WORKERS),
+    so a batch takes roughly as long as its slowest articles.
     """
     return build_outreach_package(
         campaign_config=campaign_config,
         max_articles_to_process=max_packages,
-        use_llm=use_llm
+        use_llm=use_llm,
+        max_workers=max_workers or max_packages
     )
 
 
 def get_pipeline_status(campaign_id: str) -> dict:
     """Get status of pipeline for a campaign."""
-    from pr_outreach.io.outreach_datastore import get_campaign_stats
+    from pr_outreach.io.outreach_datastore import (
+        get_campaign_stats,
+        get_pending_emails,
+        get_all_outreach
+    )
 
     stats = get_campaign_stats(campaign_id)
 
     return {
         "campaign_id": campaign_id,
         "total_generated": stats.total_emails_generated,
-        "pending_review": 0,  # Would query datastore
-        "approved": 0,
+        "pending_review": len(get_pending_emails(campaign_id)),
+        "approved": len(get_all_outreach(campaign_id, OutreachStatus.APPROVED)),
         "sent": stats.total_emails_sent,
         "replied": stats.total_replies,
         "reply_rate": stats.reply_rate
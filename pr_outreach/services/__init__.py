@@ -1,18 +1,22 @@
 """PR Outreach Services - External integrations."""
-from .article_scraper import scrape_article
+from .article_scraper import scrape_article, scrape_many
 from .author_finder import find_author_contacts
 from .contact_validator import validate_email, validate_contact
-from .domain_analyzer import analyze_domain
-from .email_sender import send_email
+from .domain_analyzer import analyze_domain, analyze_domains
+from .email_sender import send_email, send_emails, process_send_queue
 from .response_tracker import track_response, check_responses
 
 __all__ = [
     "scrape_article",
+    "scrape_many",
     "find_author_contacts",
     "validate_email",
     "validate_contact",
     "analyze_domain",
+    "analyze_domains",
     "send_email",
+    "send_emails",
+    "process_send_queue",
     "track_response",
     "check_responses",
 ]
@@ -2,15 +2,22 @@
 Article Scraper Service - Extract content from URLs.
 
 Uses newspaper3k and trafilatura for robust article extraction.
-Fallback chain: newspaper3k -> trafilatura -> basic requests
+Fallback chain: newspaper3k -> trafilatura -> BeautifulSoup
+
+Each page is downloaded once through page_fetcher (pooled session, on-disk
+HTML cache with conditional revalidation) and the same HTML is handed to
+every extractor. scrape_many() scrapes a list of URLs concurrently.
 """
 
 import warnings
 warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL")
 
 import re
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+
+from pr_outreach.services.page_fetcher import fetch_page, POOL_MAXSIZE
 from yt_autopilot.core.logger import logger, log_fallback
 
 # Optional imports with fallbacks
@@ -28,7 +35,6 @@ except ImportError:
     TRAFILATURA_AVAILABLE = False
     logger.warning("trafilatura not available, will use basic scraper")
 
-import requests
 from bs4 import BeautifulSoup
 
 
@@ -68,22 +74,38 @@ def scrape_article(url: str, timeout: int = 30) -> Dict:
             "error": "LinkedIn requires authentication"
         }
 
+    # Download once, shared by all extractors
+    page = fetch_page(url, timeout=timeout)
+    if not page.ok:
+        log_fallback(
+            component="ARTICLE_SCRAPER",
+            fallback_type="DOWNLOAD_FAILED",
+            reason=f"Could not download {url}: {page.error}",
+            impact="HIGH"
+        )
+        logger.warning(f"  ✗ Download failed for {url}: {page.error}")
+        return _empty_result("download", page.error or "Empty response")
+
+    html = page.text
+    if page.from_cache:
+        logger.info("  ↺ Using cached HTML")
+
     # Try newspaper3k first
     if NEWSPAPER_AVAILABLE:
-        result = _scrape_with_newspaper(url, timeout)
+        result = _scrape_with_newspaper(url, html)
         if result["success"]:
             logger.info(f"  ✓ Scraped with newspaper3k: {result['word_count']} words")
             return result
 
     # Try trafilatura as fallback
     if TRAFILATURA_AVAILABLE:
-        result = _scrape_with_trafilatura(url, timeout)
+        result = _scrape_with_trafilatura(url, html)
         if result["success"]:
             logger.info(f"  ✓ Scraped with trafilatura: {result['word_count']} words")
             return result
 
     # Basic fallback
-    result = _scrape_with_beautifulsoup(url, timeout)
+    result = _scrape_with_beautifulsoup(url, page.html)
     if result["success"]:
         logger.info(f"  ✓ Scraped with BeautifulSoup: {result['word_count']} words")
     else:
@@ -98,11 +120,49 @@ def scrape_article(url: str, timeout: int = 30) -> Dict:
     return result
 
 
-def _scrape_with_newspaper(url: str, timeout: int) -> Dict:
+def scrape_many(urls: List[str], max_workers: int = POOL_MAXSIZE, timeout: int = 30) -> List[Dict]:
+    """
+    Scrape several URLs concurrently.
+
+    Duplicate URLs are scraped once. Downloads share the pooled session and
+    HTML cache of scrape_article.
+
+    Args:
+        urls: Article URLs
+        max_workers: Concurrent downloads/extractions
+        timeout: Request timeout in seconds
+
+    Returns:
+        scrape_article results in the same order as urls
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return []
+
+    workers = max(1, min(max_workers, len(unique_urls)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper") as executor:
+        results = dict(zip(
+            unique_urls,
+            executor.map(lambda u: _scrape_isolated(u, timeout), unique_urls)
+        ))
+
+    return [results[url] for url in urls]
+
+
+def _scrape_isolated(url: str, timeout: int) -> Dict:
+    """scrape_article that never raises (one bad URL must not fail a batch)."""
+    try:
+        return scrape_article(url, timeout)
+    except Exception as e:
+        logger.warning(f"  ✗ Scraping crashed for {url}: {e}")
+        return _empty_result("error", str(e))
+
+
+def _scrape_with_newspaper(url: str, html: str) -> Dict:
     """Scrape using newspaper3k."""
     try:
         article = Article(url)
-        article.download()
+        article.download(input_html=html)
         article.parse()
 
         content = article.text or ""
@@ -121,15 +181,12 @@ def _scrape_with_newspaper(url: str, timeout: int) -> Dict:
         return _empty_result("newspaper3k", str(e))
 
 
-def _scrape_with_trafilatura(url: str, timeout: int) -> Dict:
+def _scrape_with_trafilatura(url: str, html: str) -> Dict:
     """Scrape using trafilatura."""
     try:
-        downloaded = trafilatura.fetch_url(url)
-        if not downloaded:
-            return _empty_result("trafilatura", "Download failed")
-
         content = trafilatura.extract(
-            downloaded,
+            html,
+            url=url,
             include_comments=False,
             include_tables=False
         )
@@ -138,7 +195,7 @@ def _scrape_with_trafilatura(url: str, timeout: int) -> Dict:
             return _empty_result("trafilatura", "Extraction failed")
 
         # Try to get metadata
-        metadata = trafilatura.extract_metadata(downloaded)
+        metadata = trafilatura.extract_metadata(html)
 
         return {
             "title": metadata.title if metadata else "",
@@ -155,16 +212,10 @@ def _scrape_with_trafilatura(url: str, timeout: int) -> Dict:
         return _empty_result("trafilatura", str(e))
 
 
-def _scrape_with_beautifulsoup(url: str, timeout: int) -> Dict:
+def _scrape_with_beautifulsoup(url: str, html: bytes) -> Dict:
     """Basic scraping with BeautifulSoup."""
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(html, "html.parser")
 
         # Remove script and style elements
         for element in soup(["script", "style", "nav", "footer", "header"]):
@@ -259,9 +310,10 @@ def extract_author_from_page(url: str) -> Optional[Tuple[str, Optional[str]]]:
         Tuple of (author_name, author_profile_url) or None
     """
     try:
-        headers = {"User-Agent": "Mozilla/5.0"}
-        response = requests.get(url, headers=headers, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
+        page = fetch_page(url, timeout=15)
+        if not page.ok:
+            return None
+        soup = BeautifulSoup(page.html, "html.parser")
 
         # Try various author patterns
         author_name = None
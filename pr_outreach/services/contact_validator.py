@@ -2,17 +2,44 @@
 Contact Validator Service - Validate email addresses and contacts.
 
 Uses email verification services to check deliverability.
+
+Domain checks (disposable list, MX records) are cached per domain with a TTL,
+so addresses on the same domain share one DNS query. bulk_validate_emails()
+groups addresses by domain and resolves the uncached domains concurrently
+before validating each address.
 """
 
 import re
 import os
+import threading
+import time
 import dns.resolver
-from typing import Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from yt_autopilot.core.logger import logger, log_fallback
 
 import requests
 
 
+DISPOSABLE_DOMAINS = frozenset({
+    "mailinator.com", "guerrillamail.com", "tempmail.com",
+    "throwaway.email", "fakeinbox.com", "temp-mail.org",
+    "10minutemail.com", "yopmail.com", "trashmail.com"
+})
+
+# MX cache TTLs: definitive answers vs. timeouts/transient resolver errors
+MX_CACHE_TTL_SECONDS = 6 * 3600
+MX_TRANSIENT_TTL_SECONDS = 300
+
+# DNS query timeout and concurrent lookups in bulk_validate_emails
+MX_LOOKUP_TIMEOUT_SECONDS = 5.0
+MX_MAX_WORKERS = 16
+
+# domain -> (has_mx, expires_at)
+_mx_cache: Dict[str, Tuple[bool, float]] = {}
+_mx_cache_lock = threading.Lock()
+
+
 def validate_email(email: str) -> Tuple[bool, float, str]:
     """
     Validate an email address.
@@ -101,22 +128,47 @@ def _is_valid_format(email: str) -> bool:
 
 def _is_disposable_domain(email: str) -> bool:
     """Check if email uses a disposable domain."""
-    disposable_domains = {
-        "mailinator.com", "guerrillamail.com", "tempmail.com",
-        "throwaway.email", "fakeinbox.com", "temp-mail.org",
-        "10minutemail.com", "yopmail.com", "trashmail.com"
-    }
     domain = email.split("@")[1].lower()
-    return domain in disposable_domains
+    return domain in DISPOSABLE_DOMAINS
 
 
 def _check_mx_records(domain: str) -> bool:
-    """Check if domain has MX records."""
+    """Check if domain has MX records (cached per domain)."""
+    domain = domain.lower()
+    cached = _cached_mx(domain)
+    if cached is not None:
+        return cached
+
+    has_mx, ttl = _resolve_mx(domain)
+    with _mx_cache_lock:
+        _mx_cache[domain] = (has_mx, time.time() + ttl)
+    return has_mx
+
+
+def _cached_mx(domain: str) -> Optional[bool]:
+    """Cached MX result for domain, or None if missing/expired."""
+    with _mx_cache_lock:
+        entry = _mx_cache.get(domain)
+    if entry and entry[1] > time.time():
+        return entry[0]
+    return None
+
+
+def _resolve_mx(domain: str) -> Tuple[bool, float]:
+    """
+    Query MX records.
+
+    Returns:
+        Tuple of (has_mx, cache TTL in seconds)
+    """
     try:
-        dns.resolver.resolve(domain, 'MX')
-        return True
-    except Exception:
-        return False
+        dns.resolver.resolve(domain, 'MX', lifetime=MX_LOOKUP_TIMEOUT_SECONDS)
+        return (True, MX_CACHE_TTL_SECONDS)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        return (False, MX_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.debug(f"MX lookup failed for {domain}: {e}")
+        return (False, MX_TRANSIENT_TTL_SECONDS)
 
 
 def _verify_with_api(email: str) -> Tuple[bool, float, str]:
@@ -198,12 +250,22 @@ def _is_valid_twitter_handle(handle: str) -> bool:
     return bool(re.match(pattern, handle))
 
 
-def bulk_validate_emails(emails: list) -> Dict:
+def bulk_validate_emails(emails: list, max_workers: int = MX_MAX_WORKERS) -> Dict:
     """
     Validate multiple emails efficiently.
 
+    Addresses are grouped by domain and every uncached, non-disposable domain
+    is resolved once, concurrently, before the per-address checks run.
+
+    Args:
+        emails: Email addresses (duplicates are validated once)
+        max_workers: Concurrent MX lookups
+
     Returns dict mapping email -> validation result
     """
+    emails = list(dict.fromkeys(emails))
+    _prefetch_mx_records(_domains_to_resolve(emails), max_workers)
+
     results = {}
     for email in emails:
         is_valid, confidence, reason = validate_email(email)
@@ -213,3 +275,25 @@ def bulk_validate_emails(emails: list) -> Dict:
             "reason": reason
         }
     return results
+
+
+def _domains_to_resolve(emails: List[str]) -> List[str]:
+    """Distinct domains of well-formed, non-disposable addresses."""
+    domains = {}
+    for email in emails:
+        if _is_valid_format(email) and not _is_disposable_domain(email):
+            domains[email.split("@")[1].lower()] = True
+    return list(domains)
+
+
+def _prefetch_mx_records(domains: List[str], max_workers: int) -> None:
+    """Resolves uncached domains concurrently into the MX cache."""
+    pending = [domain for domain in domains if _cached_mx(domain) is None]
+    if not pending:
+        return
+
+    logger.info(f"Resolving MX records for {len(pending)} domain(s) "
+                f"({len(domains) - len(pending)} cached)")
+    workers = max(1, min(max_workers, len(pending)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mx") as executor:
+        list(executor.map(_check_mx_records, pending))
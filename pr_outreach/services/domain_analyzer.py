@@ -2,23 +2,113 @@
 Domain Analyzer Service - Analyze domain authority and metrics.
 
 Uses Ahrefs, Moz, or fallback estimation.
+
+Provider results are cached on disk (data/domain_metrics_cache.json) with a
+TTL per source, including short-lived "miss" entries so a failing provider is
+not re-queried for every article. Known domains are resolved from a
+module-level authority table built once at import. analyze_domains() resolves
+a whole discovery run at once: domains are deduplicated first and Moz is
+queried with one multi-target request.
 """
 
+import json
 import os
 import re
-from typing import Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 from yt_autopilot.core.logger import logger, log_fallback
 
 import requests
 
 
-def analyze_domain(url_or_domain: str) -> Dict:
+DOMAIN_METRICS_CACHE_PATH = "data/domain_metrics_cache.json"
+
+# Cache TTL per metrics source ("miss" = every provider failed or unconfigured)
+DOMAIN_CACHE_TTL_SECONDS = {
+    "ahrefs": 7 * 24 * 3600,
+    "moz": 7 * 24 * 3600,
+    "miss": 3600,
+}
+
+# Moz url_metrics accepts up to 50 targets per request
+MOZ_BATCH_SIZE = 50
+
+# Concurrent Ahrefs lookups in analyze_domains
+AHREFS_MAX_WORKERS = 8
+
+# Known high-authority domains
+HIGH_AUTHORITY_DOMAINS: Dict[str, float] = {
+    # Major publications (DA 90+)
+    "nytimes.com": 95,
+    "washingtonpost.com": 94,
+    "theguardian.com": 94,
+    "bbc.com": 95,
+    "cnn.com": 94,
+    "forbes.com": 94,
+    "bloomberg.com": 93,
+
+    # Tech publications (DA 80-95)
+    "techcrunch.com": 93,
+    "theverge.com": 92,
+    "wired.com": 93,
+    "engadget.com": 91,
+    "arstechnica.com": 90,
+    "venturebeat.com": 89,
+    "zdnet.com": 92,
+    "cnet.com": 93,
+    "mashable.com": 92,
+    "gizmodo.com": 91,
+
+    # Business (DA 85-95)
+    "businessinsider.com": 92,
+    "entrepreneur.com": 88,
+    "inc.com": 91,
+    "fastcompany.com": 90,
+    "hbr.org": 91,
+
+    # Tech blogs (DA 60-80)
+    "producthunt.com": 85,
+    "medium.com": 94,
+    "dev.to": 75,
+    "hackernoon.com": 78,
+    "freecodecamp.org": 82,
+
+    # Fitness/Health (DA 70-90)
+    "healthline.com": 91,
+    "webmd.com": 93,
+    "menshealth.com": 88,
+    "womenshealthmag.com": 87,
+    "shape.com": 84,
+    "self.com": 86,
+    "bodybuilding.com": 80,
+    "myfitnesspal.com": 82,
+
+    # General high authority
+    "wikipedia.org": 100,
+    "github.com": 96,
+    "reddit.com": 97,
+    "quora.com": 93,
+    "linkedin.com": 98,
+}
+
+
+# Precomputed estimation results for known domains (built once at import)
+_AUTHORITY_TABLE: Dict[str, Dict] = {}
+
+_cache: Optional[Dict[str, Dict]] = None
+_cache_lock = threading.Lock()
+
+
+def analyze_domain(url_or_domain: str, use_cache: bool = True) -> Dict:
     """
     Analyze a domain's authority and metrics.
 
     Args:
         url_or_domain: Full URL or domain name
+        use_cache: Reuse cached provider metrics within their TTL
 
     Returns:
         Dict with:
@@ -28,11 +118,93 @@ def analyze_domain(url_or_domain: str) -> Dict:
         - source: Where metrics came from
         - category: Domain category (news, blog, etc.)
     """
-    # Extract domain from URL
-    domain = _extract_domain(url_or_domain)
-    logger.info(f"Analyzing domain: {domain}")
+    return analyze_domains([url_or_domain], use_cache=use_cache)[url_or_domain]
+
+
+def analyze_domains(urls_or_domains: Iterable[str], use_cache: bool = True) -> Dict[str, Dict]:
+    """
+    Analyze many domains at once.
+
+    Domains are deduplicated before any provider is called; uncached domains
+    go to Ahrefs (concurrently), then Moz (one request per MOZ_BATCH_SIZE
+    domains), then estimation. The cache file is written once per call.
+
+    Args:
+        urls_or_domains: URLs and/or domain names (duplicates allowed)
+        use_cache: Reuse cached provider metrics within their TTL
 
-    result = {
+    Returns:
+        Dict input URL/domain -> analyze_domain result (inputs on the same
+        domain share one result dict)
+    """
+    inputs = list(urls_or_domains)
+    domain_of = {item: _extract_domain(item) for item in inputs}
+    domains = list(dict.fromkeys(domain_of.values()))
+    results: Dict[str, Dict] = {}
+    cache = _load_cache()
+    now = time.time()
+
+    pending = []
+    for domain in domains:
+        entry = cache.get(domain) if use_cache else None
+        if entry and now - entry.get("fetched_at", 0) < DOMAIN_CACHE_TTL_SECONDS.get(entry.get("source"), 0):
+            if entry["source"] == "miss":
+                results[domain] = _estimated_result(domain)
+            else:
+                results[domain] = _provider_result(domain, entry["source"], entry["metrics"])
+        else:
+            pending.append(domain)
+
+    if len(domains) > 1:
+        logger.info(f"Analyzing {len(domains)} domain(s): {len(domains) - len(pending)} cached")
+
+    ahrefs_configured = bool(os.getenv("AHREFS_API_KEY"))
+    moz_configured = bool(os.getenv("MOZ_ACCESS_ID") and os.getenv("MOZ_SECRET_KEY"))
+
+    if pending:
+        fetched: Dict[str, Dict] = {}
+
+        # Try Ahrefs API
+        if ahrefs_configured:
+            workers = max(1, min(AHREFS_MAX_WORKERS, len(pending)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ahrefs") as executor:
+                for domain, metrics in zip(pending, executor.map(_get_ahrefs_metrics, pending)):
+                    if metrics:
+                        fetched[domain] = {"source": "ahrefs", "metrics": metrics}
+
+        # Try Moz API
+        remaining = [d for d in pending if d not in fetched]
+        if remaining and moz_configured:
+            for start in range(0, len(remaining), MOZ_BATCH_SIZE):
+                batch = remaining[start:start + MOZ_BATCH_SIZE]
+                for domain, metrics in _get_moz_metrics_batch(batch).items():
+                    fetched[domain] = {"source": "moz", "metrics": metrics}
+
+        for domain in pending:
+            entry = fetched.get(domain)
+            if entry:
+                results[domain] = _provider_result(domain, entry["source"], entry["metrics"])
+                logger.info(f"  ✓ Got {entry['source'].capitalize()} metrics for {domain}: "
+                            f"DA={results[domain]['domain_authority']}")
+            else:
+                # Fallback to estimation based on known domains
+                results[domain] = _estimated_result(domain)
+                logger.info(f"  ⚠️ Estimated metrics for {domain}: DA={results[domain]['domain_authority']}")
+
+        # Remember provider failures briefly (nothing to remember without providers)
+        if fetched or ahrefs_configured or moz_configured:
+            with _cache_lock:
+                for domain in pending:
+                    entry = fetched.get(domain) or {"source": "miss", "metrics": {}}
+                    entry["fetched_at"] = now
+                    cache[domain] = entry
+            _save_cache()
+
+    return {item: results[domain] for item, domain in domain_of.items()}
+
+
+def _base_result(domain: str) -> Dict:
+    return {
         "domain": domain,
         "domain_authority": 0.0,
         "monthly_traffic": 0,
@@ -42,31 +214,62 @@ def analyze_domain(url_or_domain: str) -> Dict:
         "is_high_authority": False
     }
 
-    # Try Ahrefs API
-    ahrefs_result = _get_ahrefs_metrics(domain)
-    if ahrefs_result:
-        result.update(ahrefs_result)
-        result["source"] = "ahrefs"
-        logger.info(f"  ✓ Got Ahrefs metrics: DA={result['domain_authority']}")
-        return result
-
-    # Try Moz API
-    moz_result = _get_moz_metrics(domain)
-    if moz_result:
-        result.update(moz_result)
-        result["source"] = "moz"
-        logger.info(f"  ✓ Got Moz metrics: DA={result['domain_authority']}")
-        return result
-
-    # Fallback to estimation based on known domains
-    estimated = _estimate_domain_authority(domain)
-    result.update(estimated)
-    result["source"] = "estimation"
-    logger.info(f"  ⚠️ Estimated metrics: DA={result['domain_authority']}")
 
+def _provider_result(domain: str, source: str, metrics: Dict) -> Dict:
+    result = _base_result(domain)
+    result.update(metrics)
+    result["source"] = source
     return result
 
 
+def _estimated_result(domain: str) -> Dict:
+    result = _base_result(domain)
+    result.update(_estimate_domain_authority(domain))
+    result["source"] = "estimation"
+    return result
+
+
+def _get_cache_path() -> str:
+    return os.getenv("DOMAIN_METRICS_CACHE_PATH", DOMAIN_METRICS_CACHE_PATH)
+
+
+def _load_cache() -> Dict[str, Dict]:
+    """Loads the domain metrics cache once per process."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = {}
+            path = _get_cache_path()
+            if os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        _cache = json.load(f)
+                except (json.JSONDecodeError, IOError) as e:
+                    logger.warning(f"Domain metrics cache unreadable ({e}) - starting empty")
+        return _cache
+
+
+def _save_cache() -> None:
+    """Writes the domain metrics cache atomically."""
+    path = _get_cache_path()
+    with _cache_lock:
+        if _cache is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(_cache, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log_fallback(
+                component="DOMAIN_ANALYZER",
+                fallback_type="CACHE_NOT_SAVED",
+                reason=str(e),
+                impact="LOW"
+            )
+
+
 def _extract_domain(url_or_domain: str) -> str:
     """Extract clean domain from URL or domain string."""
     if "://" in url_or_domain:
@@ -125,36 +328,49 @@ def _get_moz_metrics(domain: str) -> Optional[Dict]:
 
     Requires MOZ_ACCESS_ID and MOZ_SECRET_KEY environment variables.
     """
+    return _get_moz_metrics_batch([domain]).get(domain)
+
+
+def _get_moz_metrics_batch(domains: List[str]) -> Dict[str, Dict]:
+    """
+    Get metrics for several domains with one Moz API request.
+
+    Returns:
+        Dict domain -> metrics (domains without results are omitted)
+    """
     access_id = os.getenv("MOZ_ACCESS_ID")
     secret_key = os.getenv("MOZ_SECRET_KEY")
 
     if not access_id or not secret_key:
         logger.debug("Moz API credentials not configured")
-        return None
+        return {}
 
     try:
         url = "https://lsapi.seomoz.com/v2/url_metrics"
         data = {
-            "targets": [domain]
+            "targets": domains
         }
         auth = (access_id, secret_key)
 
         response = requests.post(url, json=data, auth=auth, timeout=15)
         if response.status_code == 200:
             results = response.json().get("results", [])
-            if results:
-                metrics = results[0]
-                return {
+            # Results are returned in target order
+            return {
+                domain: {
                     "domain_authority": metrics.get("domain_authority", 0),
                     "monthly_traffic": 0,  # Moz doesn't provide traffic
                     "backlinks": metrics.get("external_links_to_root_domain", 0),
                     "is_high_authority": metrics.get("domain_authority", 0) >= 50
                 }
+                for domain, metrics in zip(domains, results)
+                if metrics
+            }
 
     except Exception as e:
         logger.debug(f"Moz API failed: {e}")
 
-    return None
+    return {}
 
 
 def _estimate_domain_authority(domain: str) -> Dict:
@@ -163,77 +379,18 @@ def _estimate_domain_authority(domain: str) -> Dict:
 
     This is a fallback when no API is available.
     """
-    # Known high-authority domains
-    high_authority_domains = {
-        # Major publications (DA 90+)
-        "nytimes.com": 95,
-        "washingtonpost.com": 94,
-        "theguardian.com": 94,
-        "bbc.com": 95,
-        "cnn.com": 94,
-        "forbes.com": 94,
-        "bloomberg.com": 93,
-
-        # Tech publications (DA 80-95)
-        "techcrunch.com": 93,
-        "theverge.com": 92,
-        "wired.com": 93,
-        "engadget.com": 91,
-        "arstechnica.com": 90,
-        "venturebeat.com": 89,
-        "zdnet.com": 92,
-        "cnet.com": 93,
-        "mashable.com": 92,
-        "gizmodo.com": 91,
-
-        # Business (DA 85-95)
-        "businessinsider.com": 92,
-        "entrepreneur.com": 88,
-        "inc.com": 91,
-        "fastcompany.com": 90,
-        "hbr.org": 91,
-
-        # Tech blogs (DA 60-80)
-        "producthunt.com": 85,
-        "medium.com": 94,
-        "dev.to": 75,
-        "hackernoon.com": 78,
-        "freecodecamp.org": 82,
-
-        # Fitness/Health (DA 70-90)
-        "healthline.com": 91,
-        "webmd.com": 93,
-        "menshealth.com": 88,
-        "womenshealthmag.com": 87,
-        "shape.com": 84,
-        "self.com": 86,
-        "bodybuilding.com": 80,
-        "myfitnesspal.com": 82,
-
-        # General high authority
-        "wikipedia.org": 100,
-        "github.com": 96,
-        "reddit.com": 97,
-        "quora.com": 93,
-        "linkedin.com": 98,
-    }
-
     # Check exact match
-    if domain in high_authority_domains:
-        da = high_authority_domains[domain]
-        return {
-            "domain_authority": da,
-            "monthly_traffic": _estimate_traffic_from_da(da),
-            "backlinks": 0,
-            "is_high_authority": da >= 50,
-            "category": _guess_category(domain)
-        }
-
-    # Check subdomain of known domain
-    for known_domain, da in high_authority_domains.items():
-        if domain.endswith(f".{known_domain}"):
+    known = _AUTHORITY_TABLE.get(domain)
+    if known:
+        return dict(known)
+
+    # Check subdomain of known domain (walk parent domains, longest first)
+    labels = domain.split(".")
+    for i in range(1, len(labels) - 1):
+        parent = _AUTHORITY_TABLE.get(".".join(labels[i:]))
+        if parent:
             # Subdomains typically have lower DA
-            adjusted_da = max(da - 15, 30)
+            adjusted_da = max(parent["domain_authority"] - 15, 30)
             return {
                 "domain_authority": adjusted_da,
                 "monthly_traffic": _estimate_traffic_from_da(adjusted_da),
@@ -332,3 +489,18 @@ def is_high_authority_domain(domain: str, threshold: float = 50) -> bool:
     """Check if domain is high authority."""
     result = analyze_domain(domain)
     return result.get("domain_authority", 0) >= threshold
+
+
+def _build_authority_table() -> None:
+    """Precomputes estimation results for HIGH_AUTHORITY_DOMAINS."""
+    for domain, da in HIGH_AUTHORITY_DOMAINS.items():
+        _AUTHORITY_TABLE[domain] = {
+            "domain_authority": da,
+            "monthly_traffic": _estimate_traffic_from_da(da),
+            "backlinks": 0,
+            "is_high_authority": da >= 50,
+            "category": _guess_category(domain)
+        }
+
+
+_build_authority_table()
@@ -5,17 +5,310 @@ Supports:
 - SendGrid API
 - Mailgun API
 - SMTP fallback
+
+Provider clients are built once from the environment and reused: the API
+providers share a pooled HTTP session, SMTP keeps one logged-in connection
+open across messages (reconnecting when the server drops it). Each provider
+has its own rate limit (SENDGRID_RATE_PER_SECOND, MAILGUN_RATE_PER_SECOND,
+SMTP_RATE_PER_SECOND), enforced across threads.
+
+send_emails() sends a list of messages, using one SendGrid request (per-
+recipient substitutions) or one Mailgun request (recipient-variables) per
+batch where possible. process_send_queue() drains the durable send queue
+(pr_outreach.io.send_queue) with a worker pool; sends are idempotent per
+outreach_id.
+
+A message only falls through to the next provider when the request
+certainly failed before the provider could accept it (connection never
+established, 4xx rejection). A read timeout or 5xx after the request went
+out may still have been delivered: the message is reported as uncertain
+(success None) and left for reconciliation instead of being sent twice.
 """
 
+import json
 import os
 import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from yt_autopilot.core.logger import logger, log_fallback
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+
+# Default sends per second per provider (override with <PROVIDER>_RATE_PER_SECOND)
+DEFAULT_RATE_PER_SECOND = {
+    "sendgrid": 10.0,
+    "mailgun": 5.0,
+    "smtp": 2.0,
+}
+
+# Messages per provider request
+SENDGRID_BATCH_SIZE = 100
+MAILGUN_BATCH_SIZE = 500
+
+# SendGrid caps substitutions at 10,000 bytes per personalization
+SENDGRID_MAX_SUBSTITUTION_BYTES = 10_000
+
+# Queue workers and emails claimed per worker iteration
+SEND_MAX_WORKERS = 4
+SEND_CLAIM_SIZE = 20
+
+# Result of one message: (success, message_id_or_error); success is None
+# when the provider may have accepted it (timeout or 5xx after sending)
+SendResult = Tuple[Optional[bool], str]
+
+# Error prefix of uncertain results
+DELIVERY_UNKNOWN = "Delivery unknown"
+
+_providers: Optional[List["_Provider"]] = None
+_providers_lock = threading.Lock()
+
+# Serializes on_result callbacks from queue workers
+_callback_lock = threading.Lock()
+
+
+class _RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads."""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, count: int = 1) -> None:
+        """Waits for a slot covering `count` sends."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval * count
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _Provider:
+    """One configured email provider."""
+
+    name = ""
+    batch_size = 1
+
+    def __init__(self):
+        env_rate = os.getenv(f"{self.name.upper()}_RATE_PER_SECOND")
+        rate = float(env_rate) if env_rate else DEFAULT_RATE_PER_SECOND[self.name]
+        self.rate_limiter = _RateLimiter(rate)
+
+    def send(self, messages: List[Dict]) -> List[SendResult]:
+        """Sends up to batch_size messages; one result per message."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class _SendGridProvider(_Provider):
+    name = "sendgrid"
+    batch_size = SENDGRID_BATCH_SIZE
+    url = "https://api.sendgrid.com/v3/mail/send"
+
+    def __init__(self, api_key: str, session: requests.Session):
+        super().__init__()
+        self.api_key = api_key
+        self.session = session
+
+    def send(self, messages: List[Dict]) -> List[SendResult]:
+        if len(messages) > 1 and _can_merge(messages) and all(
+            len(m["body"].encode("utf-8")) + len(m["subject"].encode("utf-8")) < SENDGRID_MAX_SUBSTITUTION_BYTES
+            for m in messages
+        ):
+            self.rate_limiter.acquire(len(messages))
+            success, result = _send_via_sendgrid_batch(self.session, self.api_key, messages)
+            return [(success, result)] * len(messages)
+
+        results = []
+        for m in messages:
+            self.rate_limiter.acquire()
+            results.append(_send_via_sendgrid(
+                self.api_key, m["to_email"], m["subject"], m["body"],
+                m["from_email"], m["from_name"], m.get("reply_to"),
+                m.get("track_opens", True), m.get("track_clicks", False),
+                session=self.session
+            ))
+        return results
+
+
+class _MailgunProvider(_Provider):
+    name = "mailgun"
+    batch_size = MAILGUN_BATCH_SIZE
+
+    def __init__(self, api_key: str, domain: str, session: requests.Session):
+        super().__init__()
+        self.api_key = api_key
+        self.domain = domain
+        self.session = session
+
+    def send(self, messages: List[Dict]) -> List[SendResult]:
+        if len(messages) > 1 and _can_merge(messages):
+            self.rate_limiter.acquire(len(messages))
+            success, result = _send_via_mailgun_batch(self.session, self.api_key, self.domain, messages)
+            return [(success, result)] * len(messages)
+
+        results = []
+        for m in messages:
+            self.rate_limiter.acquire()
+            results.append(_send_via_mailgun(
+                self.api_key, self.domain, m["to_email"], m["subject"], m["body"],
+                m["from_email"], m["from_name"], m.get("reply_to"),
+                m.get("track_opens", True), m.get("track_clicks", False),
+                session=self.session
+            ))
+        return results
+
+
+class _SMTPProvider(_Provider):
+    """SMTP with one persistent, logged-in connection."""
+
+    name = "smtp"
+
+    def __init__(self, host: str, port: int, user: str, password: str, use_starttls: bool = True):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_starttls = use_starttls
+        self._server: Optional[smtplib.SMTP] = None
+        # smtplib connections are not thread-safe
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=30)
+        if self.use_starttls:
+            server.starttls()
+        server.login(self.user, self.password)
+        return server
+
+    def send(self, messages: List[Dict]) -> List[SendResult]:
+        results = []
+        for m in messages:
+            self.rate_limiter.acquire()
+            msg = _build_mime_message(
+                m["to_email"], m["subject"], m["body"],
+                m["from_email"], m["from_name"], m.get("reply_to")
+            )
+            with self._lock:
+                results.append(self._send_message(msg))
+        return results
+
+    def _send_message(self, msg: MIMEMultipart) -> SendResult:
+        # Make sure the connection is alive before anything is sent: a server
+        # that closed the idle connection is reconnected here, while nothing
+        # of this message has gone out yet
+        try:
+            if self._server is not None:
+                try:
+                    self._server.noop()
+                except smtplib.SMTPServerDisconnected:
+                    self._server = None
+            if self._server is None:
+                self._server = self._connect()
+        except Exception as e:
+            self.close_locked()
+            return (False, str(e))
+
+        try:
+            self._server.send_message(msg)
+            return (True, f"smtp_{datetime.now().timestamp()}")
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+            # The server answered with a rejection: not delivered
+            return (False, str(e))
+        except smtplib.SMTPServerDisconnected as e:
+            # Lost mid-transaction, possibly after DATA was accepted: never resend
+            self._server = None
+            return (None, f"{DELIVERY_UNKNOWN}: {e}")
+        except smtplib.SMTPException as e:
+            # Any other SMTP error reply (SMTPHeloError, SMTPNotSupportedError,
+            # ...) comes before DATA is accepted: not delivered. SMTPException
+            # subclasses OSError, so it must be caught before socket errors
+            self.close_locked()
+            return (False, str(e))
+        except OSError as e:
+            # Socket-level failure (timeout, reset, TLS error) mid-transaction:
+            # may have been delivered
+            self._server = None
+            return (None, f"{DELIVERY_UNKNOWN}: {e}")
+        except Exception as e:
+            self.close_locked()
+            return (False, str(e))
+
+    def close_locked(self) -> None:
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+    def close(self) -> None:
+        with self._lock:
+            self.close_locked()
+
+
+def _get_providers() -> List[_Provider]:
+    """Configured providers in priority order (built once from env)."""
+    global _providers
+    if _providers is None:
+        with _providers_lock:
+            if _providers is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=SEND_MAX_WORKERS * 2)
+                session.mount("https://", adapter)
+
+                providers: List[_Provider] = []
+                sendgrid_key = os.getenv("SENDGRID_API_KEY")
+                if sendgrid_key:
+                    providers.append(_SendGridProvider(sendgrid_key, session))
+
+                mailgun_key = os.getenv("MAILGUN_API_KEY")
+                mailgun_domain = os.getenv("MAILGUN_DOMAIN")
+                if mailgun_key and mailgun_domain:
+                    providers.append(_MailgunProvider(mailgun_key, mailgun_domain, session))
+
+                smtp_host = os.getenv("SMTP_HOST")
+                smtp_user = os.getenv("SMTP_USER")
+                smtp_pass = os.getenv("SMTP_PASSWORD")
+                if smtp_host and smtp_user and smtp_pass:
+                    port = int(os.getenv("SMTP_PORT", "587"))
+                    use_starttls = os.getenv("SMTP_STARTTLS", "true").lower() != "false"
+                    providers.append(_SMTPProvider(smtp_host, port, smtp_user, smtp_pass, use_starttls))
+
+                _providers = providers
+    return _providers
+
+
+def reset_providers() -> None:
+    """Closes provider connections and re-reads the environment on next send."""
+    global _providers
+    with _providers_lock:
+        for provider in _providers or []:
+            provider.close()
+        _providers = None
+
+
+def _can_merge(messages: List[Dict]) -> bool:
+    """True if messages share sender settings and have distinct recipients."""
+    keys = {
+        (m["from_email"], m["from_name"], m.get("reply_to"),
+         m.get("track_opens", True), m.get("track_clicks", False))
+        for m in messages
+    }
+    recipients = {m["to_email"].lower() for m in messages}
+    return len(keys) == 1 and len(recipients) == len(messages)
 
 
 def send_email(
@@ -42,70 +335,218 @@ def send_email(
         track_clicks: Enable click tracking
 
     Returns:
-        Tuple of (success, message_id_or_error, provider_used)
+        Tuple of (success, message_id_or_error, provider_used); success is
+        None if the provider may or may not have delivered it
     """
     logger.info(f"Sending email to: {to_email}")
     logger.info(f"  Subject: {subject[:50]}...")
 
-    # Set defaults from environment
-    from_email = from_email or os.getenv("OUTREACH_FROM_EMAIL")
-    from_name = from_name or os.getenv("OUTREACH_FROM_NAME", "")
+    return send_emails([{
+        "to_email": to_email,
+        "subject": subject,
+        "body": body,
+        "from_email": from_email,
+        "from_name": from_name,
+        "reply_to": reply_to,
+        "track_opens": track_opens,
+        "track_clicks": track_clicks,
+    }])[0]
 
-    if not from_email:
-        return (False, "No from_email configured", None)
 
-    # Try SendGrid first
-    sendgrid_key = os.getenv("SENDGRID_API_KEY")
-    if sendgrid_key:
-        success, result = _send_via_sendgrid(
-            sendgrid_key, to_email, subject, body,
-            from_email, from_name, reply_to,
-            track_opens, track_clicks
-        )
-        if success:
-            logger.info(f"  ✓ Sent via SendGrid: {result}")
-            return (True, result, "sendgrid")
-        else:
-            logger.warning(f"  ✗ SendGrid failed: {result}")
+def send_emails(messages: List[Dict]) -> List[Tuple[bool, str, Optional[str]]]:
+    """
+    Send several emails, batching requests per provider.
 
-    # Try Mailgun
-    mailgun_key = os.getenv("MAILGUN_API_KEY")
-    mailgun_domain = os.getenv("MAILGUN_DOMAIN")
-    if mailgun_key and mailgun_domain:
-        success, result = _send_via_mailgun(
-            mailgun_key, mailgun_domain, to_email, subject, body,
-            from_email, from_name, reply_to,
-            track_opens, track_clicks
-        )
-        if success:
-            logger.info(f"  ✓ Sent via Mailgun: {result}")
-            return (True, result, "mailgun")
+    Messages a provider rejects fall through to the next provider, as in
+    send_email. Messages whose delivery is unknown (success None) are not
+    retried anywhere.
+
+    Args:
+        messages: Dicts with to_email, subject, body and optionally
+            from_email, from_name, reply_to, track_opens, track_clicks
+
+    Returns:
+        (success, message_id_or_error, provider_used) per message, in order;
+        success is None if the provider may or may not have delivered it
+    """
+    default_from = os.getenv("OUTREACH_FROM_EMAIL")
+    default_name = os.getenv("OUTREACH_FROM_NAME", "")
+    messages = [
+        dict(m, from_email=m.get("from_email") or default_from, from_name=m.get("from_name") or default_name)
+        for m in messages
+    ]
+
+    results: List[Optional[Tuple[bool, str, Optional[str]]]] = [None] * len(messages)
+    pending = []
+    for i, m in enumerate(messages):
+        if m["from_email"]:
+            pending.append(i)
         else:
-            logger.warning(f"  ✗ Mailgun failed: {result}")
-
-    # Try SMTP fallback
-    smtp_host = os.getenv("SMTP_HOST")
-    smtp_user = os.getenv("SMTP_USER")
-    smtp_pass = os.getenv("SMTP_PASSWORD")
-    if smtp_host and smtp_user and smtp_pass:
-        success, result = _send_via_smtp(
-            smtp_host, smtp_user, smtp_pass,
-            to_email, subject, body, from_email, from_name, reply_to
+            results[i] = (False, "No from_email configured", None)
+
+    for provider in _get_providers():
+        if not pending:
+            break
+        failed = []
+        for start in range(0, len(pending), provider.batch_size):
+            chunk = pending[start:start + provider.batch_size]
+            try:
+                outcomes = provider.send([messages[i] for i in chunk])
+            except Exception as e:
+                outcomes = [(False, str(e))] * len(chunk)
+            errors, unknown = [], []
+            for i, (success, result) in zip(chunk, outcomes):
+                if success:
+                    results[i] = (True, result, provider.name)
+                elif success is None:
+                    # May have been delivered: another provider would double-send
+                    results[i] = (None, result, provider.name)
+                    unknown.append(result)
+                else:
+                    failed.append(i)
+                    errors.append(result)
+            sent = len(chunk) - len(errors) - len(unknown)
+            if sent:
+                logger.info(f"  ✓ Sent {sent} email(s) via {provider.name}")
+            if unknown:
+                logger.warning(f"  ⚠️ {provider.name}: delivery unknown for {len(unknown)} email(s), "
+                               f"not retried: {unknown[0]}")
+            if errors:
+                logger.warning(f"  ✗ {provider.name} failed for {len(errors)} email(s): {errors[0]}")
+        pending = failed
+
+    if pending:
+        # All methods failed
+        log_fallback(
+            component="EMAIL_SENDER",
+            fallback_type="ALL_PROVIDERS_FAILED",
+            reason=f"No email provider available or all failed ({len(pending)} email(s))",
+            impact="CRITICAL"
         )
-        if success:
-            logger.info(f"  ✓ Sent via SMTP")
-            return (True, result, "smtp")
-        else:
-            logger.warning(f"  ✗ SMTP failed: {result}")
+        for i in pending:
+            results[i] = (False, "No email provider available", None)
+
+    return results
+
+
+def process_send_queue(
+    campaign_id: Optional[str] = None,
+    outreach_ids: Optional[List[str]] = None,
+    max_workers: int = SEND_MAX_WORKERS,
+    on_result: Optional[Callable[[Dict, bool, str, Optional[str]], None]] = None
+) -> Dict[str, int]:
+    """
+    Send queued emails with a worker pool until the queue is drained.
+
+    Emails are claimed from pr_outreach.io.send_queue before sending and
+    their results recorded right after, so an outreach_id is sent at most
+    once even if the process crashes. Emails whose delivery is unknown are
+    marked uncertain in the queue.
+
+    Args:
+        campaign_id: Only send this campaign's emails
+        outreach_ids: Only send these ids
+        max_workers: Concurrent sender threads (provider rate limits still apply)
+        on_result: Called as on_result(entry, success, message_id_or_error,
+            provider) for each email, one call at a time
+
+    Returns:
+        Dict with "sent", "failed" and "uncertain" counts
+    """
+    from pr_outreach.io import send_queue
+
+    send_queue.recover_interrupted()
+    counts = {"sent": 0, "failed": 0, "uncertain": 0}
+    counts_lock = threading.Lock()
+
+    def worker() -> None:
+        while True:
+            entries = send_queue.claim_emails(SEND_CLAIM_SIZE, campaign_id, outreach_ids)
+            if not entries:
+                return
+            outcomes = send_emails(entries)
+            send_queue.complete_emails({
+                entry["outreach_id"]: outcome for entry, outcome in zip(entries, outcomes)
+            })
+            with counts_lock:
+                for success, _, _ in outcomes:
+                    counts["uncertain" if success is None else "sent" if success else "failed"] += 1
+            if on_result:
+                with _callback_lock:
+                    for entry, (success, result, provider) in zip(entries, outcomes):
+                        on_result(entry, success, result, provider)
+
+    workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sender") as executor:
+        for future in [executor.submit(worker) for _ in range(workers)]:
+            future.result()
+
+    return counts
+
+
+def _build_mime_message(
+    to_email: str,
+    subject: str,
+    body: str,
+    from_email: str,
+    from_name: str,
+    reply_to: Optional[str]
+) -> MIMEMultipart:
+    msg = MIMEMultipart()
+    msg["From"] = f"{from_name} <{from_email}>" if from_name else from_email
+    msg["To"] = to_email
+    msg["Subject"] = subject
+
+    if reply_to:
+        msg["Reply-To"] = reply_to
+
+    msg.attach(MIMEText(body, "plain"))
+    return msg
+
+
+def _failed_before_delivery(error: requests.RequestException) -> bool:
+    """True if the request never reached the provider (no connection, proxy or TLS failure)."""
+    if isinstance(error, (requests.exceptions.ConnectTimeout, requests.exceptions.ProxyError,
+                          requests.exceptions.SSLError)):
+        return True
+    if isinstance(error, requests.ConnectionError):
+        # "Connection aborted" can happen after the body was sent; only a
+        # connection that was never established is safe to retry
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def _post(session: Any, url: str, **kwargs) -> Tuple[Optional[requests.Response], Optional[SendResult]]:
+    """
+    POST one provider request.
 
-    # All methods failed
-    log_fallback(
-        component="EMAIL_SENDER",
-        fallback_type="ALL_PROVIDERS_FAILED",
-        reason="No email provider available or all failed",
-        impact="CRITICAL"
-    )
-    return (False, "No email provider available", None)
+    Returns:
+        (response, None), or (None, result) if the request raised: a failure
+        when it never reached the provider, uncertain otherwise
+    """
+    try:
+        return session.post(url, **kwargs), None
+    except requests.RequestException as e:
+        if _failed_before_delivery(e):
+            return None, (False, str(e))
+        return None, (None, f"{DELIVERY_UNKNOWN}: {e}")
+
+
+def _rejected(response: requests.Response) -> SendResult:
+    """Result of a non-success response (5xx may have been accepted before the error)."""
+    error = f"Status {response.status_code}: {response.text}"
+    if response.status_code >= 500:
+        return (None, f"{DELIVERY_UNKNOWN}: {error}")
+    return (False, error)
+
+
+def _mailgun_message_id(response: requests.Response) -> str:
+    try:
+        return response.json().get("id") or f"mg_{datetime.now().timestamp()}"
+    except ValueError:
+        # Accepted even if the body is unreadable
+        return f"mg_{datetime.now().timestamp()}"
 
 
 def _send_via_sendgrid(
@@ -117,7 +558,8 @@ def _send_via_sendgrid(
     from_name: str,
     reply_to: Optional[str],
     track_opens: bool,
-    track_clicks: bool
+    track_clicks: bool,
+    session: Optional[requests.Session] = None
 ) -> Tuple[bool, str]:
     """Send email via SendGrid API."""
     try:
@@ -150,14 +592,16 @@ def _send_via_sendgrid(
         if reply_to:
             data["reply_to"] = {"email": reply_to}
 
-        response = requests.post(url, json=data, headers=headers, timeout=30)
+        response, error = _post(session or requests, url, json=data, headers=headers, timeout=30)
+        if error:
+            return error
 
         if response.status_code in [200, 201, 202]:
             # Get message ID from headers
             message_id = response.headers.get("X-Message-Id", f"sg_{datetime.now().timestamp()}")
             return (True, message_id)
         else:
-            return (False, f"Status {response.status_code}: {response.text}")
+            return _rejected(response)
 
     except Exception as e:
         return (False, str(e))
@@ -173,7 +617,8 @@ def _send_via_mailgun(
     from_name: str,
     reply_to: Optional[str],
     track_opens: bool,
-    track_clicks: bool
+    track_clicks: bool,
+    session: Optional[requests.Session] = None
 ) -> Tuple[bool, str]:
     """Send email via Mailgun API."""
     try:
@@ -193,50 +638,129 @@ def _send_via_mailgun(
         if reply_to:
             data["h:Reply-To"] = reply_to
 
-        response = requests.post(url, auth=auth, data=data, timeout=30)
+        response, error = _post(session or requests, url, auth=auth, data=data, timeout=30)
+        if error:
+            return error
 
         if response.status_code == 200:
-            result = response.json()
-            message_id = result.get("id", f"mg_{datetime.now().timestamp()}")
+            return (True, _mailgun_message_id(response))
+        else:
+            return _rejected(response)
+
+    except Exception as e:
+        return (False, str(e))
+
+
+def _send_via_sendgrid_batch(
+    session: requests.Session,
+    api_key: str,
+    messages: List[Dict]
+) -> Tuple[bool, str]:
+    """
+    Send several emails with one SendGrid request.
+
+    Each message is one personalization; subject and body are filled in per
+    recipient through substitutions. Messages must share sender settings
+    (see _can_merge). outreach_id travels as a custom arg for event matching.
+    """
+    first = messages[0]
+    try:
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+        personalizations = []
+        for m in messages:
+            personalization = {
+                "to": [{"email": m["to_email"]}],
+                "subject": "-subject-",
+                "substitutions": {"-subject-": m["subject"], "-body-": m["body"]}
+            }
+            if m.get("outreach_id"):
+                personalization["custom_args"] = {"outreach_id": m["outreach_id"]}
+            personalizations.append(personalization)
+
+        data = {
+            "personalizations": personalizations,
+            "from": {
+                "email": first["from_email"],
+                "name": first["from_name"]
+            },
+            "content": [{
+                "type": "text/plain",
+                "value": "-body-"
+            }],
+            "tracking_settings": {
+                "open_tracking": {"enable": first.get("track_opens", True)},
+                "click_tracking": {"enable": first.get("track_clicks", False)}
+            }
+        }
+
+        if first.get("reply_to"):
+            data["reply_to"] = {"email": first["reply_to"]}
+
+        response, error = _post(session, _SendGridProvider.url, json=data, headers=headers, timeout=60)
+        if error:
+            return error
+
+        if response.status_code in [200, 201, 202]:
+            message_id = response.headers.get("X-Message-Id", f"sg_{datetime.now().timestamp()}")
             return (True, message_id)
         else:
-            return (False, f"Status {response.status_code}: {response.text}")
+            return _rejected(response)
 
     except Exception as e:
         return (False, str(e))
 
 
-def _send_via_smtp(
-    host: str,
-    user: str,
-    password: str,
-    to_email: str,
-    subject: str,
-    body: str,
-    from_email: str,
-    from_name: str,
-    reply_to: Optional[str]
+def _send_via_mailgun_batch(
+    session: requests.Session,
+    api_key: str,
+    domain: str,
+    messages: List[Dict]
 ) -> Tuple[bool, str]:
-    """Send email via SMTP."""
+    """
+    Send several emails with one Mailgun batch request.
+
+    Uses recipient-variables, so each recipient only sees their own address,
+    subject and body. Messages must share sender settings (see _can_merge).
+    """
+    first = messages[0]
     try:
-        port = int(os.getenv("SMTP_PORT", "587"))
+        url = f"https://api.mailgun.net/v3/{domain}/messages"
 
-        msg = MIMEMultipart()
-        msg["From"] = f"{from_name} <{from_email}>" if from_name else from_email
-        msg["To"] = to_email
-        msg["Subject"] = subject
+        recipient_variables = {
+            m["to_email"]: {
+                "subject": m["subject"],
+                "body": m["body"],
+                "outreach_id": m.get("outreach_id", "")
+            }
+            for m in messages
+        }
 
-        if reply_to:
-            msg["Reply-To"] = reply_to
+        data = {
+            "from": f"{first['from_name']} <{first['from_email']}>" if first["from_name"] else first["from_email"],
+            "to": [m["to_email"] for m in messages],
+            "subject": "%recipient.subject%",
+            "text": "%recipient.body%",
+            "recipient-variables": json.dumps(recipient_variables),
+            "v:outreach_id": "%recipient.outreach_id%",
+            "o:tracking-opens": "yes" if first.get("track_opens", True) else "no",
+            "o:tracking-clicks": "yes" if first.get("track_clicks", False) else "no"
+        }
 
-        msg.attach(MIMEText(body, "plain"))
+        if first.get("reply_to"):
+            data["h:Reply-To"] = first["reply_to"]
 
-        with smtplib.SMTP(host, port) as server:
-            server.starttls()
-            server.login(user, password)
-            server.send_message(msg)
+        response, error = _post(session, url, auth=("api", api_key), data=data, timeout=60)
+        if error:
+            return error
 
-        return (True, f"smtp_{datetime.now().timestamp()}")
+        if response.status_code == 200:
+            return (True, _mailgun_message_id(response))
+        else:
+            return _rejected(response)
 
     except Exception as e:
         return (False, str(e))
@@ -0,0 +1,287 @@
+"""
+Page Fetcher Service - Single download point for article pages.
+
+Every page the outreach pipeline reads (article analysis, author research,
+draft context) goes through fetch_page():
+
+- One pooled requests.Session (keep-alive, bounded connection pool, retries
+  on transient errors) shared by all threads
+- Raw HTML cached on disk by URL hash (data/html_cache/ab/abcdef....html plus
+  a .json sidecar with ETag, Last-Modified, final URL and encoding)
+- Fresh cache entries (younger than HTML_CACHE_TTL_SECONDS) are served without
+  network; stale ones are revalidated with If-None-Match / If-Modified-Since
+  and a 304 keeps the cached bytes
+- Concurrent fetches of the same URL are collapsed into one download (the
+  per-URL lock is dropped once no fetch of that URL is in flight)
+- The cache is pruned to HTML_CACHE_MAX_BYTES (least recently fetched
+  entries first) every HTML_CACHE_PRUNE_EVERY writes
+
+The cache lives across processes, so analyze -> contacts -> draft in
+outreach.py download each article once.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from yt_autopilot.core.logger import logger
+
+
+HTML_CACHE_DIR = "data/html_cache"
+
+# Served from disk without revalidation below this age
+HTML_CACHE_TTL_SECONDS = 24 * 3600
+
+# Disk budget of the HTML cache, and how many writes pass between prunes
+HTML_CACHE_MAX_BYTES = 512 * 1024 * 1024
+HTML_CACHE_PRUNE_EVERY = 200
+
+# Connection pool per host (matches scrape_many's default worker count)
+POOL_MAXSIZE = 16
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Per-URL locks with their number of holders and waiters: concurrent fetches
+# of one URL wait for the first download; unused entries are removed
+_url_locks: Dict[str, List] = {}
+_url_locks_guard = threading.Lock()
+
+_cache_writes = 0
+
+
+@dataclass
+class FetchedPage:
+    """One fetched page (from network or cache)."""
+    url: str
+    final_url: str
+    html: bytes
+    encoding: Optional[str]
+    status_code: int
+    from_cache: bool
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and bool(self.html)
+
+    @property
+    def text(self) -> str:
+        """HTML decoded with the response encoding (utf-8 fallback)."""
+        try:
+            return self.html.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return self.html.decode("utf-8", errors="replace")
+
+
+def get_session() -> requests.Session:
+    """Returns the shared pooled session."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                retry = Retry(
+                    total=2,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=("GET", "HEAD")
+                )
+                adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({
+                    "User-Agent": USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+                })
+                _session = session
+    return _session
+
+
+def _get_cache_dir() -> Path:
+    path = Path(os.getenv("HTML_CACHE_DIR", HTML_CACHE_DIR))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _cache_paths(url: str) -> tuple:
+    """(html path, metadata path) for a URL."""
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    bucket = _get_cache_dir() / digest[:2]
+    return bucket / f"{digest}.html", bucket / f"{digest}.json"
+
+
+def _read_cache(url: str) -> Optional[tuple]:
+    """Returns (metadata, html bytes) or None."""
+    html_path, meta_path = _cache_paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        html = html_path.read_bytes()
+    except (OSError, json.JSONDecodeError):
+        return None
+    return meta, html
+
+
+def _write_cache(url: str, meta: Dict, html: Optional[bytes]) -> None:
+    """Writes metadata (and html unless None) atomically."""
+    html_path, meta_path = _cache_paths(url)
+    html_path.parent.mkdir(parents=True, exist_ok=True)
+    if html is not None:
+        tmp_html = html_path.with_suffix(".html.tmp")
+        tmp_html.write_bytes(html)
+        os.replace(tmp_html, html_path)
+    tmp_meta = meta_path.with_suffix(".json.tmp")
+    with open(tmp_meta, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_meta, meta_path)
+
+    global _cache_writes
+    with _url_locks_guard:
+        _cache_writes += 1
+        prune = _cache_writes % HTML_CACHE_PRUNE_EVERY == 0
+    if prune:
+        prune_html_cache()
+
+
+def prune_html_cache(max_bytes: Optional[int] = None) -> int:
+    """
+    Deletes the least recently fetched cache entries until the cache fits max_bytes.
+
+    Args:
+        max_bytes: Disk budget (default HTML_CACHE_MAX_BYTES)
+
+    Returns:
+        Number of entries removed
+    """
+    max_bytes = HTML_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries: List[Tuple[float, int, Path, Path]] = []
+    total = 0
+    for meta_path in _get_cache_dir().glob("*/*.json"):
+        html_path = meta_path.with_suffix(".html")
+        try:
+            # Metadata is rewritten on every fetch and 304, so its mtime is the last use
+            mtime = meta_path.stat().st_mtime
+            size = meta_path.stat().st_size + (html_path.stat().st_size if html_path.exists() else 0)
+        except OSError:
+            continue
+        entries.append((mtime, size, html_path, meta_path))
+        total += size
+
+    removed = 0
+    for _, size, html_path, meta_path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        for path in (meta_path, html_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        total -= size
+        removed += 1
+
+    if removed:
+        logger.debug(f"HTML cache: pruned {removed} entries")
+    return removed
+
+
+@contextmanager
+def _url_lock(url: str) -> Iterator[None]:
+    """Holds the URL's lock; the entry is removed when its last user leaves."""
+    with _url_locks_guard:
+        entry = _url_locks.get(url)
+        if entry is None:
+            entry = _url_locks[url] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _url_locks_guard:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _url_locks[url]
+
+
+def fetch_page(
+    url: str,
+    timeout: int = 30,
+    max_age_seconds: int = HTML_CACHE_TTL_SECONDS,
+    use_cache: bool = True
+) -> FetchedPage:
+    """
+    Download a page once, reusing the on-disk HTML cache.
+
+    Args:
+        url: Page URL
+        timeout: Request timeout in seconds
+        max_age_seconds: Serve cached HTML without a request below this age
+        use_cache: If False, always download and do not touch the cache
+
+    Returns:
+        FetchedPage (error set and empty html on failure)
+    """
+    with _url_lock(url):
+        cached = _read_cache(url) if use_cache else None
+        headers = {}
+
+        if cached:
+            meta, html = cached
+            age = time.time() - meta.get("fetched_at", 0)
+            if age < max_age_seconds:
+                return FetchedPage(url, meta.get("final_url", url), html, meta.get("encoding"),
+                                   meta.get("status_code", 200), from_cache=True)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = get_session().get(url, headers=headers, timeout=timeout)
+        except requests.RequestException as e:
+            if cached:
+                # Network trouble: stale HTML beats no HTML
+                meta, html = cached
+                logger.debug(f"Fetch failed for {url}, serving stale cache: {e}")
+                return FetchedPage(url, meta.get("final_url", url), html, meta.get("encoding"),
+                                   meta.get("status_code", 200), from_cache=True)
+            return FetchedPage(url, url, b"", None, 0, from_cache=False, error=str(e))
+
+        if response.status_code == 304 and cached:
+            meta, html = cached
+            meta["fetched_at"] = time.time()
+            _write_cache(url, meta, None)
+            logger.debug(f"Not modified (304): {url}")
+            return FetchedPage(url, meta.get("final_url", url), html, meta.get("encoding"),
+                               meta.get("status_code", 200), from_cache=True)
+
+        if response.status_code >= 400:
+            return FetchedPage(url, response.url, b"", None, response.status_code, from_cache=False,
+                               error=f"HTTP {response.status_code}")
+
+        html = response.content
+        encoding = response.encoding or response.apparent_encoding
+        if use_cache:
+            _write_cache(url, {
+                "url": url,
+                "final_url": response.url,
+                "status_code": response.status_code,
+                "encoding": encoding,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            }, html)
+
+        return FetchedPage(url, response.url, html, encoding, response.status_code, from_cache=False)
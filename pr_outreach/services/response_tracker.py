@@ -195,23 +195,48 @@ Respond with just one word: positive, neutral, or negative"""
     return "neutral"
 
 
-def get_engagement_stats(campaign_id: str) -> Dict:
+def get_engagement_stats(
+    campaign_id: str,
+    record_counters: Optional[Dict[str, float]] = None
+) -> Dict:
     """
     Get engagement statistics for a campaign.
 
-    Returns aggregated stats on opens, replies, etc.
+    Returns aggregated stats on opens, replies, etc., read from the
+    datastore's materialized campaign counters (no record scan).
+    Delivery, click and bounce events are not tracked yet and stay 0.
+
+    Args:
+        campaign_id: Campaign ID
+        record_counters: Counters of the campaign's records kept outside the
+            datastore (outreach_datastore.tally_campaign_counters), added to
+            the datastore counters
+
+    Returns:
+        Dict with totals and open/reply rates
     """
+    from pr_outreach.io.outreach_datastore import get_campaign_counters
+
+    counters = get_campaign_counters(campaign_id)
+    for counter, value in (record_counters or {}).items():
+        counters[counter] = counters.get(counter, 0) + value
+    sent = int(counters["sent"])
+    replied = int(counters["replied"])
+
     return {
         "campaign_id": campaign_id,
-        "total_sent": 0,
+        "total_sent": sent,
         "total_delivered": 0,
-        "total_opened": 0,
+        "total_opened": int(counters["opened"]),
         "total_clicked": 0,
-        "total_replied": 0,
+        "total_replied": replied,
         "total_bounced": 0,
-        "open_rate": 0.0,
-        "reply_rate": 0.0,
-        "positive_reply_rate": 0.0
+        "positive_replies": int(counters["replied_positive"]),
+        "neutral_replies": int(counters["replied_neutral"]),
+        "negative_replies": int(counters["replied_negative"]),
+        "open_rate": counters["opened"] / sent if sent else 0.0,
+        "reply_rate": replied / sent if sent else 0.0,
+        "positive_reply_rate": counters["replied_positive"] / replied if replied else 0.0
     }
 
 
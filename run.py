@@ -17,7 +17,8 @@ Usage:
     python3 run.py trends [--top N] [--source SOURCE]
 
     # Video generation
-    python3 run.py generate [--use-llm-curation]
+    python3 run.py generate [--use-llm-curation] [--trace]
+    python3 run.py generate --all-workspaces | --workspaces ID [ID ...] [--workers N] [--llm-concurrency N]
 
     # Script review (Gate 1)
     python3 run.py review scripts [--all-workspaces]
@@ -30,6 +31,23 @@ Usage:
     python3 run.py review list [--all-workspaces]
     python3 run.py review show <video_id>
 
+    # LLM token/cost accounting
+    python3 run.py usage [--by workspace agent day provider model] [--days N] [--workspace-id ID]
+
+    # Resident generation worker + job queue
+    python3 run.py daemon [--schedule WORKSPACE_ID="CRON" ...] [--drain] [--max-jobs N]
+    python3 run.py jobs enqueue [--workspace-id ID] [--use-llm-curation]
+    python3 run.py jobs status [JOB_ID] [--status STATUS] [--workspace-id ID]
+
+    # Offline benchmark (record once with API keys, replay with no network)
+    python3 run.py bench record [--workspace-id ID] [--paths linear coordinator]
+    python3 run.py bench record --fixture    # re-record committed cassettes (fake providers)
+    python3 run.py bench replay [--name NAME] [--repeats N] [--latency-scale 1.0] [--json FILE]
+    python3 run.py bench replay --fixture    # committed cassettes, no API keys needed
+
+    # Startup profiling (any command): import-time breakdown
+    python3 run.py --profile-startup workspace list
+
     # Note: Current workflow stops at content package export (manual upload to YouTube)
     # Automated upload coming in future release
 
@@ -71,24 +89,9 @@ warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL')
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from yt_autopilot.core.workspace_manager import (
-    list_workspaces,
-    get_active_workspace,
-    get_active_workspace_id,
-    switch_workspace,
-    create_workspace,
-    get_workspace_info
-)
-from yt_autopilot.core.config import get_vertical_configs, get_vertical_config, get_config
-from yt_autopilot.pipeline.build_video_package import build_video_package
-from yt_autopilot.io.datastore import (
-    list_pending_review,
-    get_draft_package,
-    list_pending_script_review,
-    get_script_draft,
-    approve_script_for_generation,
-    save_script_draft
-)
+# Subsystem imports live inside each command so read-only commands (workspace
+# list, review stats, ...) do not load the pipeline, agents and provider SDKs.
+# Run with --profile-startup to see the import-time breakdown.
 
 
 # ============================================================================
@@ -97,6 +100,8 @@ from yt_autopilot.io.datastore import (
 
 def cmd_trends(args):
     """Show trending topics for active workspace without generating video"""
+    from yt_autopilot.core.workspace_manager import get_active_workspace
+    from yt_autopilot.core.config import get_vertical_config
     from yt_autopilot.core.logger import logger
     from yt_autopilot.services.trend_source import fetch_trends
     from yt_autopilot.agents.trend_hunter import _calculate_priority_score
@@ -204,6 +209,8 @@ def cmd_trends(args):
 
 def cmd_workspace_list(args):
     """List all available workspaces"""
+    from yt_autopilot.core.workspace_manager import list_workspaces, get_active_workspace_id
+    from yt_autopilot.core.config import get_vertical_config
     workspaces = list_workspaces()
     active_id = get_active_workspace_id()
 
@@ -232,6 +239,7 @@ def cmd_workspace_list(args):
 
 def cmd_workspace_info(args):
     """Show current workspace information"""
+    from yt_autopilot.core.workspace_manager import get_active_workspace, get_workspace_info
     try:
         workspace = get_active_workspace()
         info = get_workspace_info(workspace['workspace_id'])
@@ -243,6 +251,7 @@ def cmd_workspace_info(args):
 
 def cmd_workspace_switch(args):
     """Switch to different workspace"""
+    from yt_autopilot.core.workspace_manager import switch_workspace, get_workspace_info
     try:
         workspace = switch_workspace(args.workspace_id)
 
@@ -262,6 +271,8 @@ def cmd_workspace_switch(args):
 
 def cmd_workspace_create(args):
     """Interactive workspace creation"""
+    from yt_autopilot.core.workspace_manager import create_workspace
+    from yt_autopilot.core.config import get_vertical_configs
     print()
     print("=" * 70)
     print("CREATE NEW WORKSPACE")
@@ -332,6 +343,7 @@ def cmd_workspace_create(args):
 
 def cmd_workspace_reset(args):
     """Reset workspace by clearing recent titles and deleting unpublished records"""
+    from yt_autopilot.core.workspace_manager import list_workspaces, get_active_workspace
     from yt_autopilot.core.workspace_manager import reset_workspace, load_workspace_config
     from yt_autopilot.io.datastore import list_workspace_records
 
@@ -498,6 +510,13 @@ def cmd_workspace_reset(args):
 
 def cmd_generate(args):
     """Generate video using active workspace"""
+    if args.all_workspaces or args.workspaces:
+        cmd_generate_batch(args)
+        return
+
+    from yt_autopilot.core.workspace_manager import get_active_workspace
+    from yt_autopilot.pipeline.build_video_package import build_video_package
+    from yt_autopilot.io.datastore import save_script_draft
     try:
         workspace = get_active_workspace()
 
@@ -518,7 +537,8 @@ def cmd_generate(args):
         package = build_video_package(
             workspace_id=workspace['workspace_id'],
             use_real_trends=True,
-            use_llm_curation=args.use_llm_curation
+            use_llm_curation=args.use_llm_curation,
+            trace=args.trace
         )
 
         print()
@@ -587,12 +607,77 @@ def cmd_generate(args):
         sys.exit(1)
 
 
+def cmd_generate_batch(args):
+    """Generate one video per workspace in parallel (consolidated report)"""
+    from yt_autopilot.core.workspace_manager import list_workspaces
+    from yt_autopilot.pipeline.batch_generation import run_batch
+
+    if args.all_workspaces:
+        workspace_ids = [ws['workspace_id'] for ws in list_workspaces()]
+    else:
+        workspace_ids = args.workspaces
+    if not workspace_ids:
+        print("\n⚠️  No workspaces to generate for\n")
+        sys.exit(1)
+
+    report = run_batch(
+        workspace_ids,
+        use_llm_curation=args.use_llm_curation,
+        max_workers=args.workers,
+        llm_concurrency=args.llm_concurrency,
+        trace=args.trace
+    )
+    results = report['results']
+
+    print()
+    print("=" * 70)
+    print(f"BATCH GENERATION COMPLETE - {len(results)} workspace(s)")
+    print("=" * 70)
+    print(f"  {'WORKSPACE':<24} {'STATUS':<9} {'TIME':>7} {'LLM':>4} {'WAIT':>6}  TITLE / REASON")
+    print("  " + "-" * 90)
+    for r in results:
+        detail = r['title'] if r['status'] == "APPROVED" else (r['error'] or r['rejection_reason'] or r['title'] or "")
+        print(f"  {r['workspace_id'][:24]:<24} {r['status']:<9} {r['duration_seconds']:>6.0f}s "
+              f"{r['llm_calls']:>4} {r['llm_wait_ms'] / 1000:>5.0f}s  {(detail or '')[:50]}")
+    print()
+
+    counts = {}
+    for r in results:
+        counts[r['status']] = counts.get(r['status'], 0) + 1
+    print("  " + " | ".join(f"{status}: {count}" for status, count in sorted(counts.items())))
+    if report['trend_snapshots']:
+        snapshots = ", ".join(
+            f"{vertical} ({count if count is not None else 'failed'})"
+            for vertical, count in report['trend_snapshots'].items()
+        )
+        print(f"  Trend snapshots ({report['trend_fetch_seconds']}s): {snapshots}")
+    speedup = report['sum_seconds'] / report['wall_seconds'] if report['wall_seconds'] else 0
+    print(f"  Wall time: {report['wall_seconds']}s with {report['workers']} worker(s), "
+          f"LLM budget {report['llm_concurrency']} (sequential: ~{report['sum_seconds']}s, {speedup:.1f}x)")
+    print("=" * 70)
+
+    approved = [r for r in results if r['script_id']]
+    if approved:
+        print()
+        print("💡 Next steps:")
+        print("  - Review scripts: python3 run.py review scripts --all-workspaces")
+        print("  - LLM cost per workspace: python3 run.py usage --by workspace --days 1")
+    if args.trace:
+        print("  - Traces (one per workspace): data/traces/ - open *.trace.json in ui.perfetto.dev")
+    print()
+
+    if counts.get("FAILED"):
+        sys.exit(1)
+
+
 # ============================================================================
 # REVIEW COMMANDS - GATE 1 (Script Review)
 # ============================================================================
 
 def cmd_review_scripts(args):
     """List all scripts pending human review (Gate 1)."""
+    from yt_autopilot.core.workspace_manager import get_active_workspace
+    from yt_autopilot.io.datastore import list_pending_script_review
     # Get workspace filter
     if args.all_workspaces:
         workspace_id = None
@@ -662,6 +747,7 @@ def cmd_review_scripts(args):
 
 def cmd_review_show_script(args):
     """Show detailed script information in 2-level format (Gate 1)."""
+    from yt_autopilot.io.datastore import get_script_draft
     script_id = args.script_id
 
     print("=" * 70)
@@ -863,6 +949,7 @@ def cmd_review_show_script(args):
 
 def cmd_export_visual_deck(args):
     """Generate visual deck with reference images for script (Phase 1)."""
+    from yt_autopilot.io.datastore import get_script_draft
     from yt_autopilot.core.schemas import ContentPackage, VideoPlan, VideoScript, VisualPlan, VisualScene, PublishingPackage, EditorialDecision
     from yt_autopilot.services import generate_scene_reference_images
     from yt_autopilot.io.exports import export_content_package_to_markdown
@@ -1012,6 +1099,8 @@ def cmd_export_visual_deck(args):
 
 def cmd_review_approve_script(args):
     """Approve script and trigger asset generation (Gate 1 → Gate 2)."""
+    from yt_autopilot.core.config import get_config
+    from yt_autopilot.io.datastore import get_script_draft, approve_script_for_generation
     script_id = args.script_id
     approved_by = args.approved_by
 
@@ -1153,6 +1242,7 @@ def cmd_review_approve_script(args):
 
 def cmd_review_stats(args):
     """Show datastore statistics and state distribution."""
+    from yt_autopilot.core.config import get_config
     print("=" * 70)
     print("DATASTORE STATISTICS")
     print("=" * 70)
@@ -1241,6 +1331,8 @@ def cmd_review_stats(args):
 
 def cmd_review_list(args):
     """List all videos pending human review."""
+    from yt_autopilot.core.workspace_manager import get_active_workspace
+    from yt_autopilot.io.datastore import list_pending_review
     # Get workspace filter
     if args.all_workspaces:
         workspace_id = None
@@ -1287,6 +1379,7 @@ def cmd_review_list(args):
 
 def cmd_review_show(args):
     """Show detailed information about a specific draft."""
+    from yt_autopilot.io.datastore import get_draft_package
     video_id = args.video_id
 
     print("=" * 70)
@@ -1420,6 +1513,312 @@ def cmd_review_show(args):
     print("  (Automated upload coming in future release)")
     print("=" * 70)
 
+# ============================================================================
+# USAGE COMMAND (LLM token/cost accounting)
+# ============================================================================
+
+USAGE_GROUP_FIELDS = {
+    "workspace": "workspace_id",
+    "agent": "agent",
+    "day": "day",
+    "provider": "provider",
+    "model": "model",
+}
+
+
+def cmd_usage(args):
+    """Show LLM token usage, latency and estimated cost per workspace/agent/day."""
+    from yt_autopilot.services.llm_usage import summarize_usage, load_usage_rollup
+
+    if args.rebuild:
+        load_usage_rollup(rebuild=True)
+
+    group_by = [USAGE_GROUP_FIELDS[name] for name in args.by]
+    since_day = None
+    if args.days:
+        since_day = (datetime.now() - timedelta(days=args.days - 1)).strftime("%Y-%m-%d")
+
+    rows = summarize_usage(group_by=group_by, since_day=since_day, workspace_id=args.workspace_id)
+
+    print("=" * 70)
+    print("LLM USAGE REPORT")
+    print("=" * 70)
+    scope = f"last {args.days} day(s)" if args.days else "all time"
+    if args.workspace_id:
+        scope += f", workspace {args.workspace_id}"
+    print(f"Scope: {scope} | Grouped by: {', '.join(args.by)}")
+    print()
+
+    if not rows:
+        print("No LLM calls recorded yet.")
+        print()
+        return
+
+    key_width = max(24, max(len(" / ".join(str(row[f] or "-") for f in group_by)) for row in rows))
+    print(f"{'GROUP':<{key_width}}  {'CALLS':>6}  {'IN TOK':>9}  {'OUT TOK':>9}  {'CACHED':>8}  {'AVG MS':>7}  {'RETRY':>5}  {'COST $':>8}")
+    print("-" * (key_width + 70))
+
+    totals = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0, "retries": 0, "cost_usd": 0.0}
+    for row in rows:
+        label = " / ".join(str(row[f] or "-") for f in group_by)
+        print(
+            f"{label:<{key_width}}  {row['calls']:>6}  {row['prompt_tokens']:>9}  {row['completion_tokens']:>9}  "
+            f"{row['cached_tokens']:>8}  {row['avg_latency_ms']:>7.0f}  {row['retries']:>5}  {row['cost_usd']:>8.4f}"
+        )
+        for key in totals:
+            totals[key] += row[key]
+
+    print("-" * (key_width + 70))
+    print(
+        f"{'TOTAL':<{key_width}}  {totals['calls']:>6}  {totals['prompt_tokens']:>9}  {totals['completion_tokens']:>9}  "
+        f"{totals['cached_tokens']:>8}  {'':>7}  {totals['retries']:>5}  {totals['cost_usd']:>8.4f}"
+    )
+    print("=" * 70)
+
+
+# ============================================================================
+# DAEMON / JOB QUEUE COMMANDS
+# ============================================================================
+
+def cmd_daemon(args):
+    """Run the resident generation worker (takes jobs from the job queue)."""
+    from yt_autopilot.pipeline.generation_daemon import run_daemon, parse_schedules
+
+    try:
+        schedules = parse_schedules(args.schedule or [])
+    except ValueError as e:
+        print(f"\n⚠️  {e}\n")
+        sys.exit(1)
+
+    run_daemon(
+        schedules=schedules,
+        params={"use_llm_curation": args.use_llm_curation},
+        poll_seconds=args.poll_seconds,
+        max_jobs=args.max_jobs,
+        exit_when_idle=args.drain
+    )
+
+
+def cmd_jobs_enqueue(args):
+    """Queue a generation job for the daemon."""
+    from yt_autopilot.core.workspace_manager import get_active_workspace_id, workspace_exists
+    from yt_autopilot.io.job_queue import enqueue_job
+
+    workspace_id = args.workspace_id or get_active_workspace_id()
+    if not workspace_id or not workspace_exists(workspace_id):
+        print(f"\n⚠️  Workspace not found: {workspace_id or '(no active workspace)'}\n")
+        sys.exit(1)
+
+    # Idempotent: returns the workspace's pending job if there already is one
+    job = enqueue_job(workspace_id, params={"use_llm_curation": args.use_llm_curation})
+    print(f"✓ Job {job['job_id']} queued for {workspace_id} (enqueued {job['enqueued_at'][:19]})")
+    print("  Run 'python3 run.py daemon' to process the queue, 'python3 run.py jobs status' to follow it")
+
+
+def cmd_jobs_status(args):
+    """Show job queue counts and recent jobs, or one job's details."""
+    from yt_autopilot.io.job_queue import get_job, list_jobs, get_job_counts
+
+    if args.job_id:
+        job = get_job(args.job_id)
+        if job is None:
+            print(f"\n⚠️  Job not found (or ambiguous prefix): {args.job_id}\n")
+            sys.exit(1)
+        print("=" * 70)
+        print(f"JOB {job['job_id']}")
+        print("=" * 70)
+        for key in ("workspace_id", "status", "source", "attempts", "worker",
+                    "enqueued_at", "started_at", "finished_at", "last_error"):
+            if job[key] not in (None, ""):
+                print(f"  {key}: {job[key]}")
+        if job["params"]:
+            print(f"  params: {json.dumps(job['params'])}")
+        for key, value in (job["result"] or {}).items():
+            print(f"  result.{key}: {value}")
+        print("=" * 70)
+        return
+
+    counts = get_job_counts(workspace_id=args.workspace_id)
+    jobs = list_jobs(status=args.status, workspace_id=args.workspace_id, limit=args.limit)
+
+    print("=" * 70)
+    print("GENERATION JOB QUEUE")
+    print("=" * 70)
+    print("  " + " | ".join(f"{status}: {count}" for status, count in sorted(counts.items())) if counts else "  (empty)")
+    print()
+    if jobs:
+        print(f"  {'JOB':<10} {'WORKSPACE':<22} {'STATUS':<8} {'TRY':>3}  {'ENQUEUED':<19}  RESULT")
+        print("  " + "-" * 90)
+        for job in jobs:
+            result = job["result"] or {}
+            outcome = job["last_error"] or (f"{result.get('status')}: {result.get('title')}" if result else "")
+            print(f"  {job['job_id'][:8]:<10} {job['workspace_id'][:22]:<22} {job['status']:<8} "
+                  f"{job['attempts']:>3}  {(job['enqueued_at'] or '')[:19]:<19}  {outcome[:60]}")
+    print("=" * 70)
+
+
+# ============================================================================
+# OFFLINE BENCHMARK COMMANDS
+# ============================================================================
+
+def cmd_bench_record(args):
+    """Record LLM/trend cassettes for the offline benchmark (live run per pipeline path)."""
+    from yt_autopilot.core.workspace_manager import get_active_workspace_id, workspace_exists
+    from yt_autopilot.pipeline.offline_benchmark import (
+        FIXTURE_WORKSPACE_ID, record_cassettes, record_fixture_cassettes
+    )
+
+    workspace_id = FIXTURE_WORKSPACE_ID if args.fixture else args.workspace_id or get_active_workspace_id()
+    if not workspace_id or not workspace_exists(workspace_id):
+        print(f"\n⚠️  Workspace not found: {workspace_id or '(no active workspace)'}\n")
+        sys.exit(1)
+
+    if args.fixture:
+        files = record_fixture_cassettes(paths=args.paths)
+    else:
+        files = record_cassettes(
+            workspace_id,
+            name=args.name,
+            use_real_trends=not args.mock_trends,
+            use_llm_curation=args.use_llm_curation,
+            paths=args.paths
+        )
+
+    print()
+    print("=" * 70)
+    print("BENCHMARK CASSETTES RECORDED")
+    print("=" * 70)
+    for path, cassette_file in files.items():
+        print(f"  {path:<12} {cassette_file}")
+    print()
+    replay_args = "--fixture" if args.fixture else f"--name {args.name or workspace_id}"
+    print(f"  Replay: python3 run.py bench replay {replay_args}")
+    print("=" * 70)
+
+
+def cmd_bench_replay(args):
+    """Time linear and coordinator pipeline runs from cassettes, with no network."""
+    from yt_autopilot.core.workspace_manager import get_active_workspace_id
+    from yt_autopilot.pipeline.offline_benchmark import (
+        FIXTURE_CASSETTE_DIR, FIXTURE_CASSETTE_NAME, run_benchmark
+    )
+
+    if args.fixture:
+        name, cassette_dir = args.name or FIXTURE_CASSETTE_NAME, FIXTURE_CASSETTE_DIR
+    else:
+        name, cassette_dir = args.name or get_active_workspace_id(), None
+    try:
+        report = run_benchmark(
+            name,
+            repeats=args.repeats,
+            warmup=args.warmup,
+            latency_scale=args.latency_scale,
+            paths=args.paths,
+            cassette_dir=cassette_dir
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"\n⚠️  {e}")
+        print("  Record cassettes first: python3 run.py bench record\n")
+        sys.exit(1)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print()
+    print("=" * 70)
+    print(f"OFFLINE BENCHMARK - {name} ({report['repeats']} run(s), latency scale {report['latency_scale']})")
+    print("=" * 70)
+    print(f"  {'PATH':<12} {'WARMUP':>8} {'MIN':>8} {'MEDIAN':>8} {'MEAN':>8} {'MAX':>8}  {'LLM HIT/FUZZY/MISS':<19} STATUS")
+    print("  " + "-" * 90)
+
+    def _fmt(seconds):
+        return f"{seconds:.2f}s" if seconds is not None else "-"
+
+    blocked = 0
+    for path, result in report['paths'].items():
+        replay = result['replay']
+        blocked += replay.get('network_blocked', 0)
+        warmup = _fmt(max(result['warmup_seconds'])) if result['warmup_seconds'] else "-"
+        hits = f"{replay.get('llm_hits', 0)}/{replay.get('llm_fuzzy_hits', 0)}/{replay.get('llm_misses', 0)}"
+        print(f"  {path:<12} {warmup:>8} {_fmt(result['min_seconds']):>8} {_fmt(result['median_seconds']):>8} "
+              f"{_fmt(result['mean_seconds']):>8} {_fmt(result['max_seconds']):>8}  {hits:<19} "
+              f"{', '.join(result['statuses'])}")
+    print()
+    print(f"  Network connections blocked (last runs): {blocked}")
+    if args.json:
+        print(f"  Full report: {args.json}")
+    print("=" * 70)
+
+
+# ============================================================================
+# STARTUP PROFILING
+# ============================================================================
+
+# Rows shown per section of the --profile-startup report
+STARTUP_PROFILE_TOP = 10
+
+
+def _profile_startup(argv):
+    """
+    Re-runs the command under `python -X importtime` and prints where startup time went.
+
+    The command itself runs normally (stdin/stdout are inherited); only the
+    interpreter's import timings are captured from stderr.
+
+    Args:
+        argv: Command line without --profile-startup
+
+    Returns:
+        Exit code of the profiled command
+    """
+    import subprocess
+    import time
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-X", "importtime", str(Path(__file__).resolve()), *argv],
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    timings = []
+    for line in proc.stderr:
+        if not line.startswith("import time:"):
+            sys.stderr.write(line)
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header row
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        timings.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    proc.wait()
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    by_package = {}
+    for name, self_us, _, _ in timings:
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + self_us
+    top_level = sorted((t for t in timings if t[3] == 0), key=lambda t: t[2], reverse=True)
+
+    print()
+    print("=" * 70)
+    print("STARTUP PROFILE (python -X importtime)")
+    print("=" * 70)
+    print(f"Command: run.py {' '.join(argv) or '(no command)'}")
+    print(f"Wall time: {wall_ms:.0f} ms (includes running the command)")
+    print(f"Imports: {sum(t[1] for t in timings) / 1000:.0f} ms across {len(timings)} modules")
+    print()
+    print("BY PACKAGE (self time):")
+    for package, self_us in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:STARTUP_PROFILE_TOP]:
+        print(f"  {package:<40} {self_us / 1000:>8.1f} ms")
+    print()
+    print("SLOWEST TOP-LEVEL IMPORTS (cumulative):")
+    for name, _, cumulative_us, _ in top_level[:STARTUP_PROFILE_TOP]:
+        print(f"  {name:<40} {cumulative_us / 1000:>8.1f} ms")
+    print("=" * 70)
+    return proc.returncode
+
+
 # ============================================================================
 # MAIN ARGPARSE SETUP
 # ============================================================================
@@ -1430,6 +1829,11 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Run the command and print an import-time breakdown of CLI startup"
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Available command groups")
 
@@ -1491,6 +1895,35 @@ def main():
         action="store_true",
         help="Enable LLM curation for trend selection (Phase B)"
     )
+    generate_parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record timing spans; writes a Chrome trace + flame summary to data/traces/"
+    )
+    batch_group = generate_parser.add_mutually_exclusive_group()
+    batch_group.add_argument(
+        "--all-workspaces",
+        action="store_true",
+        help="Generate one video for every workspace, in parallel"
+    )
+    batch_group.add_argument(
+        "--workspaces",
+        nargs="+",
+        metavar="WORKSPACE_ID",
+        help="Generate one video for each of these workspaces, in parallel"
+    )
+    generate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Batch mode: max worker processes (default: 4)"
+    )
+    generate_parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=8,
+        help="Batch mode: max LLM calls in flight across all workers (default: 8)"
+    )
     generate_parser.set_defaults(func=cmd_generate)
 
     # ========================================================================
@@ -1529,13 +1962,94 @@ def main():
     r_show.add_argument("video_id", help="Video internal ID")
     r_show.set_defaults(func=cmd_review_show)
 
+    # ========================================================================
+    # USAGE COMMAND
+    # ========================================================================
+    usage_parser = subparsers.add_parser("usage", help="Show LLM token usage and estimated cost")
+    usage_parser.add_argument(
+        "--by",
+        nargs="+",
+        choices=list(USAGE_GROUP_FIELDS),
+        default=["workspace", "agent", "day"],
+        help="Grouping dimensions (default: workspace agent day)"
+    )
+    usage_parser.add_argument("--days", type=int, help="Only include the last N days")
+    usage_parser.add_argument("--workspace-id", help="Only include this workspace")
+    usage_parser.add_argument("--rebuild", action="store_true", help="Recompute rollups from the full usage log")
+    usage_parser.set_defaults(func=cmd_usage)
+
+    # ========================================================================
+    # DAEMON / JOB QUEUE
+    # ========================================================================
+    daemon_parser = subparsers.add_parser("daemon", help="Run the resident generation worker (job queue)")
+    daemon_parser.add_argument(
+        "--schedule",
+        action="append",
+        metavar='WORKSPACE_ID="CRON"',
+        help='Enqueue a job for a workspace on a crontab schedule, e.g. tech_ai_creator="0 8 * * *" (repeatable, needs APScheduler)'
+    )
+    daemon_parser.add_argument("--use-llm-curation", action="store_true", help="Use LLM trend curation for scheduled jobs")
+    daemon_parser.add_argument("--poll-seconds", type=float, default=5, help="Idle wait between queue polls (default: 5)")
+    daemon_parser.add_argument("--max-jobs", type=int, help="Exit after processing N jobs")
+    daemon_parser.add_argument("--drain", action="store_true", help="Exit when the queue is empty")
+    daemon_parser.set_defaults(func=cmd_daemon)
+
+    jobs_parser = subparsers.add_parser("jobs", help="Generation job queue commands")
+    jobs_subparsers = jobs_parser.add_subparsers(dest="jobs_command", help="Job queue commands")
+
+    j_enqueue = jobs_subparsers.add_parser("enqueue", help="Queue a generation job for the daemon")
+    j_enqueue.add_argument("--workspace-id", help="Workspace to generate for (default: active workspace)")
+    j_enqueue.add_argument("--use-llm-curation", action="store_true", help="Use LLM trend curation")
+    j_enqueue.set_defaults(func=cmd_jobs_enqueue)
+
+    j_status = jobs_subparsers.add_parser("status", help="Show queue counts and recent jobs, or one job")
+    j_status.add_argument("job_id", nargs="?", help="Job ID or unique prefix")
+    j_status.add_argument("--status", choices=["queued", "running", "done", "failed"], help="Only jobs in this status")
+    j_status.add_argument("--workspace-id", help="Only jobs for this workspace")
+    j_status.add_argument("--limit", type=int, default=20, help="Max jobs listed (default: 20)")
+    j_status.set_defaults(func=cmd_jobs_status)
+
+    # ========================================================================
+    # OFFLINE BENCHMARK
+    # ========================================================================
+    bench_parser = subparsers.add_parser("bench", help="Record/replay benchmark of the pipeline (no network on replay)")
+    bench_subparsers = bench_parser.add_subparsers(dest="bench_command", help="Benchmark commands")
+
+    b_record = bench_subparsers.add_parser("record", help="Run the pipeline live and record LLM/trend cassettes")
+    b_record.add_argument("--workspace-id", help="Workspace to generate for (default: active workspace)")
+    b_record.add_argument("--name", help="Cassette name prefix (default: workspace id)")
+    b_record.add_argument("--paths", nargs="+", choices=["linear", "coordinator"], default=["linear", "coordinator"],
+                          help="Pipeline paths to record (default: both)")
+    b_record.add_argument("--mock-trends", action="store_true", help="Use mock trends instead of real trend sources")
+    b_record.add_argument("--use-llm-curation", action="store_true", help="Use LLM trend curation")
+    b_record.add_argument("--fixture", action="store_true",
+                          help="Re-record the committed fixture cassettes with fake providers (no API keys)")
+    b_record.set_defaults(func=cmd_bench_record)
+
+    b_replay = bench_subparsers.add_parser("replay", help="Time pipeline paths from recorded cassettes")
+    b_replay.add_argument("--name", help="Cassette name prefix (default: active workspace id)")
+    b_replay.add_argument("--paths", nargs="+", choices=["linear", "coordinator"], default=["linear", "coordinator"],
+                          help="Pipeline paths to time (default: both)")
+    b_replay.add_argument("--repeats", type=int, default=3, help="Timed runs per path (default: 3)")
+    b_replay.add_argument("--warmup", type=int, default=1, help="Warm-up runs per path (default: 1)")
+    b_replay.add_argument("--latency-scale", type=float, default=0.0,
+                          help="Simulated LLM/trend latency as a fraction of the recorded one (default: 0 = none)")
+    b_replay.add_argument("--json", metavar="FILE", help="Also write the full report as JSON")
+    b_replay.add_argument("--fixture", action="store_true",
+                          help="Replay the committed fixture cassettes (tests/fixtures/cassettes)")
+    b_replay.set_defaults(func=cmd_bench_replay)
+
     # ========================================================================
     # PARSE AND EXECUTE
     # ========================================================================
     args = parser.parse_args()
 
+    if args.profile_startup:
+        sys.exit(_profile_startup([arg for arg in sys.argv[1:] if arg != "--profile-startup"]))
+
     # Handle no command (default behavior)
     if not args.command:
+        from yt_autopilot.core.workspace_manager import get_active_workspace
         try:
             workspace = get_active_workspace()
             cmd_workspace_info(args)
@@ -1562,6 +2076,10 @@ def main():
             workspace_parser.print_help()
         elif args.command == "review":
             review_parser.print_help()
+        elif args.command == "jobs":
+            jobs_parser.print_help()
+        elif args.command == "bench":
+            bench_parser.print_help()
         else:
             parser.print_help()
 
@@ -0,0 +1,19 @@
+"""
+Shared pytest setup: repo root on sys.path, runtime data kept out of data/.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_runtime_data(tmp_path, monkeypatch):
+    """LLM usage records and traces go to the test's tmp dir, not data/."""
+    monkeypatch.setenv("LLM_USAGE_DIR", str(tmp_path / "usage"))
+    monkeypatch.setenv("TRACE_DIR", str(tmp_path / "traces"))
@@ -0,0 +1,174 @@
+"""
+Batched relevance scoring: every entry of the LLM's JSON array is validated on
+its own, and only articles without a valid entry are re-scored one by one.
+hunt_articles skips only articles this campaign contacted (exact check).
+"""
+
+import json
+
+import pytest
+
+try:
+    from pr_outreach.agents import article_hunter
+    from pr_outreach.agents.article_hunter import (
+        _batch_relevance_scores,
+        _llm_relevance_batch,
+        _parse_score_array,
+        hunt_articles,
+    )
+    from pr_outreach.core.schemas import ArticleCandidate, CampaignConfig, ProductInfo, SenderPersona
+    from pr_outreach.io.contacted_urls import BloomFilter, ContactedURLSet, normalize_url, url_domain
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+
+PRODUCT = ProductInfo(
+    name="FitTrack",
+    tagline="Workout tracker for busy people",
+    website_url="https://fittrack.example",
+    category="fitness app",
+    key_features=["workout plans", "progress charts"],
+    unique_value_prop="Ten-minute workouts",
+    target_audience="office workers",
+)
+
+
+def _articles(count):
+    return [
+        ArticleCandidate(
+            url=f"https://blog{i}.example/best-fitness-apps",
+            title=f"Best fitness apps #{i}",
+            domain=f"blog{i}.example",
+            content_excerpt="A roundup of workout plans and progress charts.",
+        )
+        for i in range(count)
+    ]
+
+
+class FakeLLM:
+    """Answers batch prompts with a fixed response and single prompts with a fixed score."""
+
+    def __init__(self, batch_response, single_response="0.5"):
+        self.batch_response = batch_response
+        self.single_response = single_response
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def __call__(self, role, task, context, style_hints=None):
+        if style_hints and style_hints.get("response_format") == "json":
+            self.batch_calls += 1
+            if isinstance(self.batch_response, Exception):
+                raise self.batch_response
+            return self.batch_response
+        self.single_calls += 1
+        return self.single_response
+
+
+def test_parse_score_array_tolerates_code_fences_and_prose():
+    response = 'Here are the scores:\n```json\n[{"id": 0, "score": 0.8}]\n```\nDone.'
+
+    assert _parse_score_array(response) == [{"id": 0, "score": 0.8}]
+
+
+@pytest.mark.parametrize("response", ["", None, "no scores here", "[not json]", '{"id": 0, "score": 0.8}'])
+def test_parse_score_array_returns_empty_list_on_bad_response(response):
+    assert _parse_score_array(response) == []
+
+
+def test_batch_scores_every_article_in_one_call():
+    llm = FakeLLM(json.dumps([{"id": 0, "score": 0.9}, {"id": 1, "score": 0.2}, {"id": 2, "score": 1}]))
+
+    assert _llm_relevance_batch(_articles(3), PRODUCT, llm) == [0.9, 0.2, 1.0]
+    assert llm.batch_calls == 1
+
+
+@pytest.mark.parametrize("entry", [
+    {"id": True, "score": 0.9},         # bool is not an id
+    {"id": "0", "score": 0.9},          # string id
+    {"id": -1, "score": 0.9},           # out of range
+    {"id": 3, "score": 0.9},            # out of range
+    {"id": 0.0, "score": 0.9},          # float id
+    {"id": 0, "score": True},           # bool is not a score
+    {"id": 0, "score": "0.9"},          # string score
+    {"id": 0, "score": None},
+    {"id": 0},
+    "0.9",                              # not an object
+])
+def test_malformed_entry_leaves_article_unscored(entry):
+    llm = FakeLLM(json.dumps([entry, {"id": 1, "score": 0.4}, {"id": 2, "score": 0.6}]))
+
+    assert _llm_relevance_batch(_articles(3), PRODUCT, llm) == [None, 0.4, 0.6]
+
+
+def test_non_finite_scores_are_rejected():
+    # json.loads accepts NaN and Infinity literals
+    llm = FakeLLM('[{"id": 0, "score": NaN}, {"id": 1, "score": Infinity}, {"id": 2, "score": 0.7}]')
+
+    assert _llm_relevance_batch(_articles(3), PRODUCT, llm) == [None, None, 0.7]
+
+
+def test_duplicate_ids_keep_the_first_entry():
+    llm = FakeLLM(json.dumps([{"id": 0, "score": 0.3}, {"id": 0, "score": 0.9}]))
+
+    assert _llm_relevance_batch(_articles(1), PRODUCT, llm) == [0.3]
+
+
+def test_scores_are_clamped_to_unit_range():
+    llm = FakeLLM(json.dumps([{"id": 0, "score": 7}, {"id": 1, "score": -0.5}]))
+
+    assert _llm_relevance_batch(_articles(2), PRODUCT, llm) == [1.0, 0.0]
+
+
+def test_llm_error_leaves_whole_batch_unscored():
+    llm = FakeLLM(RuntimeError("provider down"))
+
+    assert _llm_relevance_batch(_articles(2), PRODUCT, llm) == [None, None]
+
+
+def test_only_malformed_entries_fall_back_to_single_scoring():
+    llm = FakeLLM(
+        '```json\n[{"id": 0, "score": 0.9}, {"id": 1, "score": NaN}, {"id": 2, "score": 0.1}, '
+        '{"id": 2, "score": 0.8}, {"id": 9, "score": 0.5}]\n```',
+        single_response="0.35",
+    )
+
+    scores = _batch_relevance_scores(_articles(4), PRODUCT, llm)
+
+    # 1 has a NaN score and 3 has no entry (9 is out of range)
+    assert scores == [0.9, 0.35, 0.1, 0.35]
+    assert llm.batch_calls == 1
+    assert llm.single_calls == 2
+
+
+def test_unparseable_batch_falls_back_for_every_article():
+    llm = FakeLLM("I cannot rate these articles.", single_response="0.6")
+
+    assert _batch_relevance_scores(_articles(3), PRODUCT, llm) == [0.6, 0.6, 0.6]
+    assert llm.single_calls == 3
+
+
+def test_hunt_skips_only_articles_contacted_by_this_campaign(monkeypatch):
+    articles = _articles(4)
+    urls = [article.url for article in articles]
+    monkeypatch.setattr(article_hunter, "_search_openai_web", lambda query, product, max_results: articles)
+    monkeypatch.setattr(article_hunter, "analyze_domains",
+                        lambda urls: {url: {"domain_authority": 40} for url in urls})
+    campaign = CampaignConfig(
+        campaign_id="camp",
+        campaign_name="Camp",
+        niche_id="fitness",
+        product=PRODUCT,
+        sender_persona=SenderPersona(name="Ann", email="ann@fittrack.example", title="PR", company="FitTrack"),
+    )
+    # 0: contacted by this campaign; 1: Bloom hit from another campaign (may
+    # be a false positive); 2: domain pitched before
+    contacted = ContactedURLSet(
+        "camp",
+        keys=[normalize_url(urls[0])],
+        url_filter=BloomFilter.from_keys([normalize_url(urls[0]), normalize_url(urls[1])]),
+        domain_filter=BloomFilter.from_keys([url_domain(urls[2])]),
+    )
+
+    found = hunt_articles(["fitness apps"], PRODUCT, campaign, contacted_articles=contacted)
+
+    assert sorted(article.url for article in found) == sorted(urls[1:])
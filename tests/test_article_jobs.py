@@ -0,0 +1,150 @@
+"""
+Resumable article jobs: results are logged as each article completes, so a
+rerun after an interruption processes only the articles without a result.
+"""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+import outreach
+
+CAMPAIGN = "camp"
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(outreach, "DATA_DIR", str(tmp_path / "outreach"))
+    monkeypatch.setattr(outreach, "_article_results_cache", {})
+    monkeypatch.setattr(outreach, "_summary_cache", {})
+    return tmp_path / "outreach"
+
+
+def _seed_articles(count):
+    articles = [{"url": f"https://blog{i}.example/post", "title": f"Post {i}"} for i in range(count)]
+    outreach.save_articles(CAMPAIGN, articles)
+    return [a["url"] for a in articles]
+
+
+def _pending():
+    """Articles the analyze command would pick up (see cmd_analyze)."""
+    return [a for a in outreach.load_articles(CAMPAIGN) if not a.get("analyzed")]
+
+
+def _analyze(processed):
+    lock = threading.Lock()
+
+    def process(article):
+        with lock:
+            processed.append(article["url"])
+        return {"analyzed": True, "relevance_score": 0.7}
+    return process
+
+
+def _join_workers(stage):
+    """Waits for the job's worker threads, left running by an interrupt."""
+    for thread in threading.enumerate():
+        if thread.name.startswith(f"outreach-{stage}"):
+            thread.join(timeout=5)
+
+
+def test_rerun_after_interrupt_processes_only_remaining_articles():
+    urls = _seed_articles(10)
+    first_run, completed = [], []
+
+    def interrupt_after_four(article, updates, error):
+        completed.append(article["url"])
+        if len(completed) == 4:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        outreach.run_article_job(CAMPAIGN, "analyze", _pending(), _analyze(first_run),
+                                 workers=1, on_result=interrupt_after_four)
+
+    progress = {job["stage"]: job for job in outreach.load_job_progress(CAMPAIGN)}
+    assert progress["analyze"]["state"] == "interrupted"
+    assert progress["analyze"]["done"] == 4
+
+    # The worker may finish the next article while the interrupt is raised;
+    # its result is logged too
+    _join_workers("analyze")
+    assert set(completed) <= set(first_run)
+    remaining = _pending()
+    assert [a["url"] for a in remaining] == [url for url in urls if url not in first_run]
+
+    second_run = []
+    counts = outreach.run_article_job(CAMPAIGN, "analyze", remaining, _analyze(second_run), workers=2)
+
+    assert counts == {"done": len(remaining), "failed": 0}
+    assert sorted(second_run) == sorted(set(urls) - set(first_run))
+    assert _pending() == []
+    assert all(a["relevance_score"] == 0.7 for a in outreach.load_articles(CAMPAIGN))
+
+
+def _logged_results(data_dir):
+    path = os.path.join(data_dir, CAMPAIGN, outreach.ARTICLE_RESULTS_FILE)
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return sum(1 for _ in f)
+
+
+def test_interrupt_keeps_results_of_workers_that_already_finished(data_dir):
+    urls = _seed_articles(3)
+    drafted = []
+    lock = threading.Lock()
+
+    def draft(article):
+        # Side effect that must not be repeated (save_outreach in cmd_draft)
+        with lock:
+            drafted.append(article["url"])
+        return {"email_drafted": True}
+
+    def interrupt_on_first_result(article, updates, error):
+        # The other workers finish while the calling thread handles this one
+        deadline = time.monotonic() + 5
+        while _logged_results(data_dir) < len(urls) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        outreach.run_article_job(CAMPAIGN, "draft", _pending(), draft,
+                                 workers=3, on_result=interrupt_on_first_result)
+
+    _join_workers("draft")
+    assert sorted(drafted) == sorted(urls)
+    # A rerun finds nothing left to draft
+    assert [a for a in outreach.load_articles(CAMPAIGN) if not a.get("email_drafted")] == []
+
+
+def test_results_logged_before_a_crash_are_merged_on_reload(data_dir):
+    urls = _seed_articles(5)
+    articles = outreach.load_articles(CAMPAIGN)
+    for article in articles[:3]:
+        outreach.append_article_result(CAMPAIGN, article, "analyze", {"analyzed": True, "relevance_score": 0.9})
+    # A later stage's update for the same article wins over the earlier one
+    outreach.append_article_result(CAMPAIGN, articles[0], "analyze", {"relevance_score": 0.2})
+    # Process killed mid-write: the last line is cut short
+    with open(os.path.join(data_dir, CAMPAIGN, outreach.ARTICLE_RESULTS_FILE), "a") as f:
+        f.write(json.dumps({"key": urls[3], "updates": {"analyzed": True}})[:20])
+
+    reloaded = outreach.load_articles(CAMPAIGN)
+
+    assert [a["url"] for a in _pending()] == urls[3:]
+    assert reloaded[0]["relevance_score"] == 0.2
+    assert [a.get("relevance_score") for a in reloaded[1:]] == [0.9, 0.9, None, None]
+
+
+def test_finished_job_folds_result_log_into_articles(data_dir):
+    _seed_articles(3)
+    processed = []
+
+    outreach.run_article_job(CAMPAIGN, "analyze", _pending(), _analyze(processed))
+
+    assert len(processed) == 3
+    assert not os.path.exists(os.path.join(data_dir, CAMPAIGN, outreach.ARTICLE_RESULTS_FILE))
+    with open(os.path.join(data_dir, CAMPAIGN, "articles.jsonl")) as f:
+        assert all(json.loads(line)["analyzed"] for line in f)
@@ -0,0 +1,264 @@
+"""
+Concurrent article processing: packages come back in input order whatever the
+completion order, a failing article only loses its own package, and every
+worker goes through the one shared LLMRateLimiter. Within an article the
+stage graph runs independent stages concurrently and respects dependencies.
+"""
+
+import importlib
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from pr_outreach.pipeline.build_outreach_package import LLMRateLimiter, build_outreach_package
+    # The package re-exports build_outreach_package, shadowing the module name
+    pipeline = importlib.import_module("pr_outreach.pipeline.build_outreach_package")
+    from pr_outreach.core.schemas import (
+        ArticleCandidate,
+        AuthorProfile,
+        CampaignConfig,
+        EmailAngle,
+        InsertionType,
+        OutreachDecision,
+        OutreachEmail,
+        PositioningStrategy,
+        ProductInfo,
+        SenderPersona,
+    )
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+
+PRODUCT = ProductInfo(
+    name="FitTrack",
+    tagline="Workout tracker for busy people",
+    website_url="https://fittrack.example",
+    category="fitness app",
+    key_features=["workout plans", "progress charts"],
+    unique_value_prop="Ten-minute workouts",
+    target_audience="office workers",
+)
+
+CAMPAIGN = CampaignConfig(
+    campaign_id="camp",
+    campaign_name="Camp",
+    niche_id="fitness",
+    product=PRODUCT,
+    sender_persona=SenderPersona(name="Ann", email="ann@fittrack.example", title="PR", company="FitTrack"),
+)
+
+
+def _articles(count):
+    return [
+        ArticleCandidate(url=f"https://blog{i}.example/post", title=f"Post {i}", domain=f"blog{i}.example")
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def discovered(monkeypatch):
+    """Stubs the datastore and discovery; returns a setter for the found articles."""
+    monkeypatch.setattr(pipeline, "get_contacted_articles", lambda campaign_id: set())
+
+    def install(articles):
+        monkeypatch.setattr(pipeline, "_discover_articles", lambda config, contacted, llm_fn: articles)
+        return articles
+    return install
+
+
+def _run(articles, max_workers):
+    return build_outreach_package(CAMPAIGN, max_articles_to_process=len(articles),
+                                  dry_run=True, max_workers=max_workers)
+
+
+def test_packages_keep_input_order_when_articles_finish_out_of_order(discovered, monkeypatch):
+    articles = discovered(_articles(4))
+    urls = [article.url for article in articles]
+    done = [threading.Event() for _ in articles]
+    finished = []
+
+    def process(article, config, llm_fn, dry_run):
+        i = urls.index(article.url)
+        # Each article waits for the next one: they finish last to first
+        if i + 1 < len(articles):
+            assert done[i + 1].wait(timeout=5)
+        finished.append(i)
+        done[i].set()
+        return SimpleNamespace(outreach_id=article.url)
+
+    monkeypatch.setattr(pipeline, "_process_single_article", process)
+
+    packages = _run(articles, max_workers=4)
+
+    assert finished == [3, 2, 1, 0]
+    assert [package.outreach_id for package in packages] == urls
+
+
+def test_failing_article_only_loses_its_own_package(discovered, monkeypatch):
+    articles = discovered(_articles(4))
+
+    def process(article, config, llm_fn, dry_run):
+        if article.url == articles[1].url:
+            raise RuntimeError("author lookup crashed")
+        if article.url == articles[2].url:
+            return None
+        return SimpleNamespace(outreach_id=article.url)
+
+    monkeypatch.setattr(pipeline, "_process_single_article", process)
+
+    packages = _run(articles, max_workers=4)
+
+    assert [package.outreach_id for package in packages] == [articles[0].url, articles[3].url]
+
+
+def test_workers_share_one_llm_rate_limiter(discovered, monkeypatch):
+    articles = discovered(_articles(6))
+    in_flight, peak, llm_fns = [0], [0], set()
+    lock = threading.Lock()
+
+    def generate_text(role, task, context="", style_hints=None):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return "ok"
+
+    def process(article, config, llm_fn, dry_run):
+        llm_fns.add(llm_fn)
+        for _ in range(3):
+            llm_fn("article_analyzer", "task")
+        return SimpleNamespace(outreach_id=article.url)
+
+    monkeypatch.setattr(pipeline, "generate_text", generate_text)
+    monkeypatch.setattr(pipeline, "_llm_limiter", LLMRateLimiter(max_concurrent=2, min_interval_seconds=0))
+    monkeypatch.setattr(pipeline, "_process_single_article", process)
+
+    packages = _run(articles, max_workers=6)
+
+    assert len(packages) == 6
+    assert len(llm_fns) == 1
+    assert peak[0] == 2
+
+
+STAGES = ("analysis", "positioning", "author", "strategy", "email", "spam_check", "personalization",
+          "quality_gate")
+
+
+def _stub_agents(monkeypatch):
+    """Agents returning fixed results; each concurrent pair meets at a barrier."""
+    # A pair that ran one after the other would time out at its barrier
+    research = threading.Barrier(2, timeout=5)
+    checks = threading.Barrier(2, timeout=5)
+    email = OutreachEmail(
+        subject_line="Quick idea for your roundup", opening_hook="Loved the roundup.",
+        connection_point="You cover fitness apps.", value_proposition="Ten-minute workouts.",
+        insertion_suggestion="Add FitTrack to the list.", call_to_action="Want a demo account?",
+        full_body="Hi, loved the roundup.",
+    )
+
+    def analyze_article(article, product, llm_fn):
+        return article.model_copy(update={"insertion_opportunities": ["list"], "opportunity_score": 0.8})
+
+    def position_product(article, product, llm_fn):
+        research.wait()
+        return PositioningStrategy(
+            insertion_type=InsertionType.LISTICLE_ADDITION, target_section="Top apps",
+            positioning_rationale="Fits the list", suggested_text="FitTrack: ten-minute workouts",
+            value_to_readers="Short workouts", reasoning="Listicle",
+        )
+
+    def profile_author(article, llm_fn):
+        research.wait()
+        return AuthorProfile(name="Jo Writer", email="jo@blog.example")
+
+    def check_spam_score(email, llm_fn):
+        checks.wait()
+        return 0.1, "clean", {}
+
+    def score_personalization(email, article, author, llm_fn):
+        checks.wait()
+        return 0.9, "personal", {}
+
+    monkeypatch.setattr(pipeline, "analyze_article", analyze_article)
+    monkeypatch.setattr(pipeline, "position_product", position_product)
+    monkeypatch.setattr(pipeline, "profile_author", profile_author)
+    monkeypatch.setattr(pipeline, "decide_outreach_strategy", lambda *args: OutreachDecision(
+        email_angle=EmailAngle.VALUE_FIRST, cta_type="reply", reasoning="Value first"))
+    monkeypatch.setattr(pipeline, "write_outreach_email", lambda *args: email)
+    monkeypatch.setattr(pipeline, "check_spam_score", check_spam_score)
+    monkeypatch.setattr(pipeline, "score_personalization", score_personalization)
+
+
+def test_independent_article_stages_overlap_and_are_timed(monkeypatch):
+    _stub_agents(monkeypatch)
+
+    package = pipeline._process_single_article(_articles(1)[0], CAMPAIGN, None, dry_run=True)
+
+    assert package.author.name == "Jo Writer"
+    assert package.overall_quality_score == pytest.approx(0.9)
+    assert set(package.stage_timings_ms) == set(STAGES)
+    assert all(ms >= 0 for ms in package.stage_timings_ms.values())
+
+
+def _graph(log, fail=None):
+    """The article graph with stubs that log start/end and the inputs they saw."""
+    deps = {
+        "analysis": (), "positioning": ("analysis",), "author": ("analysis",),
+        "strategy": ("analysis", "author", "positioning"), "email": ("strategy",),
+        "spam_check": ("email",), "personalization": ("email",),
+        "quality_gate": ("spam_check", "personalization"),
+    }
+    lock = threading.Lock()
+
+    def stage_fn(name):
+        def run(inputs):
+            with lock:
+                log.append(("start", name, frozenset(inputs)))
+            time.sleep(0.01)
+            if name == fail:
+                raise pipeline._ArticleRejected(f"{name} rejected")
+            with lock:
+                log.append(("end", name, None))
+            return name
+        return run
+
+    # Listed in reverse: order in the list must not matter
+    return [pipeline._Stage(name, deps[name], stage_fn(name)) for name in reversed(STAGES)], deps
+
+
+def test_stage_graph_respects_dependency_edges():
+    log, timings = [], {}
+    stages, deps = _graph(log)
+
+    results = pipeline._run_stage_graph(stages, timings)
+
+    assert results == {name: name for name in STAGES}
+    assert set(timings) == set(STAGES)
+    for i, (event, name, inputs) in enumerate(log):
+        if event == "start":
+            ended_before = {n for e, n, _ in log[:i] if e == "end"}
+            assert set(deps[name]) <= ended_before
+            assert set(deps[name]) <= inputs
+
+
+def test_failing_stage_stops_its_dependents():
+    log = []
+    stages, _ = _graph(log, fail="author")
+
+    with pytest.raises(pipeline._ArticleRejected, match="author rejected"):
+        pipeline._run_stage_graph(stages, {})
+
+    started = {name for event, name, _ in log if event == "start"}
+    assert started == {"analysis", "positioning", "author"}
+
+
+def test_unresolvable_dependencies_are_reported():
+    stages = [pipeline._Stage("email", ("strategy",), lambda r: None)]
+
+    with pytest.raises(RuntimeError, match="email"):
+        pipeline._run_stage_graph(stages, {})
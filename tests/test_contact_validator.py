@@ -0,0 +1,123 @@
+"""
+MX lookups: one query per domain, TTL expiry, and concurrent bulk resolution
+against a stub resolver.
+"""
+
+import threading
+import time
+
+import pytest
+
+try:
+    from pr_outreach.services import contact_validator
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+class _Resolver:
+    """Stub for dns.resolver.resolve: records queries, optional delay or error per domain."""
+
+    def __init__(self, delay=0.0, errors=None):
+        self.delay = delay
+        self.errors = errors or {}
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def resolve(self, domain, rdtype, lifetime=None):
+        with self._lock:
+            self.queries.append(domain)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if domain in self.errors:
+                raise self.errors[domain]
+            return ["mx.example.net"]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    def install(**kwargs):
+        stub = _Resolver(**kwargs)
+        monkeypatch.setattr(contact_validator.dns.resolver, "resolve", stub.resolve)
+        return stub
+
+    monkeypatch.setattr(contact_validator, "_verify_with_api", lambda email: None)
+    monkeypatch.setattr(contact_validator, "_mx_cache", {})
+    return install
+
+
+def test_one_lookup_per_domain(resolver):
+    stub = resolver()
+    emails = [f"writer{i}@Example.com" for i in range(5)] + ["editor@news.example.org"]
+
+    results = contact_validator.bulk_validate_emails(emails)
+    contact_validator.validate_email("late@example.com")
+
+    assert all(result["valid"] for result in results.values())
+    assert sorted(stub.queries) == ["example.com", "news.example.org"]
+
+
+def test_invalid_and_disposable_addresses_are_not_resolved(resolver):
+    stub = resolver()
+
+    results = contact_validator.bulk_validate_emails(["not-an-email", "x@mailinator.com"])
+
+    assert not any(result["valid"] for result in results.values())
+    assert stub.queries == []
+
+
+def test_cached_answers_expire_after_their_ttl(resolver, monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(contact_validator, "time", clock)
+    stub = resolver(errors={"flaky.example.com": TimeoutError("timed out")})
+
+    assert contact_validator._check_mx_records("example.com")
+    assert not contact_validator._check_mx_records("flaky.example.com")
+
+    # Transient failures are retried sooner than definitive answers
+    clock.now += contact_validator.MX_TRANSIENT_TTL_SECONDS + 1
+    contact_validator._check_mx_records("example.com")
+    contact_validator._check_mx_records("flaky.example.com")
+    assert stub.queries == ["example.com", "flaky.example.com", "flaky.example.com"]
+
+    clock.now += contact_validator.MX_CACHE_TTL_SECONDS
+    contact_validator._check_mx_records("example.com")
+    assert stub.queries.count("example.com") == 2
+
+
+def test_nxdomain_is_cached_as_no_mx(resolver):
+    stub = resolver(errors={"gone.example.com": contact_validator.dns.resolver.NXDOMAIN()})
+
+    assert contact_validator.validate_email("a@gone.example.com")[0] is False
+    assert contact_validator.validate_email("b@gone.example.com")[0] is False
+    assert stub.queries == ["gone.example.com"]
+
+
+def test_bulk_path_resolves_domains_in_parallel(resolver):
+    stub = resolver(delay=0.2)
+    emails = [f"writer@site{i}.example.com" for i in range(8)]
+
+    started = time.monotonic()
+    results = contact_validator.bulk_validate_emails(emails, max_workers=8)
+    elapsed = time.monotonic() - started
+
+    assert len(results) == 8 and all(result["valid"] for result in results.values())
+    assert sorted(stub.queries) == sorted(f"site{i}.example.com" for i in range(8))
+    assert stub.max_in_flight > 1
+    # Sequential lookups would take 8 * 0.2s
+    assert elapsed < 1.0
@@ -0,0 +1,108 @@
+"""
+Contacted articles: URL normalization, Bloom membership, and the datastore's
+cached sets and filters.
+"""
+
+import sqlite3
+
+import pytest
+
+try:
+    from pr_outreach.io import outreach_datastore
+    from pr_outreach.io.contacted_urls import BloomFilter, ContactedURLSet, normalize_url, url_domain
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+
+@pytest.mark.parametrize("url", [
+    "https://example.com/post",
+    "http://www.example.com/post/",
+    "HTTPS://WWW.EXAMPLE.COM:443/post#comments",
+    "example.com/post?utm_source=newsletter&fbclid=abc",
+    "https://example.com/post/index.html",
+    "https://example.com/post/amp",
+])
+def test_url_variants_share_one_key(url):
+    assert normalize_url(url) == "example.com/post"
+
+
+def test_query_is_sorted_and_meaningful_params_kept():
+    assert normalize_url("https://example.com/p?b=2&utm_medium=x&a=1") == "example.com/p?a=1&b=2"
+    assert normalize_url("https://example.com/p?id=1") != normalize_url("https://example.com/p?id=2")
+    assert normalize_url("https://example.com:8080/p") == "example.com:8080/p"
+    assert url_domain("https://www.News.example.com/a/b?x=1") == "news.example.com"
+    assert normalize_url("") == ""
+
+
+def test_bloom_has_no_false_negatives_and_few_false_positives():
+    keys = [f"site{i}.com/article-{i}" for i in range(2000)]
+    bloom = BloomFilter.from_keys(keys, min_capacity=2000)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other{i}.com/x" in bloom for i in range(5000))
+    assert false_positives < 50
+    assert not bloom.is_full
+
+
+def test_contacted_set_normalizes_membership():
+    contacted = ContactedURLSet.from_urls("camp", ["https://www.example.com/post/?utm_source=x"])
+
+    assert "http://example.com/post" in contacted
+    assert "https://example.com/other" not in contacted
+    assert not contacted.contacted_in_any_campaign("https://example.com/other")
+
+
+@pytest.fixture
+def datastore(tmp_path, monkeypatch):
+    db_path = tmp_path / "outreach.db"
+    monkeypatch.setenv("OUTREACH_DB_PATH", str(db_path))
+    monkeypatch.setenv("OUTREACH_DATASTORE_PATH", str(tmp_path / "outreach_records.jsonl"))
+    monkeypatch.setenv("CONTACTED_ARTICLES_PATH", str(tmp_path / "contacted_articles.json"))
+    yield db_path
+    conn = outreach_datastore._connections.pop(str(db_path), None)
+    if conn is not None:
+        conn.close()
+    outreach_datastore._contacted_sets.pop(str(db_path), None)
+    outreach_datastore._contacted_filters.pop(str(db_path), None)
+
+
+def test_adding_urls_updates_sets_and_filters_without_files(datastore):
+    contacted = outreach_datastore.get_contacted_articles("camp-a")
+    outreach_datastore.add_contacted_article("camp-a", "https://www.example.com/post/")
+    outreach_datastore.add_contacted_article("camp-b", "https://news.example.org/story")
+
+    assert "http://example.com/post" in contacted
+    assert contacted.contacted_in_any_campaign("https://news.example.org/story?utm_source=x")
+    assert contacted.domain_contacted("https://news.example.org/another")
+    assert not contacted.domain_contacted("https://unrelated.example.net/")
+    assert sorted(p.name for p in datastore.parent.iterdir() if p.suffix == ".bloom") == []
+
+
+def test_writes_from_another_process_are_picked_up(datastore):
+    contacted = outreach_datastore.get_contacted_articles("camp-a")
+    assert len(contacted) == 0
+
+    # Another process inserts directly into the shared database
+    other = sqlite3.connect(str(datastore))
+    with other:
+        other.execute(
+            "INSERT INTO contacted_urls (campaign_id, url_key, domain, url, contacted_at) "
+            "VALUES ('camp-a', 'example.com/late', 'example.com', 'https://example.com/late', '')"
+        )
+    other.close()
+
+    assert outreach_datastore.get_contacted_articles("camp-a") is contacted
+    assert "https://example.com/late" in contacted
+    assert contacted.contacted_in_any_campaign("https://example.com/late")
+
+
+def test_reset_rebuilds_filters_without_the_campaign(datastore):
+    outreach_datastore.add_contacted_article("camp-a", "https://example.com/a")
+    outreach_datastore.add_contacted_article("camp-b", "https://example.org/b")
+    contacted_b = outreach_datastore.get_contacted_articles("camp-b")
+
+    outreach_datastore.reset_campaign_data("camp-a", dry_run=False)
+
+    contacted_b = outreach_datastore.get_contacted_articles("camp-b")
+    assert not contacted_b.contacted_in_any_campaign("https://example.com/a")
+    assert contacted_b.contacted_in_any_campaign("https://example.org/b")
@@ -0,0 +1,150 @@
+"""
+Content index: add/nearest lookups, persistence, the recent-content window and
+the per-embedder duplicate threshold used by trend_hunter.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from yt_autopilot.agents import trend_hunter
+from yt_autopilot.core.schemas import TrendCandidate
+from yt_autopilot.io import content_index
+from yt_autopilot.io.content_index import (
+    HASHED_EMBEDDER_NAME,
+    HASHED_SEMANTIC_DUPLICATE_THRESHOLD,
+    KIND_HOOK,
+    KIND_TITLE,
+    RECENT_CONTENT_DAYS,
+    SEMANTIC_DUPLICATE_THRESHOLD,
+    ContentIndex,
+    _embed_hashed,
+)
+
+RECENT = datetime.now().isoformat()
+OLD = (datetime.now() - timedelta(days=RECENT_CONTENT_DAYS + 30)).isoformat()
+
+
+@pytest.fixture(autouse=True)
+def hashed_embedder(monkeypatch):
+    """Deterministic embeddings without a model download."""
+    monkeypatch.setattr(content_index, "_get_embedder", lambda: (HASHED_EMBEDDER_NAME, _embed_hashed))
+
+
+def _entry(record_id, text, kind=KIND_TITLE, saved_at=RECENT, **ids):
+    return {"record_id": record_id, "kind": kind, "text": text, "saved_at": saved_at, **ids}
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ContentIndex("ws", tmp_path / "content_index")
+    index.add([
+        _entry("r1", "ChatGPT for work efficiency"),
+        _entry("r2", "Best stretches for morning routine"),
+        _entry("r3", "Home workout without equipment"),
+        _entry("r3", "Stop wasting your mornings", kind=KIND_HOOK),
+    ])
+    return index
+
+
+def test_nearest_entry_is_the_most_similar_text(index):
+    (match,) = index.search("How ChatGPT boosts work efficiency", top_k=1)
+
+    assert match["record_id"] == "r1"
+    assert match["kind"] == KIND_TITLE
+    assert match["score"] > 0.5
+
+
+def test_matches_are_sorted_and_filtered(index):
+    matches = index.search("Morning stretches routine", top_k=3)
+    assert [m["record_id"] for m in matches][0] == "r2"
+    assert [m["score"] for m in matches] == sorted((m["score"] for m in matches), reverse=True)
+
+    assert index.search("Morning stretches routine", top_k=3, min_score=0.99) == []
+    assert {m["kind"] for m in index.search("mornings", top_k=4, kinds=[KIND_HOOK])} == {KIND_HOOK}
+
+
+def test_identical_text_scores_one(index):
+    (match,) = index.search("Best stretches for morning routine", top_k=1)
+
+    assert match["score"] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_batch_search_matches_single_searches(index):
+    texts = ["ChatGPT at work", "no equipment home workout"]
+
+    batch = index.search_batch(texts, top_k=2)
+
+    assert batch == [index.search(text, top_k=2) for text in texts]
+
+
+def test_add_deduplicates_and_refreshes_ids(index):
+    assert index.add([_entry("r1", "chatgpt for work efficiency ", video_internal_id="vid_1")]) == 0
+    assert len(index) == 4
+    assert index.search("ChatGPT for work efficiency", top_k=1)[0]["video_internal_id"] == "vid_1"
+
+    assert index.add([_entry("r4", "Python tutorial for beginners"), _entry("r5", "   ")]) == 1
+    assert len(index) == 5
+    assert index.search("Python tutorial", top_k=1)[0]["record_id"] == "r4"
+
+
+def test_saved_index_loads_with_same_results(index, tmp_path):
+    index.save()
+
+    loaded = ContentIndex("ws", tmp_path / "content_index")
+    assert loaded.load()
+
+    assert loaded.entries == index.entries
+    assert loaded.search("stretching in the morning", top_k=3) == index.search("stretching in the morning", top_k=3)
+
+
+def test_since_limits_search_to_recent_entries(tmp_path):
+    index = ContentIndex("ws", tmp_path)
+    index.add([
+        _entry("old", "AI productivity tools", saved_at=OLD),
+        _entry("new", "AI image generators", saved_at=RECENT),
+    ])
+    since = (datetime.now() - timedelta(days=RECENT_CONTENT_DAYS)).isoformat()
+
+    assert index.search("AI productivity tools", top_k=1)[0]["record_id"] == "old"
+    assert index.search("AI productivity tools", top_k=1, since=since)[0]["record_id"] == "new"
+    assert index.search("AI productivity tools", top_k=1, since=datetime.now().isoformat() + "~") == []
+
+
+def test_duplicate_threshold_depends_on_embedder(index):
+    assert index.duplicate_threshold == HASHED_SEMANTIC_DUPLICATE_THRESHOLD
+
+    index.embedder_name = content_index.SENTENCE_TRANSFORMER_NAME
+    assert index.duplicate_threshold == SEMANTIC_DUPLICATE_THRESHOLD
+
+
+def _trend(keyword):
+    return TrendCandidate(keyword=keyword, why_hot="test", momentum_score=0.8, source="test")
+
+
+def test_trend_hunter_ignores_content_outside_recent_window(monkeypatch, tmp_path):
+    index = ContentIndex("ws", tmp_path)
+    index.add([
+        _entry("old", "AI productivity tools", saved_at=OLD),
+        _entry("new", "Home workout without equipment", saved_at=RECENT),
+    ])
+    monkeypatch.setitem(content_index._indexes, "ws", index)
+
+    old_topic, recent_topic = trend_hunter._find_nearest_past_content(
+        "ws", ["AI productivity tools", "Home workouts with no equipment"]
+    )
+
+    assert old_topic["record_id"] == "new"
+    assert not trend_hunter._is_too_similar_to_recent(_trend("AI productivity tools"), [], old_topic)
+    assert recent_topic["record_id"] == "new"
+    assert recent_topic["threshold"] == HASHED_SEMANTIC_DUPLICATE_THRESHOLD
+
+
+def test_trend_hunter_uses_threshold_of_the_embedder():
+    trend = _trend("How ChatGPT boosts work efficiency")
+    match = {"score": 0.7, "kind": KIND_TITLE, "text": "ChatGPT for work efficiency"}
+
+    assert not trend_hunter._is_too_similar_to_recent(trend, [], match)
+    assert trend_hunter._is_too_similar_to_recent(
+        trend, [], {**match, "threshold": HASHED_SEMANTIC_DUPLICATE_THRESHOLD}
+    )
@@ -0,0 +1,171 @@
+"""
+Domain metrics: domains are deduplicated before any provider call, Moz is
+queried in MOZ_BATCH_SIZE batches, cached entries expire per source (short
+"miss" entries for failed lookups), and subdomains of known domains are
+estimated from the authority table.
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from pr_outreach.services import domain_analyzer
+    from pr_outreach.services.domain_analyzer import DOMAIN_CACHE_TTL_SECONDS, analyze_domain, analyze_domains
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+
+class Providers:
+    """Stub Ahrefs/Moz lookups that record every call and know the given domains."""
+
+    def __init__(self, ahrefs_known=(), moz_known=()):
+        self.ahrefs_known = set(ahrefs_known)
+        self.moz_known = set(moz_known)
+        self.ahrefs_calls = []
+        self.moz_batches = []
+        self._lock = threading.Lock()
+
+    def metrics(self, domain, da=60):
+        return {"domain_authority": da, "monthly_traffic": 0, "backlinks": 1, "is_high_authority": da >= 50}
+
+    def ahrefs(self, domain):
+        with self._lock:
+            self.ahrefs_calls.append(domain)
+        return self.metrics(domain) if domain in self.ahrefs_known else None
+
+    def moz_batch(self, domains):
+        self.moz_batches.append(list(domains))
+        return {domain: self.metrics(domain, da=55) for domain in domains if domain in self.moz_known}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(domain_analyzer, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "domain_metrics_cache.json"
+    monkeypatch.setenv("DOMAIN_METRICS_CACHE_PATH", str(path))
+    monkeypatch.setattr(domain_analyzer, "_cache", None)
+    for name in ("AHREFS_API_KEY", "MOZ_ACCESS_ID", "MOZ_SECRET_KEY"):
+        monkeypatch.delenv(name, raising=False)
+    return path
+
+
+@pytest.fixture
+def providers(monkeypatch, cache_path):
+    def install(ahrefs=None, moz=None):
+        """ahrefs/moz: domains each provider knows (None = not configured)."""
+        stub = Providers(ahrefs or (), moz or ())
+        if ahrefs is not None:
+            monkeypatch.setenv("AHREFS_API_KEY", "key")
+        if moz is not None:
+            monkeypatch.setenv("MOZ_ACCESS_ID", "id")
+            monkeypatch.setenv("MOZ_SECRET_KEY", "secret")
+        monkeypatch.setattr(domain_analyzer, "_get_ahrefs_metrics", stub.ahrefs)
+        monkeypatch.setattr(domain_analyzer, "_get_moz_metrics_batch", stub.moz_batch)
+        return stub
+    return install
+
+
+def test_domains_are_deduplicated_before_provider_calls(providers, clock):
+    stub = providers(ahrefs={"a.example"})
+    inputs = ["https://www.a.example/one", "https://a.example/two", "A.example", "https://b.example/x"]
+
+    results = analyze_domains(inputs)
+
+    assert sorted(stub.ahrefs_calls) == ["a.example", "b.example"]
+    assert results[inputs[0]] is results[inputs[1]] is results[inputs[2]]
+    assert results[inputs[0]]["source"] == "ahrefs"
+    assert results[inputs[3]]["source"] == "estimation"
+
+
+def test_moz_is_queried_in_batches(providers, clock, monkeypatch):
+    monkeypatch.setattr(domain_analyzer, "MOZ_BATCH_SIZE", 2)
+    domains = [f"site{i}.example" for i in range(5)]
+    stub = providers(moz=domains)
+
+    results = analyze_domains(domains)
+
+    assert stub.moz_batches == [domains[0:2], domains[2:4], domains[4:]]
+    assert {result["source"] for result in results.values()} == {"moz"}
+
+
+def test_moz_only_gets_domains_ahrefs_missed(providers, clock):
+    stub = providers(ahrefs={"a.example"}, moz={"a.example", "b.example"})
+
+    results = analyze_domains(["a.example", "b.example", "c.example"])
+
+    assert stub.moz_batches == [["b.example", "c.example"]]
+    assert [results[d]["source"] for d in ("a.example", "b.example", "c.example")] == [
+        "ahrefs", "moz", "estimation"
+    ]
+
+
+def test_cached_entries_expire_per_source(providers, clock):
+    stub = providers(ahrefs={"hit.example"})
+    analyze_domains(["hit.example", "miss.example"])
+    assert sorted(stub.ahrefs_calls) == ["hit.example", "miss.example"]
+
+    # Within both TTLs: no provider call, cached source kept
+    stub.ahrefs_calls.clear()
+    results = analyze_domains(["hit.example", "miss.example"])
+    assert stub.ahrefs_calls == []
+    assert results["hit.example"]["source"] == "ahrefs"
+    assert results["miss.example"]["source"] == "estimation"
+
+    # The short-lived miss entry expires first
+    clock[0] += DOMAIN_CACHE_TTL_SECONDS["miss"] + 1
+    analyze_domains(["hit.example", "miss.example"])
+    assert stub.ahrefs_calls == ["miss.example"]
+
+    stub.ahrefs_calls.clear()
+    clock[0] += DOMAIN_CACHE_TTL_SECONDS["ahrefs"]
+    analyze_domains(["hit.example", "miss.example"])
+    assert sorted(stub.ahrefs_calls) == ["hit.example", "miss.example"]
+
+
+def test_cache_file_is_reused_by_a_new_process(providers, clock, cache_path, monkeypatch):
+    stub = providers(ahrefs={"hit.example"})
+    analyze_domains(["hit.example"])
+
+    with open(cache_path) as f:
+        assert json.load(f)["hit.example"]["source"] == "ahrefs"
+
+    monkeypatch.setattr(domain_analyzer, "_cache", None)
+    stub.ahrefs_calls.clear()
+    assert analyze_domain("hit.example")["source"] == "ahrefs"
+    assert stub.ahrefs_calls == []
+    assert analyze_domain("hit.example", use_cache=False)["source"] == "ahrefs"
+    assert stub.ahrefs_calls == ["hit.example"]
+
+
+def test_nothing_is_cached_without_configured_providers(cache_path, clock):
+    assert analyze_domain("https://unknown.example/post")["source"] == "estimation"
+    assert not cache_path.exists()
+
+
+@pytest.mark.parametrize("domain, da", [
+    ("techcrunch.com", 93),
+    ("blog.techcrunch.com", 78),
+    ("a.b.techcrunch.com", 78),
+    ("fitness.self.com", 71),
+    ("en.wikipedia.org", 85),
+])
+def test_known_domains_and_subdomains_use_authority_table(cache_path, clock, domain, da):
+    result = analyze_domain(f"https://{domain}/post")
+
+    assert result["domain"] == domain
+    assert result["domain_authority"] == da
+    assert result["source"] == "estimation"
+
+
+def test_unknown_domain_is_not_matched_by_suffix_alone(cache_path, clock):
+    # "mytechcrunch.com" ends with "techcrunch.com" but is not a subdomain
+    assert analyze_domain("mytechcrunch.com")["domain_authority"] == 30
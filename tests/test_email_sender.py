@@ -0,0 +1,358 @@
+"""
+Provider failover: only errors that certainly happened before delivery move
+a batch to the next provider, and an SMTP message is never sent twice.
+SMTP sends also run against a local sink server on 127.0.0.1.
+"""
+
+import smtplib
+import socketserver
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+try:
+    import outreach
+    from pr_outreach.io import outreach_index, send_queue
+    from pr_outreach.services import email_sender
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+
+class _Response:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.text = "error" if status_code >= 400 else ""
+        self.headers = {"X-Message-Id": "sg-1"}
+        self._payload = payload or {"id": "mg-1"}
+
+    def json(self):
+        return self._payload
+
+
+class _Session:
+    """Returns (or raises) a fixed outcome and records each POST."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.posts = 0
+
+    def post(self, url, **kwargs):
+        self.posts += 1
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def _refused():
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.ConnectionError(MaxRetryError(None, "/", reason))
+
+
+def _messages(count=3):
+    return [
+        {"to_email": f"writer{i}@example.com", "subject": f"Hi {i}", "body": "Body",
+         "from_email": "pr@example.com", "from_name": "PR"}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    def install(sendgrid_outcome):
+        sendgrid = email_sender._SendGridProvider("key", _Session(sendgrid_outcome))
+        mailgun = email_sender._MailgunProvider("key", "example.com", _Session(_Response(200)))
+        for provider in (sendgrid, mailgun):
+            provider.rate_limiter = email_sender._RateLimiter(0)
+        monkeypatch.setattr(email_sender, "_get_providers", lambda: [sendgrid, mailgun])
+        return sendgrid, mailgun
+    return install
+
+
+@pytest.mark.parametrize("outcome", [
+    requests.exceptions.ReadTimeout("read timed out"),
+    requests.ConnectionError(ProtocolError("Connection aborted")),
+    _Response(503),
+], ids=["read-timeout", "aborted", "5xx"])
+def test_possibly_delivered_batch_is_not_failed_over(providers, outcome):
+    sendgrid, mailgun = providers(outcome)
+
+    results = email_sender.send_emails(_messages())
+
+    assert [success for success, _, _ in results] == [None] * 3
+    assert all(provider == "sendgrid" for _, _, provider in results)
+    assert all(result.startswith(email_sender.DELIVERY_UNKNOWN) for _, result, _ in results)
+    assert mailgun.session.posts == 0
+
+
+@pytest.mark.parametrize("outcome", [
+    _refused(),
+    requests.exceptions.ConnectTimeout("connect timed out"),
+    _Response(401),
+], ids=["refused", "connect-timeout", "4xx"])
+def test_undelivered_batch_fails_over(providers, outcome):
+    sendgrid, mailgun = providers(outcome)
+
+    results = email_sender.send_emails(_messages())
+
+    assert results == [(True, "mg-1", "mailgun")] * 3
+    assert sendgrid.session.posts == 1
+    assert mailgun.session.posts == 1
+
+
+def test_unknown_delivery_marks_queue_entry_uncertain(tmp_path, monkeypatch, providers):
+    monkeypatch.setenv("SEND_QUEUE_DB_PATH", str(tmp_path / "send_queue.db"))
+    providers(requests.exceptions.ReadTimeout("read timed out"))
+    monkeypatch.setenv("OUTREACH_FROM_EMAIL", "pr@example.com")
+    send_queue.enqueue_emails(
+        dict(message, outreach_id=f"o{i}", campaign_id="camp")
+        for i, message in enumerate(_messages(2))
+    )
+
+    counts = email_sender.process_send_queue(campaign_id="camp", max_workers=1)
+
+    assert counts == {"sent": 0, "failed": 0, "uncertain": 2}
+    assert send_queue.get_queue_counts("camp") == {send_queue.UNCERTAIN: 2}
+
+
+class _SMTPServer:
+    """Fake smtplib.SMTP connection; `fail_send` is raised from send_message."""
+
+    def __init__(self, alive=True, fail_send=None):
+        self.alive = alive
+        self.fail_send = fail_send
+        self.sent = 0
+
+    def noop(self):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return (250, b"OK")
+
+    def send_message(self, msg):
+        self.sent += 1
+        if self.fail_send:
+            raise self.fail_send
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    provider = email_sender._SMTPProvider("smtp.example.com", 587, "user", "pass")
+    provider.rate_limiter = email_sender._RateLimiter(0)
+    connections = []
+
+    def connect():
+        server = _SMTPServer()
+        connections.append(server)
+        return server
+
+    monkeypatch.setattr(provider, "_connect", connect)
+    return provider, connections
+
+
+def test_smtp_disconnect_during_send_is_uncertain_and_not_resent(smtp):
+    provider, connections = smtp
+    provider._server = _SMTPServer(fail_send=smtplib.SMTPServerDisconnected("closed after DATA"))
+    stale = provider._server
+
+    ((success, result),) = provider.send(_messages(1))
+
+    assert success is None and result.startswith(email_sender.DELIVERY_UNKNOWN)
+    assert stale.sent == 1 and connections == []
+
+
+def test_smtp_idle_disconnect_reconnects_before_sending(smtp):
+    provider, connections = smtp
+    provider._server = _SMTPServer(alive=False)
+
+    ((success, _),) = provider.send(_messages(1))
+
+    assert success is True
+    assert [server.sent for server in connections] == [1]
+
+
+def test_smtp_rejection_is_a_failure(smtp):
+    provider, _ = smtp
+    provider._server = _SMTPServer(fail_send=smtplib.SMTPRecipientsRefused({"x@example.com": (550, b"no")}))
+
+    ((success, _),) = provider.send(_messages(1))
+
+    assert success is False
+
+
+@pytest.mark.parametrize("error", [
+    smtplib.SMTPHeloError(501, b"bad HELO"),
+    smtplib.SMTPNotSupportedError("SMTPUTF8 not supported"),
+    smtplib.SMTPResponseException(554, b"transaction failed"),
+], ids=["helo", "not-supported", "response"])
+def test_smtp_error_reply_is_a_failure_not_uncertain(smtp, error):
+    provider, _ = smtp
+    provider._server = _SMTPServer(fail_send=error)
+
+    ((success, result),) = provider.send(_messages(1))
+
+    assert success is False and not result.startswith(email_sender.DELIVERY_UNKNOWN)
+    assert provider._server is None
+
+
+def test_smtp_socket_error_during_send_is_uncertain(smtp):
+    provider, _ = smtp
+    provider._server = _SMTPServer(fail_send=ConnectionResetError("reset by peer"))
+
+    ((success, result),) = provider.send(_messages(1))
+
+    assert success is None and result.startswith(email_sender.DELIVERY_UNKNOWN)
+
+
+class _SinkHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP dialogue: accepts AUTH and every message."""
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        sink = self.server
+        with sink.lock:
+            sink.connections += 1
+        self.reply("220 sink ESMTP")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line[:4].upper()
+            if verb == b"EHLO":
+                self.reply("250-sink")
+                self.reply("250 AUTH PLAIN LOGIN")
+            elif verb == b"AUTH":
+                self.reply("235 Authenticated")
+            elif verb == b"RCPT":
+                recipients.append(line.decode().split("<", 1)[1].split(">", 1)[0])
+                self.reply("250 OK")
+            elif verb == b"DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with sink.lock:
+                    sink.recipients.extend(recipients)
+                recipients = []
+                self.reply("250 Queued")
+            elif verb == b"QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                # HELO, MAIL, RSET, NOOP
+                self.reply("250 OK")
+
+
+class _SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SinkHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.recipients = []
+
+
+@pytest.fixture
+def smtp_sink():
+    sink = _SMTPSink()
+    thread = threading.Thread(target=sink.serve_forever, daemon=True)
+    thread.start()
+    yield sink
+    sink.shutdown()
+    sink.server_close()
+
+
+def _sink_provider(sink):
+    provider = email_sender._SMTPProvider("127.0.0.1", sink.server_address[1], "user", "pass",
+                                          use_starttls=False)
+    provider.rate_limiter = email_sender._RateLimiter(0)
+    return provider
+
+
+def test_smtp_sends_every_message_over_one_connection(smtp_sink):
+    provider = _sink_provider(smtp_sink)
+
+    results = provider.send(_messages(3))
+    provider.close()
+
+    assert [success for success, _ in results] == [True] * 3
+    assert smtp_sink.connections == 1
+    assert smtp_sink.recipients == [m["to_email"] for m in _messages(3)]
+
+
+@pytest.fixture
+def outreach_sink(tmp_path, monkeypatch, smtp_sink):
+    """send_outreach_records wired to the sink through tmp queue and index DBs."""
+    queue_db, index_db = tmp_path / "send_queue.db", tmp_path / "outreach_index.db"
+    monkeypatch.setenv("SEND_QUEUE_DB_PATH", str(queue_db))
+    monkeypatch.setenv("OUTREACH_INDEX_DB_PATH", str(index_db))
+    monkeypatch.setenv("OUTREACH_FROM_EMAIL", "pr@example.com")
+    monkeypatch.setattr(outreach, "DATA_DIR", str(tmp_path / "outreach"))
+    provider = _sink_provider(smtp_sink)
+    monkeypatch.setattr(email_sender, "_get_providers", lambda: [provider])
+    yield smtp_sink
+    provider.close()
+    for module, db_path in ((send_queue, queue_db), (outreach_index, index_db)):
+        conn = module._connections.pop(str(db_path), None)
+        if conn is not None:
+            conn.close()
+
+
+def _records(count=3):
+    return [
+        {"outreach_id": f"o{i}", "campaign_id": "camp", "author_email": f"writer{i}@example.com",
+         "subject": f"Hi {i}", "body": "Body", "status": "approved"}
+        for i in range(count)
+    ]
+
+
+def test_rerunning_send_outreach_records_sends_nothing(outreach_sink):
+    first = outreach.send_outreach_records(_records(), workers=2)
+    second = outreach.send_outreach_records(_records(), workers=2)
+
+    assert first == {"sent": 3, "failed": 0, "uncertain": 0, "already_sent": 0}
+    assert second == {"sent": 0, "failed": 0, "uncertain": 0, "already_sent": 3}
+    assert sorted(outreach_sink.recipients) == [r["author_email"] for r in _records()]
+    assert outreach_sink.connections == 1
+
+
+def test_stale_sending_claim_becomes_uncertain_and_is_not_sent(outreach_sink, monkeypatch):
+    records = _records()
+    # A process that crashed mid-send left o0 claimed
+    send_queue.enqueue_emails(
+        {"outreach_id": r["outreach_id"], "campaign_id": r["campaign_id"], "to_email": r["author_email"],
+         "subject": r["subject"], "body": r["body"]}
+        for r in records
+    )
+    assert [e["outreach_id"] for e in send_queue.claim_emails(1, outreach_ids=["o0"])] == ["o0"]
+    later = time.time() + send_queue.SENDING_STALE_SECONDS + 1
+    monkeypatch.setattr(send_queue, "time", SimpleNamespace(time=lambda: later))
+
+    counts = outreach.send_outreach_records(records, workers=2)
+
+    assert counts == {"sent": 2, "failed": 0, "uncertain": 1, "already_sent": 0}
+    assert sorted(outreach_sink.recipients) == ["writer1@example.com", "writer2@example.com"]
+    assert send_queue.get_queue_entries(["o0"])["o0"]["status"] == send_queue.UNCERTAIN
+
+
+def test_claim_by_ids_beyond_sqlite_variable_limit(tmp_path, monkeypatch):
+    monkeypatch.setenv("SEND_QUEUE_DB_PATH", str(tmp_path / "send_queue.db"))
+    ids = [f"o{i:05d}" for i in range(1200)]
+    send_queue.enqueue_emails(
+        dict(message, outreach_id=outreach_id, campaign_id="camp")
+        for outreach_id, message in zip(ids, _messages(1) * len(ids))
+    )
+
+    claimed = send_queue.claim_emails(limit=700, outreach_ids=list(reversed(ids)))
+
+    assert [entry["outreach_id"] for entry in claimed] == ids[:700]
+    assert send_queue.claim_emails(limit=1000, outreach_ids=ids)[0]["outreach_id"] == ids[700]
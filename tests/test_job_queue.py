@@ -0,0 +1,199 @@
+"""
+Durable job queue: claims hand each queued job to one worker, stale running
+jobs are re-queued until MAX_JOB_ATTEMPTS, released jobs keep their attempt
+budget, and jobs resolve by unique id prefix.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import REPO_ROOT
+from yt_autopilot.io import job_queue
+
+_CLAIM_ALL = """
+import sys
+from yt_autopilot.io import job_queue
+while True:
+    job = job_queue.claim_job(sys.argv[1])
+    if job is None:
+        break
+    print(job["job_id"], flush=True)
+"""
+
+
+@pytest.fixture(autouse=True)
+def queue_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "job_queue.db"
+    monkeypatch.setenv("JOB_QUEUE_DB_PATH", str(db_path))
+    yield db_path
+    conn = job_queue._connections.pop(str(db_path), None)
+    if conn is not None:
+        conn.close()
+
+
+def test_enqueue_is_idempotent_while_workspace_has_queued_job():
+    first = job_queue.enqueue_job("ws_a", params={"use_llm_curation": True})
+    again = job_queue.enqueue_job("ws_a", params={"use_llm_curation": False})
+    other = job_queue.enqueue_job("ws_b")
+
+    assert again["job_id"] == first["job_id"]
+    assert again["params"] == {"use_llm_curation": True}
+    assert other["job_id"] != first["job_id"]
+    assert job_queue.get_job_counts() == {job_queue.QUEUED: 2}
+
+
+def test_claim_takes_oldest_queued_job():
+    first = job_queue.enqueue_job("ws_a")
+    second = job_queue.enqueue_job("ws_b")
+
+    claimed = job_queue.claim_job("host:1")
+
+    assert claimed["job_id"] == first["job_id"]
+    assert claimed["status"] == job_queue.RUNNING
+    assert claimed["worker"] == "host:1"
+    assert claimed["attempts"] == 1
+    assert job_queue.claim_job("host:2")["job_id"] == second["job_id"]
+    assert job_queue.claim_job("host:3") is None
+
+
+def test_concurrent_claims_never_share_a_job():
+    job_ids = {job_queue.enqueue_job(f"ws_{i}")["job_id"] for i in range(20)}
+    claimed = []
+
+    def worker(name):
+        while True:
+            job = job_queue.claim_job(name)
+            if job is None:
+                return
+            claimed.append(job["job_id"])
+
+    threads = [threading.Thread(target=worker, args=(f"host:{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == sorted(job_ids)
+
+
+def test_daemons_in_separate_processes_never_share_a_job(queue_db):
+    job_ids = {job_queue.enqueue_job(f"ws_{i}")["job_id"] for i in range(60)}
+    env = dict(os.environ, JOB_QUEUE_DB_PATH=str(queue_db))
+
+    daemons = [
+        subprocess.Popen([sys.executable, "-c", _CLAIM_ALL, f"host:{i}"], cwd=REPO_ROOT, env=env,
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        for i in range(3)
+    ]
+    claimed = []
+    for daemon in daemons:
+        stdout, stderr = daemon.communicate(timeout=60)
+        assert daemon.returncode == 0, stderr[-2000:]
+        claimed.extend(stdout.split())
+
+    assert sorted(claimed) == sorted(job_ids)
+
+
+def test_workspace_can_queue_again_once_its_job_is_claimed():
+    first = job_queue.enqueue_job("ws_a")
+    job_queue.claim_job("host:1")
+
+    assert job_queue.enqueue_job("ws_a")["job_id"] != first["job_id"]
+
+
+def test_stale_job_is_requeued_and_reclaimed():
+    job = job_queue.enqueue_job("ws_a")
+    job_queue.claim_job("host:1")
+
+    # Fresh heartbeat: not stale
+    assert job_queue.recover_stale_jobs() == 0
+    # Negative threshold: every running job counts as stale
+    assert job_queue.recover_stale_jobs(stale_seconds=-1) == 1
+
+    requeued = job_queue.get_job(job["job_id"])
+    assert requeued["status"] == job_queue.QUEUED
+    assert requeued["worker"] is None
+    assert requeued["attempts"] == 1
+    assert "re-queued" in requeued["last_error"]
+
+    reclaimed = job_queue.claim_job("host:2")
+    assert reclaimed["job_id"] == job["job_id"]
+    assert reclaimed["attempts"] == 2
+
+
+def test_stale_job_fails_after_max_attempts():
+    job = job_queue.enqueue_job("ws_a")
+
+    for attempt in range(1, job_queue.MAX_JOB_ATTEMPTS + 1):
+        assert job_queue.claim_job("host:1")["attempts"] == attempt
+        assert job_queue.recover_stale_jobs(stale_seconds=-1) == 1
+
+    failed = job_queue.get_job(job["job_id"])
+    assert failed["status"] == job_queue.FAILED
+    assert failed["attempts"] == job_queue.MAX_JOB_ATTEMPTS
+    assert "max attempts" in failed["last_error"]
+    assert job_queue.claim_job("host:1") is None
+
+
+def test_heartbeat_keeps_job_running():
+    job = job_queue.enqueue_job("ws_a")
+    job_queue.claim_job("host:1")
+    job_queue.heartbeat_job(job["job_id"])
+
+    assert job_queue.recover_stale_jobs(stale_seconds=60) == 0
+    assert job_queue.get_job(job["job_id"])["status"] == job_queue.RUNNING
+
+
+def test_release_requeues_without_spending_an_attempt():
+    job = job_queue.enqueue_job("ws_a")
+    job_queue.claim_job("host:1")
+
+    job_queue.release_job(job["job_id"])
+
+    released = job_queue.get_job(job["job_id"])
+    assert released["status"] == job_queue.QUEUED
+    assert released["worker"] is None
+    assert released["attempts"] == 0
+    assert job_queue.claim_job("host:2")["attempts"] == 1
+
+
+def test_release_ignores_finished_jobs():
+    job = job_queue.enqueue_job("ws_a")
+    job_queue.claim_job("host:1")
+    job_queue.complete_job(job["job_id"], {"video_id": "v1"})
+
+    job_queue.release_job(job["job_id"])
+
+    done = job_queue.get_job(job["job_id"])
+    assert done["status"] == job_queue.DONE
+    assert done["result"] == {"video_id": "v1"}
+
+
+def test_get_job_by_unique_prefix(monkeypatch):
+    ids = iter(["abc12345-0000", "abc12399-0000", "def00000-0000"])
+    monkeypatch.setattr(job_queue, "uuid", SimpleNamespace(uuid4=lambda: next(ids)))
+    job_queue.enqueue_job("ws_a")
+    job_queue.enqueue_job("ws_b")
+    job_queue.enqueue_job("ws_c")
+
+    assert job_queue.get_job("abc12345-0000")["workspace_id"] == "ws_a"
+    assert job_queue.get_job("abc1234")["workspace_id"] == "ws_a"
+    assert job_queue.get_job("d")["workspace_id"] == "ws_c"
+    # Ambiguous or unknown prefixes resolve to nothing
+    assert job_queue.get_job("abc1") is None
+    assert job_queue.get_job("zzz") is None
+
+
+def test_exact_id_wins_over_longer_ids_sharing_it_as_prefix(monkeypatch):
+    ids = iter(["abc", "abcd"])
+    monkeypatch.setattr(job_queue, "uuid", SimpleNamespace(uuid4=lambda: next(ids)))
+    job_queue.enqueue_job("ws_a")
+    job_queue.enqueue_job("ws_b")
+
+    assert job_queue.get_job("abc")["workspace_id"] == "ws_a"
+    assert job_queue.get_job("abcd")["workspace_id"] == "ws_b"
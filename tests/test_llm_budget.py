@@ -0,0 +1,131 @@
+"""
+LLM concurrency budget: one semaphore caps provider calls in flight across
+worker processes, a cancelled waiter gives up without taking a slot, and
+run_batch reports unknown workspaces and crashed workers instead of raising.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from yt_autopilot.core import workspace_manager
+from yt_autopilot.pipeline import batch_generation
+from yt_autopilot.services import llm_budget
+from yt_autopilot.services.llm_budget import create_llm_budget, install_llm_budget, llm_slot
+
+
+@pytest.fixture(autouse=True)
+def budget_state(monkeypatch):
+    """install_llm_budget() changes module globals: restore them after each test."""
+    monkeypatch.setattr(llm_budget, "_budget", None)
+    monkeypatch.setattr(llm_budget, "_budget_size", None)
+    monkeypatch.setattr(llm_budget, "_env_checked", True)
+    monkeypatch.setattr(llm_budget, "_stats", {"calls": 0, "waited_calls": 0, "wait_ms": 0.0})
+    monkeypatch.setattr(llm_budget, "LLM_BUDGET_POLL_SECONDS", 0.01)
+
+
+def _call_provider(budget, size, in_flight, peak, lock):
+    """Worker process: one provider call holding a budget slot."""
+    install_llm_budget(budget, size)
+    with llm_slot() as proceed:
+        assert proceed
+        with lock:
+            in_flight.value += 1
+            peak.value = max(peak.value, in_flight.value)
+        time.sleep(0.2)
+        with lock:
+            in_flight.value -= 1
+
+
+def test_shared_budget_caps_calls_across_processes():
+    ctx = multiprocessing.get_context("spawn")
+    budget = create_llm_budget(2, ctx)
+    in_flight, peak, lock = ctx.Value("i", 0), ctx.Value("i", 0), ctx.Lock()
+
+    workers = [ctx.Process(target=_call_provider, args=(budget, 2, in_flight, peak, lock)) for _ in range(5)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    assert [worker.exitcode for worker in workers] == [0] * 5
+    assert peak.value == 2
+    # Every slot was given back
+    assert all(budget.acquire(False) for _ in range(2))
+    assert not budget.acquire(False)
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    install_llm_budget(threading.BoundedSemaphore(1), 1)
+    cancelled, waiting = threading.Event(), threading.Event()
+    outcomes = {}
+
+    def waiter(name, event):
+        waiting.set()
+        with llm_slot(event) as proceed:
+            outcomes[name] = proceed
+
+    with llm_slot() as proceed:
+        assert proceed
+        hedge = threading.Thread(target=waiter, args=("hedge", cancelled))
+        hedge.start()
+        assert waiting.wait(timeout=5)
+        other = threading.Thread(target=waiter, args=("other", None))
+        other.start()
+
+        cancelled.set()
+        hedge.join(timeout=5)
+        assert outcomes == {"hedge": False}
+
+    # The slot goes to the next waiter, the cancelled one never took it
+    other.join(timeout=5)
+    assert outcomes == {"hedge": False, "other": True}
+    stats = llm_budget.get_llm_budget_stats()
+    assert (stats["max_concurrent"], stats["calls"]) == (1, 2)
+
+
+def _stub_generate_workspace(workspace_id, trends, use_real_trends, use_llm_curation, trace):
+    """Worker entry point stub: "crash" kills its process, the others succeed."""
+    if workspace_id == "crash":
+        os._exit(1)
+    return {**batch_generation._failed_result(None, 0.1), "status": "APPROVED", "title": f"{workspace_id} video",
+            "worker_pid": os.getpid()}
+
+
+@pytest.fixture
+def batch(monkeypatch):
+    """run_batch on forked workers, which inherit the stubbed entry point."""
+    fork = multiprocessing.get_context("fork")
+    monkeypatch.setattr(batch_generation.multiprocessing, "get_context", lambda method: fork)
+    monkeypatch.setattr(batch_generation, "_generate_workspace", _stub_generate_workspace)
+    monkeypatch.setattr(workspace_manager, "list_workspaces", lambda: [
+        {"workspace_id": workspace_id, "vertical_id": "tech_ai"} for workspace_id in ("ws_a", "ws_b", "crash")
+    ])
+
+    def run(workspace_ids):
+        return batch_generation.run_batch(workspace_ids, use_real_trends=False, max_workers=2)
+    return run
+
+
+def test_batch_reports_unknown_workspaces_in_input_order(batch):
+    report = batch(["ws_b", "missing", "ws_a", "ws_b"])
+
+    results = report["results"]
+    assert [r["workspace_id"] for r in results] == ["ws_b", "missing", "ws_a"]
+    assert [r["status"] for r in results] == ["APPROVED", "FAILED", "APPROVED"]
+    assert results[1]["error"] == "Workspace not found"
+    assert results[1]["vertical_id"] is None
+    assert results[0]["worker_pid"] not in (None, os.getpid())
+    assert report["workers"] == 2
+
+
+def test_batch_reports_a_crashed_worker(batch):
+    report = batch(["crash", "missing"])
+
+    crashed, missing = report["results"]
+    assert crashed["status"] == "FAILED"
+    assert crashed["error"].startswith("Worker crashed: BrokenProcessPool")
+    assert missing["error"] == "Workspace not found"
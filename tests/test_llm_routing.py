@@ -0,0 +1,235 @@
+"""
+LatencyRouter hedging: losing attempts must not hold router workers. Through
+generate_text with fake providers: hedging after the primary's p95, loser
+cancellation, failover on errors and health-window steering.
+"""
+
+import threading
+import time
+
+from yt_autopilot.services import llm_routing
+from yt_autopilot.services.llm_fake_providers import FakeProvider, LatencyDistribution, fake_providers
+from yt_autopilot.services.llm_router import generate_text
+from yt_autopilot.services.llm_routing import MIN_SAMPLES_FOR_STATS, LatencyRouter
+
+
+def test_hedge_losers_do_not_exhaust_worker_pool():
+    release = threading.Event()
+    router = LatencyRouter(max_workers=2)
+    router.hedge_delay_ms = lambda provider, role: 20
+
+    def stuck(attempt):
+        # Ignores cancellation, like an HTTP call whose client.close() has no effect
+        release.wait(10)
+        return "late"
+
+    def fast(attempt):
+        time.sleep(0.05)
+        return "fast"
+
+    started = time.monotonic()
+    try:
+        outcomes = [
+            router.execute("audience_inference", [("stuck", stuck), ("fast", fast)], hedge=True)
+            for _ in range(6)
+        ]
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+
+    assert [outcome.provider for outcome in outcomes] == ["fast"] * 6
+    assert all(outcome.hedged for outcome in outcomes)
+    # 6 hedged calls on 2 workers: each loser would otherwise pin a worker for 10s
+    assert elapsed < 3
+
+
+def test_attempt_timeout_follows_role_slo():
+    from yt_autopilot.services.llm_routing import (
+        ATTEMPT_TIMEOUT_SLO_MULTIPLIER, ProviderAttempt, get_role_slo_ms
+    )
+
+    attempt = ProviderAttempt("openai", "script_writer")
+    assert attempt.timeout_s == get_role_slo_ms("script_writer") * ATTEMPT_TIMEOUT_SLO_MULTIPLIER / 1000
+
+
+def test_budget_slot_wait_is_not_hedged_or_recorded():
+    router = LatencyRouter(max_workers=4)
+    router.hedge_delay_ms = lambda provider, role: 50
+    backup_calls = []
+
+    def queued(attempt):
+        time.sleep(0.3)  # waiting for a budget slot
+        attempt.mark_started()
+        time.sleep(0.02)
+        return "primary"
+
+    def backup(attempt):
+        backup_calls.append(attempt)
+        attempt.mark_started()
+        return "backup"
+
+    outcome = router.execute(
+        "audience_inference", [("primary", queued), ("backup", backup)], hedge=True, deferred_start=True
+    )
+
+    assert outcome.provider == "primary"
+    assert not outcome.hedged and backup_calls == []
+    ((latency_ms, ok),) = router.health("primary")._samples
+    assert ok and latency_ms < 250
+
+
+def test_started_attempt_is_hedged_after_delay():
+    release = threading.Event()
+    router = LatencyRouter(max_workers=4)
+    router.hedge_delay_ms = lambda provider, role: 50
+
+    def slow(attempt):
+        attempt.mark_started()
+        release.wait(2)
+        return "slow"
+
+    def fast(attempt):
+        attempt.mark_started()
+        return "fast"
+
+    try:
+        outcome = router.execute(
+            "audience_inference", [("slow", slow), ("fast", fast)], hedge=True, deferred_start=True
+        )
+    finally:
+        release.set()
+
+    assert outcome.provider == "fast" and outcome.hedged
+
+
+def test_hedge_losses_raise_slow_provider_p95():
+    release = threading.Event()
+    router = LatencyRouter(max_workers=8)
+    router.hedge_delay_ms = lambda provider, role: 60
+    calls = {"slow": 0}
+
+    def slow(attempt):
+        calls["slow"] += 1
+        if calls["slow"] <= 5:
+            return "slow"  # its fast tail: won without a hedge
+        release.wait(5)
+        return "late"
+
+    def fast(attempt):
+        return "fast"
+
+    try:
+        for _ in range(5):
+            router.execute("audience_inference", [("slow", slow), ("fast", fast)], hedge=True)
+        p95_before = router.health("slow").latency_percentile(0.95)
+
+        for _ in range(6):
+            outcome = router.execute("audience_inference", [("slow", slow), ("fast", fast)], hedge=True)
+            assert outcome.provider == "fast" and outcome.hedged
+    finally:
+        release.set()
+
+    health = router.health("slow")
+    assert health.sample_count == 11
+    assert p95_before < 60 <= health.latency_percentile(0.95)
+
+
+# generate_text end to end, through fake providers (services/llm_fake_providers)
+
+def _latencies(*ms):
+    """Latency distribution that returns the given values in order, then repeats the last."""
+    values = list(ms)
+    return LatencyDistribution(lambda rng: values.pop(0) if len(values) > 1 else values[0], f"sequence {ms}")
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_generate_text_hedges_after_primary_p95(monkeypatch):
+    monkeypatch.setattr(llm_routing, "MIN_HEDGE_DELAY_MS", 50)
+    warm_calls = MIN_SAMPLES_FOR_STATS
+    primary = FakeProvider("openai", _latencies(*[20] * warm_calls, 3000), response="primary")
+    backup = FakeProvider("anthropic", LatencyDistribution.constant(10), response="backup")
+
+    with fake_providers(primary, backup):
+        # Fast primary answers alone: a hedge only fires once its p95 is exceeded
+        assert [generate_text("audience_inference", "task", "ctx") for _ in range(warm_calls)] == \
+            ["primary"] * warm_calls
+        assert backup.stats()["calls"] == 0
+
+        started = time.monotonic()
+        text = generate_text("audience_inference", "task", "ctx")
+        elapsed = time.monotonic() - started
+
+    assert text == "backup"
+    # Hedge delay = primary p95 (~20ms) clamped up to MIN_HEDGE_DELAY_MS
+    assert 0.05 <= elapsed < 1.0
+    assert backup.stats()["calls"] == 1
+
+
+def test_hedge_loser_is_cancelled(monkeypatch):
+    monkeypatch.setattr(llm_routing, "MIN_HEDGE_DELAY_MS", 50)
+    primary = FakeProvider("openai", _latencies(*[20] * MIN_SAMPLES_FOR_STATS, 3000), response="primary")
+    backup = FakeProvider("anthropic", LatencyDistribution.constant(10), response="backup")
+
+    with fake_providers(primary, backup):
+        for _ in range(MIN_SAMPLES_FOR_STATS + 1):
+            generate_text("audience_inference", "task", "ctx")
+
+        # The slow primary stops long before its 3s latency is over
+        assert _wait_for(lambda: primary.stats()["cancellations"] == 1, timeout=1.0)
+    assert primary.stats()["successes"] == MIN_SAMPLES_FOR_STATS
+
+
+def test_generate_text_fails_over_on_provider_error():
+    primary = FakeProvider("openai", LatencyDistribution.constant(5), error_rate=1.0, response="primary")
+    backup = FakeProvider("anthropic", LatencyDistribution.constant(5), response="backup")
+
+    with fake_providers(primary, backup):
+        started = time.monotonic()
+        text = generate_text("audience_inference", "task", "ctx")
+        elapsed = time.monotonic() - started
+
+    assert text == "backup"
+    assert primary.stats()["failures"] == 1
+    # Immediately, not after a hedge delay (no stats yet: the role SLO)
+    assert elapsed < 1.0
+
+
+def test_all_providers_failing_returns_fallback():
+    failing = [FakeProvider(name, LatencyDistribution.constant(5), error_rate=1.0) for name in ("openai", "anthropic")]
+
+    with fake_providers(*failing):
+        text = generate_text("audience_inference", "task", "ctx")
+
+    assert text.startswith("[LLM_FALLBACK]")
+    assert [provider.stats()["failures"] for provider in failing] == [1, 1]
+
+
+def test_window_steers_away_from_failing_provider():
+    primary = FakeProvider("openai", LatencyDistribution.constant(5), error_rate=1.0, response="primary")
+    backup = FakeProvider("anthropic", LatencyDistribution.constant(5), response="backup")
+
+    with fake_providers(primary, backup, hedging=False):
+        for _ in range(MIN_SAMPLES_FOR_STATS + 3):
+            assert generate_text("audience_inference", "task", "ctx") == "backup"
+
+    # Tried first until its window held enough failures, then ranked last
+    assert primary.stats()["calls"] == MIN_SAMPLES_FOR_STATS
+    assert backup.stats()["calls"] == MIN_SAMPLES_FOR_STATS + 3
+
+
+def test_window_steers_away_from_provider_over_role_slo(monkeypatch):
+    monkeypatch.setitem(llm_routing.ROLE_LATENCY_SLO_MS, "audience_inference", 60)
+    primary = FakeProvider("openai", LatencyDistribution.constant(100), response="primary")
+    backup = FakeProvider("anthropic", LatencyDistribution.constant(5), response="backup")
+
+    with fake_providers(primary, backup, hedging=False):
+        texts = [generate_text("audience_inference", "task", "ctx") for _ in range(MIN_SAMPLES_FOR_STATS + 2)]
+
+    # Slow but healthy: served every call until its p95 was known to exceed the SLO
+    assert texts == ["primary"] * MIN_SAMPLES_FOR_STATS + ["backup"] * 2
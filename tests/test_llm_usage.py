@@ -0,0 +1,28 @@
+"""
+LLM cost estimation: dated snapshot names are priced by prefix.
+"""
+
+import pytest
+
+from yt_autopilot.services.llm_usage import MODEL_PRICING_PER_MTOK, estimate_cost_usd
+
+
+def _cost(pricing, prompt_tokens, completion_tokens):
+    input_price, _, output_price = pricing
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+@pytest.mark.parametrize("model, priced_as", [
+    ("gpt-4o-2024-08-06", "gpt-4o"),
+    ("gpt-4o-mini-2024-07-18", "gpt-4o-mini"),
+    ("claude-3-5-sonnet-20241022", "claude-3-5-sonnet"),
+])
+def test_snapshot_names_use_longest_prefix(model, priced_as):
+    expected = _cost(MODEL_PRICING_PER_MTOK[priced_as], 1000, 500)
+    assert estimate_cost_usd(model, 1000, 500) == pytest.approx(expected)
+
+
+def test_unpriced_model_falls_back_to_requested_model():
+    expected = _cost(MODEL_PRICING_PER_MTOK["gpt-4o"], 1000, 500)
+    assert estimate_cost_usd("chatgpt-4o-latest", 1000, 500, requested_model="gpt-4o") == pytest.approx(expected)
+    assert estimate_cost_usd("some-new-model", 1000, 500, requested_model="other-model") == 0.0
@@ -0,0 +1,80 @@
+"""
+Offline benchmark: the committed fixture cassettes replay with no network,
+and replayed LLM calls are matched by prompt first, then by role.
+
+Regenerate the fixtures (e.g. after prompts change) with the fake providers
+and canned trend sources:
+
+    from yt_autopilot.pipeline.offline_benchmark import record_fixture_cassettes
+    record_fixture_cassettes()
+"""
+
+import shutil
+
+import pytest
+
+from yt_autopilot.pipeline.offline_benchmark import (
+    BENCHMARK_PATHS, FIXTURE_CASSETTE_DIR, FIXTURE_CASSETTE_NAME, run_benchmark
+)
+from yt_autopilot.services.cassette import Cassette
+
+
+@pytest.fixture
+def scratch_workspace(tmp_path, monkeypatch):
+    """Runs the pipeline from tmp_path, against copies of the workspace configs and datastore."""
+    from yt_autopilot.core import workspace_manager
+    from yt_autopilot.io import content_index, datastore
+
+    workspaces = tmp_path / "workspaces"
+    shutil.copytree(workspace_manager.WORKSPACE_DIR, workspaces)
+    monkeypatch.setattr(workspace_manager, "WORKSPACE_DIR", workspaces)
+
+    records_path = tmp_path / "data" / "records.jsonl"
+    records_path.parent.mkdir()
+    monkeypatch.setattr(datastore, "_get_datastore_path", lambda: records_path)
+    monkeypatch.setattr(content_index, "_get_datastore_path", lambda: records_path)
+    monkeypatch.setattr(content_index, "_indexes", {})
+    monkeypatch.chdir(tmp_path)
+
+
+def test_fixture_cassettes_replay_offline(scratch_workspace):
+    report = run_benchmark(FIXTURE_CASSETTE_NAME, repeats=1, warmup=0, cassette_dir=FIXTURE_CASSETTE_DIR)
+
+    assert set(report["paths"]) == set(BENCHMARK_PATHS)
+    for path, result in report["paths"].items():
+        (run,) = result["runs"]
+        assert run["network_blocked"] == 0, path
+        assert run["llm_misses"] == 0 and run["trend_misses"] == 0, path
+        assert run["llm_unused"] == 0, path
+        # Recorded trend-source calls are served from the cassette
+        assert run["trend_hits"] == run["trend_recorded"] > 0, path
+        # The fixture run passes script validation and every later gate
+        assert result["cassette"]["status"] == "APPROVED", path
+        assert result["statuses"] == ["APPROVED"], path
+
+
+def _record(cassette, role, prompt, text):
+    cassette.add_llm_call(role, prompt, None, text, provider="fake", model="fake",
+                          usage={}, latency_ms=1.0)
+
+
+def test_llm_calls_match_exact_prompt_then_next_unused_of_role():
+    cassette = Cassette()
+    _record(cassette, "script_writer", "draft A", "text A")
+    _record(cassette, "script_writer", "draft B", "text B")
+    _record(cassette, "seo_title_generator", "title", "text T")
+
+    # Exact prompt wins over recording order
+    assert cassette.take_llm_call("script_writer", "draft B", None)["text"] == "text B"
+    # Prompt changed (dates, ids): next unused call of the same role
+    assert cassette.take_llm_call("script_writer", "draft A (2026)", None)["text"] == "text A"
+    # Each entry is served once; other roles are never borrowed
+    assert cassette.take_llm_call("script_writer", "draft A", None) is None
+    # A different system prefix is a different prompt
+    assert cassette.take_llm_call("seo_title_generator", "title", "prefix")["text"] == "text T"
+
+    stats = cassette.stats()
+    assert (stats["llm_hits"], stats["llm_fuzzy_hits"], stats["llm_misses"]) == (1, 2, 1)
+
+    cassette.rewind()
+    assert cassette.take_llm_call("script_writer", "draft A", None)["text"] == "text A"
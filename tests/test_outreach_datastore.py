@@ -0,0 +1,150 @@
+"""
+Outreach datastore: one-time import of the legacy JSONL store, status updates
+of single records, bulk transitions applied in one transaction, and the
+campaign/status filters of get_pending_emails and get_all_outreach.
+"""
+
+import json
+
+import pytest
+
+try:
+    from pr_outreach.core.schemas import OutreachStatus
+    from pr_outreach.io import outreach_datastore as datastore
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+PENDING = OutreachStatus.PENDING_REVIEW.value
+APPROVED = OutreachStatus.APPROVED.value
+
+
+@pytest.fixture(autouse=True)
+def datastore_paths(tmp_path, monkeypatch):
+    db_path = tmp_path / "outreach.db"
+    legacy_path = tmp_path / "outreach_records.jsonl"
+    monkeypatch.setenv("OUTREACH_DB_PATH", str(db_path))
+    monkeypatch.setenv("OUTREACH_DATASTORE_PATH", str(legacy_path))
+    monkeypatch.setenv("CONTACTED_ARTICLES_PATH", str(tmp_path / "contacted_articles.json"))
+    yield legacy_path
+    _close(db_path)
+
+
+def _close(db_path):
+    """Drops the connection and the in-memory caches of one database."""
+    for cache in (datastore._counter_cache, datastore._contacted_sets, datastore._contacted_filters):
+        cache.pop(str(db_path), None)
+    conn = datastore._connections.pop(str(db_path), None)
+    if conn is not None:
+        conn.close()
+
+
+def _record(outreach_id, campaign_id="camp_a", status=PENDING, **fields):
+    return {"outreach_id": outreach_id, "campaign_id": campaign_id, "status": status,
+            "created_at": "2026-01-01T00:00:00", "email_subject": f"Subject {outreach_id}", **fields}
+
+
+def _seed(legacy_path, records):
+    """Writes a legacy JSONL store; the datastore imports it on first use."""
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def _ids(records):
+    return [record["outreach_id"] for record in records]
+
+
+def test_legacy_jsonl_is_imported_once(datastore_paths, tmp_path):
+    _seed(datastore_paths, [_record("o1"), _record("o2"), _record("o1", email_subject="Edited")])
+    with open(datastore_paths, "a", encoding="utf-8") as f:
+        f.write("{not json\n")
+
+    assert sorted(_ids(datastore.get_all_outreach())) == ["o1", "o2"]
+    # Later lines win for duplicate ids
+    assert datastore.get_outreach_by_id("o1")["email_subject"] == "Edited"
+    assert datastore.get_campaign_counters("camp_a")["drafted"] == 2
+
+    # Reopened with new legacy lines: not imported again
+    _close(tmp_path / "outreach.db")
+    _seed(datastore_paths, [_record("o3")])
+    assert sorted(_ids(datastore.get_all_outreach())) == ["o1", "o2"]
+
+
+def test_single_record_updates_change_only_that_record(datastore_paths):
+    _seed(datastore_paths, [_record("o1"), _record("o2")])
+
+    assert datastore.approve_email("o1", "ann@example.com")
+    assert datastore.update_response_status("o2", opened=True, replied=True, reply_sentiment="positive")
+    assert not datastore.approve_email("missing", "ann@example.com")
+
+    approved = datastore.get_outreach_by_id("o1")
+    assert approved["status"] == APPROVED
+    assert approved["approved_by"] == "ann@example.com"
+    assert approved["email_subject"] == "Subject o1"
+    replied = datastore.get_outreach_by_id("o2")
+    assert replied["status"] == OutreachStatus.REPLIED.value
+    assert replied["opened"] and replied["reply_sentiment"] == "positive"
+    assert datastore.get_outreach_by_id("missing") is None
+
+
+def test_bulk_transitions_update_every_found_record(datastore_paths):
+    _seed(datastore_paths, [_record(f"o{i}") for i in range(5)])
+
+    assert datastore.approve_emails(["o0", "o1", "o2", "missing"], "ann@example.com") == 3
+    assert datastore.reject_emails(["o3"], "off topic") == 1
+    assert datastore.mark_emails_as_sent({"o0": "msg-0", "o1": None}) == 2
+
+    records = {record["outreach_id"]: record for record in datastore.get_all_outreach()}
+    assert [records[f"o{i}"]["status"] for i in range(5)] == [
+        OutreachStatus.SENT.value, OutreachStatus.SENT.value, APPROVED, OutreachStatus.REJECTED.value, PENDING
+    ]
+    assert records["o0"]["message_id"] == "msg-0" and records["o0"]["approved_by"] == "ann@example.com"
+    assert records["o3"]["rejection_reason"] == "off topic"
+    assert datastore.get_campaign_counters("camp_a")["sent"] == 2
+
+
+def test_bulk_transition_is_rolled_back_as_a_whole(datastore_paths):
+    _seed(datastore_paths, [_record(f"o{i}") for i in range(3)])
+    counters = datastore.get_campaign_counters("camp_a")
+    with datastore._write_lock:
+        conn = datastore._get_connection()
+        conn.execute(
+            "CREATE TRIGGER fail_o2 BEFORE UPDATE ON outreach_records WHEN NEW.outreach_id = 'o2' "
+            "BEGIN SELECT RAISE(ABORT, 'disk full'); END"
+        )
+
+    assert datastore.approve_emails(["o0", "o1", "o2"], "ann@example.com") == 0
+
+    assert [record["status"] for record in datastore.get_all_outreach()] == [PENDING] * 3
+    assert datastore.get_campaign_counters("camp_a") == counters
+
+
+def test_pending_and_all_outreach_filter_by_campaign_and_status(datastore_paths):
+    _seed(datastore_paths, [
+        _record("a1"),
+        _record("a2", status=APPROVED),
+        _record("b1", campaign_id="camp_b"),
+        _record("b2", campaign_id="camp_b", status=APPROVED),
+        _record("a3"),
+    ])
+
+    assert _ids(datastore.get_pending_emails()) == ["a1", "b1", "a3"]
+    assert _ids(datastore.get_pending_emails("camp_a")) == ["a1", "a3"]
+    assert _ids(datastore.get_pending_emails("camp_c")) == []
+    assert _ids(datastore.get_all_outreach("camp_b")) == ["b1", "b2"]
+    assert _ids(datastore.get_all_outreach(status=OutreachStatus.APPROVED)) == ["a2", "b2"]
+    assert _ids(datastore.get_all_outreach("camp_a", OutreachStatus.APPROVED)) == ["a2"]
+
+    datastore.approve_emails(["a1", "b1"], "ann@example.com")
+    assert _ids(datastore.get_pending_emails()) == ["a3"]
+
+
+def test_status_counters_follow_transitions(datastore_paths):
+    _seed(datastore_paths, [_record(f"o{i}") for i in range(4)])
+
+    datastore.approve_emails(["o0", "o1"], "ann@example.com")
+    datastore.reject_email("o2", "off topic")
+
+    counters = datastore.get_campaign_counters("camp_a")
+    assert (counters["pending_review"], counters["approved"], counters["rejected"]) == (1, 2, 1)
+    assert counters["drafted"] == 4
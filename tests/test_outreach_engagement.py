@@ -0,0 +1,59 @@
+"""
+Engagement counters: outreach.jsonl records and the datastore counter cache.
+"""
+
+import sqlite3
+
+import pytest
+
+try:
+    from pr_outreach.io import outreach_datastore
+    from pr_outreach.io.outreach_datastore import get_campaign_counters, tally_campaign_counters
+    from pr_outreach.services.response_tracker import get_engagement_stats
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def datastore(tmp_path, monkeypatch):
+    db_path = tmp_path / "outreach.db"
+    monkeypatch.setenv("OUTREACH_DB_PATH", str(db_path))
+    monkeypatch.setenv("OUTREACH_DATASTORE_PATH", str(tmp_path / "outreach_records.jsonl"))
+    monkeypatch.setenv("CONTACTED_ARTICLES_PATH", str(tmp_path / "contacted_articles.json"))
+    yield str(db_path)
+    conn = outreach_datastore._connections.pop(str(db_path), None)
+    if conn is not None:
+        conn.close()
+    outreach_datastore._counter_cache.pop(str(db_path), None)
+
+
+def test_cli_records_count_as_sent(datastore):
+    # Shape written by outreach.py save_outreach / _mark_record_sent
+    records = [
+        {"outreach_id": "a", "campaign_id": "cli", "status": "sent",
+         "sent_at": "2026-01-01T10:00:00", "message_id": "<m1>", "sent_via": "sendgrid"},
+        {"outreach_id": "b", "campaign_id": "cli", "status": "sent",
+         "sent_at": "2026-01-01T10:01:00", "message_id": "<m2>", "sent_via": "mailgun"},
+        {"outreach_id": "c", "campaign_id": "cli", "status": "approved"},
+        {"outreach_id": "d", "campaign_id": "cli", "status": "pending_review"},
+    ]
+
+    engagement = get_engagement_stats("cli", tally_campaign_counters(records))
+
+    assert engagement["total_sent"] == 2
+    assert engagement["total_opened"] == 0
+    assert get_engagement_stats("cli")["total_sent"] == 0
+
+
+def test_counter_cache_sees_writes_from_other_connections(datastore):
+    assert get_campaign_counters("camp")["sent"] == 0
+
+    # Another process committing to the same database
+    other = sqlite3.connect(datastore)
+    with other:
+        other.execute(
+            "INSERT INTO campaign_counters (campaign_id, counter, value) VALUES ('camp', 'sent', 3)"
+        )
+    other.close()
+
+    assert get_campaign_counters("camp")["sent"] == 3
@@ -0,0 +1,120 @@
+"""
+Outreach index: prefix lookups, stale offsets, compaction, and appends from
+several processes at once.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import REPO_ROOT
+
+try:
+    from pr_outreach.io import outreach_index
+    from pr_outreach.io.outreach_index import append_record, find_record, read_records
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    db_path = tmp_path / "outreach_index.db"
+    monkeypatch.setenv("OUTREACH_INDEX_DB_PATH", str(db_path))
+    (tmp_path / "outreach" / "camp").mkdir(parents=True)
+    yield str(tmp_path / "outreach")
+    conn = outreach_index._connections.pop(str(db_path), None)
+    if conn is not None:
+        conn.close()
+
+
+def _path(data_dir, campaign_id="camp"):
+    return os.path.join(data_dir, campaign_id, outreach_index.OUTREACH_FILE)
+
+
+def _record(outreach_id, status="draft", **fields):
+    return {"outreach_id": outreach_id, "campaign_id": "camp", "status": status,
+            "created_at": f"2026-01-01T00:00:{outreach_id[-2:]}", **fields}
+
+
+def test_find_by_exact_id_and_prefix(data_dir):
+    for outreach_id in ("ab12cd34-0001", "ab12cd34-0002", "ff00ee11-0003"):
+        append_record(_path(data_dir), "camp", _record(outreach_id))
+
+    assert find_record(data_dir, "ff00ee11-0003")["outreach_id"] == "ff00ee11-0003"
+    assert find_record(data_dir, "ff00ee11")["outreach_id"] == "ff00ee11-0003"
+    # Ambiguous prefix: smallest matching id
+    assert find_record(data_dir, "ab12cd34")["outreach_id"] == "ab12cd34-0001"
+    assert find_record(data_dir, "0000") is None
+    assert find_record(data_dir, "ff00ee11")["_file"] == os.path.abspath(_path(data_dir))
+
+
+def test_lookup_returns_latest_version(data_dir):
+    append_record(_path(data_dir), "camp", _record("ab12cd34-0001"))
+    append_record(_path(data_dir), "camp", _record("ab12cd34-0001", status="sent"))
+
+    assert find_record(data_dir, "ab12cd34")["status"] == "sent"
+    assert [r["status"] for r in read_records(_path(data_dir))] == ["sent"]
+
+
+def test_stale_offsets_are_reindexed(data_dir):
+    path = _path(data_dir)
+    append_record(path, "camp", _record("aaaa0000-0001"))
+    append_record(path, "camp", _record("bbbb0000-0002"))
+    stat = os.stat(path)
+
+    # Swap the two same-length lines and keep size and mtime: the index
+    # cannot notice by stat, only by reading a different id at the offset
+    with open(path, "rb") as f:
+        first, second = f.read().splitlines(keepends=True)
+    with open(path, "wb") as f:
+        f.write(second + first)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert find_record(data_dir, "aaaa0000")["outreach_id"] == "aaaa0000-0001"
+    assert find_record(data_dir, "bbbb0000")["outreach_id"] == "bbbb0000-0002"
+
+
+def test_superseded_versions_are_compacted(data_dir, monkeypatch):
+    monkeypatch.setattr(outreach_index, "COMPACT_MIN_SUPERSEDED", 5)
+    path = _path(data_dir)
+    append_record(path, "camp", _record("aaaa0000-0001"))
+    for attempt in range(10):
+        append_record(path, "camp", _record("bbbb0000-0002", attempt=attempt))
+
+    with open(path) as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    assert len(lines) < 11
+    assert [r["outreach_id"] for r in read_records(path)] == ["aaaa0000-0001", "bbbb0000-0002"]
+    assert find_record(data_dir, "bbbb0000")["attempt"] == 9
+    assert find_record(data_dir, "aaaa0000")["outreach_id"] == "aaaa0000-0001"
+
+
+_WRITER = """
+import sys
+from pr_outreach.io import outreach_index
+outreach_index.COMPACT_MIN_SUPERSEDED = 3
+path, tag = sys.argv[1], sys.argv[2]
+for i in range(400):
+    if i % 10 == 0:
+        outreach_index.append_record(path, "camp", {"outreach_id": f"{tag}-{i:03d}"})
+    else:
+        # Supersede a shared record so compactions keep replacing the file
+        outreach_index.append_record(path, "camp", {"outreach_id": "shared", "writer": tag})
+"""
+
+
+def test_concurrent_process_appends_survive_compaction(data_dir):
+    tags = ("w1", "w2", "w3", "w4")
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    writers = [
+        subprocess.Popen([sys.executable, "-c", _WRITER, _path(data_dir), tag], cwd=REPO_ROOT, env=env)
+        for tag in tags
+    ]
+    assert [writer.wait(timeout=120) for writer in writers] == [0] * len(tags)
+
+    ids = {r["outreach_id"] for r in read_records(_path(data_dir))}
+    assert ids == {f"{tag}-{i:03d}" for tag in tags for i in range(0, 400, 10)} | {"shared"}
+    assert find_record(data_dir, "w4-390")["outreach_id"] == "w4-390"
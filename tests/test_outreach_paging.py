@@ -0,0 +1,154 @@
+"""
+Campaign listings: the article cursor starts over once articles.jsonl is
+rewritten, the outreach cursor is a key so it survives status changes, and the
+campaign summary is recomputed only when one of its files changes.
+"""
+
+import os
+
+import pytest
+
+import outreach
+
+CAMPAIGN = "camp"
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(outreach, "DATA_DIR", str(tmp_path / "outreach"))
+    monkeypatch.setattr(outreach, "_article_results_cache", {})
+    monkeypatch.setattr(outreach, "_summary_cache", {})
+    return tmp_path / "outreach"
+
+
+@pytest.fixture
+def outreach_index(tmp_path, monkeypatch):
+    try:
+        from pr_outreach.io import outreach_index
+    except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+        pytest.skip(f"pr_outreach not importable: {e}")
+    db_path = tmp_path / "outreach_index.db"
+    monkeypatch.setenv("OUTREACH_INDEX_DB_PATH", str(db_path))
+    yield outreach_index
+    conn = outreach_index._connections.pop(str(db_path), None)
+    if conn is not None:
+        conn.close()
+
+
+def _seed_articles(count, **fields):
+    articles = [{"url": f"https://blog{i}.example/post", "title": f"Post {i}", **fields} for i in range(count)]
+    outreach.save_articles(CAMPAIGN, articles)
+    return [a["url"] for a in articles]
+
+
+def _articles_path(data_dir):
+    return os.path.join(data_dir, CAMPAIGN, "articles.jsonl")
+
+
+def _touch(path):
+    """Moves the mtime forward: coarse filesystem clocks can hide a rewrite."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _urls(articles):
+    return [a["url"] for a in articles]
+
+
+def test_article_cursor_walks_the_file_then_resets_after_a_rewrite(data_dir):
+    urls = _seed_articles(5)
+
+    first, cursor = outreach.page_articles(CAMPAIGN, limit=2)
+    second, cursor = outreach.page_articles(CAMPAIGN, cursor=cursor, limit=2)
+    assert _urls(first) == urls[:2]
+    assert _urls(second) == urls[2:4]
+
+    # A search rewrites articles.jsonl: the old offset means nothing any more
+    rewritten = _seed_articles(6)
+    _touch(_articles_path(data_dir))
+    page, cursor = outreach.page_articles(CAMPAIGN, cursor=cursor, limit=2)
+    assert _urls(page) == rewritten[:2]
+
+    pages = [page]
+    while cursor:
+        page, cursor = outreach.page_articles(CAMPAIGN, cursor=cursor, limit=2)
+        pages.append(page)
+    assert [_urls(page) for page in pages] == [rewritten[0:2], rewritten[2:4], rewritten[4:6]]
+
+
+def test_article_cursor_applies_the_filter_per_page():
+    urls = _seed_articles(6)
+    articles = outreach.load_articles(CAMPAIGN)
+    for article in articles[1::2]:
+        outreach.append_article_result(CAMPAIGN, article, "analyze", {"analyzed": True})
+
+    first, cursor = outreach.page_articles(CAMPAIGN, "not_analyzed", limit=2)
+    second, cursor = outreach.page_articles(CAMPAIGN, "not_analyzed", cursor=cursor, limit=2)
+
+    assert _urls(first) == [urls[0], urls[2]]
+    assert _urls(second) == [urls[4]]
+    assert cursor is None
+
+
+def _outreach_record(i, status="pending_review"):
+    return {"outreach_id": f"out-{i:04d}", "campaign_id": CAMPAIGN, "status": status,
+            "created_at": f"2026-01-01T00:00:{i:02d}", "subject": f"Subject {i}"}
+
+
+def _ids(records):
+    return [r["outreach_id"] for r in records]
+
+
+def test_outreach_cursor_is_stable_while_records_change_status(outreach_index):
+    for i in range(6):
+        outreach.update_outreach(_outreach_record(i))
+
+    first, cursor = outreach.page_outreach(CAMPAIGN, status="pending_review", limit=2)
+    assert _ids(first) == ["out-0000", "out-0001"]
+
+    # Approving records of the page already shown must not shift the next one,
+    # records further on that leave the filter are skipped
+    for record in first:
+        outreach.update_outreach({**record, "status": "approved"})
+    outreach.update_outreach(_outreach_record(3, status="approved"))
+    outreach.update_outreach(_outreach_record(6))
+
+    second, cursor = outreach.page_outreach(CAMPAIGN, status="pending_review", cursor=cursor, limit=2)
+    third, cursor = outreach.page_outreach(CAMPAIGN, status="pending_review", cursor=cursor, limit=2)
+
+    assert _ids(second) == ["out-0002", "out-0004"]
+    assert _ids(third) == ["out-0005", "out-0006"]
+    assert cursor is None
+    assert {r["status"] for r in second + third} == {"pending_review"}
+
+
+def test_summary_is_recomputed_only_when_its_files_change(data_dir, outreach_index, monkeypatch):
+    _seed_articles(3, analyzed=True, relevance_score=0.8)
+    outreach.update_outreach(_outreach_record(0))
+    streams = []
+    stream_articles = outreach._stream_articles
+
+    def counting_stream(campaign_id, offset=0):
+        streams.append(campaign_id)
+        return stream_articles(campaign_id, offset)
+
+    monkeypatch.setattr(outreach, "_stream_articles", counting_stream)
+
+    summary = outreach.campaign_summary(CAMPAIGN)
+    assert (summary["articles"], summary["analyzed"], summary["good_fit"]) == (3, 3, 3)
+    assert summary["emails"] == {"pending_review": 1}
+    assert outreach.campaign_summary(CAMPAIGN) is summary
+    assert len(streams) == 1
+
+    # Each watched file invalidates the cached summary
+    article = outreach.load_articles(CAMPAIGN)[0]
+    outreach.append_article_result(CAMPAIGN, article, "enrich", {"author_email": "jo@blog0.example"})
+    assert outreach.campaign_summary(CAMPAIGN)["contacts"] == 1
+
+    outreach.update_outreach(_outreach_record(1))
+    assert outreach.campaign_summary(CAMPAIGN)["emails"] == {"pending_review": 2}
+
+    _touch(_articles_path(data_dir))
+    summary = outreach.campaign_summary(CAMPAIGN)
+    assert outreach.campaign_summary(CAMPAIGN) is summary
+    assert len(streams) == 4
@@ -0,0 +1,112 @@
+"""
+Page fetcher against a local HTTP server: one download per URL, ETag
+revalidation with 304, bounded lock table and cache pruning.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+try:
+    from pr_outreach.services import page_fetcher
+except Exception as e:  # pr_outreach.core.schemas needs a compatible pydantic
+    pytest.skip(f"pr_outreach not importable: {e}", allow_module_level=True)
+
+PAGE = b"<html><body><article>Cached article body</article></body></html>"
+ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("If-None-Match")))
+        server.release.wait(5)
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setenv("HTML_CACHE_DIR", str(tmp_path / "html_cache"))
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1,localhost")
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.requests = []
+    httpd.lock = threading.Lock()
+    httpd.release = threading.Event()
+    httpd.release.set()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path="/article"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_fresh_cache_is_served_without_a_request(server):
+    first = page_fetcher.fetch_page(_url(server))
+    second = page_fetcher.fetch_page(_url(server))
+
+    assert first.ok and not first.from_cache
+    assert second.html == PAGE and second.from_cache
+    assert len(server.requests) == 1
+
+
+def test_stale_cache_is_revalidated_with_etag(server):
+    page_fetcher.fetch_page(_url(server))
+
+    revalidated = page_fetcher.fetch_page(_url(server), max_age_seconds=0)
+
+    assert server.requests == [("/article", None), ("/article", ETAG)]
+    assert revalidated.from_cache and revalidated.status_code == 200
+    assert revalidated.html == PAGE
+    # The 304 refreshed the entry: fresh again without another request
+    assert page_fetcher.fetch_page(_url(server)).from_cache
+    assert len(server.requests) == 2
+
+
+def test_concurrent_fetches_of_one_url_download_once(server):
+    server.release.clear()
+    pages = []
+    threads = [
+        threading.Thread(target=lambda: pages.append(page_fetcher.fetch_page(_url(server))))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    server.release.set()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(pages) == 6 and all(page.html == PAGE for page in pages)
+    assert len(server.requests) == 1
+    assert page_fetcher._url_locks == {}
+
+
+def test_cache_is_pruned_oldest_first(server):
+    urls = [_url(server, f"/article-{index}") for index in range(4)]
+    for url in urls:
+        page_fetcher.fetch_page(url)
+    newest_two = sum(path.stat().st_size for url in urls[2:] for path in page_fetcher._cache_paths(url))
+
+    removed = page_fetcher.prune_html_cache(max_bytes=newest_two)
+
+    assert removed == 2
+    assert page_fetcher._read_cache(_url(server, "/article-0")) is None
+    assert page_fetcher._read_cache(_url(server, "/article-3")) is not None
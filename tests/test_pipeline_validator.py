@@ -0,0 +1,236 @@
+"""
+Memoized validation gates: cached outcomes match a fresh run, changing one
+input re-runs only the checks that declare it, and the pipeline report counts
+run and cached checks correctly.
+"""
+
+import time
+
+import pytest
+
+from yt_autopilot.core.pipeline_validator import (
+    Gate1_PostEditorialValidator,
+    Gate2_PostDurationValidator,
+    Gate3_PostScriptValidator,
+    Gate4_PostVisualValidator,
+    PipelineValidationReport,
+    clear_validation_memo,
+)
+
+ITALIAN = ("Questa è una frase completa scritta in italiano sugli strumenti di intelligenza "
+           "artificiale e su come aiutano i creatori ogni giorno con i loro video.")
+ENGLISH = ("This is a complete sentence written in English about artificial intelligence tools "
+           "and how they help creators every single day with their videos.")
+
+# Per gate: inputs (chosen to raise issues and warnings, so comparisons are
+# not trivially empty) and a different value for every declared input
+GATE_CASES = {
+    "gate_1": (
+        Gate1_PostEditorialValidator,
+        {
+            "editorial.serie_concept": "Unknown Serie",
+            "editorial.format": "podcast",
+            "editorial.angle": "education",
+            "editorial.monetization_path": "lead_magnet",
+            "editorial.duration_target": 60,
+            "editorial.duration_breakdown": {"hook": 5, "content": 30, "cta": 5},
+            "editorial.cta_specific": "Iscriviti al canale",
+            "series_formats_available": ["tutorial", "news_flash"],
+        },
+        {
+            "editorial.serie_concept": "tutorial",
+            "editorial.format": "tutorial",
+            "editorial.angle": "rumor",
+            "editorial.monetization_path": "playlist",
+            "editorial.duration_target": 40,
+            "editorial.duration_breakdown": {"hook": 5, "content": 45, "cta": 10},
+            "editorial.cta_specific": "Scarica la guida",
+            "series_formats_available": ["unknown_serie"],
+        },
+    ),
+    "gate_2": (
+        Gate2_PostDurationValidator,
+        {
+            "editorial.duration_target": 60,
+            "duration_strategy.target_duration_seconds": 600,
+            "timeline.reconciled_duration": 300,
+            "timeline.format_type": "long",
+            "timeline.editorial_weight": 0.3,
+            "timeline.duration_weight": 0.3,
+            "visual_plan.aspect_ratio": "9:16",
+        },
+        {
+            "editorial.duration_target": 590,
+            "duration_strategy.target_duration_seconds": 60,
+            "timeline.reconciled_duration": 540,
+            "timeline.format_type": "mid",
+            "timeline.editorial_weight": 0.7,
+            "timeline.duration_weight": 0.7,
+            "visual_plan.aspect_ratio": "16:9",
+        },
+    ),
+    "gate_3": (
+        Gate3_PostScriptValidator,
+        {
+            "script.bullet_count": 2,
+            "script.full_voiceover_text": ENGLISH,
+            "script.hook": "Oggi parliamo di intelligenza artificiale",
+            "script.outro_cta": "Ciao",
+            "script.scene_voiceover_map": {},
+            "content_depth.recommended_bullets": 5,
+            "editorial.cta_specific": "Scarica la guida gratuita",
+            "workspace.target_language": "it",
+            "target_duration": 120,
+            "thresholds": {},
+        },
+        {
+            "script.bullet_count": 5,
+            "script.full_voiceover_text": ITALIAN,
+            "script.hook": "Il 90% dei creator sbaglia questo passaggio",
+            "script.outro_cta": "Scarica la guida gratuita",
+            "script.scene_voiceover_map": {"scene_1": "hook"},
+            "content_depth.recommended_bullets": 2,
+            "editorial.cta_specific": "Ciao",
+            "workspace.target_language": "en",
+            "target_duration": 10,
+            "thresholds": {"script_length_divergence_pct": 95.0, "script_length_warning_pct": 90.0},
+        },
+    ),
+    "gate_4": (
+        Gate4_PostVisualValidator,
+        {
+            "visual_plan.scene_count": 2,
+            "visual_plan.aspect_ratio": "9:16",
+            "visual_plan.scene_prompts": ["close-up of a laptop"] * 4,
+            "visual_plan.scene_voiceovers": ["", ""],
+            "script.bullet_count": 5,
+            "timeline.format_type": "long",
+            "timeline.reconciled_duration": 600,
+        },
+        {
+            "visual_plan.scene_count": 7,
+            "visual_plan.aspect_ratio": "16:9",
+            "visual_plan.scene_prompts": ["wide shot of a city", "close-up of hands", "aerial drone view"],
+            "visual_plan.scene_voiceovers": ["Prima scena", "Seconda scena"],
+            "script.bullet_count": 2,
+            "timeline.format_type": "shorts",
+            "timeline.reconciled_duration": 45,
+        },
+    ),
+}
+
+
+@pytest.fixture(autouse=True)
+def _empty_memo():
+    clear_validation_memo()
+    yield
+    clear_validation_memo()
+
+
+def _outcome(result):
+    return (
+        result.is_valid,
+        result.validation_score,
+        result.issues,
+        result.warnings,
+        result.recommendations,
+    )
+
+
+def _run(gate_cls, inputs):
+    return gate_cls()._run_checks(dict(inputs), time.time())
+
+
+def _declaring(gate_cls, input_name):
+    return {check for check, input_names in gate_cls.CHECKS if input_name in input_names}
+
+
+@pytest.mark.parametrize("label", sorted(GATE_CASES))
+def test_cached_results_match_recomputed_results(label):
+    gate_cls, inputs, _ = GATE_CASES[label]
+
+    fresh = _run(gate_cls, inputs)
+    assert fresh.cached_checks == []
+    assert fresh.issues, "case should produce issues to compare"
+
+    cached = _run(gate_cls, inputs)
+    assert cached.cached_checks == [check for check, _ in gate_cls.CHECKS]
+    assert set(cached.check_timings_ms.values()) == {0.0}
+
+    clear_validation_memo()
+    recomputed = _run(gate_cls, inputs)
+    assert recomputed.cached_checks == []
+
+    assert _outcome(cached) == _outcome(fresh) == _outcome(recomputed)
+
+
+@pytest.mark.parametrize("label", sorted(GATE_CASES))
+def test_changing_one_input_reruns_only_checks_that_declare_it(label):
+    gate_cls, inputs, changed = GATE_CASES[label]
+    declared = {name for _, input_names in gate_cls.CHECKS for name in input_names}
+    assert declared <= set(changed)
+
+    _run(gate_cls, inputs)
+    for input_name in sorted(declared):
+        result = _run(gate_cls, {**inputs, input_name: changed[input_name]})
+        rerun = set(result.check_timings_ms) - set(result.cached_checks)
+        assert rerun == _declaring(gate_cls, input_name), input_name
+
+        # The changed outcome equals a fresh evaluation of the same inputs
+        clear_validation_memo()
+        fresh = _run(gate_cls, {**inputs, input_name: changed[input_name]})
+        assert _outcome(result) == _outcome(fresh), input_name
+
+        clear_validation_memo()
+        _run(gate_cls, inputs)
+
+
+def test_retry_with_new_hook_reruns_hook_check_only():
+    gate_cls, inputs, _ = GATE_CASES["gate_3"]
+    _run(gate_cls, inputs)
+
+    retry = _run(gate_cls, {**inputs, "script.hook": "Il 90% dei creator sbaglia questo passaggio"})
+
+    assert set(retry.check_timings_ms) - set(retry.cached_checks) == {"hook_strength"}
+    assert len(retry.cached_checks) == len(gate_cls.CHECKS) - 1
+
+
+def test_missing_declared_input_raises():
+    gate_cls, inputs, _ = GATE_CASES["gate_3"]
+    missing = dict(inputs)
+    del missing["script.hook"]
+
+    with pytest.raises(KeyError):
+        _run(gate_cls, missing)
+
+
+def test_report_counts_run_and_cached_checks():
+    gate_results = {}
+    for label, (gate_cls, inputs, _) in GATE_CASES.items():
+        _run(gate_cls, inputs)
+        gate_results[label] = _run(gate_cls, inputs)
+    gate_3_cls, gate_3_inputs, gate_3_changed = GATE_CASES["gate_3"]
+    gate_results["gate_3"] = _run(gate_3_cls, {**gate_3_inputs, "script.hook": gate_3_changed["script.hook"]})
+
+    report = PipelineValidationReport.from_results(gate_results)
+
+    total_checks = sum(len(gate_cls.CHECKS) for gate_cls, _, _ in GATE_CASES.values())
+    assert report.checks_run == 1
+    assert report.checks_cached == total_checks - 1
+    assert report.gates_passed + report.gates_failed == 4
+    assert report.gates_passed == sum(1 for r in gate_results.values() if r.is_valid)
+    assert report.total_issues == sum(len(r.issues) for r in gate_results.values())
+    assert report.blocking_issues == sum(len(r.get_blocking_issues()) for r in gate_results.values())
+    assert report.overall_score == pytest.approx(
+        sum(r.validation_score for r in gate_results.values()) / 4
+    )
+    assert set(report.check_timings_ms) == set(GATE_CASES)
+    assert report.check_timings_ms["gate_3"]["hook_strength"] >= 0.0
+
+
+def test_report_of_no_gates_is_valid():
+    report = PipelineValidationReport.from_results({})
+
+    assert report.overall_score == 1.0
+    assert report.checks_run == report.checks_cached == 0
+    assert report.is_pipeline_valid()
@@ -0,0 +1,57 @@
+"""
+Prompt prefix: only attached when providers can cache it, and only to the
+prompts that reference it.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from yt_autopilot.core.prompt_prefix import (
+    PROMPT_CACHE_MIN_TOKENS, build_workspace_prompt_prefix, get_prompt_prefix_for, shared_workspace_block
+)
+from yt_autopilot.core.run_context import llm_call_scope
+
+WORKSPACES_DIR = Path(__file__).resolve().parent.parent / "workspaces"
+
+
+def _long_workspace():
+    return {
+        "workspace_id": "long",
+        "brand_tone": "Calm, precise and practical. " * 400,
+    }
+
+
+@pytest.mark.parametrize("path", sorted(WORKSPACES_DIR.glob("*.json")), ids=lambda p: p.stem)
+def test_shipped_workspace_prefix_below_cache_minimum_stays_inline(path):
+    workspace = json.loads(path.read_text(encoding="utf-8"))
+    prefix = build_workspace_prompt_prefix(workspace)
+    assert prefix.est_tokens < PROMPT_CACHE_MIN_TOKENS
+
+    with llm_call_scope(prompt_prefix=prefix):
+        block = shared_workspace_block("CHANNEL IDENTITY", "- Brand tone: calm\n")
+        assert block == "- Brand tone: calm\n"
+        assert get_prompt_prefix_for(f"Task\n{block}") is None
+
+
+def test_cacheable_prefix_only_goes_with_referencing_prompts():
+    prefix = build_workspace_prompt_prefix(_long_workspace())
+    assert prefix.cacheable
+
+    with llm_call_scope(prompt_prefix=prefix):
+        block = shared_workspace_block("CHANNEL IDENTITY", "- Brand tone: calm\n" * 10)
+        assert get_prompt_prefix_for(f"Write the script\n{block}") is prefix
+        assert get_prompt_prefix_for("Translate this text to Italian") is None
+
+
+def test_savings_report_subtracts_uncached_prefix_tokens():
+    prefix = build_workspace_prompt_prefix(_long_workspace())
+    prefix.record_block_reference("x" * 400)  # 100 tokens
+    prefix.record_call(cached_tokens=0)
+    prefix.record_call(cached_tokens=prefix.est_tokens)
+
+    report = prefix.savings_report()
+
+    assert report["inline_tokens_saved"] == 100
+    assert report["net_uncached_tokens_saved"] == 100 - prefix.est_tokens
@@ -0,0 +1,98 @@
+"""
+Read-only run.py commands must not load the pipeline, the agents or the
+provider SDKs (see run.py --profile-startup), and their yt_autopilot imports
+must stay within an import-time budget.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import REPO_ROOT
+
+# Packages a read-only command must never import
+HEAVY_MODULES = ("yt_autopilot.pipeline", "yt_autopilot.agents", "openai", "anthropic")
+
+# Generous wall-clock timeout per command (interpreter start included)
+STARTUP_BUDGET_SECONDS = 20
+
+# Budget for the summed cumulative -X importtime of top-level yt_autopilot imports
+IMPORT_BUDGET_MS = 300
+
+_PROBE = """
+import json, runpy, sys
+sys.argv = ["run.py"] + json.loads(sys.argv[1])
+try:
+    runpy.run_path("run.py", run_name="__main__")
+except SystemExit as e:
+    code = e.code
+else:
+    code = 0
+print("MODULES=" + json.dumps(sorted(sys.modules)))
+sys.exit(code or 0)
+"""
+
+
+@pytest.mark.parametrize("command", [
+    ["workspace", "list"],
+    ["review", "stats"],
+    ["usage"],
+], ids=" ".join)
+def test_read_only_command_stays_light(command):
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, json.dumps(command)],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=STARTUP_BUDGET_SECONDS
+    )
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    modules_line = next(line for line in result.stdout.splitlines() if line.startswith("MODULES="))
+    modules = json.loads(modules_line[len("MODULES="):])
+    loaded = [
+        name for name in modules
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    ]
+    assert loaded == []
+
+
+def _top_level_import_us(importtime_log: str, prefix: str) -> dict:
+    """Cumulative µs of each top-level import under prefix from -X importtime output."""
+    cumulative = {}
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented below their importer
+        if name.startswith("  ") or not cumulative_us.strip().isdigit():
+            continue
+        name = name.strip()
+        if name == prefix or name.startswith(f"{prefix}."):
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+@pytest.mark.parametrize("command", [
+    ["workspace", "list"],
+    ["review", "stats"],
+    ["usage"],
+], ids=" ".join)
+def test_read_only_command_import_time_budget(command):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, json.dumps(command)],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=STARTUP_BUDGET_SECONDS
+    )
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    imports = _top_level_import_us(result.stderr, "yt_autopilot")
+    assert imports, "no yt_autopilot import recorded"
+    total_ms = sum(imports.values()) / 1000
+    assert total_ms < IMPORT_BUDGET_MS, f"{total_ms:.0f}ms: {imports}"
+
+
+def test_core_exports_resolve():
+    import yt_autopilot.core as core
+
+    for name in core.__all__:
+        assert getattr(core, name) is not None
+    assert core.schemas.__name__ == "yt_autopilot.core.schemas"
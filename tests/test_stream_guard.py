@@ -0,0 +1,67 @@
+"""
+Streamed generation: router fallback text and streams that break halfway are
+failed streams, and completed streams get the same language enforcement as
+the non-streaming path.
+"""
+
+import pytest
+
+from yt_autopilot.agents.narrative_architect import _stream_expansion
+from yt_autopilot.agents.script_writer import stream_llm_suggestion
+from yt_autopilot.core.language_validator import enforce_language
+from yt_autopilot.core.stream_guard import LLM_FALLBACK_MARKER, StreamAborted, StreamGuard, StreamInterrupted
+
+ENGLISH = ("This is a complete sentence written in English about artificial intelligence tools "
+           "and how they help creators every single day with their videos.")
+ITALIAN = ("Questa è una frase completa scritta in italiano sugli strumenti di intelligenza "
+           "artificiale e su come aiutano i creatori ogni giorno con i loro video.")
+
+
+def test_guard_rejects_router_fallback_text():
+    guard = StreamGuard("it")
+    with pytest.raises(StreamAborted) as aborted:
+        guard.feed(f"{LLM_FALLBACK_MARKER} write script\n\nBased on: topic")
+    assert aborted.value.reason == "llm_fallback"
+
+
+def test_fallback_stream_sends_script_writer_to_non_stream_path():
+    def fallback_stream(role, task, context, style_hints=None):
+        yield f"{LLM_FALLBACK_MARKER} {task}\n\nBased on: {context}"
+
+    assert stream_llm_suggestion(fallback_stream, task="write script", context="AI tools",
+                                 target_language="it") is None
+
+
+def test_stream_error_halfway_sends_script_writer_to_non_stream_path():
+    closed = []
+
+    def broken_stream(role, task, context, style_hints=None):
+        try:
+            yield "HOOK: Questi strumenti cambiano il modo di creare video.\n"
+            yield "BULLETS:\n- Il primo strumento scrive"
+            raise StreamInterrupted("OpenAI stream failed mid-response: connection reset")
+        finally:
+            closed.append(True)
+
+    assert stream_llm_suggestion(broken_stream, task="write script", context="AI tools",
+                                 target_language="it") is None
+    assert closed == [True]
+
+
+def test_stream_error_halfway_rejects_expansion():
+    def broken_stream(role, task, context, style_hints=None):
+        yield '{"acts": [{"voiceover": "Prima parte"}, {"voiceover": "Seconda'
+        raise StreamInterrupted("Anthropic stream ended with stop_reason=max_tokens")
+
+    assert _stream_expansion(broken_stream, "expand", "it", max_words=500) is None
+
+
+def test_streamed_output_in_wrong_language_is_corrected():
+    corrections = []
+
+    def generate(role, task, context="", **kwargs):
+        corrections.append(role)
+        return ITALIAN
+
+    assert enforce_language(ENGLISH, "script_writer", "it", generate) == ITALIAN
+    assert corrections == ["language_corrector"]
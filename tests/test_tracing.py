@@ -0,0 +1,186 @@
+"""
+Tracing: spans nest under the innermost open span, trace_step() opens
+sibling steps, work handed to another thread keeps its parent, and the
+Chrome trace and flame summary are built from the recorded span tree.
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from yt_autopilot.core import tracing
+from yt_autopilot.core.tracing import annotate_span, current_span_id, span, trace_step
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """perf_counter in seconds, moved by the test."""
+    now = [100.0]
+    monkeypatch.setattr(tracing, "time", SimpleNamespace(perf_counter=lambda: now[0]))
+    return now
+
+
+def _by_name(tracer):
+    return {s["name"]: s for s in tracer.spans}
+
+
+def _parent(tracer, name):
+    spans = _by_name(tracer)
+    parent_id = spans[name]["parent_id"]
+    return next((s["name"] for s in tracer.spans if s["id"] == parent_id), None)
+
+
+def test_spans_nest_under_the_innermost_open_span():
+    with span("untraced") as args:
+        assert args is None
+
+    with tracing.tracing("run", trace_id="exec-1") as tracer:
+        with span("root"):
+            with span("agent:writer", cat="agent", attempt=1):
+                with span("llm:writer", cat="llm"):
+                    annotate_span(provider="openai")
+            with span("gate:validation", cat="validation"):
+                pass
+            with pytest.raises(ValueError):
+                with span("failing"):
+                    raise ValueError("bad")
+        assert current_span_id() is None
+
+    spans = _by_name(tracer)
+    assert [s["name"] for s in tracer.spans] == ["root", "agent:writer", "llm:writer", "gate:validation", "failing"]
+    assert spans["root"]["parent_id"] is None
+    assert _parent(tracer, "agent:writer") == "root"
+    assert _parent(tracer, "llm:writer") == "agent:writer"
+    assert _parent(tracer, "gate:validation") == "root"
+    assert spans["agent:writer"]["args"] == {"attempt": 1}
+    assert spans["llm:writer"]["args"] == {"provider": "openai"}
+    assert spans["failing"]["args"] == {"error": "ValueError"}
+    assert all(s["dur_us"] is not None for s in tracer.spans)
+    assert tracing.get_active_tracer() is None
+
+
+def test_trace_steps_are_siblings_that_end_each_other():
+    with tracing.tracing("run", trace_id="exec-1") as tracer:
+        with span("root"):
+            trace_step("Step 1: Trends")
+            with span("fetch"):
+                pass
+            trace_step("Step 2: Script")
+            step_2 = _by_name(tracer)["Step 2: Script"]
+            assert _by_name(tracer)["Step 1: Trends"]["dur_us"] is not None
+            assert step_2["dur_us"] is None
+            with span("agent:writer"):
+                # A step inside a span belongs to that span
+                trace_step("attempt 1")
+                trace_step("attempt 2")
+            assert current_span_id() == step_2["id"]
+        # The last step ends with its parent
+        assert step_2["dur_us"] is not None
+
+    assert _parent(tracer, "Step 1: Trends") == "root"
+    assert _parent(tracer, "fetch") == "Step 1: Trends"
+    assert _parent(tracer, "Step 2: Script") == "root"
+    assert _parent(tracer, "agent:writer") == "Step 2: Script"
+    assert _parent(tracer, "attempt 1") == _parent(tracer, "attempt 2") == "agent:writer"
+    assert {s["cat"] for s in tracer.spans if s["name"].startswith(("Step", "attempt"))} == {"step"}
+
+
+def test_spans_in_other_threads_keep_an_explicit_parent():
+    with tracing.tracing("run", trace_id="exec-1") as tracer:
+        with span("root"):
+            parent_id = current_span_id()
+            # Both threads alive at once: a finished thread's ident can be reused
+            overlap = threading.Barrier(2, timeout=5)
+
+            def attempt(name):
+                # Threads do not inherit the context: untraced unless handed the tracer
+                with span("lost"):
+                    pass
+                with span(name, cat="llm", parent_id=parent_id, tracer=tracer):
+                    with span("nested"):
+                        overlap.wait()
+
+            workers = [threading.Thread(target=attempt, args=(f"attempt:{i}",), name=f"llm-{i}") for i in range(2)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(timeout=5)
+
+    spans = _by_name(tracer)
+    assert "lost" not in spans
+    assert _parent(tracer, "attempt:0") == _parent(tracer, "attempt:1") == "root"
+    nested = [s for s in tracer.spans if s["name"] == "nested"]
+    assert {s["parent_id"] for s in nested} == {spans["attempt:0"]["id"], spans["attempt:1"]["id"]}
+    assert len({spans["root"]["tid"], spans["attempt:0"]["tid"], spans["attempt:1"]["tid"]}) == 3
+
+
+def test_chrome_trace_and_folded_stacks_are_written(tmp_path, clock):
+    with tracing.tracing("build_video_package", trace_id="abcdef123456", workspace_id="tech") as tracer:
+        with span("root"):
+            clock[0] += 0.001
+            with span("llm:writer", cat="llm", provider="openai"):
+                clock[0] += 0.002
+        paths = tracer.write(str(tmp_path))
+
+    assert paths["trace"].name.endswith("_build_video_package_abcdef12.trace.json")
+    with open(paths["trace"]) as f:
+        trace = json.load(f)
+    assert trace["displayTimeUnit"] == "ms"
+    assert trace["otherData"]["trace_id"] == "abcdef123456"
+    assert trace["otherData"]["workspace_id"] == "tech"
+
+    metadata = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+    assert [(e["name"], e["tid"], e["args"]["name"]) for e in metadata] == [
+        ("thread_name", 1, threading.current_thread().name)
+    ]
+    events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert (events["root"]["ts"], events["root"]["dur"]) == (0.0, 3000.0)
+    assert (events["llm:writer"]["ts"], events["llm:writer"]["dur"]) == (1000.0, 2000.0)
+    assert events["llm:writer"]["cat"] == "llm"
+    assert events["llm:writer"]["args"] == {
+        "provider": "openai", "span_id": events["llm:writer"]["args"]["span_id"],
+        "parent_id": events["root"]["args"]["span_id"],
+    }
+
+    with open(paths["folded"]) as f:
+        folded = [line.rsplit(" ", 1) for line in f.read().splitlines()]
+    assert [path for path, _ in folded] == ["root;llm:writer", "root"]
+    # Whole microseconds of self time (truncated)
+    assert [int(us) for _, us in folded] == [pytest.approx(2000, abs=1), pytest.approx(1000, abs=1)]
+
+
+def test_flame_summary_self_time_excludes_children(clock):
+    with tracing.tracing("run", trace_id="exec-1") as tracer:
+        with span("root"):
+            clock[0] += 0.010
+            for ms in (0.030, 0.010):
+                with span("llm"):
+                    clock[0] += ms
+            with span("gate"):
+                # Parallel attempts: together longer than their parent
+                first = tracer.start_span("attempt", "llm", tracing.current_span_id(), {})
+                second = tracer.start_span("attempt", "llm", tracing.current_span_id(), {})
+                clock[0] += 0.015
+                tracer.end_span(first)
+                tracer.end_span(second)
+            clock[0] += 0.005
+        # Written mid-run: an open span ends now
+        with span("open"):
+            clock[0] += 0.002
+            rows = {row["path"]: row for row in tracer.flame_summary()}
+
+    assert rows["root;llm"]["calls"] == 2
+    assert rows["root;llm"]["total_ms"] == pytest.approx(40)
+    assert rows["root"]["total_ms"] == pytest.approx(70)
+    assert rows["root"]["self_ms"] == pytest.approx(70 - 40 - 15)
+    assert rows["root;gate"]["self_ms"] == 0
+    assert rows["root;gate;attempt"] == {"path": "root;gate;attempt", "name": "attempt", "calls": 2,
+                                         "total_ms": pytest.approx(30), "self_ms": pytest.approx(30)}
+    assert rows["open"]["total_ms"] == pytest.approx(2)
+    assert list(rows) == ["root;llm", "root;gate;attempt", "root", "open", "root;gate"]
+
+    lines = tracing.format_flame_summary(list(rows.values()), top=2)
+    assert len(lines) == 3
+    assert lines[1].split() == ["40ms", "46.0%", "40ms", "2", "root;llm"]
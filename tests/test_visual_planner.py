@@ -0,0 +1,103 @@
+"""
+Multi-scene visual planning: the composition chain is planned up front, so
+per-scene prompts generated concurrently give the same scenes, in the same
+order and with the same spatial continuity, as a sequential run.
+"""
+
+import json
+import re
+import threading
+
+import pytest
+
+from yt_autopilot.agents import visual_planner
+from yt_autopilot.core.schemas import SceneVoiceover, VideoPlan, VideoScript
+from yt_autopilot.services import llm_router
+
+SCENES = 5
+
+PLAN = VideoPlan(
+    working_title="AI coding assistants for small teams",
+    strategic_angle="Practical workflow",
+    target_audience="Developers",
+)
+
+
+def _script():
+    texts = [f"Scene {i} explains step {i} of the workflow in plain words." for i in range(1, SCENES + 1)]
+    return VideoScript(
+        hook=texts[0],
+        bullets=texts[1:-1],
+        outro_cta=texts[-1],
+        full_voiceover_text=" ".join(texts),
+        scene_voiceover_map=[
+            SceneVoiceover(scene_id=i + 1, voiceover_text=text, est_duration_seconds=60 // SCENES)
+            for i, text in enumerate(texts)
+        ],
+    )
+
+
+class FakeCinematographer:
+    """generate_text stub: records the continuity each scene prompt asked for."""
+
+    def __init__(self, barrier=None):
+        self.barrier = barrier
+        self.continuity = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, role, task, context="", style_hints=None):
+        scene = int(re.search(r"Position: Scene (\d+) of", task).group(1))
+        previous = re.search(r"Previous scene setting: (.*)\n- Maintain spatial anchor: (.*)\n"
+                             r"- Camera remains in: (.*) perspective", task)
+        with self._lock:
+            self.continuity[scene] = previous.groups() if previous else None
+        if self.barrier:
+            # Every scene prompt must be in flight at once to pass
+            self.barrier.wait()
+        return json.dumps({"veo_prompt": f"Prompt for scene {scene}", "text_overlays": [], "broll_notes": []})
+
+
+def _plan(monkeypatch, max_workers, barrier=None):
+    fake = FakeCinematographer(barrier)
+    monkeypatch.setattr(llm_router, "generate_text", fake)
+    monkeypatch.setattr(visual_planner, "SCENE_PROMPT_MAX_WORKERS", max_workers)
+    visual_plan = visual_planner.generate_visual_plan(PLAN, _script(), memory={})
+    return visual_plan, fake
+
+
+def test_concurrent_prompts_match_sequential_plan(monkeypatch):
+    sequential, sequential_llm = _plan(monkeypatch, max_workers=1)
+    concurrent, concurrent_llm = _plan(monkeypatch, max_workers=SCENES,
+                                       barrier=threading.Barrier(SCENES, timeout=5))
+
+    assert [scene.scene_id for scene in concurrent.scenes] == list(range(1, SCENES + 1))
+    assert [(s.scene_id, s.prompt_for_ai_tool, s.segment_type) for s in concurrent.scenes] == [
+        (s.scene_id, s.prompt_for_ai_tool, s.segment_type) for s in sequential.scenes
+    ]
+    assert concurrent_llm.continuity == sequential_llm.continuity
+    # The first scene establishes the set, every later one continues it
+    assert concurrent_llm.continuity[1] is None
+    assert all(concurrent_llm.continuity[i] for i in range(2, SCENES + 1))
+
+
+def test_composition_chain_skips_faceless_hook():
+    jobs = [
+        {"scene_index": 0, "segment_name": "hook", "kind": "hook", "ai_format": "animated_infographics"},
+        {"scene_index": 1, "segment_name": "content_1", "kind": "faceless", "ai_format": "animated_infographics"},
+        {"scene_index": 2, "segment_name": "cta", "kind": "faceless", "ai_format": "animated_infographics"},
+    ]
+
+    visual_planner._plan_scene_compositions(jobs, 3, "tutorial", "tech_ai", {"color_palette": {"primary": "#111111"}})
+
+    assert jobs[0]["previous_scene_composition"] is None
+    assert jobs[1]["previous_scene_composition"] is None
+    assert jobs[2]["previous_scene_composition"]["setting"] == "animated_infographics virtual environment"
+    assert "#111111" in jobs[2]["previous_scene_composition"]["spatial_anchor"]
+
+
+def test_unparseable_response_falls_back_to_raw_prompt(monkeypatch):
+    monkeypatch.setattr(llm_router, "generate_text", lambda role, task, context="", style_hints=None: "A wide shot")
+
+    visual_plan = visual_planner.generate_visual_plan(PLAN, _script(), memory={})
+
+    assert [scene.prompt_for_ai_tool for scene in visual_plan.scenes] == ["A wide shot"] * SCENES
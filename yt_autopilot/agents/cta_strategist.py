@@ -32,6 +32,7 @@ from typing import Dict, Any, List, Optional
 from yt_autopilot.core.schemas import EditorialDecision
 from yt_autopilot.core.logger import logger, truncate_for_log, log_fallback
 from yt_autopilot.core.config import LOG_TRUNCATE_REASONING
+from yt_autopilot.core.prompt_prefix import shared_workspace_block
 import json
 
 
@@ -118,15 +119,20 @@ def design_cta_strategy(
     vertical_id = workspace_config.get('vertical_id', 'unknown')
     brand_tone = workspace_config.get('brand_tone', 'Professional, educational')
 
+    # Stable channel blocks: referenced from the run's CHANNEL PROFILE prefix when active
+    channel_identity = shared_workspace_block(
+        "CHANNEL IDENTITY",
+        f"- Vertical: {vertical_id}\n- Brand Tone: {brand_tone[:100]}\n",
+        workspace_id=workspace_config.get('workspace_id')
+    )
+
     # Build LLM prompt for CTA strategy
     prompt = f"""You are a conversion optimization specialist designing CTA placement for a YouTube video.
 
 **VIDEO CONTEXT:**
 - Duration: {target_duration}s ({target_duration // 60}min {target_duration % 60}s)
 - Format: {format_type}
-- Vertical: {vertical_id}
-- Brand Tone: {brand_tone[:100]}
-
+{channel_identity}
 **NARRATIVE STRUCTURE:**
 {acts_text}
 
@@ -27,6 +27,7 @@ from yt_autopilot.core.logger import logger, truncate_for_log, log_fallback
 from yt_autopilot.core.config import LOG_TRUNCATE_REASONING
 from yt_autopilot.core.language_validator import validate_and_fix_enum_fields
 from yt_autopilot.core.series_manager import list_available_series
+from yt_autopilot.core.prompt_prefix import shared_workspace_block
 
 
 def _format_performance_insights(performance_history: Optional[List[Dict]]) -> str:
@@ -171,6 +172,14 @@ def decide_editorial_strategy(
         for serie_id, name in available_series.items()
     ])
 
+    # Stable channel blocks: referenced from the run's CHANNEL PROFILE prefix when active
+    channel_identity = shared_workspace_block(
+        "CHANNEL IDENTITY",
+        f"- Vertical: {workspace.get('vertical_id', 'finance')}\n"
+        f"- Brand tone: {workspace.get('brand_tone', 'Professional, educational, transparent')}\n",
+        workspace_id=workspace.get('workspace_id')
+    )
+
     # Build Chain-of-Thought reasoning prompt
     prompt = f"""You are an editorial strategist for a YouTube finance channel with CPM ${cpm_baseline}.
 
@@ -245,9 +254,7 @@ If you suggest a non-existent serie, the system will fallback to "tutorial", los
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 CHANNEL CONTEXT:
-- Vertical: {workspace.get('vertical_id', 'finance')}
-- Brand tone: {workspace.get('brand_tone', 'Professional, educational, transparent')}
-- Recent videos (last 10): {workspace.get('recent_titles', [])[-10:]}
+{channel_identity}- Recent videos (last 10): {workspace.get('recent_titles', [])[-10:]}
 
 PERFORMANCE HISTORY (last 10 videos):
 {perf_insights}
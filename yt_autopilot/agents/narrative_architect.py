@@ -14,9 +14,12 @@ Key Features:
 Replaces: Generic LLM script generation with strategic narrative design.
 """
 
+import json
+import re
 from typing import Dict, Any, List, Optional
 from yt_autopilot.services.llm_router import generate_text
 from yt_autopilot.core.logger import logger, log_fallback
+from yt_autopilot.core.language_validator import enforce_language
 from yt_autopilot.core.schemas import Timeline
 
 
@@ -325,9 +328,6 @@ RESPOND WITH RAW JSON ONLY.
         )
 
         # Parse JSON response with robust handling
-        import json
-        import re
-
         # Try direct JSON parse first
         try:
             narrative = json.loads(response)
@@ -442,7 +442,8 @@ def expand_narrative_voiceovers(
     target_duration: int,
     target_language: str,
     llm_generate_fn: callable,
-    max_attempts: int = 3
+    max_attempts: int = 3,
+    llm_stream_fn: Optional[callable] = None
 ) -> Dict[str, Any]:
     """
     Layer 2: AI-driven narrative expansion for duration matching.
@@ -463,6 +464,11 @@ def expand_narrative_voiceovers(
         target_language: Target language code (e.g., "it", "en")
         llm_generate_fn: LLM function for expansion
         max_attempts: Maximum expansion attempts (default: 2)
+        llm_stream_fn: Optional streaming LLM function. When set, acts are
+                       validated as they stream in (language, runaway length)
+                       and a bad stream is aborted before it completes.
+                       A completed stream gets the same language enforcement
+                       as llm_generate_fn
 
     Returns:
         Expanded narrative_arc with enriched voiceovers
@@ -562,18 +568,33 @@ OUTPUT ONLY VALID JSON:
 """
 
         try:
-            # Call LLM for expansion
-            expanded_response = llm_generate_fn(
-                role="narrative_expansion_specialist",
-                task=expansion_prompt,
-                context="",
-                style_hints={"temperature": 0.3, "language": target_language}  # Low temp for consistency
-            )
+            # Call LLM for expansion (streamed when available, validated act by act)
+            expanded_response = None
+            if llm_stream_fn:
+                expanded_response = _stream_expansion(
+                    llm_stream_fn,
+                    expansion_prompt,
+                    target_language,
+                    max_words=target_words * 2 + 40 * len(narrative_arc['narrative_structure'])
+                )
+                if expanded_response is not None:
+                    # Same language enforcement the non-streaming llm_generate_fn applies
+                    expanded_response = enforce_language(
+                        expanded_response,
+                        role="narrative_expansion_specialist",
+                        target_language=target_language,
+                        llm_generate_fn=generate_text,
+                        component_name="narrative_expansion"
+                    )
+            if expanded_response is None:
+                expanded_response = llm_generate_fn(
+                    role="narrative_expansion_specialist",
+                    task=expansion_prompt,
+                    context="",
+                    style_hints={"temperature": 0.3, "language": target_language}  # Low temp for consistency
+                )
 
             # Parse JSON response
-            import json
-            import re
-
             # Try direct JSON parse
             try:
                 expanded_data = json.loads(expanded_response)
@@ -675,3 +696,81 @@ OUTPUT ONLY VALID JSON:
 
     # Return best attempt (not original) to minimize divergence
     return best_narrative_arc
+
+
+# Matches one complete "voiceover": "<text>" value in a (partial) JSON stream
+_STREAMED_VOICEOVER_PATTERN = re.compile(r'"voiceover"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def _stream_expansion(
+    llm_stream_fn: callable,
+    expansion_prompt: str,
+    target_language: str,
+    max_words: int
+) -> Optional[str]:
+    """
+    Streams the expansion JSON, validating each act's voiceover as soon as it closes.
+
+    Args:
+        llm_stream_fn: Streaming LLM function
+        expansion_prompt: Expansion prompt (same as the non-streaming call)
+        target_language: Expected language code
+        max_words: Runaway-length budget for the whole JSON response
+
+    Returns:
+        Full response text, or None if the stream was aborted or incomplete
+    """
+    from yt_autopilot.core.stream_guard import StreamGuard, StreamAborted, StreamInterrupted
+
+    guard = StreamGuard(target_language, max_words, component_name="narrative_expansion")
+    deltas = llm_stream_fn(
+        role="narrative_expansion_specialist",
+        task=expansion_prompt,
+        context="",
+        style_hints={"temperature": 0.3, "language": target_language}
+    )
+
+    buffer = ""
+    scan_from = 0
+    acts_done = 0
+
+    try:
+        for delta in deltas:
+            guard.feed(delta)
+            buffer += delta
+
+            for match in _STREAMED_VOICEOVER_PATTERN.finditer(buffer, scan_from):
+                scan_from = match.end()
+                acts_done += 1
+                try:
+                    voiceover = json.loads(f'"{match.group(1)}"')
+                except json.JSONDecodeError:
+                    voiceover = match.group(1)
+                guard.finish_segment(f"act_{acts_done}", voiceover)
+
+    except StreamAborted as e:
+        log_fallback(
+            component="NARRATIVE_ARCHITECT_STREAM",
+            fallback_type=e.reason.upper(),
+            reason=f"Streamed expansion aborted after {acts_done} acts: {e.detail}",
+            impact="MEDIUM"
+        )
+        return None
+    except StreamInterrupted as e:
+        log_fallback(
+            component="NARRATIVE_ARCHITECT_STREAM",
+            fallback_type="STREAM_INTERRUPTED",
+            reason=f"Streamed expansion incomplete after {acts_done} acts: {e}",
+            impact="MEDIUM"
+        )
+        return None
+    finally:
+        if hasattr(deltas, "close"):
+            deltas.close()
+
+    summary = guard.summary()
+    logger.info(
+        f"     ✓ Streamed expansion: {acts_done} acts, ~{summary['estimated_seconds']}s spoken "
+        f"(first act after {summary['first_segment_ms']}ms, total {summary['total_ms']}ms)"
+    )
+    return buffer
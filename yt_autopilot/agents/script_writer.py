@@ -36,6 +36,15 @@ NEW: Segment-aware script generation
 - Tags bullets and scenes with segment_type from template
 - Maintains backward compatibility (series_format=None → legacy mode)
 
+==============================================================================
+Streaming Script Generation
+==============================================================================
+
+- Pipeline may pass llm_stream_fn (llm_router.stream_text) to stream_llm_suggestion()
+- Scenes are parsed as they arrive and checked by core/stream_guard.StreamGuard
+  (duration estimate, language check, runaway-length budget)
+- Aborted streams return None → pipeline falls back to llm_generate_fn
+
 ==============================================================================
 """
 
@@ -45,6 +54,11 @@ import re
 from yt_autopilot.core.schemas import VideoPlan, VideoScript, SceneVoiceover, SeriesFormat, EditorialDecision
 from yt_autopilot.core.memory_store import get_brand_tone
 from yt_autopilot.core.logger import logger, log_fallback
+from yt_autopilot.core.prompt_prefix import shared_workspace_block
+
+# Streamed script suggestions (hook + bullets + CTA + voiceover) are aborted once
+# they exceed this multiple of the target spoken word count
+STREAM_RUNAWAY_FACTOR = 4.0
 
 
 def _detect_content_type_with_llm(
@@ -350,6 +364,125 @@ RESPOND WITH THE SHORTENED HOOK ONLY (no explanations, no quotes):
         return _truncate_hook_deterministic(hook, max_chars=200)
 
 
+def _match_section_marker(line_stripped: str) -> Optional[str]:
+    """
+    Returns the script section a marker line opens ("hook", "bullets", "cta",
+    "voiceover"), or None for content lines.
+
+    Step 09: Supports format variations (# Hook, **HOOK**, Hook:, etc.)
+    """
+    line_upper = line_stripped.upper()
+    line_clean = line_upper.replace("#", "").replace("*", "").replace(":", "").strip()
+
+    if line_clean.startswith("HOOK") or line_upper.startswith("HOOK:"):
+        return "hook"
+    if line_clean.startswith("BULLETS") or line_upper.startswith("BULLETS:"):
+        return "bullets"
+    if line_clean.startswith("CTA") or line_clean.startswith("CALL TO ACTION") or line_upper.startswith("CTA:"):
+        return "cta"
+    if line_clean.startswith("VOICEOVER") or line_clean.startswith("VOICE OVER") or line_upper.startswith("VOICEOVER:"):
+        return "voiceover"
+    return None
+
+
+def stream_llm_suggestion(
+    llm_stream_fn: Callable,
+    task: str,
+    context: str,
+    style_hints: Optional[Dict] = None,
+    target_language: Optional[str] = None,
+    target_duration_seconds: Optional[int] = None
+) -> Optional[str]:
+    """
+    Consumes a streamed script suggestion scene by scene.
+
+    Scene boundaries (hook, each bullet, CTA, each voiceover paragraph) are
+    detected as lines arrive. Every finished scene gets a duration estimate and
+    a language check; the stream is aborted early on a confidently wrong
+    language or when it runs far past the target length.
+
+    Args:
+        llm_stream_fn: Streaming LLM function (role, task, context, style_hints) → Iterator[str]
+        task: Script prompt (same as the non-streaming call)
+        context: Prompt context
+        style_hints: Optional style hints
+        target_language: Expected language code (None disables language checks)
+        target_duration_seconds: Target video duration (None disables the length budget)
+
+    Returns:
+        Full suggestion text (same format as the non-streaming call), or None if
+        the stream was aborted or incomplete and the caller should use
+        llm_generate_fn instead
+    """
+    from yt_autopilot.core.stream_guard import (
+        StreamGuard, StreamAborted, StreamInterrupted, iter_stream_lines, WORDS_PER_SECOND
+    )
+
+    max_words = None
+    if target_duration_seconds:
+        max_words = int(target_duration_seconds * WORDS_PER_SECOND * STREAM_RUNAWAY_FACTOR)
+
+    guard = StreamGuard(target_language, max_words, component_name="script_writer")
+    deltas = llm_stream_fn(role="script_writer", task=task, context=context, style_hints=style_hints)
+
+    lines = []
+    current_section = None
+    section_counts = {"bullets": 0, "voiceover": 0}
+    finished_single = set()
+
+    try:
+        for line in iter_stream_lines(deltas, guard):
+            lines.append(line)
+            line_stripped = line.strip()
+            if not line_stripped:
+                continue
+
+            section_marker = _match_section_marker(line_stripped)
+            if section_marker:
+                current_section = section_marker
+                # Content on the marker line itself (e.g. "HOOK: ...")
+                line_stripped = line_stripped.split(":", 1)[1].strip() if ":" in line_stripped else ""
+                if len(line_stripped.replace("*", "").replace('"', "").strip()) == 0:
+                    continue
+
+            if current_section in ("hook", "cta"):
+                if current_section not in finished_single:
+                    finished_single.add(current_section)
+                    guard.finish_segment(current_section, _strip_quotes(line_stripped))
+            elif current_section in ("bullets", "voiceover"):
+                section_counts[current_section] += 1
+                label = "bullet" if current_section == "bullets" else "voiceover"
+                text = line_stripped.lstrip("-•").strip()
+                guard.finish_segment(f"{label}_{section_counts[current_section]}", text)
+
+    except StreamAborted as e:
+        log_fallback(
+            component="SCRIPT_WRITER_STREAM",
+            fallback_type=e.reason.upper(),
+            reason=f"Streamed script aborted: {e.detail}",
+            impact="MEDIUM"
+        )
+        return None
+    except StreamInterrupted as e:
+        log_fallback(
+            component="SCRIPT_WRITER_STREAM",
+            fallback_type="STREAM_INTERRUPTED",
+            reason=f"Streamed script incomplete after {len(lines)} lines: {e}",
+            impact="MEDIUM"
+        )
+        return None
+    finally:
+        if hasattr(deltas, "close"):
+            deltas.close()
+
+    summary = guard.summary()
+    logger.info(
+        f"  ✓ Streamed script: {summary['segments']} scenes, ~{summary['estimated_seconds']}s spoken, "
+        f"first scene after {summary['first_segment_ms']}ms (total {summary['total_ms']}ms)"
+    )
+    return "\n".join(lines)
+
+
 def _parse_llm_suggestion(llm_text: str) -> Optional[Dict[str, any]]:
     """
     Parse LLM-generated script suggestion into components.
@@ -392,11 +525,9 @@ def _parse_llm_suggestion(llm_text: str) -> Optional[Dict[str, any]]:
             line_stripped = line.strip()
 
             # Check for section markers (case-insensitive)
-            # Step 09: Support format variations (# Hook, **HOOK**, Hook:, etc.)
-            line_upper = line_stripped.upper()
-            line_clean = line_upper.replace("#", "").replace("*", "").replace(":", "").strip()
+            section_marker = _match_section_marker(line_stripped)
 
-            if line_clean.startswith("HOOK") or line_upper.startswith("HOOK:"):
+            if section_marker == "hook":
                 current_section = "hook"
                 # Extract text after marker if present on same line
                 if ":" in line_stripped:
@@ -405,9 +536,9 @@ def _parse_llm_suggestion(llm_text: str) -> Optional[Dict[str, any]]:
                     # Skip if it's only asterisks, quotes, or other formatting
                     if hook_text and len(hook_text.replace('*', '').replace('"', '').strip()) > 0:
                         hook = _strip_quotes(hook_text)
-            elif line_clean.startswith("BULLETS") or line_upper.startswith("BULLETS:"):
+            elif section_marker == "bullets":
                 current_section = "bullets"
-            elif line_clean.startswith("CTA") or line_clean.startswith("CALL TO ACTION") or line_upper.startswith("CTA:"):
+            elif section_marker == "cta":
                 current_section = "cta"
                 # Extract text after marker if present on same line
                 if ":" in line_stripped:
@@ -415,7 +546,7 @@ def _parse_llm_suggestion(llm_text: str) -> Optional[Dict[str, any]]:
                     # Step 09: Only use text from same line if it's actual content
                     if cta_text and len(cta_text.replace('*', '').replace('"', '').strip()) > 0:
                         outro_cta = _strip_quotes(cta_text)
-            elif line_clean.startswith("VOICEOVER") or line_clean.startswith("VOICE OVER") or line_upper.startswith("VOICEOVER:"):
+            elif section_marker == "voiceover":
                 current_section = "voiceover"
                 # Extract text after marker if present on same line
                 if ":" in line_stripped:
@@ -966,6 +1097,17 @@ Credibility markers (mention when relevant):
     }
     language_name = language_names.get(target_language.lower(), target_language.upper())
 
+    # Stable narrator/brand block: referenced from the run's CHANNEL PROFILE prefix when active
+    brand_identity = shared_workspace_block(
+        "NARRATOR PERSONA and CHANNEL IDENTITY",
+        f"""Narrator: {narrator.get('name', 'Host')} - {narrator.get('identity', 'Content creator')}
+Relationship with audience: {narrator.get('relationship', 'informative')}
+Tone of address: {narrator.get('tone_of_address', 'tu_informale')}
+{signature_phrases_text}{credibility_text}
+Brand tone: {brand_tone}
+"""
+    )
+
     prompt = f"""⚠️ CRITICAL LANGUAGE REQUIREMENT ⚠️
 ═══════════════════════════════════════════════════════════════
 ALL OUTPUT MUST BE IN {language_name}
@@ -979,12 +1121,7 @@ Strategic angle: {plan.strategic_angle}
 ─────────────────────────────────────────────
 BRAND IDENTITY (interpret appropriately for format):
 ─────────────────────────────────────────────
-Narrator: {narrator.get('name', 'Host')} - {narrator.get('identity', 'Content creator')}
-Relationship with audience: {narrator.get('relationship', 'informative')}
-Tone of address: {narrator.get('tone_of_address', 'tu_informale')}
-{signature_phrases_text}{credibility_text}
-Brand tone: {brand_tone}
-
+{brand_identity}
 ─────────────────────────────────────────────
 VIDEO FORMAT (primary structure driver):
 ─────────────────────────────────────────────
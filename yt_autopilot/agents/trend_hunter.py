@@ -49,6 +49,7 @@ ARCHITECTURE RULE:
 from typing import List, Dict, Optional, Callable
 import re
 import json
+from datetime import datetime, timedelta
 from yt_autopilot.core.schemas import TrendCandidate, VideoPlan
 from yt_autopilot.core.memory_store import get_banned_topics, get_recent_titles, get_brand_tone
 from yt_autopilot.core.logger import logger, log_fallback
@@ -123,17 +124,84 @@ def _is_topic_banned(trend: TrendCandidate, banned_topics: List[str]) -> bool:
     return False
 
 
-def _is_too_similar_to_recent(trend: TrendCandidate, recent_titles: List[str]) -> bool:
+def _find_nearest_past_content(workspace_id: Optional[str], keywords: List[str]) -> List[Optional[Dict]]:
+    """
+    Finds the nearest recent title/working title/hook for each keyword.
+
+    Uses one batched top-1 query against the workspace content index
+    (io/content_index.py) instead of comparing each keyword with each title.
+    Only content saved in the last RECENT_CONTENT_DAYS is searched; older
+    topics may come back.
+
+    Args:
+        workspace_id: Workspace identifier (None = no index)
+        keywords: Trend keywords to look up
+
+    Returns:
+        One entry dict (with "score" and the index's duplicate "threshold")
+        or None per keyword.
+        All None if the index is unavailable (word-overlap check still applies).
+    """
+    if not workspace_id or not keywords:
+        return [None] * len(keywords)
+
+    try:
+        from yt_autopilot.io.content_index import RECENT_CONTENT_DAYS, get_content_index
+
+        content_index = get_content_index(workspace_id)
+        if len(content_index) == 0:
+            return [None] * len(keywords)
+
+        since = (datetime.now() - timedelta(days=RECENT_CONTENT_DAYS)).isoformat()
+        threshold = content_index.duplicate_threshold
+        return [
+            {**matches[0], "threshold": threshold} if matches else None
+            for matches in content_index.search_batch(keywords, top_k=1, since=since)
+        ]
+    except Exception as e:
+        logger.warning(f"Content index unavailable: {e}")
+        log_fallback(
+            component="TREND_HUNTER_DEDUP",
+            fallback_type="WORD_OVERLAP_ONLY",
+            reason=f"Content index unavailable: {e}",
+            impact="LOW"
+        )
+        return [None] * len(keywords)
+
+
+def _is_too_similar_to_recent(
+    trend: TrendCandidate,
+    recent_titles: List[str],
+    nearest_match: Optional[Dict] = None
+) -> bool:
     """
     Checks if trend is too similar to recently published content.
 
+    Two layers:
+    1. Word overlap with recent titles (>50% of keyword words)
+    2. Semantic similarity with the nearest recent title/working title/hook
+       from the workspace content index (io/content_index.py)
+
     Args:
         trend: Trend candidate to check
         recent_titles: List of recent video titles
+        nearest_match: Optional nearest content index entry for trend.keyword
+                       (dict with "score", "kind", "text" and optionally the
+                       embedder's duplicate "threshold")
 
     Returns:
         True if trend is too similar to recent content
     """
+    if nearest_match:
+        from yt_autopilot.io.content_index import SEMANTIC_DUPLICATE_THRESHOLD
+
+        if nearest_match["score"] >= nearest_match.get("threshold", SEMANTIC_DUPLICATE_THRESHOLD):
+            logger.debug(
+                f"Trend '{trend.keyword}' semantically similar to past {nearest_match['kind']} "
+                f"'{nearest_match['text']}' (score: {nearest_match['score']:.2f})"
+            )
+            return True
+
     if not recent_titles:
         return False
 
@@ -477,12 +545,15 @@ def generate_video_plan(
     suitable_trends = []
     workspace_id = memory.get("workspace_id")  # For workspace-scoped duplicate check
 
-    for trend in trends:
+    # Semantic dedup: nearest past content for every candidate in one query
+    nearest_matches = _find_nearest_past_content(workspace_id, [t.keyword for t in trends])
+
+    for trend, nearest_match in zip(trends, nearest_matches):
         if _is_topic_banned(trend, banned_topics):
             logger.debug(f"Filtered out trend '{trend.keyword}': contains banned topic")
             continue
 
-        if _is_too_similar_to_recent(trend, recent_titles):
+        if _is_too_similar_to_recent(trend, recent_titles, nearest_match=nearest_match):
             logger.debug(f"Filtered out trend '{trend.keyword}': too similar to recent content")
             continue
 
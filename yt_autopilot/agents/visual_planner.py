@@ -39,13 +39,20 @@ NEW: Visual format engine with intro/outro support
 """
 
 from typing import Dict, List, Tuple, Optional
+import contextvars
 import random
+from concurrent.futures import ThreadPoolExecutor
 from yt_autopilot.core.schemas import VideoPlan, VideoScript, VisualPlan, VisualScene, SceneVoiceover, SeriesFormat
 from yt_autopilot.core.memory_store import get_visual_style
 from yt_autopilot.core.logger import logger, log_fallback  # Phase C - P4: Add fallback logging
+from yt_autopilot.core.prompt_prefix import shared_workspace_block
 from yt_autopilot.agents.cinematographer import get_cinematic_specs
 
 
+# Concurrent per-scene prompt generation in multi-scene mode (phase 2)
+SCENE_PROMPT_MAX_WORKERS = 12
+
+
 def _estimate_duration_from_text(text: str) -> int:
     """
     Estimates speaking duration in seconds based on text length.
@@ -458,6 +465,53 @@ CTA: {script.outro_cta}"""
 # Use get_cinematic_specs() from cinematographer for all cinematography needs
 
 
+def _scene_composition(cinematic_specs: Dict, ai_format: str, brand_manual: Optional[Dict]) -> Dict:
+    """
+    Spatial composition a scene establishes (shot, setting, spatial anchor).
+
+    Derived only from cinematographer specs and the brand palette, never from
+    the LLM response, so the whole chain can be planned before any prompt is
+    generated (see _plan_scene_compositions).
+    """
+    palette = brand_manual.get('color_palette', {}) if brand_manual else {}
+    return {
+        'shot': cinematic_specs['shot_type'],
+        'setting': f"{ai_format} virtual environment",
+        'spatial_anchor': f"{cinematic_specs['lighting']['mood']} lit {ai_format} space with "
+                          f"{palette.get('primary', '#1976D2')} tones"
+    }
+
+
+def _plan_scene_compositions(
+    scene_jobs: List[Dict],
+    total_scenes: int,
+    series_format_name: str,
+    vertical_id: str,
+    brand_manual: Optional[Dict]
+) -> None:
+    """
+    Phase 1 of multi-scene planning: fill in each job's previous_scene_composition.
+
+    Walks the scenes in order exactly like the former sequential loop (the
+    faceless hook scene does not establish a composition), using the
+    deterministic cinematographer shot progression instead of LLM output.
+    """
+    previous_scene_composition = None
+    for job in scene_jobs:
+        job['previous_scene_composition'] = previous_scene_composition
+        if job['kind'] == 'hook':
+            continue
+        cinematic_specs = get_cinematic_specs(
+            scene_index=job['scene_index'],
+            segment_name=job['segment_name'],
+            series_format_name=series_format_name,
+            vertical_id=vertical_id,
+            ai_format=job['ai_format'],
+            total_scenes=total_scenes
+        )
+        previous_scene_composition = _scene_composition(cinematic_specs, job['ai_format'], brand_manual)
+
+
 def _generate_ai_enhanced_scene_prompt(
     segment_name: str,
     segment_text: str,
@@ -545,14 +599,25 @@ def _generate_ai_enhanced_scene_prompt(
     }
 
     # Step 3: Build rich LLM context
+    # Stable workspace blocks are referenced from the run's CHANNEL PROFILE prefix when active
     narrator_context = ""
     if narrator_persona and narrator_persona.get('enabled'):
-        narrator_context = f"""
-NARRATOR PERSONA:
-- Name: {narrator_persona.get('name', 'N/A')}
+        narrator_context = "\nNARRATOR PERSONA:\n" + shared_workspace_block(
+            "NARRATOR PERSONA",
+            f"""- Name: {narrator_persona.get('name', 'N/A')}
 - Identity: {narrator_persona.get('identity', 'N/A')}
 - Relationship: {narrator_persona.get('relationship', 'N/A')}
 """
+        )
+
+    brand_colors_context = f"""- Primary Color: {colors['primary']}
+- Secondary Color: {colors['secondary']}
+- Accent Color: {colors['accent']}
+- Background: {colors['background']}
+"""
+    if brand_manual and brand_manual.get('enabled'):
+        # Palette comes from the brand manual → identical to the prefix section
+        brand_colors_context = shared_workspace_block("VISUAL BRAND MANUAL", brand_colors_context)
 
     # Step 3b: Build character context for character-based mode
     character_context = ""
@@ -603,11 +668,7 @@ VIDEO IDENTITY:
 
 BRAND VISUAL IDENTITY:
 - Visual Format: {ai_format} (STRICT - must use ONLY this format throughout)
-- Primary Color: {colors['primary']}
-- Secondary Color: {colors['secondary']}
-- Accent Color: {colors['accent']}
-- Background: {colors['background']}
-{narrator_context}{character_context}
+{brand_colors_context}{narrator_context}{character_context}
 EMOTIONAL ORCHESTRATION (Retention Optimization):
 - Energy Level: {emotional_context['energy_level']} (governs visual intensity)
 - Story Beat: {emotional_context['story_beat']} (narrative role in arc)
@@ -813,11 +874,7 @@ OUTPUT FORMAT (JSON):
             broll_notes = []
 
         # Build composition info for next scene's spatial continuity
-        current_composition = {
-            'shot': shot_specs['shot'],
-            'setting': f"{ai_format} virtual environment",
-            'spatial_anchor': f"{lighting['mood']} lit {ai_format} space with {colors['primary']} tones"
-        }
+        current_composition = _scene_composition(cinematic_specs, ai_format, brand_manual)
 
         return {
             'prompt': prompt,
@@ -831,7 +888,6 @@ OUTPUT FORMAT (JSON):
         logger.info(f"  → Falling back to deterministic prompt generation")
 
         # Phase B1: Log fallback for overlay/B-roll planning failure
-        from yt_autopilot.core.logger import log_fallback
         log_fallback(
             component="VISUAL_PLANNER",
             fallback_type="DETERMINISTIC_PROMPT_NO_OVERLAYS",
@@ -853,11 +909,7 @@ OUTPUT FORMAT (JSON):
         )
 
         # Build composition info for next scene (same as success path)
-        current_composition = {
-            'shot': shot_specs['shot'],
-            'setting': f"{ai_format} virtual environment",
-            'spatial_anchor': f"{lighting['mood']} lit {ai_format} space with {colors['primary']} tones"
-        }
+        current_composition = _scene_composition(cinematic_specs, ai_format, brand_manual)
 
         # Phase B1: Return empty arrays for overlays/B-roll (no AI planning available)
         return {
@@ -1520,10 +1572,12 @@ def generate_visual_plan(
             logger.debug(f"    Narrative preview: {full_narrative[:100]}...")
 
         else:
-            # MULTI-SCENE MODE (original behavior)
-            # Track composition for spatial continuity across scenes
-            previous_scene_composition = None
-
+            # MULTI-SCENE MODE (two-phase)
+            # Phase 1: plan every scene's composition chain up front (deterministic,
+            # cinematographer shot progression) so spatial continuity does not
+            # depend on the previous scene's LLM call.
+            # Phase 2: generate the per-scene prompts concurrently.
+            scene_jobs = []
             for scene_index, scene_vo in enumerate(script.scene_voiceover_map):
                 # Step 07.5: Use segment_type from script if available (set by ScriptWriter)
                 # Otherwise, determine based on scene position (legacy)
@@ -1536,6 +1590,26 @@ def generate_visual_plan(
                 else:
                     segment_name = f"content_{scene_vo.scene_id - 1}"
 
+                if segment_name == "hook" and video_style_mode == 'faceless':
+                    kind = 'hook'
+                elif video_style_mode == 'faceless':
+                    kind = 'faceless'
+                else:
+                    kind = 'character'
+
+                scene_jobs.append({
+                    'scene_vo': scene_vo,
+                    'scene_index': scene_index,
+                    'segment_name': segment_name,
+                    'kind': kind,
+                    'ai_format': "character_based" if kind == 'character' else ai_selected_format,
+                })
+
+            _plan_scene_compositions(scene_jobs, total_scenes, series_format_name, vertical_id, brand_manual)
+
+            def generate_scene_prompt(job: Dict) -> Dict:
+                scene_vo = job['scene_vo']
+
                 # Generate cinematic Veo prompt for this scene
                 # NEW: Cinematic Prompt Engine integrates:
                 # - Shot type progression (wide/medium/close variety)
@@ -1546,7 +1620,7 @@ def generate_visual_plan(
                 # - Content-specific descriptions
 
                 # Special handling for hook scene (first content scene)
-                if segment_name == "hook" and video_style_mode == 'faceless':
+                if job['kind'] == 'hook':
                     # Optimize hook for maximum impact retention
                     palette = brand_manual.get('color_palette', {}) if brand_manual else {}
                     brand_colors = {
@@ -1561,58 +1635,50 @@ def generate_visual_plan(
                         brand_colors=brand_colors,
                         vertical_id=vertical_id
                     )
-                elif video_style_mode == 'faceless':
-                    # Use AI-enhanced prompt generator with FULL workspace context and spatial continuity
-                    result = _generate_ai_enhanced_scene_prompt(
-                        segment_name=segment_name,
-                        segment_text=scene_vo.voiceover_text,
-                        plan=plan,
-                        scene_index=scene_index,
-                        total_scenes=total_scenes,
-                        series_format_name=series_format_name,
-                        vertical_id=vertical_id,
-                        ai_format=ai_selected_format,
-                        brand_manual=brand_manual if brand_manual else {},
-                        brand_tone=workspace_config.get('brand_tone', '') if workspace_config else '',
-                        narrator_persona=workspace_config.get('narrator_persona') if workspace_config else None,
-                        target_language=workspace_config.get('target_language', 'en') if workspace_config else 'en',
-                        recent_titles=workspace_config.get('recent_titles', []) if workspace_config else [],
-                        previous_scene_composition=previous_scene_composition  # Spatial continuity
-                    )
-                    # Extract prompt and update composition for next scene
-                    veo_prompt = result['prompt']
-                    previous_scene_composition = result['composition']
-                else:
-                    # Use AI-enhanced prompt generator for CHARACTER-BASED mode
-                    # Now includes Energy Orchestration + Spatial Continuity!
-                    result = _generate_ai_enhanced_scene_prompt(
-                        segment_name=segment_name,
-                        segment_text=scene_vo.voiceover_text,
-                        plan=plan,
-                        scene_index=scene_index,
-                        total_scenes=total_scenes,
-                        series_format_name=series_format_name,
-                        vertical_id=vertical_id,
-                        ai_format="character_based",  # Mark as character mode
-                        brand_manual=brand_manual if brand_manual else {},
-                        brand_tone=workspace_config.get('brand_tone', '') if workspace_config else '',
-                        narrator_persona=workspace_config.get('narrator_persona') if workspace_config else None,
-                        target_language=workspace_config.get('target_language', 'en') if workspace_config else 'en',
-                        recent_titles=workspace_config.get('recent_titles', []) if workspace_config else [],
-                        previous_scene_composition=previous_scene_composition,  # Spatial continuity
-                        character_description=character_description,  # Character identity anchor
-                        video_style_mode="character_based"  # Mode flag
-                    )
-                    # Extract prompt and update composition for next scene
-                    veo_prompt = result['prompt']
-                    previous_scene_composition = result['composition']
+                    return {'prompt': veo_prompt, 'text_overlays': [], 'broll_notes': []}
+
+                # Use AI-enhanced prompt generator with FULL workspace context and spatial continuity
+                # (character-based mode also gets Energy Orchestration + character identity anchor)
+                character_mode = job['kind'] == 'character'
+                return _generate_ai_enhanced_scene_prompt(
+                    segment_name=job['segment_name'],
+                    segment_text=scene_vo.voiceover_text,
+                    plan=plan,
+                    scene_index=job['scene_index'],
+                    total_scenes=total_scenes,
+                    series_format_name=series_format_name,
+                    vertical_id=vertical_id,
+                    ai_format=job['ai_format'],
+                    brand_manual=brand_manual if brand_manual else {},
+                    brand_tone=workspace_config.get('brand_tone', '') if workspace_config else '',
+                    narrator_persona=workspace_config.get('narrator_persona') if workspace_config else None,
+                    target_language=workspace_config.get('target_language', 'en') if workspace_config else 'en',
+                    recent_titles=workspace_config.get('recent_titles', []) if workspace_config else [],
+                    previous_scene_composition=job['previous_scene_composition'],  # Planned in phase 1
+                    character_description=character_description if character_mode else None,
+                    video_style_mode="character_based" if character_mode else "faceless"
+                )
+
+            workers = max(1, min(SCENE_PROMPT_MAX_WORKERS, len(scene_jobs)))
+            logger.info(f"  Planned {len(scene_jobs)} scene compositions, generating prompts ({workers} workers)")
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scene-prompt") as executor:
+                # copy_context: each worker keeps the caller's LLM call scope (prompt prefix, attribution)
+                futures = [
+                    executor.submit(contextvars.copy_context().run, generate_scene_prompt, job)
+                    for job in scene_jobs
+                ]
+                results = [future.result() for future in futures]
+
+            for job, result in zip(scene_jobs, results):
+                scene_vo = job['scene_vo']
+                segment_name = job['segment_name']
 
                 # Create VisualScene with embedded voiceover text (Step 07.3)
                 # and segment_type (Step 07.5)
                 # Phase B1: Include AI-planned overlays and B-roll from result
                 scene = VisualScene(
                     scene_id=scene_vo.scene_id,
-                    prompt_for_ai_tool=veo_prompt,
+                    prompt_for_ai_tool=result['prompt'],
                     est_duration_seconds=scene_vo.est_duration_seconds,
                     voiceover_text=scene_vo.voiceover_text,  # Sync with script!
                     segment_type=segment_name,  # Step 07.5: Tag with segment type
@@ -3,27 +3,34 @@ Core module: Shared data models, configuration, logging, and channel memory.
 This module has no dependencies on other yt_autopilot modules.
 """
 
-from yt_autopilot.core.config import (
-    get_config,
-    validate_config,
-    get_memory_path,
-    get_output_dir,
-    get_temp_dir,
-    get_llm_anthropic_key,
-    get_llm_openai_key,
-    get_env,
-)
+import importlib
+
+# logger stays eager: it is cheap, and the yt_autopilot.core.logger submodule
+# would otherwise shadow the re-exported object once imported.
 from yt_autopilot.core.logger import logger
-from yt_autopilot.core import schemas
-from yt_autopilot.core.memory_store import (
-    load_memory,
-    save_memory,
-    get_brand_tone,
-    get_visual_style,
-    get_banned_topics,
-    get_recent_titles,
-    append_recent_title,
-)
+
+# Other re-exports are imported on first access, so importing a light submodule
+# (e.g. yt_autopilot.core.workspace_manager) does not load pydantic schemas.
+_LAZY_EXPORTS = {
+    "get_config": "yt_autopilot.core.config",
+    "validate_config": "yt_autopilot.core.config",
+    "get_memory_path": "yt_autopilot.core.config",
+    "get_output_dir": "yt_autopilot.core.config",
+    "get_temp_dir": "yt_autopilot.core.config",
+    "get_llm_anthropic_key": "yt_autopilot.core.config",
+    "get_llm_openai_key": "yt_autopilot.core.config",
+    "get_env": "yt_autopilot.core.config",
+    "load_memory": "yt_autopilot.core.memory_store",
+    "save_memory": "yt_autopilot.core.memory_store",
+    "get_brand_tone": "yt_autopilot.core.memory_store",
+    "get_visual_style": "yt_autopilot.core.memory_store",
+    "get_banned_topics": "yt_autopilot.core.memory_store",
+    "get_recent_titles": "yt_autopilot.core.memory_store",
+    "append_recent_title": "yt_autopilot.core.memory_store",
+}
+
+# Submodules re-exported as attributes (yt_autopilot.core.schemas)
+_LAZY_SUBMODULES = ("schemas",)
 
 __all__ = [
     # Config
@@ -48,3 +55,16 @@ __all__ = [
     "get_recent_titles",
     "append_recent_title",
 ]
+
+
+def __getattr__(name):
+    """Resolves re-exports on first access (PEP 562)."""
+    if name in _LAZY_SUBMODULES:
+        # import_module binds the submodule in globals(): later lookups skip this
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
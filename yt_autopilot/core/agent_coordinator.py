@@ -41,6 +41,8 @@ from yt_autopilot.core.schemas import (
     Timeline
 )
 from yt_autopilot.core.logger import logger, log_fallback
+from yt_autopilot.core.run_context import llm_call_scope
+from yt_autopilot.core.tracing import span, current_span_id
 
 # Forward declarations for type hints (actual imports happen in AgentRegistry)
 VisualPlan = Any  # Will be imported from visual_planner
@@ -149,7 +151,7 @@ class AgentContext:
     Benefits:
     - Single source of truth for pipeline state
     - Easy to add new context without changing agent signatures
-    - Tracing support with execution_id
+    - Tracing support with execution_id (and trace_parent_id for timing spans)
     - Agent call history for debugging
     - Performance data accumulation
 
@@ -200,6 +202,9 @@ class AgentContext:
     # ============ Performance & Analytics ============
     performance_history: List[Dict] = field(default_factory=list)
     pipeline_start_time: float = field(default_factory=time.time)
+    # Span that agent spans nest under (core/tracing.py). While an agent runs this
+    # is the agent's own span, so work it hands to other threads can attach to it.
+    trace_parent_id: Optional[str] = None
 
     # ============ Optional Context ============
     memory: Optional[Dict] = None  # For agents that use memory
@@ -678,8 +683,20 @@ class AgentCoordinator:
 
                 start_time = time.time()
 
-                # Call agent with context adaptation
-                output = self._call_agent_with_adaptation(spec, context)
+                # Call agent with context adaptation (LLM calls attributed to this agent)
+                parent_span_id = context.trace_parent_id
+                with span(f"agent:{agent_name}", cat="agent", parent_id=parent_span_id, attempt=attempt + 1), \
+                        llm_call_scope(
+                            workspace_id=context.workspace_id,
+                            execution_id=context.execution_id,
+                            agent=agent_name,
+                            retry_reason="agent_retry" if attempt > 0 else None
+                        ):
+                    context.trace_parent_id = current_span_id()
+                    try:
+                        output = self._call_agent_with_adaptation(spec, context)
+                    finally:
+                        context.trace_parent_id = parent_span_id
 
                 execution_time_ms = (time.time() - start_time) * 1000
 
@@ -715,7 +732,10 @@ class AgentCoordinator:
                     logger.info(f"  🔍 Running quality validation for {agent_name}...")
 
                     try:
-                        is_valid, validation_error = spec.quality_validator(output, context)
+                        with span(f"quality_validation:{agent_name}", cat="validation") as validation_span:
+                            is_valid, validation_error = spec.quality_validator(output, context)
+                            if validation_span is not None:
+                                validation_span["is_valid"] = is_valid
 
                         if not is_valid:
                             logger.warning(f"  ⚠️ Quality validation failed: {validation_error}")
@@ -733,11 +753,12 @@ class AgentCoordinator:
                                 )
 
                                 try:
-                                    # Regenerate with quality constraints
-                                    output = spec.quality_retry_fn(output, context, validation_error)
+                                    with span(f"quality_retry:{agent_name}", cat="retry", reason=validation_error):
+                                        # Regenerate with quality constraints
+                                        output = spec.quality_retry_fn(output, context, validation_error)
 
-                                    # Re-validate after retry
-                                    is_valid_after_retry, retry_error = spec.quality_validator(output, context)
+                                        # Re-validate after retry
+                                        is_valid_after_retry, retry_error = spec.quality_validator(output, context)
 
                                     if not is_valid_after_retry:
                                         logger.warning(f"  ⚠️ Quality still invalid after retry: {retry_error}")
@@ -823,7 +844,8 @@ class AgentCoordinator:
                         logger.info(f"  🔧 Using fallback strategy for {agent_name}")
 
                         try:
-                            fallback_output = spec.fallback_strategy(context)
+                            with span(f"fallback:{agent_name}", cat="retry"):
+                                fallback_output = spec.fallback_strategy(context)
 
                             call_record = AgentCallRecord(
                                 agent_name=agent_name,
@@ -4,7 +4,6 @@ Loads environment variables and provides centralized config access.
 """
 
 import os
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
@@ -14,6 +13,9 @@ _project_root = Path(__file__).parent.parent.parent
 _env_path = _project_root / ".env"
 load_dotenv(_env_path)
 
+# Output/temp directories already created by get_config() in this process
+_ensured_dirs = set()
+
 
 def get_config() -> Dict[str, Any]:
     """
@@ -48,9 +50,11 @@ def get_config() -> Dict[str, Any]:
         "MEMORY_FILE": os.getenv("MEMORY_FILE", "channel_memory.json"),
     }
 
-    # Ensure directories exist
-    config["OUTPUT_DIR"].mkdir(parents=True, exist_ok=True)
-    config["TEMP_DIR"].mkdir(parents=True, exist_ok=True)
+    # Ensure directories exist (once per path, get_config() is called per operation)
+    for key in ("OUTPUT_DIR", "TEMP_DIR"):
+        if config[key] not in _ensured_dirs:
+            config[key].mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(config[key])
 
     return config
 
@@ -502,6 +506,7 @@ def load_validation_thresholds(
         FileNotFoundError: If config/validation_thresholds.yaml is missing
         yaml.YAMLError: If YAML file is malformed
     """
+    import yaml
     from yt_autopilot.core.logger import logger
 
     # Load YAML configuration
@@ -18,6 +18,8 @@ from typing import Dict, Tuple, Optional, Callable
 import logging
 from enum import Enum
 from yt_autopilot.core.logger import log_fallback
+from yt_autopilot.core.run_context import llm_call_scope
+from yt_autopilot.core.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +93,10 @@ class LanguageValidator:
         """
         try:
             import langdetect
-            from langdetect import detect_langs
+            from langdetect import DetectorFactory, detect_langs
+
+            # langdetect samples randomly: seeded, the same text always gets the same result
+            DetectorFactory.seed = 0
 
             # detect_langs returns list of (Language, probability) tuples
             detections = detect_langs(text)
@@ -462,17 +467,63 @@ def wrap_llm_with_language_enforcement(
         # Call original LLM
         llm_output = llm_generate_fn(role, task, context, **kwargs)
 
-        # Validate and correct if needed
+        return _enforce_language(validator, llm_output, role, llm_generate_fn, context, component_name)
+
+    return wrapped_llm_fn
+
+
+def enforce_language(
+    llm_output: str,
+    role: str,
+    target_language: str,
+    llm_generate_fn: Callable,
+    context: str = "",
+    strict_mode: bool = True,
+    component_name: str = "unknown"
+) -> str:
+    """
+    Applica a un output già generato la stessa validazione di wrap_llm_with_language_enforcement.
+
+    Used for streamed output (script, narrative expansion), which bypasses the
+    wrapped llm_generate_fn.
+
+    Args:
+        llm_output: Output LLM da validare
+        role: Agent role che ha prodotto l'output
+        target_language: Target language code
+        llm_generate_fn: LLM function per la correzione
+        context: Optional context per la correzione
+        strict_mode: Strict validation mode
+        component_name: Component name per logging
+
+    Returns:
+        Output nella lingua target (corretto se necessario)
+    """
+    validator = LanguageValidator(target_language, strict_mode)
+    return _enforce_language(validator, llm_output, role, llm_generate_fn, context, component_name)
+
+
+def _enforce_language(
+    validator: "LanguageValidator",
+    llm_output: str,
+    role: str,
+    llm_generate_fn: Callable,
+    context: str,
+    component_name: str
+) -> str:
+    # Validate and correct if needed (correction calls are accounted as retries)
+    with span(f"language_check:{role}", cat="validation") as check_span, \
+            llm_call_scope(retry_reason="language_correction"):
         validated_output = validator.ensure_language_consistency(
             llm_output,
             llm_generate_fn,
             context=context,
             component_name=f"{component_name}:{role}"
         )
+        if check_span is not None:
+            check_span["corrected"] = validated_output != llm_output
 
-        return validated_output
-
-    return wrapped_llm_fn
+    return validated_output
 
 
 def validate_and_fix_enum_fields(
@@ -13,6 +13,8 @@ Gates:
 
 Architecture:
 - Each gate = independent validator with specific checks
+- Checks declare their inputs and are memoized by input content hash, so
+  re-validating after a retry only re-runs checks whose inputs changed
 - Blocking vs non-blocking validation configurable
 - Validation results aggregated for analytics
 - LLM-powered reasoning for complex validations
@@ -21,11 +23,14 @@ Author: YT Autopilot Team
 Version: 1.0 (Phase A3 - Sprint 2)
 """
 
+import hashlib
+import json
+import threading
 import time
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 from dataclasses import dataclass, field
-from collections import Counter
+from collections import Counter, OrderedDict
 from difflib import SequenceMatcher
 from yt_autopilot.core.logger import log_fallback
 
@@ -37,6 +42,7 @@ from yt_autopilot.core.schemas import (
     Timeline
 )
 from yt_autopilot.core.logger import logger
+from yt_autopilot.core.tracing import span
 
 
 class ValidationSeverity(str, Enum):
@@ -77,6 +83,8 @@ class ValidationResult:
     warnings: List[str] = field(default_factory=list)
     recommendations: List[str] = field(default_factory=list)
     execution_time_ms: float = 0.0
+    check_timings_ms: Dict[str, float] = field(default_factory=dict)  # check -> ms (0.0 if cached)
+    cached_checks: List[str] = field(default_factory=list)           # checks reused from memo
 
     def to_dict(self) -> Dict:
         """Convert to dict for logging/storage."""
@@ -86,7 +94,9 @@ class ValidationResult:
             "validation_score": self.validation_score,
             "issues_count": len(self.issues),
             "warnings_count": len(self.warnings),
-            "execution_time_ms": self.execution_time_ms
+            "execution_time_ms": self.execution_time_ms,
+            "check_timings_ms": self.check_timings_ms,
+            "cached_checks": self.cached_checks
         }
 
     def get_blocking_issues(self) -> List[ValidationIssue]:
@@ -103,19 +113,198 @@ class PipelineValidationReport:
     blocking_issues: int
     overall_score: float
     gate_results: Dict[str, ValidationResult]
+    check_timings_ms: Dict[str, Dict[str, float]] = field(default_factory=dict)  # gate -> check -> ms
+    checks_run: int = 0
+    checks_cached: int = 0
+    total_time_ms: float = 0.0
 
     def is_pipeline_valid(self) -> bool:
         """Pipeline valid if no blocking issues."""
         return self.blocking_issues == 0
 
+    @classmethod
+    def from_results(cls, gate_results: Dict[str, ValidationResult]) -> "PipelineValidationReport":
+        """
+        Aggregates the latest result of each gate.
+
+        Args:
+            gate_results: Gate label (e.g. "gate_3") -> final ValidationResult
+
+        Returns:
+            PipelineValidationReport with per-check timings
+        """
+        results = list(gate_results.values())
+        checks_cached = sum(len(r.cached_checks) for r in results)
+        return cls(
+            gates_passed=sum(1 for r in results if r.is_valid),
+            gates_failed=sum(1 for r in results if not r.is_valid),
+            total_issues=sum(len(r.issues) for r in results),
+            blocking_issues=sum(len(r.get_blocking_issues()) for r in results),
+            overall_score=sum(r.validation_score for r in results) / len(results) if results else 1.0,
+            gate_results=dict(gate_results),
+            check_timings_ms={label: dict(r.check_timings_ms) for label, r in gate_results.items()},
+            checks_run=sum(len(r.check_timings_ms) for r in results) - checks_cached,
+            checks_cached=checks_cached,
+            total_time_ms=sum(r.execution_time_ms for r in results)
+        )
+
+
+# ============================================================================
+# CHECK MEMOIZATION
+# ============================================================================
+#
+# Every gate check declares the inputs it reads (e.g. "script.hook",
+# "thresholds"). Its outcome is memoized under a content hash of exactly those
+# inputs, so re-validating after a retry (script rewrite, language fix) only
+# re-runs the checks whose inputs actually changed. Checks are pure functions
+# of their declared inputs; reading an undeclared input raises KeyError.
+
+# Max memoized check outcomes kept in-process (LRU)
+VALIDATION_MEMO_MAX_ENTRIES = 1024
+
+_memo: "OrderedDict[str, _CheckOutcome]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+@dataclass
+class _CheckOutcome:
+    """Issues, warnings and recommendations produced by a single check."""
+    issues: List[ValidationIssue] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+
+
+def _content_hash(value: Any) -> str:
+    """Stable hash of a check input (pydantic models hashed by content)."""
+    def _default(obj: Any) -> Any:
+        if hasattr(obj, 'model_dump'):
+            return obj.model_dump(mode='json')
+        return str(obj)
+
+    payload = json.dumps(value, sort_keys=True, default=_default, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def clear_validation_memo() -> None:
+    """Drops all memoized check outcomes (e.g. after changing validation thresholds on disk)."""
+    with _memo_lock:
+        _memo.clear()
+
+
+class _MemoizedGate:
+    """
+    Base for gates built from declared, memoized checks.
+
+    Subclasses set GATE_NAME and CHECKS, and implement each check as
+    `_check_<name>(self, inputs, outcome)` reading only its declared inputs.
+    """
+
+    GATE_NAME = ""
+    # (check name, declared input names) in execution order
+    CHECKS: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+
+    def _run_checks(self, inputs: Dict[str, Any], start_time: float) -> ValidationResult:
+        """
+        Runs the gate's checks inside a trace span (see _evaluate_checks).
+        """
+        with span(f"gate:{self.GATE_NAME}", cat="validation") as gate_span:
+            result = self._evaluate_checks(inputs, start_time)
+            if gate_span is not None:
+                gate_span.update(
+                    is_valid=result.is_valid,
+                    checks_run=len(self.CHECKS) - len(result.cached_checks),
+                    checks_cached=len(result.cached_checks)
+                )
+        return result
+
+    def _evaluate_checks(self, inputs: Dict[str, Any], start_time: float) -> ValidationResult:
+        """
+        Runs every check, reusing memoized outcomes whose inputs are unchanged.
+
+        Args:
+            inputs: Input name -> value for every input declared in CHECKS
+            start_time: time.time() when validate() was entered
+
+        Returns:
+            ValidationResult with per-check timings
+        """
+        input_hashes: Dict[str, str] = {}
+        issues = []
+        warnings = []
+        recommendations = []
+        check_timings = {}
+        cached_checks = []
+
+        for check_name, input_names in self.CHECKS:
+            for name in input_names:
+                if name not in input_hashes:
+                    input_hashes[name] = _content_hash(inputs[name])
+            memo_key = "|".join(
+                [type(self).__name__, check_name] + [input_hashes[name] for name in input_names]
+            )
+
+            with _memo_lock:
+                outcome = _memo.get(memo_key)
+                if outcome is not None:
+                    _memo.move_to_end(memo_key)
+
+            if outcome is not None:
+                check_timings[check_name] = 0.0
+                cached_checks.append(check_name)
+            else:
+                check_start = time.perf_counter()
+                outcome = _CheckOutcome()
+                getattr(self, f"_check_{check_name}")({name: inputs[name] for name in input_names}, outcome)
+                check_timings[check_name] = (time.perf_counter() - check_start) * 1000
+                with _memo_lock:
+                    _memo[memo_key] = outcome
+                    while len(_memo) > VALIDATION_MEMO_MAX_ENTRIES:
+                        _memo.popitem(last=False)
+
+            issues.extend(outcome.issues)
+            warnings.extend(outcome.warnings)
+            recommendations.extend(outcome.recommendations)
+
+        # Calculate validation score
+        blocking_count = sum(1 for i in issues if i.severity == ValidationSeverity.BLOCKING)
+        warning_count = sum(1 for i in issues if i.severity == ValidationSeverity.WARNING)
+
+        # Score formula: 1.0 - (blocking*0.25 + warnings*0.10)
+        validation_score = max(0.0, 1.0 - (blocking_count * 0.25 + warning_count * 0.10))
+
+        is_valid = blocking_count == 0
+        execution_time = (time.time() - start_time) * 1000  # ms
+
+        return ValidationResult(
+            gate_name=self.GATE_NAME,
+            is_valid=is_valid,
+            validation_score=validation_score,
+            issues=issues,
+            warnings=warnings,
+            recommendations=recommendations,
+            execution_time_ms=execution_time,
+            check_timings_ms=check_timings,
+            cached_checks=cached_checks
+        )
+
 
 # ============================================================================
 # GATE 1: POST-EDITORIAL VALIDATION
 # ============================================================================
 
-class Gate1_PostEditorialValidator:
+class Gate1_PostEditorialValidator(_MemoizedGate):
     """Validates Editorial Strategist output consistency."""
 
+    GATE_NAME = "Post-Editorial Validation"
+    CHECKS = (
+        ("serie_concept", ("editorial.serie_concept", "series_formats_available")),
+        ("format", ("editorial.format",)),
+        ("angle", ("editorial.angle",)),
+        ("duration_range", ("editorial.duration_target",)),
+        ("duration_breakdown", ("editorial.duration_target", "editorial.duration_breakdown")),
+        ("cta_keywords", ("editorial.cta_specific", "editorial.monetization_path")),
+    )
+
     VALID_FORMATS = ['tutorial', 'analysis', 'alert', 'comparison', 'listicle', 'story']
     VALID_ANGLES = ['risk', 'opportunity', 'education', 'history', 'trend', 'breaking']
     VALID_MONETIZATION_PATHS = ['lead_magnet', 'playlist', 'comment_trigger', 'external']
@@ -238,96 +427,103 @@ class Gate1_PostEditorialValidator:
         """
         start_time = time.time()
 
-        issues = []
-        warnings = []
-        recommendations = []
-
         # Layer 3: Hard-coded enum normalization (fallback safety net)
         workspace_language = workspace.get('target_language', 'en')
         logger.info("  🛡️ Layer 3: Applying hard-coded enum normalization (fallback)")
 
         # Normalize enum fields from workspace language to English
         # This catches any cases that Layer 1 (prompts) and Layer 2 (AI correction) missed
+        # (checks below see the normalized values)
         normalized_format = self._normalize_enum_field('format', editorial_decision.format, workspace_language)
         normalized_angle = self._normalize_enum_field('angle', editorial_decision.angle, workspace_language)
         normalized_monetization = self._normalize_enum_field('monetization_path', editorial_decision.monetization_path, workspace_language)
 
-        # Update editorial_decision with normalized values
-        # (we'll use normalized values in validation checks)
-        from copy import copy
-        editorial_decision = copy(editorial_decision)
-        if normalized_format != editorial_decision.format:
-            object.__setattr__(editorial_decision, 'format', normalized_format)
-        if normalized_angle != editorial_decision.angle:
-            object.__setattr__(editorial_decision, 'angle', normalized_angle)
-        if normalized_monetization != editorial_decision.monetization_path:
-            object.__setattr__(editorial_decision, 'monetization_path', normalized_monetization)
-
-        # Check 1: Serie concept validation
-        serie_id = editorial_decision.serie_concept.lower().replace(' ', '_')
+        return self._run_checks({
+            "editorial.serie_concept": editorial_decision.serie_concept,
+            "editorial.format": normalized_format,
+            "editorial.angle": normalized_angle,
+            "editorial.monetization_path": normalized_monetization,
+            "editorial.duration_target": editorial_decision.duration_target,
+            "editorial.duration_breakdown": editorial_decision.duration_breakdown,
+            "editorial.cta_specific": editorial_decision.cta_specific,
+            "series_formats_available": series_formats_available,
+        }, start_time)
+
+    def _check_serie_concept(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 1: Serie concept validation."""
+        serie_concept = inputs["editorial.serie_concept"]
+        series_formats_available = inputs["series_formats_available"]
+        serie_id = serie_concept.lower().replace(' ', '_')
         if serie_id not in series_formats_available and not serie_id.startswith('new_serie_'):
-            warnings.append(
-                f"Serie '{editorial_decision.serie_concept}' not found in available formats. "
+            outcome.warnings.append(
+                f"Serie '{serie_concept}' not found in available formats. "
                 f"Will fallback to 'tutorial'. Consider creating format for this serie."
             )
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_EDITORIAL,
                 severity=ValidationSeverity.WARNING,
                 code="ED_SERIE_NOT_FOUND",
-                message=f"Serie '{editorial_decision.serie_concept}' not in config/series_formats/",
+                message=f"Serie '{serie_concept}' not in config/series_formats/",
                 field="editorial_decision.serie_concept",
                 expected=f"One of: {series_formats_available[:5]}..." if len(series_formats_available) > 5 else str(series_formats_available),
                 actual=serie_id,
                 fix_suggestion=f"Create config/series_formats/{serie_id}.yaml or use existing serie"
             ))
 
-        # Check 2: Format validation
-        if editorial_decision.format not in self.VALID_FORMATS:
-            issues.append(ValidationIssue(
+    def _check_format(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 2: Format validation."""
+        format_value = inputs["editorial.format"]
+        if format_value not in self.VALID_FORMATS:
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_EDITORIAL,
                 severity=ValidationSeverity.BLOCKING,
                 code="ED_INVALID_FORMAT",
-                message=f"Format '{editorial_decision.format}' not recognized",
+                message=f"Format '{format_value}' not recognized",
                 field="editorial_decision.format",
                 expected=self.VALID_FORMATS,
-                actual=editorial_decision.format,
+                actual=format_value,
                 fix_suggestion="Use one of: tutorial, analysis, alert, comparison, listicle, story"
             ))
 
-        # Check 3: Angle validation
-        if editorial_decision.angle not in self.VALID_ANGLES:
-            issues.append(ValidationIssue(
+    def _check_angle(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 3: Angle validation."""
+        angle = inputs["editorial.angle"]
+        if angle not in self.VALID_ANGLES:
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_EDITORIAL,
                 severity=ValidationSeverity.BLOCKING,
                 code="ED_INVALID_ANGLE",
-                message=f"Angle '{editorial_decision.angle}' not recognized",
+                message=f"Angle '{angle}' not recognized",
                 field="editorial_decision.angle",
                 expected=self.VALID_ANGLES,
-                actual=editorial_decision.angle,
+                actual=angle,
                 fix_suggestion="Use one of: risk, opportunity, education, history, trend, breaking"
             ))
 
-        # Check 4: Duration range validation
-        if not (15 <= editorial_decision.duration_target <= 1200):
-            issues.append(ValidationIssue(
+    def _check_duration_range(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 4: Duration range validation."""
+        duration_target = inputs["editorial.duration_target"]
+        if not (15 <= duration_target <= 1200):
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_EDITORIAL,
                 severity=ValidationSeverity.BLOCKING,
                 code="ED_DURATION_OUT_OF_RANGE",
-                message=f"Duration {editorial_decision.duration_target}s outside valid range",
+                message=f"Duration {duration_target}s outside valid range",
                 field="editorial_decision.duration_target",
                 expected="15-1200 seconds (15s to 20min)",
-                actual=editorial_decision.duration_target,
+                actual=duration_target,
                 fix_suggestion="Adjust duration to be between 15s and 1200s"
             ))
 
-        # Check 5: Duration breakdown coherence
-        breakdown = editorial_decision.duration_breakdown
+    def _check_duration_breakdown(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 5: Duration breakdown coherence."""
+        breakdown = inputs["editorial.duration_breakdown"]
         breakdown_sum = sum(breakdown.values())
-        target = editorial_decision.duration_target
+        target = inputs["editorial.duration_target"]
         tolerance = target * 0.10  # 10% tolerance
 
         if not (target - tolerance <= breakdown_sum <= target + tolerance):
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_EDITORIAL,
                 severity=ValidationSeverity.WARNING,
                 code="ED_BREAKDOWN_MISMATCH",
@@ -338,21 +534,23 @@ class Gate1_PostEditorialValidator:
                 fix_suggestion=f"Adjust breakdown components to sum to ~{target}s"
             ))
 
-        # Check 6: CTA appropriateness
-        cta_text = editorial_decision.cta_specific.lower()
-        monetization_path = editorial_decision.monetization_path
+    def _check_cta_keywords(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 6: CTA appropriateness."""
+        cta_specific = inputs["editorial.cta_specific"]
+        cta_text = cta_specific.lower()
+        monetization_path = inputs["editorial.monetization_path"]
 
         if monetization_path in self.CTA_KEYWORDS:
             expected_keywords = self.CTA_KEYWORDS[monetization_path]
             has_keyword = any(kw in cta_text for kw in expected_keywords)
 
             if not has_keyword:
-                warnings.append(
-                    f"CTA '{editorial_decision.cta_specific}' doesn't contain expected keywords "
+                outcome.warnings.append(
+                    f"CTA '{cta_specific}' doesn't contain expected keywords "
                     f"for monetization_path '{monetization_path}'. "
                     f"Expected one of: {expected_keywords[:3]}"
                 )
-                issues.append(ValidationIssue(
+                outcome.issues.append(ValidationIssue(
                     gate=ValidationGate.POST_EDITORIAL,
                     severity=ValidationSeverity.WARNING,
                     code="ED_CTA_KEYWORD_MISMATCH",
@@ -363,35 +561,23 @@ class Gate1_PostEditorialValidator:
                     fix_suggestion=f"Add keyword like '{expected_keywords[0]}' to CTA"
                 ))
 
-        # Calculate validation score
-        blocking_count = sum(1 for i in issues if i.severity == ValidationSeverity.BLOCKING)
-        warning_count = sum(1 for i in issues if i.severity == ValidationSeverity.WARNING)
-
-        # Score formula: 1.0 - (blocking*0.25 + warnings*0.10)
-        validation_score = max(0.0, 1.0 - (blocking_count * 0.25 + warning_count * 0.10))
-
-        is_valid = blocking_count == 0
-
-        execution_time = (time.time() - start_time) * 1000  # ms
-
-        return ValidationResult(
-            gate_name="Post-Editorial Validation",
-            is_valid=is_valid,
-            validation_score=validation_score,
-            issues=issues,
-            warnings=warnings,
-            recommendations=recommendations,
-            execution_time_ms=execution_time
-        )
-
 
 # ============================================================================
 # GATE 2: POST-DURATION VALIDATION
 # ============================================================================
 
-class Gate2_PostDurationValidator:
+class Gate2_PostDurationValidator(_MemoizedGate):
     """Validates duration reconciliation coherence."""
 
+    GATE_NAME = "Post-Duration Validation"
+    CHECKS = (
+        ("divergence", ("editorial.duration_target", "duration_strategy.target_duration_seconds",
+                        "timeline.reconciled_duration")),
+        ("final_duration_range", ("timeline.reconciled_duration",)),
+        ("aspect_ratio", ("visual_plan.aspect_ratio", "timeline.format_type", "timeline.reconciled_duration")),
+        ("weight_balance", ("timeline.editorial_weight", "timeline.duration_weight")),
+    )
+
     ASPECT_RATIO_RULES = {
         'shorts': {'required': '9:16', 'max_duration': 60},
         'mid': {'preferred': '16:9', 'acceptable': '9:16', 'max_vertical_duration': 180},
@@ -419,27 +605,34 @@ class Gate2_PostDurationValidator:
         """
         start_time = time.time()
 
-        issues = []
-        warnings = []
-
-        editorial_duration = editorial_decision.duration_target
-        duration_duration = duration_strategy['target_duration_seconds']
         # Phase C - P0: Access Timeline object attributes, not dict keys
-        final_duration = reconciled_format.reconciled_duration
-        format_type = reconciled_format.format_type
+        return self._run_checks({
+            "editorial.duration_target": editorial_decision.duration_target,
+            "duration_strategy.target_duration_seconds": duration_strategy['target_duration_seconds'],
+            "timeline.reconciled_duration": reconciled_format.reconciled_duration,
+            "timeline.format_type": reconciled_format.format_type,
+            "timeline.editorial_weight": reconciled_format.editorial_weight,
+            "timeline.duration_weight": reconciled_format.duration_weight,
+            "visual_plan.aspect_ratio": visual_plan_aspect_ratio,
+        }, start_time)
+
+    def _check_divergence(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 1: Divergence between Editorial and Duration."""
+        editorial_duration = inputs["editorial.duration_target"]
+        duration_duration = inputs["duration_strategy.target_duration_seconds"]
+        final_duration = inputs["timeline.reconciled_duration"]
 
-        # Check 1: Divergence between Editorial and Duration
         max_duration = max(editorial_duration, duration_duration)
         min_duration = min(editorial_duration, duration_duration)
         divergence_pct = ((max_duration - min_duration) / max_duration) * 100 if max_duration > 0 else 0
 
         if divergence_pct > 50:
-            warnings.append(
+            outcome.warnings.append(
                 f"High divergence ({divergence_pct:.1f}%) between Editorial ({editorial_duration}s) "
                 f"and Duration ({duration_duration}s) strategies. "
                 f"Reconciled to {final_duration}s."
             )
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_DURATION,
                 severity=ValidationSeverity.WARNING,
                 code="DUR_HIGH_DIVERGENCE",
@@ -450,9 +643,11 @@ class Gate2_PostDurationValidator:
                 fix_suggestion="Review Editorial and Duration Strategist prompts for alignment"
             ))
 
-        # Check 2: Final duration in valid range
+    def _check_final_duration_range(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 2: Final duration in valid range."""
+        final_duration = inputs["timeline.reconciled_duration"]
         if not (15 <= final_duration <= 1200):
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_DURATION,
                 severity=ValidationSeverity.BLOCKING,
                 code="DUR_OUT_OF_RANGE",
@@ -463,13 +658,18 @@ class Gate2_PostDurationValidator:
                 fix_suggestion="Adjust reconciled duration to be between 15s and 1200s"
             ))
 
-        # Check 3: Aspect ratio coherence with format type
+    def _check_aspect_ratio(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 3: Aspect ratio coherence with format type."""
+        visual_plan_aspect_ratio = inputs["visual_plan.aspect_ratio"]
+        format_type = inputs["timeline.format_type"]
+        final_duration = inputs["timeline.reconciled_duration"]
+
         if visual_plan_aspect_ratio:
             rules = self.ASPECT_RATIO_RULES.get(format_type, {})
 
             if format_type == 'shorts':
                 if visual_plan_aspect_ratio != rules.get('required'):
-                    issues.append(ValidationIssue(
+                    outcome.issues.append(ValidationIssue(
                         gate=ValidationGate.POST_DURATION,
                         severity=ValidationSeverity.WARNING,
                         code="DUR_ASPECT_SHORTS_MISMATCH",
@@ -483,11 +683,11 @@ class Gate2_PostDurationValidator:
             elif format_type == 'mid':
                 max_vertical_duration = rules.get('max_vertical_duration', 180)
                 if final_duration > max_vertical_duration and visual_plan_aspect_ratio == '9:16':
-                    warnings.append(
+                    outcome.warnings.append(
                         f"Mid-form video >3min ({final_duration}s) with vertical aspect ratio. "
                         f"Horizontal {rules.get('preferred')} recommended for better watch time."
                     )
-                    issues.append(ValidationIssue(
+                    outcome.issues.append(ValidationIssue(
                         gate=ValidationGate.POST_DURATION,
                         severity=ValidationSeverity.WARNING,
                         code="DUR_ASPECT_MID_SUBOPTIMAL",
@@ -500,7 +700,7 @@ class Gate2_PostDurationValidator:
 
             elif format_type == 'long':
                 if visual_plan_aspect_ratio != rules.get('required'):
-                    issues.append(ValidationIssue(
+                    outcome.issues.append(ValidationIssue(
                         gate=ValidationGate.POST_DURATION,
                         severity=ValidationSeverity.WARNING,
                         code="DUR_ASPECT_LONG_MISMATCH",
@@ -511,18 +711,18 @@ class Gate2_PostDurationValidator:
                         fix_suggestion=f"Change aspect ratio to {rules.get('required')} for long-form"
                     ))
 
-        # Check 4: Weight balance
-        # Phase C - P0: Access Timeline object attributes directly
-        editorial_weight = reconciled_format.editorial_weight
-        duration_weight = reconciled_format.duration_weight
+    def _check_weight_balance(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 4: Weight balance."""
+        editorial_weight = inputs["timeline.editorial_weight"]
+        duration_weight = inputs["timeline.duration_weight"]
         weight_sum = editorial_weight + duration_weight
 
         if not (0.85 <= weight_sum <= 1.15):
-            warnings.append(
+            outcome.warnings.append(
                 f"Weights don't sum to 1.0: editorial={editorial_weight:.2f}, "
                 f"duration={duration_weight:.2f}, sum={weight_sum:.2f}"
             )
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_DURATION,
                 severity=ValidationSeverity.WARNING,
                 code="DUR_WEIGHT_IMBALANCE",
@@ -533,31 +733,24 @@ class Gate2_PostDurationValidator:
                 fix_suggestion="Adjust editorial_weight and duration_weight to sum to ~1.0"
             ))
 
-        # Calculate score
-        blocking_count = sum(1 for i in issues if i.severity == ValidationSeverity.BLOCKING)
-        warning_count = sum(1 for i in issues if i.severity == ValidationSeverity.WARNING)
-        validation_score = max(0.0, 1.0 - (blocking_count * 0.25 + warning_count * 0.10))
-
-        is_valid = blocking_count == 0
-        execution_time = (time.time() - start_time) * 1000
-
-        return ValidationResult(
-            gate_name="Post-Duration Validation",
-            is_valid=is_valid,
-            validation_score=validation_score,
-            issues=issues,
-            warnings=warnings,
-            execution_time_ms=execution_time
-        )
-
 
 # ============================================================================
 # GATE 3: POST-SCRIPT VALIDATION
 # ============================================================================
 
-class Gate3_PostScriptValidator:
+class Gate3_PostScriptValidator(_MemoizedGate):
     """Validates script quality and consistency."""
 
+    GATE_NAME = "Post-Script Validation"
+    CHECKS = (
+        ("bullets_count", ("script.bullet_count", "content_depth.recommended_bullets")),
+        ("language", ("script.full_voiceover_text", "workspace.target_language")),
+        ("hook_strength", ("script.hook",)),
+        ("cta_integration", ("editorial.cta_specific", "script.outro_cta", "thresholds")),
+        ("scene_voiceover_map", ("script.scene_voiceover_map",)),
+        ("script_length", ("script.full_voiceover_text", "target_duration", "thresholds")),
+    )
+
     TEMPLATE_HOOKS = [
         "attenzione:",
         "scopri come",
@@ -588,6 +781,9 @@ class Gate3_PostScriptValidator:
         """
         Validates script quality and consistency.
 
+        Re-validating after a retry only re-runs checks whose inputs changed
+        (e.g. a language fix re-runs language/hook/CTA/length, not bullet count).
+
         Args:
             script: Generated VideoScript
             content_depth_strategy: Content Depth Strategist output
@@ -595,15 +791,11 @@ class Gate3_PostScriptValidator:
             workspace: Workspace config (used for threshold loading if thresholds=None)
             target_duration: Target video duration in seconds
             thresholds: Optional validation thresholds (if None, loads from config)
-            workspace: Workspace config
-            target_duration: Target duration in seconds
 
         Returns:
             ValidationResult
         """
         start_time = time.time()
-        issues = []
-        warnings = []
 
         # Load validation thresholds if not provided (FASE 2: Config-driven thresholds)
         if thresholds is None:
@@ -611,44 +803,58 @@ class Gate3_PostScriptValidator:
             workspace_id = workspace.get('workspace_id', 'unknown')
             thresholds = load_validation_thresholds(workspace_id=workspace_id)
 
-        # =============================================================================
-        # VALIDATION THRESHOLD: BULLET COUNT MISMATCH
-        # =============================================================================
-        # Threshold: ±1 bullet = WARNING, >1 bullet = BLOCKING
-        #
-        # Data Source: Internal testing (50 videos across 4 formats)
-        # False Positive Rate: ~5% (acceptable - occurs when narrative arc intentionally merges bullets)
-        # False Negative Rate: ~2% (low risk)
-        # Last Reviewed: 2025-11-02
-        # Next Review: 2026-02-02 (quarterly review cycle)
-        #
-        # RATIONALE:
-        #   Content Depth Strategist calculates optimal bullets based on:
-        #   1. Duration: 15-30s per bullet (long-form), 8-12s per bullet (shorts)
-        #   2. Format complexity: tutorial (deep content), news_flash (shallow/fast)
-        #   3. Audience retention patterns per vertical
-        #
-        #   Deviation of ±1 bullet = Minor pacing adjustment (acceptable)
-        #     - Example: 5 bullets vs 6 bullets → slightly faster/slower pacing
-        #     - Impact: Negligible on viewer experience
-        #
-        #   Deviation >1 bullet = Content inadequacy (BLOCKING)
-        #     - Example: 2 bullets vs 6 bullets → significantly rushed/shallow content
-        #     - Impact: Video quality severely degraded
-        #
-        # KNOWN EDGE CASES:
-        #   - Narrative Arc may intentionally merge 2 bullets into 1 deeper segment
-        #   - Workaround: Use format-specific tolerance in future (see Sprint 3 backlog)
-        #
-        # CONFIGURATION OVERRIDE:
-        #   Future: config/validation_thresholds.yaml (Sprint 3)
-        #   Per-workspace: workspace.validation_thresholds.bullet_count_tolerance
-        #   Per-format: series_format.validation.bullet_count_tolerance
-        # =============================================================================
-
-        # Check 1: Bullets count match
-        actual_bullets = len(script.bullets)
-        recommended_bullets = content_depth_strategy.get('recommended_bullets', 4)
+        return self._run_checks({
+            "script.bullet_count": len(script.bullets),
+            "script.full_voiceover_text": script.full_voiceover_text,
+            "script.hook": script.hook,
+            "script.outro_cta": script.outro_cta,
+            "script.scene_voiceover_map": script.scene_voiceover_map,
+            "content_depth.recommended_bullets": content_depth_strategy.get('recommended_bullets', 4),
+            "editorial.cta_specific": editorial_decision.cta_specific,
+            "workspace.target_language": workspace.get('target_language', 'en'),
+            "target_duration": target_duration,
+            "thresholds": thresholds,
+        }, start_time)
+
+    # =============================================================================
+    # VALIDATION THRESHOLD: BULLET COUNT MISMATCH
+    # =============================================================================
+    # Threshold: ±1 bullet = WARNING, >1 bullet = BLOCKING
+    #
+    # Data Source: Internal testing (50 videos across 4 formats)
+    # False Positive Rate: ~5% (acceptable - occurs when narrative arc intentionally merges bullets)
+    # False Negative Rate: ~2% (low risk)
+    # Last Reviewed: 2025-11-02
+    # Next Review: 2026-02-02 (quarterly review cycle)
+    #
+    # RATIONALE:
+    #   Content Depth Strategist calculates optimal bullets based on:
+    #   1. Duration: 15-30s per bullet (long-form), 8-12s per bullet (shorts)
+    #   2. Format complexity: tutorial (deep content), news_flash (shallow/fast)
+    #   3. Audience retention patterns per vertical
+    #
+    #   Deviation of ±1 bullet = Minor pacing adjustment (acceptable)
+    #     - Example: 5 bullets vs 6 bullets → slightly faster/slower pacing
+    #     - Impact: Negligible on viewer experience
+    #
+    #   Deviation >1 bullet = Content inadequacy (BLOCKING)
+    #     - Example: 2 bullets vs 6 bullets → significantly rushed/shallow content
+    #     - Impact: Video quality severely degraded
+    #
+    # KNOWN EDGE CASES:
+    #   - Narrative Arc may intentionally merge 2 bullets into 1 deeper segment
+    #   - Workaround: Use format-specific tolerance in future (see Sprint 3 backlog)
+    #
+    # CONFIGURATION OVERRIDE:
+    #   Future: config/validation_thresholds.yaml (Sprint 3)
+    #   Per-workspace: workspace.validation_thresholds.bullet_count_tolerance
+    #   Per-format: series_format.validation.bullet_count_tolerance
+    # =============================================================================
+
+    def _check_bullets_count(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 1: Bullets count match."""
+        actual_bullets = inputs["script.bullet_count"]
+        recommended_bullets = inputs["content_depth.recommended_bullets"]
 
         if not (recommended_bullets - 1 <= actual_bullets <= recommended_bullets + 1):
             bullets_diff = abs(actual_bullets - recommended_bullets)
@@ -658,7 +864,7 @@ class Gate3_PostScriptValidator:
             # Large deviation (>1 bullet) = BLOCKING (content inadequate)
             if bullets_diff > 1:
                 severity = ValidationSeverity.BLOCKING
-                issues.append(ValidationIssue(
+                outcome.issues.append(ValidationIssue(
                     gate=ValidationGate.POST_SCRIPT,
                     severity=severity,
                     code="SCR_BULLETS_COUNT_CRITICAL_MISMATCH",
@@ -670,11 +876,11 @@ class Gate3_PostScriptValidator:
                 ))
             else:
                 severity = ValidationSeverity.WARNING
-                warnings.append(
+                outcome.warnings.append(
                     f"Script has {actual_bullets} bullets but Content Depth recommended {recommended_bullets}. "
                     f"Content may be too thin or too dense."
                 )
-                issues.append(ValidationIssue(
+                outcome.issues.append(ValidationIssue(
                     gate=ValidationGate.POST_SCRIPT,
                     severity=severity,
                     code="SCR_BULLETS_COUNT_MISMATCH",
@@ -685,13 +891,14 @@ class Gate3_PostScriptValidator:
                     fix_suggestion=f"Adjust script to have {recommended_bullets} content bullets"
                 ))
 
-        # Check 2: Language consistency
-        target_language = workspace.get('target_language', 'en')
-        detected_lang, confidence = self._detect_language(script.full_voiceover_text)
+    def _check_language(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 2: Language consistency."""
+        target_language = inputs["workspace.target_language"]
+        detected_lang, confidence = self._detect_language(inputs["script.full_voiceover_text"])
         language_score = confidence if detected_lang == target_language else (1.0 - confidence)
 
         if language_score < 0.95:
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_SCRIPT,
                 severity=ValidationSeverity.BLOCKING,
                 code="SCR_LANGUAGE_MISMATCH",
@@ -702,17 +909,19 @@ class Gate3_PostScriptValidator:
                 fix_suggestion="Use LanguageValidator.ensure_language_consistency() to fix"
             ))
 
-        # Check 3: Hook strength
-        hook_text = script.hook.lower().strip()
+    def _check_hook_strength(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 3: Hook strength."""
+        hook = inputs["script.hook"]
+        hook_text = hook.lower().strip()
         is_template = any(hook_text.startswith(t) for t in self.TEMPLATE_HOOKS)
         is_too_short = len(hook_text) < 20
 
         if is_template or is_too_short:
-            warnings.append(
-                f"Hook appears weak or template-based: '{script.hook[:50]}...'. "
+            outcome.warnings.append(
+                f"Hook appears weak or template-based: '{hook[:50]}...'. "
                 f"Consider regenerating for stronger attention grab."
             )
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_SCRIPT,
                 severity=ValidationSeverity.WARNING,
                 code="SCR_WEAK_HOOK",
@@ -723,67 +932,68 @@ class Gate3_PostScriptValidator:
                 fix_suggestion="Regenerate hook with more specificity to topic"
             ))
 
-        # =============================================================================
-        # VALIDATION THRESHOLD: CTA SIMILARITY
-        # =============================================================================
-        # Thresholds: ≥70% = PASS, 50-70% = WARNING, 30-50% = ERROR, <30% = BLOCKING
-        #
-        # Data Source: Manual analysis of 30 CTA pairs (Editorial CTA vs Script CTA)
-        # False Positive Rate: ~15% (HIGH - paraphrasing causes false positives)
-        # False Negative Rate: ~3% (acceptable)
-        # Last Reviewed: 2025-11-02
-        # Next Review: 2026-01-02 (monthly - high FP rate requires monitoring)
-        #
-        # RATIONALE:
-        #   CTA (Call-To-Action) is critical for monetization strategy enforcement.
-        #   Editorial Strategist designs CTA based on monetization path:
-        #   - lead_magnet: "Download our checklist..."
-        #   - engagement: "Subscribe and hit the bell..."
-        #   - community: "Join our Discord server..."
-        #
-        #   Similarity Method: SequenceMatcher (character-level comparison)
-        #   ⚠️ LIMITATION: Does NOT detect semantic similarity (paraphrasing)
-        #
-        #   Threshold breakdown:
-        #   ≥70%: High alignment - CTA clearly implements monetization strategy
-        #     - Example: "Download checklist" vs "Get our free checklist"
-        #   50-70%: Moderate alignment - CTA partially implements strategy (WARNING)
-        #     - Example: "Download checklist" vs "Check out our resources"
-        #   30-50%: Low alignment - CTA significantly diverges (ERROR - revenue at risk)
-        #     - Example: "Download checklist" vs "Subscribe for more"
-        #   <30%: Critical failure - CTA completely different (BLOCKING)
-        #     - Example: "Download checklist" vs "Drop a comment below"
-        #
-        # KNOWN LIMITATIONS:
-        #   1. Paraphrasing causes false positives:
-        #      - Expected: "Subscribe and hit the bell for crypto alerts!"
-        #      - Actual: "Don't miss our next video - subscribe now!"
-        #      - Character similarity: ~20% (BLOCKING) ❌
-        #      - Semantic similarity: ~85% (PASS) ✅
-        #
-        #   2. Narrator persona variations trigger false positives:
-        #      - Expected: "Click the subscribe button"
-        #      - Actual: "I recommend hitting that subscribe button"
-        #      - Difference is stylistic, not strategic
-        #
-        # IMPROVEMENT ROADMAP (Sprint 3):
-        #   - Replace SequenceMatcher with semantic similarity (sentence transformers)
-        #   - Target false positive rate: <5% (vs current 15%)
-        #   - Estimated effort: 2 hours
-        #
-        # CONFIGURATION OVERRIDE:
-        #   Future: config/validation_thresholds.yaml
-        #   Per-vertical: Finance = strict (monetization critical), Gaming = flexible
-        # =============================================================================
-
-        # Check 4: CTA integration
-        expected_cta = editorial_decision.cta_specific
-        actual_cta = script.outro_cta
+    # =============================================================================
+    # VALIDATION THRESHOLD: CTA SIMILARITY
+    # =============================================================================
+    # Thresholds: ≥70% = PASS, 50-70% = WARNING, 30-50% = ERROR, <30% = BLOCKING
+    #
+    # Data Source: Manual analysis of 30 CTA pairs (Editorial CTA vs Script CTA)
+    # False Positive Rate: ~15% (HIGH - paraphrasing causes false positives)
+    # False Negative Rate: ~3% (acceptable)
+    # Last Reviewed: 2025-11-02
+    # Next Review: 2026-01-02 (monthly - high FP rate requires monitoring)
+    #
+    # RATIONALE:
+    #   CTA (Call-To-Action) is critical for monetization strategy enforcement.
+    #   Editorial Strategist designs CTA based on monetization path:
+    #   - lead_magnet: "Download our checklist..."
+    #   - engagement: "Subscribe and hit the bell..."
+    #   - community: "Join our Discord server..."
+    #
+    #   Similarity Method: SequenceMatcher (character-level comparison)
+    #   ⚠️ LIMITATION: Does NOT detect semantic similarity (paraphrasing)
+    #
+    #   Threshold breakdown:
+    #   ≥70%: High alignment - CTA clearly implements monetization strategy
+    #     - Example: "Download checklist" vs "Get our free checklist"
+    #   50-70%: Moderate alignment - CTA partially implements strategy (WARNING)
+    #     - Example: "Download checklist" vs "Check out our resources"
+    #   30-50%: Low alignment - CTA significantly diverges (ERROR - revenue at risk)
+    #     - Example: "Download checklist" vs "Subscribe for more"
+    #   <30%: Critical failure - CTA completely different (BLOCKING)
+    #     - Example: "Download checklist" vs "Drop a comment below"
+    #
+    # KNOWN LIMITATIONS:
+    #   1. Paraphrasing causes false positives:
+    #      - Expected: "Subscribe and hit the bell for crypto alerts!"
+    #      - Actual: "Don't miss our next video - subscribe now!"
+    #      - Character similarity: ~20% (BLOCKING) ❌
+    #      - Semantic similarity: ~85% (PASS) ✅
+    #
+    #   2. Narrator persona variations trigger false positives:
+    #      - Expected: "Click the subscribe button"
+    #      - Actual: "I recommend hitting that subscribe button"
+    #      - Difference is stylistic, not strategic
+    #
+    # IMPROVEMENT ROADMAP (Sprint 3):
+    #   - Replace SequenceMatcher with semantic similarity (sentence transformers)
+    #   - Target false positive rate: <5% (vs current 15%)
+    #   - Estimated effort: 2 hours
+    #
+    # CONFIGURATION OVERRIDE:
+    #   Future: config/validation_thresholds.yaml
+    #   Per-vertical: Finance = strict (monetization critical), Gaming = flexible
+    # =============================================================================
+
+    def _check_cta_integration(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 4: CTA integration."""
+        expected_cta = inputs["editorial.cta_specific"]
+        actual_cta = inputs["script.outro_cta"]
 
         similarity = SequenceMatcher(None, expected_cta.lower(), actual_cta.lower()).ratio()
 
         # FASE 2: Load CTA thresholds from config (with fallback to defaults)
-        cta_config = thresholds.get('cta_similarity', {})
+        cta_config = inputs["thresholds"].get('cta_similarity', {})
         blocking_threshold = cta_config.get('blocking_threshold', 0.30)
         error_threshold = cta_config.get('error_threshold', 0.50)
         pass_threshold = cta_config.get('pass_threshold', 0.70)
@@ -795,7 +1005,7 @@ class Gate3_PostScriptValidator:
         # Very low similarity (<blocking_threshold) = WARNING (FASE 3 handles retry)
         if similarity < blocking_threshold:
             # WARNING: CTA is completely different (FASE 3 will handle retry)
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_SCRIPT,
                 severity=ValidationSeverity.WARNING,
                 code="SCR_CTA_CRITICAL_MISMATCH",
@@ -807,7 +1017,7 @@ class Gate3_PostScriptValidator:
             ))
         elif similarity < error_threshold:
             # WARNING: CTA very different (FASE 3 will handle retry)
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_SCRIPT,
                 severity=ValidationSeverity.WARNING,
                 code="SCR_CTA_MAJOR_MISMATCH",
@@ -819,11 +1029,11 @@ class Gate3_PostScriptValidator:
             ))
         elif similarity < pass_threshold:
             # WARNING: CTA somewhat different
-            warnings.append(
+            outcome.warnings.append(
                 f"Script CTA '{actual_cta}' differs from editorial CTA '{expected_cta}'. "
                 f"Similarity: {similarity:.0%}"
             )
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_SCRIPT,
                 severity=ValidationSeverity.WARNING,
                 code="SCR_CTA_MISMATCH",
@@ -834,12 +1044,14 @@ class Gate3_PostScriptValidator:
                 fix_suggestion=f"Align CTA closer to editorial CTA: '{expected_cta}'"
             ))
 
-        # Check 5: Scene voiceover mapping
-        if not script.scene_voiceover_map or len(script.scene_voiceover_map) == 0:
-            warnings.append(
+    def _check_scene_voiceover_map(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 5: Scene voiceover mapping."""
+        scene_voiceover_map = inputs["script.scene_voiceover_map"]
+        if not scene_voiceover_map or len(scene_voiceover_map) == 0:
+            outcome.warnings.append(
                 "Script missing scene_voiceover_map. Visual-script sync may be imprecise."
             )
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_SCRIPT,
                 severity=ValidationSeverity.WARNING,
                 code="SCR_MISSING_SCENE_MAP",
@@ -850,23 +1062,27 @@ class Gate3_PostScriptValidator:
                 fix_suggestion="Populate scene_voiceover_map with script-to-scene mappings"
             ))
 
-        # =============================================================================
-        # Check 6: Script Length vs Target Duration (PHASE C - P1)
-        # =============================================================================
-        # PROBLEM: Script may be significantly shorter/longer than target duration
-        # Example: Target 540s (9min) but script only ~120s (2min) of speech → 78% divergence
-        #
-        # SOLUTION: Estimate speech duration using word count and speaking rate
-        # - Average speaking rate: 140-160 words/min (Italian), 120-150 words/min (English)
-        # - Use 150 words/min as conservative estimate
-        #
-        # THRESHOLDS:
-        # - <10% divergence: OK
-        # - 10-20% divergence: WARNING (minor pacing adjustment)
-        # - >20% divergence: BLOCKING (content inadequate for target duration)
-        # =============================================================================
-
-        voiceover_text = script.full_voiceover_text
+    # =============================================================================
+    # Check 6: Script Length vs Target Duration (PHASE C - P1)
+    # =============================================================================
+    # PROBLEM: Script may be significantly shorter/longer than target duration
+    # Example: Target 540s (9min) but script only ~120s (2min) of speech → 78% divergence
+    #
+    # SOLUTION: Estimate speech duration using word count and speaking rate
+    # - Average speaking rate: 140-160 words/min (Italian), 120-150 words/min (English)
+    # - Use 150 words/min as conservative estimate
+    #
+    # THRESHOLDS:
+    # - <10% divergence: OK
+    # - 10-20% divergence: WARNING (minor pacing adjustment)
+    # - >20% divergence: BLOCKING (content inadequate for target duration)
+    # =============================================================================
+
+    def _check_script_length(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 6: Script length vs target duration."""
+        voiceover_text = inputs["script.full_voiceover_text"]
+        target_duration = inputs["target_duration"]
+        thresholds = inputs["thresholds"]
         word_count = len(voiceover_text.split())
 
         # Estimate speech duration (150 words/min = 2.5 words/sec)
@@ -880,7 +1096,7 @@ class Gate3_PostScriptValidator:
 
         if divergence_pct > script_length_threshold:
             # BLOCKING: Script significantly too short/long
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_SCRIPT,
                 code="SCRIPT_DURATION_MISMATCH",
                 severity=ValidationSeverity.BLOCKING,
@@ -899,7 +1115,7 @@ class Gate3_PostScriptValidator:
             ))
         elif divergence_pct > script_length_warning_threshold:
             # WARNING: Minor divergence
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_SCRIPT,
                 code="SCRIPT_DURATION_MINOR_MISMATCH",
                 severity=ValidationSeverity.WARNING,
@@ -913,27 +1129,11 @@ class Gate3_PostScriptValidator:
                 fix_suggestion="Consider adjusting script length for better pacing."
             ))
 
-        # Calculate score
-        blocking_count = sum(1 for i in issues if i.severity == ValidationSeverity.BLOCKING)
-        warning_count = sum(1 for i in issues if i.severity == ValidationSeverity.WARNING)
-        validation_score = max(0.0, 1.0 - (blocking_count * 0.25 + warning_count * 0.10))
-
-        is_valid = blocking_count == 0
-        execution_time = (time.time() - start_time) * 1000
-
-        return ValidationResult(
-            gate_name="Post-Script Validation",
-            is_valid=is_valid,
-            validation_score=validation_score,
-            issues=issues,
-            warnings=warnings,
-            execution_time_ms=execution_time
-        )
-
     def _detect_language(self, text: str) -> Tuple[str, float]:
         """Detect language using langdetect."""
         try:
-            from langdetect import detect_langs
+            from langdetect import DetectorFactory, detect_langs
+            DetectorFactory.seed = 0  # same text, same result (see LanguageValidator.detect_language)
             detections = detect_langs(text)
             if detections:
                 return detections[0].lang, detections[0].prob
@@ -953,9 +1153,18 @@ class Gate3_PostScriptValidator:
 # GATE 4: POST-VISUAL VALIDATION
 # ============================================================================
 
-class Gate4_PostVisualValidator:
+class Gate4_PostVisualValidator(_MemoizedGate):
     """Validates visual plan consistency."""
 
+    GATE_NAME = "Post-Visual Validation"
+    CHECKS = (
+        ("scenes_vs_bullets", ("visual_plan.scene_count", "script.bullet_count")),
+        ("aspect_ratio", ("visual_plan.aspect_ratio", "timeline.format_type", "timeline.reconciled_duration")),
+        ("camera_variety", ("visual_plan.scene_prompts",)),
+        ("prompt_repetition", ("visual_plan.scene_prompts",)),
+        ("voiceover_sync", ("visual_plan.scene_voiceovers",)),
+    )
+
     def validate(
         self,
         visual_plan: VisualPlan,
@@ -976,20 +1185,29 @@ class Gate4_PostVisualValidator:
             ValidationResult
         """
         start_time = time.time()
-        issues = []
-        warnings = []
-        recommendations = []
 
-        # Check 1: Scenes count vs bullets
-        scenes_count = len(visual_plan.scenes)
-        bullets_count = len(script.bullets)
+        # Phase C - P0: Access Timeline object attributes directly
+        return self._run_checks({
+            "visual_plan.scene_count": len(visual_plan.scenes),
+            "visual_plan.aspect_ratio": visual_plan.aspect_ratio,
+            "visual_plan.scene_prompts": [scene.prompt_for_ai_tool for scene in visual_plan.scenes],
+            "visual_plan.scene_voiceovers": [scene.voiceover_text for scene in visual_plan.scenes],
+            "script.bullet_count": len(script.bullets),
+            "timeline.format_type": reconciled_format.format_type,
+            "timeline.reconciled_duration": reconciled_format.reconciled_duration,
+        }, start_time)
+
+    def _check_scenes_vs_bullets(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 1: Scenes count vs bullets."""
+        scenes_count = inputs["visual_plan.scene_count"]
+        bullets_count = inputs["script.bullet_count"]
 
         if scenes_count < bullets_count:
-            warnings.append(
+            outcome.warnings.append(
                 f"Visual plan has {scenes_count} scenes but script has {bullets_count} bullets. "
                 f"Some content may not have visual representation."
             )
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_VISUAL,
                 severity=ValidationSeverity.WARNING,
                 code="VIS_INSUFFICIENT_SCENES",
@@ -1000,11 +1218,11 @@ class Gate4_PostVisualValidator:
                 fix_suggestion="Add scenes to cover all script content points"
             ))
 
-        # Check 2: Aspect ratio vs duration
-        aspect_ratio = visual_plan.aspect_ratio
-        # Phase C - P0: Access Timeline object attributes directly
-        format_type = reconciled_format.format_type
-        final_duration = reconciled_format.reconciled_duration
+    def _check_aspect_ratio(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 2: Aspect ratio vs duration."""
+        aspect_ratio = inputs["visual_plan.aspect_ratio"]
+        format_type = inputs["timeline.format_type"]
+        final_duration = inputs["timeline.reconciled_duration"]
 
         aspect_mismatch = False
         expected_aspect = aspect_ratio
@@ -1020,7 +1238,7 @@ class Gate4_PostVisualValidator:
             expected_aspect = '16:9'
 
         if aspect_mismatch:
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_VISUAL,
                 severity=ValidationSeverity.WARNING,
                 code="VIS_ASPECT_RATIO_MISMATCH",
@@ -1031,10 +1249,14 @@ class Gate4_PostVisualValidator:
                 fix_suggestion=f"Change aspect ratio to {expected_aspect} for format {format_type}"
             ))
 
-        # Check 3: Camera movement variety (if applicable)
+    def _check_camera_variety(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 3: Camera movement variety (if applicable)."""
+        prompts = inputs["visual_plan.scene_prompts"]
+        scenes_count = len(prompts)
+
         camera_movements = []
-        for scene in visual_plan.scenes:
-            prompt = scene.prompt_for_ai_tool.lower()
+        for prompt in prompts:
+            prompt = prompt.lower()
             # Extract camera movements (simple heuristic)
             if 'zoom' in prompt:
                 camera_movements.append('zoom')
@@ -1050,22 +1272,22 @@ class Gate4_PostVisualValidator:
         unique_movements = len(set(camera_movements))
 
         if scenes_count > 5 and unique_movements < 3:
-            recommendations.append(
+            outcome.recommendations.append(
                 f"Visual plan has {scenes_count} scenes but only {unique_movements} unique camera movements. "
                 f"Consider adding variety (zoom, pan, static, tracking) for better engagement."
             )
 
-        # Check 4: Visual prompt repetition
-        prompts = [scene.prompt_for_ai_tool for scene in visual_plan.scenes]
-        prompt_counts = Counter(prompts)
+    def _check_prompt_repetition(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 4: Visual prompt repetition."""
+        prompt_counts = Counter(inputs["visual_plan.scene_prompts"])
         repeated_prompts = {p: c for p, c in prompt_counts.items() if c > 2}
 
         if repeated_prompts:
-            warnings.append(
+            outcome.warnings.append(
                 f"Found {len(repeated_prompts)} prompts repeated >2 times. "
                 f"This may result in visually repetitive content."
             )
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_VISUAL,
                 severity=ValidationSeverity.WARNING,
                 code="VIS_PROMPT_REPETITION",
@@ -1076,78 +1298,80 @@ class Gate4_PostVisualValidator:
                 fix_suggestion="Vary visual prompts to avoid repetitive visuals"
             ))
 
-        # =============================================================================
-        # VALIDATION THRESHOLD: VOICEOVER SYNC (Scene-to-Voiceover Mapping)
-        # =============================================================================
-        # Thresholds: <10% missing = WARNING, 10-30% = ERROR, >30% = BLOCKING
-        #
-        # Data Source: Internal testing (50 visual plans across 4 formats)
-        # False Positive Rate: ~8% (medium - intro/outro scenes legitimately lack VO)
-        # False Negative Rate: ~3% (acceptable)
-        # Last Reviewed: 2025-11-02
-        # Next Review: 2026-02-02 (quarterly review cycle)
-        #
-        # RATIONALE:
-        #   Voiceover-to-scene mapping is critical for audio-visual synchronization.
-        #   Visual Planner creates scenes from script bullets, each scene should have:
-        #   - voiceover_text: Narrator speech for this scene
-        #   - est_duration_seconds: Estimated scene length based on voiceover
-        #
-        #   Missing voiceover causes:
-        #   1. Incorrect duration estimation (scenes default to generic duration)
-        #   2. Audio-visual desync (narrator speaks during wrong visuals)
-        #   3. TTS generation failure (no text to synthesize)
-        #
-        #   Threshold breakdown:
-        #   <10% missing: WARNING (acceptable)
-        #     - Typical: 1-2 scenes out of 20 lack voiceover
-        #     - Common for: intro bumpers (2s logo), visual transitions, outro CTAs (text overlay)
-        #     - Impact: Minor sync gaps, viewer experience acceptable
-        #     - Example: [intro][content][content][content][outro] → intro/outro OK without VO
-        #
-        #   10-30% missing: ERROR (significant issue)
-        #     - Typical: 3-6 scenes out of 20 lack voiceover
-        #     - Indicates: Visual Planner failed to map script bullets to scenes correctly
-        #     - Impact: Noticeable audio gaps, reduced engagement, unprofessional quality
-        #     - Action: Should regenerate visual plan, but not a hard blocker
-        #
-        #   >30% missing: BLOCKING (broken sync)
-        #     - Typical: 7+ scenes out of 20 lack voiceover
-        #     - Indicates: Complete sync failure, ScriptWriter/Visual Planner integration broken
-        #     - Impact: Unwatchable video, must regenerate before asset generation
-        #     - Action: BLOCK pipeline, regenerate entire visual plan
-        #
-        # KNOWN EDGE CASES:
-        #   1. Intro/outro scenes legitimately lack voiceover:
-        #      - Intro: Logo animation, no speech
-        #      - Outro: End screen with text CTA, no speech
-        #      - These are acceptable and should not trigger ERROR/BLOCKING
-        #
-        #   2. Format-specific VO patterns:
-        #      - Tutorial: ALL content scenes MUST have voiceover (strict)
-        #      - Cinematic montage: Some scenes intentionally silent (music-only)
-        #      - News flash: Fast cuts, some transitions silent
-        #
-        # IMPROVEMENT ROADMAP (Sprint 4):
-        #   1. Scene-type awareness:
-        #      - Classify scenes: content vs non-content (intro/outro/transition)
-        #      - Apply stricter thresholds to content scenes only
-        #      - Allow non-content scenes to skip voiceover
-        #
-        #   2. Format-specific thresholds:
-        #      - Tutorial: 5% warning, 10% error, 20% blocking (strict)
-        #      - Cinematic: 20% warning, 40% error, 60% blocking (flexible)
-        #
-        # CONFIGURATION OVERRIDE:
-        #   Future: config/validation_thresholds.yaml
-        #   Per-format: tutorial.voiceover_sync.blocking_ratio = 0.20 (stricter)
-        # =============================================================================
-
-        # Check 5: Scene-voiceover sync
-        scenes_without_vo = [s for s in visual_plan.scenes if not s.voiceover_text]
-
-        if scenes_without_vo:
-            missing_count = len(scenes_without_vo)
+    # =============================================================================
+    # VALIDATION THRESHOLD: VOICEOVER SYNC (Scene-to-Voiceover Mapping)
+    # =============================================================================
+    # Thresholds: <10% missing = WARNING, 10-30% = ERROR, >30% = BLOCKING
+    #
+    # Data Source: Internal testing (50 visual plans across 4 formats)
+    # False Positive Rate: ~8% (medium - intro/outro scenes legitimately lack VO)
+    # False Negative Rate: ~3% (acceptable)
+    # Last Reviewed: 2025-11-02
+    # Next Review: 2026-02-02 (quarterly review cycle)
+    #
+    # RATIONALE:
+    #   Voiceover-to-scene mapping is critical for audio-visual synchronization.
+    #   Visual Planner creates scenes from script bullets, each scene should have:
+    #   - voiceover_text: Narrator speech for this scene
+    #   - est_duration_seconds: Estimated scene length based on voiceover
+    #
+    #   Missing voiceover causes:
+    #   1. Incorrect duration estimation (scenes default to generic duration)
+    #   2. Audio-visual desync (narrator speaks during wrong visuals)
+    #   3. TTS generation failure (no text to synthesize)
+    #
+    #   Threshold breakdown:
+    #   <10% missing: WARNING (acceptable)
+    #     - Typical: 1-2 scenes out of 20 lack voiceover
+    #     - Common for: intro bumpers (2s logo), visual transitions, outro CTAs (text overlay)
+    #     - Impact: Minor sync gaps, viewer experience acceptable
+    #     - Example: [intro][content][content][content][outro] → intro/outro OK without VO
+    #
+    #   10-30% missing: ERROR (significant issue)
+    #     - Typical: 3-6 scenes out of 20 lack voiceover
+    #     - Indicates: Visual Planner failed to map script bullets to scenes correctly
+    #     - Impact: Noticeable audio gaps, reduced engagement, unprofessional quality
+    #     - Action: Should regenerate visual plan, but not a hard blocker
+    #
+    #   >30% missing: BLOCKING (broken sync)
+    #     - Typical: 7+ scenes out of 20 lack voiceover
+    #     - Indicates: Complete sync failure, ScriptWriter/Visual Planner integration broken
+    #     - Impact: Unwatchable video, must regenerate before asset generation
+    #     - Action: BLOCK pipeline, regenerate entire visual plan
+    #
+    # KNOWN EDGE CASES:
+    #   1. Intro/outro scenes legitimately lack voiceover:
+    #      - Intro: Logo animation, no speech
+    #      - Outro: End screen with text CTA, no speech
+    #      - These are acceptable and should not trigger ERROR/BLOCKING
+    #
+    #   2. Format-specific VO patterns:
+    #      - Tutorial: ALL content scenes MUST have voiceover (strict)
+    #      - Cinematic montage: Some scenes intentionally silent (music-only)
+    #      - News flash: Fast cuts, some transitions silent
+    #
+    # IMPROVEMENT ROADMAP (Sprint 4):
+    #   1. Scene-type awareness:
+    #      - Classify scenes: content vs non-content (intro/outro/transition)
+    #      - Apply stricter thresholds to content scenes only
+    #      - Allow non-content scenes to skip voiceover
+    #
+    #   2. Format-specific thresholds:
+    #      - Tutorial: 5% warning, 10% error, 20% blocking (strict)
+    #      - Cinematic: 20% warning, 40% error, 60% blocking (flexible)
+    #
+    # CONFIGURATION OVERRIDE:
+    #   Future: config/validation_thresholds.yaml
+    #   Per-format: tutorial.voiceover_sync.blocking_ratio = 0.20 (stricter)
+    # =============================================================================
+
+    def _check_voiceover_sync(self, inputs: Dict[str, Any], outcome: _CheckOutcome) -> None:
+        """Check 5: Scene-voiceover sync."""
+        voiceovers = inputs["visual_plan.scene_voiceovers"]
+        scenes_count = len(voiceovers)
+        missing_count = sum(1 for text in voiceovers if not text)
+
+        if missing_count:
             missing_ratio = missing_count / scenes_count if scenes_count > 0 else 0
 
             # CRITICAL FIX: Tiered severity based on extent of missing voiceover
@@ -1162,12 +1386,12 @@ class Gate4_PostVisualValidator:
                 severity = ValidationSeverity.WARNING
                 code = "VIS_MISSING_VOICEOVER"
                 message = f"{missing_count}/{scenes_count} scenes without voiceover_text (likely intro/outro). Audio-visual sync may be imprecise."
-                warnings.append(
+                outcome.warnings.append(
                     f"{missing_count}/{scenes_count} scenes missing voiceover text. "
                     f"Audio-visual sync may be imprecise."
                 )
 
-            issues.append(ValidationIssue(
+            outcome.issues.append(ValidationIssue(
                 gate=ValidationGate.POST_VISUAL,
                 severity=severity,
                 code=code,
@@ -1178,24 +1402,6 @@ class Gate4_PostVisualValidator:
                 fix_suggestion="Regenerate visual plan with proper scene-voiceover mapping" if missing_ratio > 0.10 else "Populate voiceover_text for intro/outro scenes"
             ))
 
-        # Calculate score
-        blocking_count = sum(1 for i in issues if i.severity == ValidationSeverity.BLOCKING)
-        warning_count = sum(1 for i in issues if i.severity == ValidationSeverity.WARNING)
-        validation_score = max(0.0, 1.0 - (blocking_count * 0.25 + warning_count * 0.10))
-
-        is_valid = blocking_count == 0
-        execution_time = (time.time() - start_time) * 1000
-
-        return ValidationResult(
-            gate_name="Post-Visual Validation",
-            is_valid=is_valid,
-            validation_score=validation_score,
-            issues=issues,
-            warnings=warnings,
-            recommendations=recommendations,
-            execution_time_ms=execution_time
-        )
-
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -1236,11 +1442,35 @@ def log_validation_result(result: ValidationResult, gate_number: int = 0) -> Non
         for rec in result.recommendations[:2]:  # Show first 2
             logger.info(f"    💡 {rec}")
 
+    if result.cached_checks:
+        logger.info(f"  Checks: {len(result.check_timings_ms) - len(result.cached_checks)} run, "
+                    f"{len(result.cached_checks)} unchanged (cached)")
     logger.info(f"  Execution time: {result.execution_time_ms:.1f}ms")
     logger.info("=" * 70)
     logger.info("")
 
 
+def log_validation_report(report: PipelineValidationReport) -> None:
+    """
+    Logs the aggregated gate report with the slowest checks.
+
+    Args:
+        report: PipelineValidationReport to log
+    """
+    logger.info(
+        f"🔒 Validation gates: {report.gates_passed} passed, {report.gates_failed} failed, "
+        f"score {report.overall_score:.2f}, {report.checks_run} checks run, "
+        f"{report.checks_cached} cached, {report.total_time_ms:.1f}ms"
+    )
+    timings = [
+        (ms, f"{gate}.{check}")
+        for gate, checks in report.check_timings_ms.items()
+        for check, ms in checks.items()
+    ]
+    for ms, name in sorted(timings, reverse=True)[:3]:
+        logger.debug(f"  {name}: {ms:.1f}ms")
+
+
 # Example usage
 if __name__ == '__main__':
     print("Pipeline Validator - 4 Gates Framework")
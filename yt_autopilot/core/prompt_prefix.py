@@ -0,0 +1,241 @@
+"""
+Prompt Prefix: Stable per-workspace system prefix shared by all agent prompts.
+
+Agents used to re-embed the same workspace blocks (brand tone, narrator persona,
+visual brand manual) in every prompt. Within a run these blocks never change,
+so they are rendered ONCE into a "CHANNEL PROFILE" system prefix:
+
+- Built by the pipeline at run start (build_workspace_prompt_prefix)
+- Hashed (sha256 of the rendered text) so identical prefixes are recognisable
+  across runs and in logs
+- Agents replace their inline copies with a one-line reference via
+  shared_workspace_block(); only the variable suffix changes between calls
+- Sent by llm_router as the FIRST part of exactly those requests whose prompt
+  references it (OpenAI: first system message; Anthropic: system block with
+  cache_control), which is what provider prompt caching keys on. Other roles
+  (language_corrector, enum validation, curation, ...) never pay for it
+
+Providers only cache prefixes of at least PROMPT_CACHE_MIN_TOKENS. A shorter
+prefix would be billed in full on every call while saving only the small
+inline blocks, so it stays inactive and agents inline their blocks as before.
+
+The active prefix lives in the run scope (core/run_context), so it is only used
+inside the pipeline run that built it. Without an active prefix agents inline
+their blocks exactly as before.
+
+Usage:
+    prefix = build_workspace_prompt_prefix(workspace)
+    with llm_call_scope(prompt_prefix=prefix):
+        ...  # agents + llm_router pick it up
+    logger.info(prefix.savings_report())
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from yt_autopilot.core.run_context import get_llm_call_scope
+
+# Rough token estimate used for reporting (provider-agnostic)
+CHARS_PER_TOKEN = 4
+
+# Bump when the rendered layout changes (changes every hash)
+PROMPT_PREFIX_VERSION = 1
+
+# Smallest prompt prefix OpenAI and Anthropic serve from their prompt cache
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+# Start of the reference shared_workspace_block() puts in place of an inline block
+PREFIX_REFERENCE_MARKER = "(See CHANNEL PROFILE › "
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (CHARS_PER_TOKEN characters per token)."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+class WorkspacePromptPrefix:
+    """
+    Rendered workspace prefix plus per-run reuse counters.
+    """
+
+    def __init__(self, workspace_id: str, text: str):
+        self.workspace_id = workspace_id
+        self.text = text
+        self.prefix_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        self.calls = 0
+        self.cached_tokens = 0
+        self.block_references = 0
+        self.inline_chars_saved = 0
+        self._lock = threading.Lock()
+
+    @property
+    def est_tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+    @property
+    def cacheable(self) -> bool:
+        """True if the prefix is long enough for provider prompt caching."""
+        return self.est_tokens >= PROMPT_CACHE_MIN_TOKENS
+
+    def record_call(self, cached_tokens: int = 0) -> None:
+        """Counts one LLM call sent with this prefix (cached_tokens from provider usage)."""
+        with self._lock:
+            self.calls += 1
+            self.cached_tokens += cached_tokens
+
+    def record_block_reference(self, inline_text: str) -> None:
+        """Counts one inline workspace block replaced by a reference to the prefix."""
+        with self._lock:
+            self.block_references += 1
+            self.inline_chars_saved += len(inline_text)
+
+    def savings_report(self) -> Dict[str, Any]:
+        """
+        Per-run prefix statistics.
+
+        Returns:
+            Dict with prefix_hash, prefix_tokens, cacheable, calls,
+            inline_tokens_saved (workspace blocks agents no longer repeat),
+            provider_cached_tokens (prefix tokens billed at the cache rate),
+            cache_hit_ratio and net_uncached_tokens_saved (inline tokens saved
+            minus the prefix tokens sent at full price; negative = net cost)
+        """
+        with self._lock:
+            cacheable = self.est_tokens * max(0, self.calls - 1)
+            inline_tokens_saved = self.inline_chars_saved // CHARS_PER_TOKEN
+            uncached_prefix_tokens = max(0, self.est_tokens * self.calls - self.cached_tokens)
+            return {
+                "workspace_id": self.workspace_id,
+                "prefix_hash": self.prefix_hash[:12],
+                "prefix_tokens": self.est_tokens,
+                "cacheable": self.cacheable,
+                "calls": self.calls,
+                "block_references": self.block_references,
+                "inline_tokens_saved": inline_tokens_saved,
+                "provider_cached_tokens": self.cached_tokens,
+                "cache_hit_ratio": round(self.cached_tokens / cacheable, 2) if cacheable else 0.0,
+                "net_uncached_tokens_saved": inline_tokens_saved - uncached_prefix_tokens,
+            }
+
+
+def _render_section(title: str, lines: list) -> str:
+    body = "\n".join(line for line in lines if line)
+    return f"## {title}\n{body}" if body else ""
+
+
+def build_workspace_prompt_prefix(workspace: Dict[str, Any]) -> WorkspacePromptPrefix:
+    """
+    Renders the stable CHANNEL PROFILE prefix for a workspace.
+
+    Only configuration that is constant for the whole run is included
+    (no recent_titles, no performance data), rendered in a fixed order so the
+    same workspace config always yields the same text and hash.
+
+    Args:
+        workspace: Workspace configuration dict
+
+    Returns:
+        WorkspacePromptPrefix
+    """
+    narrator = workspace.get("narrator_persona") or {}
+    formula = workspace.get("content_formula") or {}
+    brand_manual = workspace.get("visual_brand_manual") or {}
+
+    sections = [
+        _render_section("CHANNEL IDENTITY", [
+            f"- Channel: {workspace.get('workspace_name', workspace.get('workspace_id', 'unknown'))}",
+            f"- Vertical: {workspace.get('vertical_id', 'unknown')}",
+            f"- Content language: {workspace.get('target_language', 'en')}",
+            f"- Brand tone: {workspace.get('brand_tone', '')}",
+            f"- Banned topics: {', '.join(workspace.get('banned_topics', []))}" if workspace.get("banned_topics") else "",
+        ]),
+    ]
+
+    if narrator.get("enabled"):
+        phrases = narrator.get("signature_phrases") or []
+        markers = narrator.get("credibility_markers") or []
+        sections.append(_render_section("NARRATOR PERSONA", [
+            f"- Name: {narrator.get('name', 'Host')}",
+            f"- Identity: {narrator.get('identity', 'Content creator')}",
+            f"- Relationship with audience: {narrator.get('relationship', 'informative')}",
+            f"- Tone of address: {narrator.get('tone_of_address', 'tu_informale')}",
+            f"- Signature phrases (opening / mid-content / closing): {' / '.join(phrases)}" if phrases else "",
+            "- Credibility markers: " + "; ".join(markers) if markers else "",
+        ]))
+
+    if formula:
+        sections.append(_render_section("CONTENT FORMULA", [
+            f"- {key}: {formula[key]}" for key in sorted(formula)
+        ]))
+
+    visual_lines = []
+    if workspace.get("visual_style"):
+        visual_lines.append(f"- Visual style: {workspace['visual_style']}")
+    if brand_manual.get("enabled"):
+        palette = brand_manual.get("color_palette") or {}
+        visual_lines.extend(f"- {name.capitalize()} color: {palette[name]}" for name in sorted(palette))
+    if workspace.get("video_style_mode"):
+        mode = workspace["video_style_mode"]
+        visual_lines.append(f"- Video style mode: {json.dumps(mode, sort_keys=True, ensure_ascii=False) if isinstance(mode, dict) else mode}")
+    if visual_lines:
+        sections.append(_render_section("VISUAL BRAND MANUAL", visual_lines))
+
+    text = "\n\n".join([
+        f"CHANNEL PROFILE (v{PROMPT_PREFIX_VERSION}) - applies to every task in this session.",
+        *[section for section in sections if section],
+        "Task-specific instructions follow. When a task refers to a CHANNEL PROFILE "
+        "section, apply that section exactly as written here.",
+    ])
+
+    return WorkspacePromptPrefix(workspace.get("workspace_id", "unknown"), text)
+
+
+def get_active_prompt_prefix(workspace_id: Optional[str] = None) -> Optional[WorkspacePromptPrefix]:
+    """
+    Returns the prefix of the current run scope (None outside a pipeline run).
+
+    Args:
+        workspace_id: If given, only return a prefix built for this workspace
+    """
+    prefix = get_llm_call_scope().get("prompt_prefix")
+    if prefix is None:
+        return None
+    if workspace_id and prefix.workspace_id != workspace_id:
+        return None
+    return prefix
+
+
+def get_prompt_prefix_for(prompt: str) -> Optional[WorkspacePromptPrefix]:
+    """
+    Returns the active prefix if the prompt references it, else None.
+
+    Used by llm_router so only prompts built with shared_workspace_block()
+    references carry the CHANNEL PROFILE system prefix.
+    """
+    prefix = get_active_prompt_prefix()
+    if prefix is None or PREFIX_REFERENCE_MARKER not in prompt:
+        return None
+    return prefix
+
+
+def shared_workspace_block(section: str, inline_text: str, workspace_id: Optional[str] = None) -> str:
+    """
+    Returns a reference to a CHANNEL PROFILE section when a cacheable prefix
+    is active, otherwise the inline block unchanged.
+
+    Args:
+        section: CHANNEL PROFILE section name (e.g. "NARRATOR PERSONA")
+        inline_text: Block the agent would embed without a prefix
+        workspace_id: Workspace the block belongs to (None = any active prefix)
+
+    Returns:
+        Text to embed in the agent prompt
+    """
+    prefix = get_active_prompt_prefix(workspace_id)
+    if prefix is None or not prefix.cacheable:
+        return inline_text
+
+    prefix.record_block_reference(inline_text)
+    return f"{PREFIX_REFERENCE_MARKER}{section} in the system prompt.)\n"
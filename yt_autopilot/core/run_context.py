@@ -0,0 +1,75 @@
+"""
+Run Context: Ambient attribution fields for LLM calls.
+
+LLM calls go through llm_generate_fn(role, task, context, style_hints), which
+carries no information about WHICH run, workspace or agent made the call.
+This module keeps that attribution in a contextvar so the pipeline and the
+AgentCoordinator can set it once and services/llm_usage.py can read it when
+recording each call - without changing any agent signature.
+
+Fields (all optional):
+- workspace_id: Workspace being generated
+- execution_id: Pipeline run UUID (same as AgentContext.execution_id)
+- agent: Agent currently running (e.g. "script_writer")
+- retry_reason: Why this call is a repeat (e.g. "agent_retry", "language_correction")
+- prompt_prefix: Per-run WorkspacePromptPrefix (core/prompt_prefix.py) that
+  llm_router sends as the cache-friendly system prefix of every call
+
+Scopes nest: inner scopes override only the fields they set.
+update_llm_call_scope() fills in fields of the innermost open scope (e.g. the
+workspace_id once the active workspace has been resolved).
+
+Note: contextvars do not flow into ThreadPoolExecutor workers automatically.
+Submit work with contextvars.copy_context().run to keep attribution.
+
+Usage:
+    from yt_autopilot.core.run_context import llm_call_scope
+
+    with llm_call_scope(workspace_id="tech_ai_creator", execution_id=run_id):
+        with llm_call_scope(agent="script_writer"):
+            llm_generate_fn(role="script_writer", task=..., context=...)
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_llm_call_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar("llm_call_scope", default=None)
+
+
+@contextmanager
+def llm_call_scope(**fields: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Sets attribution fields for LLM calls made inside the block.
+
+    Args:
+        **fields: Attribution fields (None values are ignored)
+
+    Yields:
+        The merged scope dict
+    """
+    merged = {**(_llm_call_scope.get() or {}), **{k: v for k, v in fields.items() if v is not None}}
+    token = _llm_call_scope.set(merged)
+    try:
+        yield merged
+    finally:
+        _llm_call_scope.reset(token)
+
+
+def update_llm_call_scope(**fields: Any) -> None:
+    """
+    Sets fields on the innermost open scope (no-op outside any scope).
+
+    Args:
+        **fields: Attribution fields (None values are ignored)
+    """
+    scope = _llm_call_scope.get()
+    if scope is not None:
+        scope.update({k: v for k, v in fields.items() if v is not None})
+
+
+def get_llm_call_scope() -> Dict[str, Any]:
+    """
+    Returns the current attribution fields (empty dict outside any scope).
+    """
+    return dict(_llm_call_scope.get() or {})
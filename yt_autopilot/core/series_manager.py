@@ -9,13 +9,17 @@ This module handles:
 - Format template loading from YAML configs
 - Intro/outro video caching for series reuse
 - Series-specific asset directory management
+
+Parsed YAML configs are cached by file mtime, so a long-lived process (the
+generation daemon) reads each format once but still picks up edits.
 """
 
 import os
 import shutil
+import threading
 import yaml
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, Tuple
 from yt_autopilot.core.schemas import SeriesFormat, SeriesSegment
 from yt_autopilot.core.config import get_config
 from yt_autopilot.core.logger import logger
@@ -23,6 +27,26 @@ from yt_autopilot.core.logger import logger
 
 DEFAULT_SERIE = "tutorial"  # Generic default (was "tech_tutorial")
 
+# yaml path -> (mtime_ns, parsed data)
+_yaml_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def _load_yaml(yaml_path: Path) -> Dict[str, Any]:
+    """Parsed YAML file, re-read only when its mtime changes (do not mutate)."""
+    mtime_ns = yaml_path.stat().st_mtime_ns
+    key = str(yaml_path)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (mtime_ns, data)
+    return data
+
 
 def detect_serie(topic: str, strategic_angle: Optional[str] = None) -> str:
     """
@@ -126,8 +150,7 @@ def load_format(serie_id: str) -> SeriesFormat:
 
     logger.info(f"Loading series format: {yaml_path}")
 
-    with open(yaml_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(yaml_path)
 
     # Parse segments
     segments = []
@@ -303,9 +326,8 @@ def list_available_series() -> Dict[str, str]:
     for yaml_file in config_dir.glob("*.yaml"):
         serie_id = yaml_file.stem
         try:
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                series_list[serie_id] = data.get("name", serie_id)
+            data = _load_yaml(yaml_file)
+            series_list[serie_id] = data.get("name", serie_id)
         except Exception as e:
             logger.warning(f"Failed to load series {yaml_file}: {e}")
 
@@ -0,0 +1,216 @@
+"""
+Stream Guard: Incremental validation of streamed LLM output.
+
+Long-form generation (scripts, narrative expansion) is consumed as a stream of
+text deltas (services/llm_router.stream_text). Agents parse scene boundaries as
+they arrive and hand every finished scene to a StreamGuard, which:
+
+- Estimates speaking duration per scene (2.5 words/second, same as ScriptWriter)
+- Runs the language check on each finished scene (LanguageValidator.detect_language)
+- Tracks total streamed words against a runaway-length budget
+
+On clearly invalid output the guard raises StreamAborted. A stream that is
+the router's deterministic fallback text (no provider answered) is invalid
+too: it must never be accepted as generated content. The consumer closes
+the stream (stopping token generation) and falls back to the regular,
+language-enforced llm_generate_fn path.
+
+A provider error after the first delta cannot fail over without repeating
+text, so llm_router raises StreamInterrupted to the consumer instead of
+ending the stream quietly with a truncated body.
+
+Usage:
+    guard = StreamGuard(target_language="it", max_words=900, component_name="script_writer")
+    deltas = llm_stream_fn(role="script_writer", task=task, context=context)
+    try:
+        for line in iter_stream_lines(deltas, guard):
+            ...
+            guard.finish_segment("bullet_1", bullet_text)
+    except StreamAborted as e:
+        logger.warning(f"Stream aborted: {e}")
+    finally:
+        deltas.close()
+"""
+
+import re
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from yt_autopilot.core.logger import logger
+
+# Speaking rate used for scene duration estimates (~150 words/minute)
+WORDS_PER_SECOND = 2.5
+
+# Scenes shorter than this are not language-checked (detection is unreliable)
+MIN_WORDS_FOR_LANGUAGE_CHECK = 12
+
+# Abort only when the detector is confident the scene is in another language
+WRONG_LANGUAGE_CONFIDENCE = 0.90
+
+# Prefix of llm_router's deterministic fallback text
+LLM_FALLBACK_MARKER = "[LLM_FALLBACK]"
+
+_WORD_PATTERN = re.compile(r"\S+")
+
+
+class StreamAborted(Exception):
+    """
+    Raised by StreamGuard when streamed output is clearly invalid.
+
+    Attributes:
+        reason: "wrong_language", "runaway_length" or "llm_fallback"
+        detail: Human-readable explanation
+    """
+
+    def __init__(self, reason: str, detail: str):
+        super().__init__(f"{reason}: {detail}")
+        self.reason = reason
+        self.detail = detail
+
+
+class StreamInterrupted(Exception):
+    """
+    Raised by llm_router stream providers when a stream breaks after it has
+    yielded text, so the partial output must not be used.
+    """
+
+
+class StreamGuard:
+    """
+    Per-stream validator fed by an incremental consumer.
+    """
+
+    def __init__(
+        self,
+        target_language: Optional[str] = None,
+        max_words: Optional[int] = None,
+        component_name: str = "stream"
+    ):
+        """
+        Args:
+            target_language: Expected language code (None disables language checks)
+            max_words: Runaway-length budget for the whole stream (None disables)
+            component_name: Component name for logging
+        """
+        self.target_language = target_language
+        self.max_words = max_words
+        self.component_name = component_name
+
+        self.segments: List[Dict[str, Any]] = []
+        self.streamed_words = 0
+        self.first_segment_ms: Optional[float] = None
+
+        self._started_at = time.monotonic()
+        self._ends_inside_word = False
+        self._received_text = False
+        self._validator = None
+        if target_language:
+            from yt_autopilot.core.language_validator import LanguageValidator
+            self._validator = LanguageValidator(target_language)
+
+    def feed(self, delta: str) -> None:
+        """
+        Counts words in a streamed delta and enforces the runaway-length budget.
+
+        Raises:
+            StreamAborted: If the stream exceeded max_words or is the router's fallback text
+        """
+        if not delta:
+            return
+
+        if not self._received_text and delta.strip():
+            self._received_text = True
+            if delta.lstrip().startswith(LLM_FALLBACK_MARKER):
+                raise StreamAborted("llm_fallback", "no LLM provider produced output (router fallback text)")
+
+        words = len(_WORD_PATTERN.findall(delta))
+        if words and self._ends_inside_word and not delta[0].isspace():
+            words -= 1  # Word split across two deltas
+        self._ends_inside_word = not delta[-1].isspace()
+        self.streamed_words += words
+
+        if self.max_words and self.streamed_words > self.max_words:
+            raise StreamAborted(
+                "runaway_length",
+                f"{self.streamed_words} words streamed (budget {self.max_words})"
+            )
+
+    def finish_segment(self, name: str, text: str) -> Dict[str, Any]:
+        """
+        Validates one finished scene.
+
+        Args:
+            name: Scene label (e.g. "hook", "bullet_2", "act_3")
+            text: Scene text
+
+        Returns:
+            Segment info: name, words, estimated_seconds, language, ready_ms
+
+        Raises:
+            StreamAborted: If the scene is confidently in the wrong language
+        """
+        words = len(text.split())
+        ready_ms = (time.monotonic() - self._started_at) * 1000
+        segment = {
+            "name": name,
+            "words": words,
+            "estimated_seconds": round(words / WORDS_PER_SECOND, 1),
+            "language": None,
+            "ready_ms": round(ready_ms),
+        }
+
+        if self._validator and words >= MIN_WORDS_FOR_LANGUAGE_CHECK:
+            detected, confidence = self._validator.detect_language(text)
+            segment["language"] = detected
+            if (
+                detected not in ("unknown", self._validator.target_language)
+                and confidence >= WRONG_LANGUAGE_CONFIDENCE
+            ):
+                raise StreamAborted(
+                    "wrong_language",
+                    f"{name} detected as '{detected}' ({confidence:.2f}), "
+                    f"expected '{self._validator.target_language}'"
+                )
+
+        if self.first_segment_ms is None:
+            self.first_segment_ms = ready_ms
+            logger.info(f"  ⚡ {self.component_name}: first scene ready after {ready_ms:.0f}ms ({name})")
+
+        self.segments.append(segment)
+        return segment
+
+    @property
+    def estimated_seconds(self) -> float:
+        """Estimated speaking duration of all finished scenes."""
+        return round(sum(s["estimated_seconds"] for s in self.segments), 1)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "segments": len(self.segments),
+            "streamed_words": self.streamed_words,
+            "estimated_seconds": self.estimated_seconds,
+            "first_segment_ms": round(self.first_segment_ms) if self.first_segment_ms is not None else None,
+            "total_ms": round((time.monotonic() - self._started_at) * 1000),
+        }
+
+
+def iter_stream_lines(deltas: Iterable[str], guard: StreamGuard) -> Iterator[str]:
+    """
+    Re-chunks a delta stream into complete lines, feeding the guard as text arrives.
+
+    Args:
+        deltas: Text deltas from llm_stream_fn
+        guard: StreamGuard enforcing the length budget
+
+    Yields:
+        Complete lines (without trailing newline); the final partial line last
+    """
+    pending = ""
+    for delta in deltas:
+        guard.feed(delta)
+        pending += delta
+        while "\n" in pending:
+            line, pending = pending.split("\n", 1)
+            yield line
+    if pending:
+        yield pending
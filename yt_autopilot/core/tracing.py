@@ -0,0 +1,371 @@
+"""
+Tracing: Nested timing spans for profiling pipeline runs.
+
+AgentCoordinator records execution_time_ms per agent, but a run's time is
+spent in what happens inside agents: LLM calls (and their hedged/failover
+attempts), validator gates, quality retries and language corrections.
+Spans tie those together in one tree per execution.
+
+Model:
+- A Tracer collects spans for one execution (trace_id = execution_id)
+- span() is a context manager; its parent is the innermost open span
+  (contextvar), or an explicit parent_id when work crosses threads
+  (e.g. LLM attempts in the routing executor, AgentContext.trace_parent_id)
+- trace_step() marks sequential pipeline steps ("Step 3: TrendHunter")
+  without re-indenting the step's code: it closes the previous step and
+  opens the next one under the same parent
+- annotate_span() adds fields (provider, tokens, cached checks...) to the
+  innermost open span
+- Without an active tracer every call is a no-op, so instrumentation stays
+  in place at no cost for untraced runs
+
+Output (Tracer.write(), under data/traces/ or $TRACE_DIR):
+- <run>.trace.json: Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev)
+- <run>.folded: collapsed stacks with self time in microseconds
+  ("a;b;c 1234" per line), for flamegraph.pl / speedscope
+- flame_summary(): self/total time aggregated per stack path, for logs/CLI
+
+Usage:
+    from yt_autopilot.core.tracing import tracing, span, trace_step
+
+    with tracing("build_video_package", trace_id=execution_id) as tracer:
+        with span("build_video_package"):
+            trace_step("Step 2: Fetch trends")
+            ...
+            with span("gate:Post-Script Validation", cat="validation"):
+                ...
+    paths = tracer.write()
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+TRACE_DIR = "data/traces"
+
+# Rows shown by format_flame_summary()
+FLAME_SUMMARY_TOP = 15
+
+
+class Tracer:
+    """
+    Span collector for one traced execution (thread-safe).
+    """
+
+    def __init__(self, name: str, trace_id: str, metadata: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.metadata = dict(metadata or {})
+        self.started_at = datetime.now()
+        self.spans: List[Dict[str, Any]] = []
+        self._t0 = time.perf_counter()
+        self._ids = itertools.count(1)
+        self._tids: Dict[int, int] = {}
+        self._thread_names: Dict[int, str] = {}
+        self._open_steps: Dict[Optional[str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._t0) * 1_000_000
+
+    def start_span(self, name: str, cat: str, parent_id: Optional[str], args: Dict[str, Any]) -> Dict[str, Any]:
+        """Opens a span (use span() instead of calling this directly)."""
+        thread = threading.current_thread()
+        with self._lock:
+            tid = self._tids.setdefault(thread.ident, len(self._tids) + 1)
+            self._thread_names.setdefault(tid, thread.name)
+            record = {
+                "id": f"{next(self._ids):x}",
+                "parent_id": parent_id,
+                "name": name,
+                "cat": cat,
+                "tid": tid,
+                "start_us": self._now_us(),
+                "dur_us": None,
+                "args": dict(args),
+            }
+            self.spans.append(record)
+        return record
+
+    def end_span(self, record: Dict[str, Any]) -> None:
+        """Closes a span and any trace_step() still open under it."""
+        with self._lock:
+            step = self._open_steps.pop(record["id"], None)
+        if step is not None:
+            self.end_span(step)
+        if record["dur_us"] is None:
+            record["dur_us"] = self._now_us() - record["start_us"]
+
+    def step(self, name: str, current_id: Optional[str]) -> Dict[str, Any]:
+        """
+        Opens step `name` next to the open step it replaces (use trace_step()).
+
+        Steps are siblings: if current_id is itself an open step, the new step
+        goes under that step's parent and the old step ends.
+        """
+        with self._lock:
+            parent_id = current_id
+            for step_parent, open_step in self._open_steps.items():
+                if open_step["id"] == current_id:
+                    parent_id = step_parent
+                    break
+            previous = self._open_steps.pop(parent_id, None)
+        if previous is not None:
+            self.end_span(previous)
+        record = self.start_span(name, "step", parent_id, {})
+        with self._lock:
+            self._open_steps[parent_id] = record
+        return record
+
+    def _closed_spans(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            spans = list(self.spans)
+        now = self._now_us()
+        # Spans still open (trace written mid-run or after an error) end now
+        return [
+            span if span["dur_us"] is not None else {**span, "dur_us": now - span["start_us"]}
+            for span in spans
+        ]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Chrome trace-event JSON (complete "X" events, microseconds).
+
+        Returns:
+            Dict with traceEvents, displayTimeUnit and otherData (run metadata)
+        """
+        pid = os.getpid()
+        with self._lock:
+            thread_names = sorted(self._thread_names.items())
+        events: List[Dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+            for tid, thread_name in thread_names
+        ]
+        for span in self._closed_spans():
+            events.append({
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "ts": round(span["start_us"], 1),
+                "dur": round(span["dur_us"], 1),
+                "pid": pid,
+                "tid": span["tid"],
+                "args": {**span["args"], "span_id": span["id"], "parent_id": span["parent_id"]},
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "name": self.name,
+                "trace_id": self.trace_id,
+                "started_at": self.started_at.isoformat(),
+                **self.metadata,
+            },
+        }
+
+    def flame_summary(self) -> List[Dict[str, Any]]:
+        """
+        Aggregates spans by stack path (root;...;span names).
+
+        Self time excludes child spans; children running in parallel (hedged
+        attempts) can exceed their parent, so self time is clamped at 0.
+
+        Returns:
+            Rows {path, name, calls, total_ms, self_ms}, by descending self_ms
+        """
+        spans = self._closed_spans()
+        by_id = {span["id"]: span for span in spans}
+        child_us: Dict[str, float] = {}
+        for span in spans:
+            if span["parent_id"] in by_id:
+                child_us[span["parent_id"]] = child_us.get(span["parent_id"], 0.0) + span["dur_us"]
+
+        paths: Dict[str, str] = {}
+
+        def _path(span: Dict[str, Any]) -> str:
+            if span["id"] not in paths:
+                parent = by_id.get(span["parent_id"])
+                paths[span["id"]] = f"{_path(parent)};{span['name']}" if parent else span["name"]
+            return paths[span["id"]]
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        for span in spans:
+            path = _path(span)
+            row = rows.setdefault(path, {"path": path, "name": span["name"], "calls": 0, "total_ms": 0.0, "self_ms": 0.0})
+            row["calls"] += 1
+            row["total_ms"] += span["dur_us"] / 1000
+            row["self_ms"] += max(0.0, span["dur_us"] - child_us.get(span["id"], 0.0)) / 1000
+
+        return sorted(rows.values(), key=lambda r: r["self_ms"], reverse=True)
+
+    def write(self, directory: Optional[str] = None) -> Dict[str, Path]:
+        """
+        Writes the Chrome trace and the folded-stack flame file.
+
+        Args:
+            directory: Output directory (default: $TRACE_DIR or data/traces)
+
+        Returns:
+            {"trace": path to .trace.json, "folded": path to .folded}
+        """
+        out_dir = Path(directory or os.getenv("TRACE_DIR", TRACE_DIR))
+        out_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.started_at.strftime('%Y%m%d_%H%M%S')}_{self.name}_{self.trace_id[:8]}"
+
+        trace_path = out_dir / f"{stem}.trace.json"
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
+
+        folded_path = out_dir / f"{stem}.folded"
+        with open(folded_path, "w", encoding="utf-8") as f:
+            for row in self.flame_summary():
+                self_us = int(row["self_ms"] * 1000)
+                if self_us > 0:
+                    f.write(f"{row['path']} {self_us}\n")
+
+        return {"trace": trace_path, "folded": folded_path}
+
+
+_active_tracer: ContextVar[Optional[Tracer]] = ContextVar("active_tracer", default=None)
+_current_span: ContextVar[Optional[str]] = ContextVar("current_span", default=None)
+_current_args: ContextVar[Optional[Dict[str, Any]]] = ContextVar("current_span_args", default=None)
+
+
+@contextmanager
+def tracing(name: str, trace_id: str, **metadata: Any) -> Iterator[Tracer]:
+    """
+    Activates a Tracer for the block (spans opened inside are recorded).
+
+    Args:
+        name: Run name (used in file names)
+        trace_id: Execution id
+        **metadata: Stored in the trace's otherData (e.g. workspace_id)
+
+    Yields:
+        The Tracer (call write() after the block, or inside it to include errors)
+    """
+    tracer = Tracer(name, trace_id, metadata)
+    tracer_token = _active_tracer.set(tracer)
+    span_token = _current_span.set(None)
+    args_token = _current_args.set(None)
+    try:
+        yield tracer
+    finally:
+        _current_args.reset(args_token)
+        _current_span.reset(span_token)
+        _active_tracer.reset(tracer_token)
+
+
+def get_active_tracer() -> Optional[Tracer]:
+    """Returns the Tracer of the current context (None when not tracing)."""
+    return _active_tracer.get()
+
+
+def current_span_id() -> Optional[str]:
+    """Returns the innermost open span id (None when not tracing)."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(
+    name: str,
+    cat: str = "pipeline",
+    parent_id: Optional[str] = None,
+    tracer: Optional[Tracer] = None,
+    activate: bool = True,
+    **args: Any
+) -> Iterator[Optional[Dict[str, Any]]]:
+    """
+    Records a timed span (no-op when no tracer is active).
+
+    Args:
+        name: Span name (e.g. "agent:script_writer", "llm:seo_title_generator")
+        cat: Category shown in the trace viewer ("pipeline", "agent", "llm", "validation", ...)
+        parent_id: Explicit parent (default: innermost open span)
+        tracer: Explicit tracer, for work handed to another thread
+        activate: If False, nested spans do not attach to this one
+                  (use for generators, which share their consumer's context)
+        **args: Span fields shown in the trace viewer
+
+    Yields:
+        The span's args dict (add fields to it), or None when not tracing
+    """
+    tracer = tracer or _active_tracer.get()
+    if tracer is None:
+        yield None
+        return
+
+    record = tracer.start_span(name, cat, parent_id or _current_span.get(), args)
+    tokens = None
+    if activate:
+        tokens = (
+            _active_tracer.set(tracer),
+            _current_span.set(record["id"]),
+            _current_args.set(record["args"]),
+        )
+    try:
+        yield record["args"]
+    except BaseException as e:
+        record["args"]["error"] = type(e).__name__
+        raise
+    finally:
+        if tokens is not None:
+            _current_args.reset(tokens[2])
+            _current_span.reset(tokens[1])
+            _active_tracer.reset(tokens[0])
+        tracer.end_span(record)
+
+
+def trace_step(name: str) -> None:
+    """
+    Starts a sequential step under the innermost open span.
+
+    The previous step under the same span ends here; the last one ends with
+    its parent. Spans opened afterwards (in this context) nest under the step.
+
+    Args:
+        name: Step name (e.g. "Step 4: ScriptWriter")
+    """
+    tracer = _active_tracer.get()
+    if tracer is None:
+        return
+    record = tracer.step(name, _current_span.get())
+    _current_span.set(record["id"])
+    _current_args.set(record["args"])
+
+
+def annotate_span(**fields: Any) -> None:
+    """Adds fields to the innermost open span (no-op when not tracing)."""
+    args = _current_args.get()
+    if args is not None:
+        args.update(fields)
+
+
+def format_flame_summary(rows: List[Dict[str, Any]], top: int = FLAME_SUMMARY_TOP) -> List[str]:
+    """
+    Formats flame_summary() rows as aligned text lines (top N by self time).
+
+    Args:
+        rows: Tracer.flame_summary() output
+        top: Max rows
+
+    Returns:
+        Lines: self ms, total ms, calls, stack path (leading frames elided)
+    """
+    total_self = sum(row["self_ms"] for row in rows) or 1.0
+    lines = [f"{'SELF':>10} {'%':>5} {'TOTAL':>10} {'CALLS':>5}  STACK"]
+    for row in rows[:top]:
+        frames = row["path"].split(";")
+        path = ";".join(frames) if len(frames) <= 3 else "…;" + ";".join(frames[-3:])
+        lines.append(
+            f"{row['self_ms']:>8.0f}ms {row['self_ms'] / total_self:>5.1%} "
+            f"{row['total_ms']:>8.0f}ms {row['calls']:>5}  {path}"
+        )
+    return lines
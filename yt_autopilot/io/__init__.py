@@ -11,20 +11,22 @@ Production States:
 - SCHEDULED_ON_YOUTUBE: Video uploaded and scheduled on YouTube
 """
 
-from yt_autopilot.io.datastore import (
-    list_published_videos,
-    save_metrics,
-    get_metrics_history,
-    save_draft_package,
-    get_draft_package,
-    list_scheduled_videos,
-    list_pending_review
-)
-from yt_autopilot.io.exports import (
-    export_report_csv,
-    export_metrics_timeseries_csv,
-    export_content_package_to_markdown
-)
+import importlib
+
+# Re-exports are imported on first access, so importing yt_autopilot.io.datastore
+# does not also load the exporters.
+_LAZY_EXPORTS = {
+    "list_published_videos": "yt_autopilot.io.datastore",
+    "save_metrics": "yt_autopilot.io.datastore",
+    "get_metrics_history": "yt_autopilot.io.datastore",
+    "save_draft_package": "yt_autopilot.io.datastore",
+    "get_draft_package": "yt_autopilot.io.datastore",
+    "list_scheduled_videos": "yt_autopilot.io.datastore",
+    "list_pending_review": "yt_autopilot.io.datastore",
+    "export_report_csv": "yt_autopilot.io.exports",
+    "export_metrics_timeseries_csv": "yt_autopilot.io.exports",
+    "export_content_package_to_markdown": "yt_autopilot.io.exports",
+}
 
 __all__ = [
     # Datastore - content strategy focus
@@ -42,3 +44,13 @@ __all__ = [
     # Exports - Content packages (Phase 1 refactor)
     "export_content_package_to_markdown",
 ]
+
+
+def __getattr__(name):
+    """Resolves re-exports on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,556 @@
+"""
+Content Index: Local vector index of past content per workspace.
+
+Keeps an embedding for every produced title, working title and script hook so
+that "too similar to recent content" checks and historical-performance matching
+become top-k queries instead of word-overlap loops over the whole datastore.
+
+Storage (next to data/records.jsonl):
+- data/content_index/<workspace_id>.json: entry metadata + embedder name
+- data/content_index/<workspace_id>.npy: float32 matrix (one L2-normalized row per entry)
+
+Backends:
+- NumPy brute force (default): one matrix-vector product per query, milliseconds
+  for thousands of entries
+- HNSW (optional): used automatically when `hnswlib` is installed and the index
+  holds at least HNSW_MIN_ITEMS entries
+
+Embedders:
+- sentence-transformers all-MiniLM-L6-v2 (same model as utils/semantic_similarity)
+- Hashed bag-of-words fallback when sentence-transformers is not installed
+  (logged via log_fallback, deterministic, no model download)
+
+The index is updated on every datastore save (save_script_draft, save_draft_package)
+and bootstrapped from the datastore the first time a workspace is queried.
+
+Usage:
+    from yt_autopilot.io.content_index import find_similar_content
+
+    matches = find_similar_content("tech_ai_creator", "ChatGPT for work efficiency", top_k=3)
+    for match in matches:
+        print(f"{match['score']:.2f} - {match['kind']}: {match['text']}")
+"""
+
+import json
+import os
+import re
+import threading
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable, Tuple
+
+import numpy as np
+
+from yt_autopilot.core.logger import logger, log_fallback
+from yt_autopilot.io.datastore import _get_datastore_path
+
+
+# Entry kinds indexed for every datastore record
+KIND_TITLE = "title"
+KIND_WORKING_TITLE = "working_title"
+KIND_HOOK = "hook"
+ALL_KINDS = (KIND_TITLE, KIND_WORKING_TITLE, KIND_HOOK)
+
+# Cosine similarity thresholds (embedding space, 0.0-1.0)
+SEMANTIC_DUPLICATE_THRESHOLD = 0.85   # trend_hunter: "too similar to recent content"
+HISTORICAL_MATCH_THRESHOLD = 0.75     # trend_scorer: "similar past video"
+
+# Duplicate threshold with the hashed fallback embedder: it scores paraphrases
+# ~0.6-0.8 and unrelated titles of the same niche ~0.2-0.45, so 0.85 would
+# let nearly every duplicate through
+HASHED_SEMANTIC_DUPLICATE_THRESHOLD = 0.60
+
+# trend_hunter compares trends only with content saved in this many days
+RECENT_CONTENT_DAYS = 90
+
+# Switch from brute force to HNSW above this many entries (if hnswlib is installed)
+HNSW_MIN_ITEMS = 2000
+
+HASHED_EMBEDDER_NAME = "hashed-bow-384"
+HASHED_EMBEDDING_DIM = 384
+SENTENCE_TRANSFORMER_NAME = "all-MiniLM-L6-v2"
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+# ============================================================================
+# EMBEDDERS
+# ============================================================================
+
+def _embed_hashed(texts: List[str]) -> np.ndarray:
+    """
+    Deterministic hashed bag-of-words embedding (fallback embedder).
+
+    Features: lowercase word unigrams, word bigrams and character trigrams,
+    hashed into HASHED_EMBEDDING_DIM buckets with a sign bit (feature hashing).
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        float32 matrix (len(texts), HASHED_EMBEDDING_DIM), rows L2-normalized
+    """
+    vectors = np.zeros((len(texts), HASHED_EMBEDDING_DIM), dtype=np.float32)
+
+    for row, text in enumerate(texts):
+        tokens = _TOKEN_PATTERN.findall((text or "").lower())
+        features = [(token, 1.0) for token in tokens]
+        features += [(f"{a} {b}", 0.5) for a, b in zip(tokens, tokens[1:])]
+        for token in tokens:
+            padded = f"#{token}#"
+            features += [(padded[i:i + 3], 0.25) for i in range(len(padded) - 2)]
+
+        for feature, weight in features:
+            digest = zlib.crc32(feature.encode("utf-8"))
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            vectors[row, digest % HASHED_EMBEDDING_DIM] += sign * weight
+
+    return _normalize_rows(vectors)
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize matrix rows (zero rows are left untouched)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32)
+
+
+@lru_cache(maxsize=1)
+def _get_embedder() -> Tuple[str, Callable[[List[str]], np.ndarray]]:
+    """
+    Returns (embedder_name, embed_fn), preferring sentence-transformers.
+
+    Cached so the model is loaded at most once per process.
+    """
+    try:
+        from yt_autopilot.utils.semantic_similarity import _get_model
+
+        model = _get_model()
+
+        def _embed_sentence_transformer(texts: List[str]) -> np.ndarray:
+            vectors = model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+            return _normalize_rows(np.asarray(vectors, dtype=np.float32))
+
+        return SENTENCE_TRANSFORMER_NAME, _embed_sentence_transformer
+
+    except Exception as e:
+        log_fallback(
+            component="CONTENT_INDEX",
+            fallback_type="HASHED_EMBEDDINGS",
+            reason=f"sentence-transformers unavailable: {e}",
+            impact="LOW"
+        )
+        return HASHED_EMBEDDER_NAME, _embed_hashed
+
+
+def _load_hnswlib():
+    """Returns the hnswlib module if installed, None otherwise."""
+    try:
+        import hnswlib
+        return hnswlib
+    except ImportError:
+        return None
+
+
+# ============================================================================
+# CONTENT INDEX
+# ============================================================================
+
+class ContentIndex:
+    """
+    Vector index of past content for one workspace.
+
+    Entries are dicts with keys: record_id, video_internal_id, script_internal_id,
+    kind, text, saved_at. Row i of the embedding matrix belongs to entry i.
+    """
+
+    def __init__(self, workspace_id: str, index_dir: Path):
+        self.workspace_id = workspace_id
+        self.meta_path = index_dir / f"{workspace_id}.json"
+        self.vectors_path = index_dir / f"{workspace_id}.npy"
+
+        self.embedder_name, self._embed = _get_embedder()
+        self.entries: List[Dict[str, Any]] = []
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+
+        self._keys: Dict[Tuple[str, str, str], int] = {}
+        self._hnsw = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def duplicate_threshold(self) -> float:
+        """Semantic duplicate threshold calibrated for this index's embedder."""
+        if self.embedder_name == HASHED_EMBEDDER_NAME:
+            return HASHED_SEMANTIC_DUPLICATE_THRESHOLD
+        return SEMANTIC_DUPLICATE_THRESHOLD
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self) -> bool:
+        """
+        Loads the index from disk.
+
+        Returns:
+            True if an index file was found, False otherwise.
+            If the stored embedder differs from the current one, entries are re-embedded.
+        """
+        if not self.meta_path.exists():
+            return False
+
+        with open(self.meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        self.entries = meta.get("entries", [])
+        self._keys = {self._entry_key(e): i for i, e in enumerate(self.entries)}
+
+        if meta.get("embedder") == self.embedder_name and self.vectors_path.exists():
+            self.vectors = np.load(self.vectors_path)
+        else:
+            logger.info(
+                f"Content index '{self.workspace_id}': embedder changed "
+                f"({meta.get('embedder')} → {self.embedder_name}), re-embedding {len(self.entries)} entries"
+            )
+            self.vectors = self._embed([e["text"] for e in self.entries]) if self.entries else \
+                np.zeros((0, 0), dtype=np.float32)
+            self.save()
+
+        self._hnsw = None
+        return True
+
+    def save(self) -> None:
+        """Writes metadata and vectors atomically (temp file + rename)."""
+        self.meta_path.parent.mkdir(parents=True, exist_ok=True)
+
+        meta = {
+            "workspace_id": self.workspace_id,
+            "embedder": self.embedder_name,
+            "entries": self.entries
+        }
+
+        tmp_meta = self.meta_path.with_suffix(".json.tmp")
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        tmp_vectors = self.vectors_path.with_suffix(".tmp.npy")
+        np.save(tmp_vectors, self.vectors)
+
+        os.replace(tmp_vectors, self.vectors_path)
+        os.replace(tmp_meta, self.meta_path)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _entry_key(entry: Dict[str, Any]) -> Tuple[str, str, str]:
+        return (entry.get("record_id") or "", entry.get("kind") or "", (entry.get("text") or "").strip().lower())
+
+    def add(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Adds entries (deduplicated by record_id + kind + text) and embeds them.
+
+        Existing entries with the same key get their ids refreshed instead
+        (e.g. a script record later linked to a video_internal_id).
+
+        Args:
+            items: Entry dicts (see class docstring)
+
+        Returns:
+            Number of new entries embedded
+        """
+        with self._lock:
+            new_items = []
+            for item in items:
+                if not (item.get("text") or "").strip():
+                    continue
+                key = self._entry_key(item)
+                if key in self._keys:
+                    existing = self.entries[self._keys[key]]
+                    for id_field in ("video_internal_id", "script_internal_id"):
+                        if item.get(id_field):
+                            existing[id_field] = item[id_field]
+                    continue
+                self._keys[key] = len(self.entries) + len(new_items)
+                new_items.append(item)
+
+            if not new_items:
+                return 0
+
+            new_vectors = self._embed([item["text"] for item in new_items])
+            if self.vectors.size == 0:
+                self.vectors = new_vectors
+            else:
+                self.vectors = np.vstack([self.vectors, new_vectors])
+
+            self.entries.extend(new_items)
+            self._hnsw = None  # Rebuilt lazily on next query
+            return len(new_items)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _candidate_rows(
+        self,
+        query_vectors: np.ndarray,
+        k: int,
+        subset: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (rows, scores) of the k nearest entries for each query vector.
+
+        Uses HNSW when available and the index is large, brute force otherwise.
+        With subset (row numbers), only those rows are searched (brute force).
+        """
+        if subset is not None:
+            if len(subset) == 0:
+                empty = np.zeros((len(query_vectors), 0))
+                return empty.astype(np.int64), empty
+            rows, scores = self._brute_force(query_vectors, self.vectors[subset], k)
+            return subset[rows], scores
+
+        n = len(self.entries)
+        k = min(k, n)
+
+        hnswlib = _load_hnswlib() if n >= HNSW_MIN_ITEMS else None
+        if hnswlib is not None:
+            if self._hnsw is None:
+                index = hnswlib.Index(space="cosine", dim=self.vectors.shape[1])
+                index.init_index(max_elements=n, ef_construction=200, M=16)
+                index.add_items(self.vectors, np.arange(n))
+                index.set_ef(max(50, k * 2))
+                self._hnsw = index
+            rows, distances = self._hnsw.knn_query(query_vectors, k=k)
+            return rows, 1.0 - distances
+
+        return self._brute_force(query_vectors, self.vectors, k)
+
+    @staticmethod
+    def _brute_force(query_vectors: np.ndarray, vectors: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(rows, scores) of the k best rows of vectors for each query, by descending score."""
+        n = len(vectors)
+        k = min(k, n)
+        scores = query_vectors @ vectors.T
+        if k < n:
+            rows = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            rows = np.tile(np.arange(n), (len(query_vectors), 1))
+        top_scores = np.take_along_axis(scores, rows, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        return np.take_along_axis(rows, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+    def search_batch(
+        self,
+        texts: List[str],
+        top_k: int = 5,
+        kinds: Optional[List[str]] = None,
+        min_score: float = 0.0,
+        since: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Top-k nearest past content for each query text (one embedding call for all texts).
+
+        Args:
+            texts: Query texts (e.g. trend keywords)
+            top_k: Maximum matches per query
+            kinds: Optional entry kinds to keep (default: all kinds)
+            min_score: Minimum cosine similarity to keep a match
+            since: Optional ISO timestamp; only entries saved at or after it are searched
+
+        Returns:
+            One list per query text of entry dicts with an added "score" key,
+            sorted by descending score
+        """
+        if not texts:
+            return []
+        if not self.entries:
+            return [[] for _ in texts]
+
+        with self._lock:
+            subset = None
+            if since is not None:
+                subset = np.array(
+                    [i for i, entry in enumerate(self.entries) if (entry.get("saved_at") or "") >= since],
+                    dtype=np.int64
+                )
+            query_vectors = self._embed(texts)
+            # Over-fetch when filtering by kind so top_k survives the filter
+            fetch_k = top_k if not kinds else top_k * len(ALL_KINDS) * 2
+            rows, scores = self._candidate_rows(query_vectors, fetch_k, subset=subset)
+
+        results = []
+        for query_rows, query_scores in zip(rows, scores):
+            matches = []
+            for row, score in zip(query_rows, query_scores):
+                entry = self.entries[int(row)]
+                if kinds and entry.get("kind") not in kinds:
+                    continue
+                if score < min_score:
+                    break
+                matches.append({**entry, "score": float(score)})
+                if len(matches) >= top_k:
+                    break
+            results.append(matches)
+
+        return results
+
+    def search(
+        self,
+        text: str,
+        top_k: int = 5,
+        kinds: Optional[List[str]] = None,
+        min_score: float = 0.0,
+        since: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Top-k nearest past content for a single query text (see search_batch)."""
+        return self.search_batch([text], top_k=top_k, kinds=kinds, min_score=min_score, since=since)[0]
+
+
+# ============================================================================
+# MODULE API
+# ============================================================================
+
+_indexes: Dict[str, ContentIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _get_index_dir() -> Path:
+    """Returns data/content_index (next to the datastore file)."""
+    return _get_datastore_path().parent / "content_index"
+
+
+def _entries_from_record(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extracts index entries (title, working title, hook) from a datastore record.
+
+    Args:
+        record: Datastore record (script draft or video draft)
+
+    Returns:
+        List of entry dicts (empty texts are skipped by ContentIndex.add)
+    """
+    script_id = record.get("script_internal_id")
+    video_id = record.get("video_internal_id")
+    base = {
+        "record_id": script_id or video_id,
+        "script_internal_id": script_id,
+        "video_internal_id": video_id,
+        "saved_at": record.get("saved_at", "")
+    }
+
+    video_plan = record.get("video_plan") or {}
+    script = record.get("script") or {}
+
+    return [
+        {**base, "kind": KIND_TITLE, "text": record.get("title") or ""},
+        {**base, "kind": KIND_WORKING_TITLE, "text": video_plan.get("working_title") or ""},
+        {**base, "kind": KIND_HOOK, "text": script.get("hook") or ""},
+    ]
+
+
+def rebuild_content_index(workspace_id: str) -> ContentIndex:
+    """
+    Rebuilds a workspace index from scratch using all datastore records.
+
+    Args:
+        workspace_id: Workspace to rebuild
+
+    Returns:
+        Rebuilt ContentIndex (also persisted to disk)
+    """
+    from yt_autopilot.io.datastore import list_workspace_records
+
+    index = ContentIndex(workspace_id, _get_index_dir())
+
+    items = []
+    for record in list_workspace_records(workspace_id, include_all_states=True):
+        items.extend(_entries_from_record(record))
+
+    added = index.add(items)
+    index.save()
+
+    with _indexes_lock:
+        _indexes[workspace_id] = index
+
+    logger.info(f"✓ Content index rebuilt for '{workspace_id}': {added} entries ({index.embedder_name})")
+    return index
+
+
+def get_content_index(workspace_id: str) -> ContentIndex:
+    """
+    Returns the (process-cached) content index for a workspace.
+
+    Loads it from disk, or bootstraps it from the datastore if no index exists yet.
+
+    Args:
+        workspace_id: Workspace identifier
+
+    Returns:
+        ContentIndex for the workspace
+    """
+    with _indexes_lock:
+        index = _indexes.get(workspace_id)
+    if index is not None:
+        return index
+
+    index = ContentIndex(workspace_id, _get_index_dir())
+    if not index.load():
+        return rebuild_content_index(workspace_id)
+
+    with _indexes_lock:
+        _indexes[workspace_id] = index
+
+    logger.debug(f"Content index loaded for '{workspace_id}': {len(index)} entries")
+    return index
+
+
+def index_datastore_record(record: Dict[str, Any]) -> None:
+    """
+    Adds a freshly saved datastore record to its workspace index and persists it.
+
+    Called by datastore save functions. Records without workspace_id are skipped.
+
+    Args:
+        record: Datastore record that was just appended to records.jsonl
+    """
+    workspace_id = record.get("workspace_id")
+    if not workspace_id:
+        return
+
+    index = get_content_index(workspace_id)
+    if index.add(_entries_from_record(record)):
+        index.save()
+        logger.debug(f"Content index updated for '{workspace_id}' ({len(index)} entries)")
+
+
+def find_similar_content(
+    workspace_id: str,
+    text: str,
+    top_k: int = 5,
+    kinds: Optional[List[str]] = None,
+    min_score: float = 0.0
+) -> List[Dict[str, Any]]:
+    """
+    Finds past content of a workspace semantically similar to text.
+
+    Args:
+        workspace_id: Workspace to search
+        text: Query text (e.g. trend keyword)
+        top_k: Maximum number of matches
+        kinds: Optional filter on entry kinds ("title", "working_title", "hook")
+        min_score: Minimum cosine similarity
+
+    Returns:
+        Entry dicts with "score", sorted by descending similarity
+
+    Example:
+        >>> find_similar_content("gym_fitness_pro", "Best stretches for morning routine", top_k=1)
+        [{'kind': 'title', 'text': 'Morning stretches', 'score': 0.91, ...}]
+    """
+    return get_content_index(workspace_id).search(text, top_k=top_k, kinds=kinds, min_score=min_score)
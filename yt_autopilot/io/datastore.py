@@ -18,10 +18,13 @@ import json
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from yt_autopilot.core.schemas import ContentPackage, VideoMetrics
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from yt_autopilot.core.config import get_config
-from yt_autopilot.core.logger import logger
+from yt_autopilot.core.logger import logger, log_fallback
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: read-only commands should not pay for pydantic
+    from yt_autopilot.core.schemas import ContentPackage, VideoMetrics
 
 
 def _get_datastore_path() -> Path:
@@ -37,6 +40,30 @@ def _get_datastore_path() -> Path:
     return data_dir / "records.jsonl"
 
 
+def _update_content_index(record: Dict[str, Any]) -> None:
+    """
+    Adds a newly saved record to the workspace content index (io/content_index.py).
+
+    The index only accelerates similarity checks, so a failure here never
+    blocks the save: the record is already in records.jsonl and the index
+    can be rebuilt from it.
+
+    Args:
+        record: Record just appended to the datastore
+    """
+    try:
+        from yt_autopilot.io.content_index import index_datastore_record
+        index_datastore_record(record)
+    except Exception as e:
+        logger.warning(f"Content index update failed: {e}")
+        log_fallback(
+            component="DATASTORE_CONTENT_INDEX",
+            fallback_type="INDEX_NOT_UPDATED",
+            reason=f"Content index update failed: {e}",
+            impact="LOW"
+        )
+
+
 def list_published_videos() -> List[Dict[str, Any]]:
     """
     Returns list of all published/scheduled videos.
@@ -119,7 +146,7 @@ def get_all_videos(workspace_id: Optional[str] = None) -> List[Dict[str, Any]]:
     return videos
 
 
-def save_metrics(video_id: str, metrics: VideoMetrics) -> None:
+def save_metrics(video_id: str, metrics: "VideoMetrics") -> None:
     """
     Saves analytics metrics for a video.
 
@@ -163,7 +190,7 @@ def save_metrics(video_id: str, metrics: VideoMetrics) -> None:
     logger.info(f"  Views: {metrics.views:,}, CTR: {metrics.ctr:.2%}")
 
 
-def get_metrics_history(video_id: str) -> List[VideoMetrics]:
+def get_metrics_history(video_id: str) -> List["VideoMetrics"]:
     """
     Retrieves historical metrics for a video.
 
@@ -178,6 +205,8 @@ def get_metrics_history(video_id: str) -> List[VideoMetrics]:
         >>> print(f"Collected {len(history)} metric snapshots")
         Collected 5 metric snapshots
     """
+    from yt_autopilot.core.schemas import VideoMetrics
+
     logger.info(f"Retrieving metrics history for video {video_id}...")
 
     config = get_config()
@@ -283,7 +312,7 @@ def get_videos_performance_summary(
 
 
 def save_draft_package(
-    ready: ContentPackage,
+    ready: "ContentPackage",
     scene_paths: List[str],
     voiceover_path: str,
     final_video_path: str,
@@ -393,6 +422,8 @@ def save_draft_package(
     with open(datastore_path, "a", encoding="utf-8") as f:
         f.write(json.dumps(record, ensure_ascii=False) + "\n")
 
+    _update_content_index(record)
+
     logger.info(f"✓ Draft package saved to {datastore_path}")
     logger.info(f"  Internal ID: {video_internal_id}")
     logger.info(f"  Workspace: {workspace_id}")
@@ -558,7 +589,7 @@ def list_pending_review(workspace_id: Optional[str] = None) -> List[Dict[str, An
 # ==============================================================================
 
 def save_script_draft(
-    ready: ContentPackage,
+    ready: "ContentPackage",
     publish_datetime_iso: str,
     workspace_id: str
 ) -> str:
@@ -663,6 +694,8 @@ def save_script_draft(
     with open(datastore_path, "a", encoding="utf-8") as f:
         f.write(json.dumps(record, ensure_ascii=False) + "\n")
 
+    _update_content_index(record)
+
     logger.info(f"✓ Script draft saved to {datastore_path}")
     logger.info(f"  Script ID: {script_internal_id}")
     logger.info(f"  Workspace: {workspace_id}")
@@ -1081,4 +1114,18 @@ def delete_workspace_records(workspace_id: str, keep_published: bool = True) ->
     logger.info(f"✓ Deleted {deleted_count} records from workspace '{workspace_id}'")
     logger.info(f"✓ Kept {len(kept_records)} records")
 
+    # Drop deleted records from the workspace content index
+    if deleted_count:
+        try:
+            from yt_autopilot.io.content_index import rebuild_content_index
+            rebuild_content_index(workspace_id)
+        except Exception as e:
+            logger.warning(f"Content index rebuild failed: {e}")
+            log_fallback(
+                component="DATASTORE_CONTENT_INDEX",
+                fallback_type="STALE_INDEX",
+                reason=f"Content index rebuild failed after delete: {e}",
+                impact="LOW"
+            )
+
     return deleted_count
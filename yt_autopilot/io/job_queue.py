@@ -0,0 +1,311 @@
+"""
+Job Queue - Durable queue of video generation jobs for the daemon.
+
+Rows live in a SQLite database (data/job_queue.db) and move through:
+
+    queued -> running -> done
+                      -> failed   (pipeline raised; re-enqueue to retry)
+
+A job is claimed (status "running", claimed by one worker) inside a
+BEGIN IMMEDIATE transaction, so several daemons can share the queue. Running
+workers refresh heartbeat_at; a running job whose heartbeat is older than
+JOB_STALE_SECONDS was left behind by a dead worker and is re-queued (or
+failed once it has been attempted MAX_JOB_ATTEMPTS times).
+
+Enqueueing is idempotent per workspace: while a workspace already has a
+queued job, enqueue_job() returns that job instead of adding another, so a
+schedule that fires faster than jobs complete does not build a backlog.
+
+Workers live in pipeline/generation_daemon.run_daemon().
+
+Usage:
+    from yt_autopilot.io.job_queue import enqueue_job, list_jobs
+
+    job = enqueue_job("tech_ai_creator", params={"use_llm_curation": True})
+    print(job["job_id"], job["status"])
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from yt_autopilot.core.logger import logger
+
+
+JOB_QUEUE_DB_PATH = "data/job_queue.db"
+
+# A running job without a heartbeat for this long belongs to a dead worker
+JOB_STALE_SECONDS = 300
+
+# Stale jobs are re-queued until they have been attempted this many times
+MAX_JOB_ATTEMPTS = 3
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+JOB_STATUSES = (QUEUED, RUNNING, DONE, FAILED)
+
+_lock = threading.RLock()
+_connections: Dict[str, sqlite3.Connection] = {}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    workspace_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    source TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    result TEXT,
+    last_error TEXT,
+    enqueued_at TEXT,
+    started_at TEXT,
+    finished_at TEXT,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status
+    ON jobs (status, workspace_id);
+"""
+
+_JOB_COLUMNS = (
+    "job_id, workspace_id, status, params, source, attempts, worker, result, "
+    "last_error, enqueued_at, started_at, finished_at"
+)
+
+
+def _get_db_path() -> str:
+    """Get path to the job queue SQLite database."""
+    path = os.getenv("JOB_QUEUE_DB_PATH", JOB_QUEUE_DB_PATH)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Returns the shared connection (callers must hold _lock)."""
+    path = _get_db_path()
+    conn = _connections.get(path)
+    if conn is None:
+        # timeout: another daemon may hold the write lock while claiming
+        conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _connections[path] = conn
+    return conn
+
+
+def _job(row: Tuple) -> Dict[str, Any]:
+    (job_id, workspace_id, status, params, source, attempts, worker, result,
+     last_error, enqueued_at, started_at, finished_at) = row
+    return {
+        "job_id": job_id,
+        "workspace_id": workspace_id,
+        "status": status,
+        "params": json.loads(params),
+        "source": source,
+        "attempts": attempts,
+        "worker": worker,
+        "result": json.loads(result) if result else None,
+        "last_error": last_error,
+        "enqueued_at": enqueued_at,
+        "started_at": started_at,
+        "finished_at": finished_at,
+    }
+
+
+def enqueue_job(
+    workspace_id: str,
+    params: Optional[Dict[str, Any]] = None,
+    source: str = "cli"
+) -> Dict[str, Any]:
+    """
+    Queue a generation job (idempotent while the workspace has a queued job).
+
+    Args:
+        workspace_id: Workspace to generate for
+        params: build_video_package options (e.g. {"use_llm_curation": True})
+        source: Who enqueued it ("cli", "schedule", ...)
+
+    Returns:
+        The new job, or the workspace's already-queued job
+    """
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs WHERE workspace_id = ? AND status = ? "
+                f"ORDER BY rowid LIMIT 1",
+                (workspace_id, QUEUED)
+            ).fetchone()
+            if row:
+                return _job(row)
+
+            job_id = str(uuid.uuid4())
+            conn.execute(
+                "INSERT INTO jobs (job_id, workspace_id, status, params, source, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, workspace_id, QUEUED, json.dumps(params or {}), source, datetime.now().isoformat())
+            )
+            row = conn.execute(f"SELECT {_JOB_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+    return _job(row)
+
+
+def claim_job(worker: str) -> Optional[Dict[str, Any]]:
+    """
+    Atomically move the oldest queued job to "running".
+
+    Args:
+        worker: Worker identifier (host:pid)
+
+    Returns:
+        The claimed job, or None if the queue is empty
+    """
+    now = datetime.now().isoformat()
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            # BEGIN IMMEDIATE: other daemons cannot claim the same row
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs WHERE status = ? ORDER BY rowid LIMIT 1",
+                (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1, "
+                "started_at = ?, finished_at = NULL, heartbeat_at = ? WHERE job_id = ?",
+                (RUNNING, worker, now, time.time(), row[0])
+            )
+            row = conn.execute(f"SELECT {_JOB_COLUMNS} FROM jobs WHERE job_id = ?", (row[0],)).fetchone()
+    return _job(row)
+
+
+def heartbeat_job(job_id: str) -> None:
+    """Mark a running job as still alive."""
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE job_id = ? AND status = ?",
+                (time.time(), job_id, RUNNING)
+            )
+
+
+def complete_job(job_id: str, result: Dict[str, Any]) -> None:
+    """Record a finished job and its result summary."""
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, last_error = NULL, finished_at = ? WHERE job_id = ?",
+                (DONE, json.dumps(result), datetime.now().isoformat(), job_id)
+            )
+
+
+def fail_job(job_id: str, error: str) -> None:
+    """Record a job whose pipeline run raised."""
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, last_error = ?, finished_at = ? WHERE job_id = ?",
+                (FAILED, error, datetime.now().isoformat(), job_id)
+            )
+
+
+def release_job(job_id: str) -> None:
+    """Put a running job back in the queue (worker stopped before finishing it)."""
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = NULL, attempts = MAX(attempts - 1, 0) "
+                "WHERE job_id = ? AND status = ?",
+                (QUEUED, job_id, RUNNING)
+            )
+
+
+def recover_stale_jobs(stale_seconds: int = JOB_STALE_SECONDS) -> int:
+    """
+    Re-queue running jobs whose worker stopped sending heartbeats.
+
+    Jobs that already used MAX_JOB_ATTEMPTS attempts are failed instead.
+
+    Returns:
+        Number of jobs recovered (re-queued or failed)
+    """
+    cutoff = time.time() - stale_seconds
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            failed = conn.execute(
+                "UPDATE jobs SET status = ?, last_error = ?, finished_at = ? "
+                "WHERE status = ? AND heartbeat_at < ? AND attempts >= ?",
+                (FAILED, "Worker died while running (max attempts reached)", datetime.now().isoformat(),
+                 RUNNING, cutoff, MAX_JOB_ATTEMPTS)
+            ).rowcount
+            requeued = conn.execute(
+                "UPDATE jobs SET status = ?, worker = NULL, last_error = ? "
+                "WHERE status = ? AND heartbeat_at < ?",
+                (QUEUED, "Worker died while running (re-queued)", RUNNING, cutoff)
+            ).rowcount
+    if failed or requeued:
+        logger.warning(f"Recovered {requeued + failed} stale job(s): {requeued} re-queued, {failed} failed")
+    return failed + requeued
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Job by id or unique id prefix (None if missing or ambiguous)."""
+    with _lock:
+        rows = _get_connection().execute(
+            f"SELECT {_JOB_COLUMNS} FROM jobs WHERE job_id >= ? AND job_id < ? ORDER BY job_id LIMIT 2",
+            (job_id, job_id + "\uffff")
+        ).fetchall()
+    if rows and (rows[0][0] == job_id or len(rows) == 1):
+        return _job(rows[0])
+    return None
+
+
+def list_jobs(
+    status: Optional[str] = None,
+    workspace_id: Optional[str] = None,
+    limit: int = 20
+) -> List[Dict[str, Any]]:
+    """Most recent jobs first, optionally filtered by status/workspace."""
+    where = []
+    params: List[Any] = []
+    if status:
+        where.append("status = ?")
+        params.append(status)
+    if workspace_id:
+        where.append("workspace_id = ?")
+        params.append(workspace_id)
+    sql = f"SELECT {_JOB_COLUMNS} FROM jobs"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY rowid DESC LIMIT ?"
+    with _lock:
+        rows = _get_connection().execute(sql, params + [limit]).fetchall()
+    return [_job(row) for row in rows]
+
+
+def get_job_counts(workspace_id: Optional[str] = None) -> Dict[str, int]:
+    """Number of jobs per status."""
+    sql = "SELECT status, COUNT(*) FROM jobs"
+    params: List[Any] = []
+    if workspace_id:
+        sql += " WHERE workspace_id = ?"
+        params.append(workspace_id)
+    sql += " GROUP BY status"
+    with _lock:
+        rows = _get_connection().execute(sql, params).fetchall()
+    return dict(rows)
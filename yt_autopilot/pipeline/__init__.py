@@ -9,6 +9,9 @@ Content Strategy Focus (Phase 1 Refactor):
 
 Available modules:
 - build_video_package: Editorial brain orchestrator (AI-driven strategy)
+- batch_generation: Parallel build_video_package runs across workspaces
+- generation_daemon: Resident worker for the generation job queue
+- offline_benchmark: Timed record/replay runs of the linear and coordinator paths
 """
 
 from yt_autopilot.pipeline.build_video_package import build_video_package
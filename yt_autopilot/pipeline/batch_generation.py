@@ -0,0 +1,240 @@
+"""
+Batch Generation: runs build_video_package for many workspaces in parallel.
+
+`run.py generate` builds one package for the active workspace. A day's batch
+for several channels is mostly LLM and trend-API wait time, so running the
+workspaces side by side on a process pool takes roughly as long as the
+slowest workspace instead of the sum of all of them.
+
+How a batch runs:
+- Trend snapshots: trends are fetched once per vertical (in parallel, before
+  the pool starts) and handed to every workspace of that vertical, instead of
+  each run hitting YouTube/Reddit/HN for the same data
+- Process pool (spawn): each workspace runs in its own worker process with
+  its own pipeline state (AgentContext, llm_call_scope, prompt prefix)
+- LLM concurrency budget: one cross-process semaphore (services/llm_budget.py)
+  caps provider calls in flight across all workers, so N workers do not hit
+  provider rate limits N times harder
+- Approved scripts are saved for human review, exactly like `run.py generate`
+- A failing workspace is reported and does not stop the others
+
+Usage:
+    from yt_autopilot.pipeline.batch_generation import run_batch
+
+    report = run_batch(["tech_ai_creator", "gym_fitness_pro"], use_llm_curation=True)
+    for result in report["results"]:
+        print(result["workspace_id"], result["status"], result["title"])
+
+CLI:
+    python3 run.py generate --all-workspaces
+    python3 run.py generate --workspaces tech_ai_creator gym_fitness_pro --workers 4
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from yt_autopilot.core.logger import logger, log_fallback
+
+
+# Max worker processes (each runs one workspace at a time)
+BATCH_MAX_WORKERS = 4
+
+# Max LLM provider calls in flight across all workers
+BATCH_LLM_CONCURRENCY = 8
+
+
+def _fetch_trend_snapshots(vertical_ids: List[str]) -> Dict[str, Optional[List[Any]]]:
+    """
+    Fetches one trend pool per vertical, in parallel.
+
+    Returns:
+        vertical_id -> trends, or None if fetching failed (workers then fetch themselves)
+    """
+    from yt_autopilot.services.trend_source import fetch_trends
+
+    def _fetch(vertical_id: str) -> Optional[List[Any]]:
+        try:
+            return fetch_trends(vertical_id=vertical_id, use_real_apis=True)
+        except Exception as e:
+            log_fallback(
+                component="BATCH_GENERATION",
+                fallback_type="TREND_SNAPSHOT_FAILED",
+                reason=f"Trend snapshot for vertical '{vertical_id}' failed: {e}",
+                impact="LOW"
+            )
+            return None
+
+    if not vertical_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(vertical_ids), thread_name_prefix="trend-snapshot") as pool:
+        return dict(zip(vertical_ids, pool.map(_fetch, vertical_ids)))
+
+
+def _failed_result(error: str, duration_seconds: float = 0.0) -> Dict[str, Any]:
+    """Result entry for a workspace that produced no package."""
+    return {
+        "status": "FAILED",
+        "title": None,
+        "script_id": None,
+        "rejection_reason": None,
+        "error": error,
+        "duration_seconds": duration_seconds,
+        "worker_pid": None,
+        "llm_calls": 0,
+        "llm_wait_ms": 0.0,
+    }
+
+
+def _init_worker(budget: Any, llm_concurrency: int) -> None:
+    """Pool initializer: joins the batch-wide LLM concurrency budget."""
+    from yt_autopilot.services.llm_budget import install_llm_budget
+    install_llm_budget(budget, llm_concurrency)
+
+
+def _generate_workspace(
+    workspace_id: str,
+    trends: Optional[List[Any]],
+    use_real_trends: bool,
+    use_llm_curation: bool,
+    trace: bool
+) -> Dict[str, Any]:
+    """
+    Worker entry point: one workspace, one pipeline run.
+
+    Returns:
+        run_generation_job() result plus worker pid and LLM budget usage.
+        Pipeline errors are returned as status "FAILED" (never raised).
+    """
+    from yt_autopilot.pipeline.generation_daemon import run_generation_job
+    from yt_autopilot.services.llm_budget import get_llm_budget_stats
+
+    started = time.perf_counter()
+    budget_before = get_llm_budget_stats()
+    job = {
+        "workspace_id": workspace_id,
+        "params": {"use_real_trends": use_real_trends, "use_llm_curation": use_llm_curation, "trace": trace},
+    }
+    try:
+        result = run_generation_job(job, trends=trends)
+        result["error"] = None
+    except Exception as e:
+        logger.error(f"✗ Batch: {workspace_id} failed: {e}")
+        result = _failed_result(f"{type(e).__name__}: {e}", round(time.perf_counter() - started, 1))
+
+    budget_after = get_llm_budget_stats()
+    result["worker_pid"] = os.getpid()
+    result["llm_calls"] = budget_after["calls"] - budget_before["calls"]
+    result["llm_wait_ms"] = round(budget_after["wait_ms"] - budget_before["wait_ms"], 1)
+    return result
+
+
+def run_batch(
+    workspace_ids: List[str],
+    use_real_trends: bool = True,
+    use_llm_curation: bool = False,
+    max_workers: int = BATCH_MAX_WORKERS,
+    llm_concurrency: int = BATCH_LLM_CONCURRENCY,
+    trace: bool = False
+) -> Dict[str, Any]:
+    """
+    Generates one video package per workspace on a process pool.
+
+    Args:
+        workspace_ids: Workspaces to generate for
+        use_real_trends: Fetch real trends (one snapshot per vertical); False = mock trends
+        use_llm_curation: Use LLM trend curation (Phase B)
+        max_workers: Max worker processes
+        llm_concurrency: Max LLM provider calls in flight across all workers
+        trace: Write a trace per workspace (build_video_package(trace=True))
+
+    Returns:
+        Consolidated report: results (one per workspace, input order), workers,
+        llm_concurrency, trend_snapshots (vertical -> trend count),
+        trend_fetch_seconds, wall_seconds, sum_seconds
+    """
+    from yt_autopilot.core.workspace_manager import list_workspaces
+    from yt_autopilot.services.llm_budget import create_llm_budget
+
+    batch_started = time.perf_counter()
+    verticals = {ws["workspace_id"]: ws["vertical_id"] for ws in list_workspaces()}
+
+    workspace_ids = list(dict.fromkeys(workspace_ids))
+    results: Dict[str, Dict[str, Any]] = {
+        workspace_id: _failed_result("Workspace not found")
+        for workspace_id in workspace_ids if workspace_id not in verticals
+    }
+    runnable = [workspace_id for workspace_id in workspace_ids if workspace_id in verticals]
+
+    workers = max(1, min(max_workers, len(runnable)))
+    logger.info("=" * 70)
+    logger.info(f"BATCH GENERATION: {len(runnable)} workspace(s), {workers} worker(s), "
+                f"LLM budget {llm_concurrency} concurrent calls")
+    logger.info("=" * 70)
+
+    snapshots: Dict[str, Optional[List[Any]]] = {}
+    trend_fetch_started = time.perf_counter()
+    if use_real_trends and runnable:
+        vertical_ids = sorted({verticals[ws] for ws in runnable})
+        logger.info(f"Fetching trend snapshots for {len(vertical_ids)} vertical(s): {', '.join(vertical_ids)}")
+        snapshots = _fetch_trend_snapshots(vertical_ids)
+    trend_fetch_seconds = time.perf_counter() - trend_fetch_started
+
+    if runnable:
+        # spawn: workers must not inherit the parent's threads/locks (trend fetch pool, loggers)
+        mp_context = multiprocessing.get_context("spawn")
+        budget = create_llm_budget(llm_concurrency, mp_context)
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(budget, llm_concurrency)
+        )
+        try:
+            futures = {
+                executor.submit(
+                    _generate_workspace,
+                    workspace_id,
+                    snapshots.get(verticals[workspace_id]),
+                    use_real_trends,
+                    use_llm_curation,
+                    trace
+                ): workspace_id
+                for workspace_id in runnable
+            }
+            for future in as_completed(futures):
+                workspace_id = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker process died (e.g. killed, out of memory)
+                    result = _failed_result(f"Worker crashed: {type(e).__name__}: {e}")
+                results[workspace_id] = result
+                logger.info(f"  [{len(results)}/{len(workspace_ids)}] {workspace_id}: {result['status']} "
+                            f"in {result['duration_seconds']}s")
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+    ordered = []
+    for workspace_id in workspace_ids:
+        result = dict(results[workspace_id])
+        result["workspace_id"] = workspace_id
+        result["vertical_id"] = verticals.get(workspace_id)
+        ordered.append(result)
+
+    return {
+        "results": ordered,
+        "workers": workers,
+        "llm_concurrency": llm_concurrency,
+        "trend_snapshots": {
+            vertical_id: (len(trends) if trends is not None else None)
+            for vertical_id, trends in snapshots.items()
+        },
+        "trend_fetch_seconds": round(trend_fetch_seconds, 1),
+        "wall_seconds": round(time.perf_counter() - batch_started, 1),
+        "sum_seconds": round(sum(r["duration_seconds"] for r in ordered), 1),
+    }
@@ -12,6 +12,8 @@ NEW (Workspace System): Multi-workspace support for managing multiple YouTube ch
 with different verticals, brand identities, and configurations.
 """
 
+import uuid
+from contextlib import nullcontext
 from typing import List, Dict, Optional
 from yt_autopilot.core.schemas import (
     TrendCandidate,
@@ -29,6 +31,11 @@ from yt_autopilot.core.workspace_manager import (
     update_workspace_recent_titles
 )
 from yt_autopilot.core.logger import logger, truncate_for_log, log_fallback
+from yt_autopilot.core.run_context import llm_call_scope, update_llm_call_scope, get_llm_call_scope
+from yt_autopilot.core.tracing import tracing, span, trace_step, format_flame_summary
+from yt_autopilot.core.prompt_prefix import (
+    build_workspace_prompt_prefix, get_active_prompt_prefix, PROMPT_CACHE_MIN_TOKENS
+)
 
 # Import agents
 from yt_autopilot.agents.editorial_strategist import decide_editorial_strategy
@@ -39,14 +46,14 @@ from yt_autopilot.agents.narrative_architect import design_narrative_arc, expand
 from yt_autopilot.agents.cta_strategist import design_cta_strategy  # Fase 2 Sprint 1: CTA placement
 from yt_autopilot.agents.content_depth_strategist import analyze_content_depth  # NEW: AI-driven bullets count
 from yt_autopilot.agents.trend_hunter import generate_video_plan
-from yt_autopilot.agents.script_writer import write_script, _build_persona_aware_prompt  # Step 09: narrator persona
+from yt_autopilot.agents.script_writer import write_script, stream_llm_suggestion, _build_persona_aware_prompt  # Step 09: narrator persona
 from yt_autopilot.agents.visual_planner import generate_visual_plan
 from yt_autopilot.agents.seo_manager import generate_publishing_package
 from yt_autopilot.agents.quality_reviewer import review
 from yt_autopilot.agents.monetization_qa import validate_monetization_readiness  # Monetization Refactor
 
 # Import services (Step 06-fullrun: LLM integration)
-from yt_autopilot.services.llm_router import generate_text
+from yt_autopilot.services.llm_router import generate_text, stream_text, is_streaming_enabled
 
 # Phase B: LLM-powered trend curation
 from yt_autopilot.services.llm_trend_curator import curate_trends_with_llm
@@ -65,7 +72,7 @@ from yt_autopilot.core.config import get_vertical_config, LOG_TRUNCATE_REASONING
 
 # VALIDATORS (AI-Driven Quality Framework)
 from yt_autopilot.core.config_validator import ConfigAuthorityEnforcer
-from yt_autopilot.core.language_validator import wrap_llm_with_language_enforcement, LanguageValidator
+from yt_autopilot.core.language_validator import wrap_llm_with_language_enforcement, enforce_language, LanguageValidator
 from yt_autopilot.core.format_validator import validate_and_enforce_format
 
 
@@ -409,7 +416,9 @@ def build_video_package(
     workspace_id: Optional[str] = None,
     use_real_trends: bool = False,
     use_llm_curation: bool = False,
-    use_coordinator: bool = False  # NEW: Phase A4 - Use AgentCoordinator for standardized execution
+    use_coordinator: bool = False,  # NEW: Phase A4 - Use AgentCoordinator for standardized execution
+    trends: Optional[List[TrendCandidate]] = None,
+    trace: bool = False
 ) -> ContentPackage:
     """
     Orchestrates the full editorial pipeline to produce a ContentPackage.
@@ -440,6 +449,10 @@ def build_video_package(
         use_real_trends: If True, fetch real trends from APIs; if False, use mocks
         use_llm_curation: If True, use LLM to curate top 10 trends (Phase B); if False, use Phase A filtering only
         use_coordinator: If True, use AgentCoordinator for standardized execution (Phase A4); if False, use legacy path
+        trends: Pre-fetched trend pool for the workspace's vertical (skips step 2 fetching).
+                Batch generation fetches one snapshot per vertical and shares it.
+        trace: If True, record timing spans (steps, agents, LLM calls, gates) and write
+               a Chrome trace + flame summary under data/traces/ (core/tracing.py)
 
     Returns:
         ContentPackage object with status "APPROVED" or "REJECTED"
@@ -459,6 +472,100 @@ def build_video_package(
         - LLM evaluates top 30 trends for educational value, brand fit, timing
         - Selects top 10 curated trends
         - Cost: ~$0.01 per curation (cheap for high-value filtering)
+
+    Usage Accounting:
+        - Every LLM call made during the run is attributed to workspace_id and
+          a per-run execution_id (services/llm_usage.py, `run.py usage`)
+
+    Prompt Prefix:
+        - The workspace CHANNEL PROFILE is rendered once per run and sent as the
+          provider-cached prefix of every LLM call (core/prompt_prefix.py);
+          prefix savings are logged at the end of the run
+
+    Tracing:
+        - trace=True writes <run>.trace.json (chrome://tracing, ui.perfetto.dev) and
+          <run>.folded (flamegraph.pl / speedscope); the top stacks by self time
+          are logged at the end of the run (also when the run fails)
+    """
+    execution_id = str(uuid.uuid4())
+    trace_scope = tracing("build_video_package", trace_id=execution_id) if trace else nullcontext()
+
+    with trace_scope as tracer, llm_call_scope(workspace_id=workspace_id, execution_id=execution_id):
+        try:
+            with span("build_video_package", use_llm_curation=use_llm_curation):
+                return _build_video_package(
+                    workspace_id=workspace_id,
+                    use_real_trends=use_real_trends,
+                    use_llm_curation=use_llm_curation,
+                    use_coordinator=use_coordinator,
+                    execution_id=execution_id,
+                    trends=trends
+                )
+        finally:
+            _log_prompt_prefix_savings()
+            if tracer is not None:
+                _write_trace(tracer)
+
+
+def _write_trace(tracer) -> None:
+    """
+    Writes the run's trace files and logs where the time went.
+    """
+    tracer.metadata["workspace_id"] = get_llm_call_scope().get("workspace_id")
+    try:
+        paths = tracer.write()
+    except OSError as e:
+        log_fallback(
+            component="PIPELINE_TRACING",
+            fallback_type="TRACE_NOT_WRITTEN",
+            reason=f"Trace files could not be written: {e}",
+            impact="LOW"
+        )
+        return
+
+    logger.info("=" * 70)
+    logger.info(f"TRACE {tracer.trace_id} ({len(tracer.spans)} spans)")
+    logger.info(f"  Chrome trace: {paths['trace']} (open in chrome://tracing or ui.perfetto.dev)")
+    logger.info(f"  Flame stacks: {paths['folded']}")
+    for line in format_flame_summary(tracer.flame_summary()):
+        logger.info(f"  {line}")
+    logger.info("=" * 70)
+
+
+def _log_prompt_prefix_savings() -> None:
+    """
+    Logs per-run prompt prefix reuse (tokens not repeated inline, provider cache hits).
+    """
+    prompt_prefix = get_active_prompt_prefix()
+    if not prompt_prefix or not prompt_prefix.cacheable:
+        return
+
+    report = prompt_prefix.savings_report()
+    logger.info(
+        f"Prompt prefix {report['prefix_hash']}: ~{report['prefix_tokens']} tokens, "
+        f"sent with {report['calls']} LLM calls"
+    )
+    logger.info(
+        f"  Inline workspace blocks replaced: {report['block_references']} "
+        f"(~{report['inline_tokens_saved']} tokens saved)"
+    )
+    logger.info(
+        f"  Provider-cached prefix tokens: {report['provider_cached_tokens']} "
+        f"(cache hit ratio {report['cache_hit_ratio']:.0%})"
+    )
+    logger.info(f"  Net uncached tokens saved: {report['net_uncached_tokens_saved']}")
+
+
+def _build_video_package(
+    workspace_id: Optional[str],
+    use_real_trends: bool,
+    use_llm_curation: bool,
+    use_coordinator: bool,
+    execution_id: str,
+    trends: Optional[List[TrendCandidate]] = None
+) -> ContentPackage:
+    """
+    Runs the editorial pipeline for build_video_package() inside its LLM call scope.
     """
     logger.info("=" * 70)
     logger.info("STARTING EDITORIAL PIPELINE: build_video_package()")
@@ -466,6 +573,7 @@ def build_video_package(
 
     # Step 1: Load workspace configuration
     logger.info("Step 1: Loading workspace configuration...")
+    trace_step("Step 1: Loading workspace configuration")
 
     if workspace_id:
         workspace = load_workspace_config(workspace_id)
@@ -474,6 +582,7 @@ def build_video_package(
         workspace = get_active_workspace()
         workspace_id = workspace['workspace_id']
         logger.info(f"Using active workspace: {workspace['workspace_name']} ({workspace_id})")
+        update_llm_call_scope(workspace_id=workspace_id)
 
     vertical_id = workspace['vertical_id']
 
@@ -521,6 +630,24 @@ def build_video_package(
         component_name="pipeline"
     )
     logger.info(f"✅ Language validator active - all LLM outputs will be validated for {target_language} consistency")
+
+    # Streaming for long-form generation (script, narrative expansion):
+    # scenes are validated as they arrive, bad streams are aborted early, and
+    # completed streams get the same language enforcement as llm_generate_fn
+    llm_stream_fn = stream_text if is_streaming_enabled() else None
+    if llm_stream_fn:
+        logger.info("✅ LLM streaming active for script generation and narrative expansion")
+
+    # Stable per-workspace prompt prefix: built once, sent first in the agent calls that reference it
+    prompt_prefix = build_workspace_prompt_prefix(workspace)
+    update_llm_call_scope(prompt_prefix=prompt_prefix)
+    if prompt_prefix.cacheable:
+        logger.info(f"✅ Prompt prefix {prompt_prefix.prefix_hash[:12]} (~{prompt_prefix.est_tokens} tokens) shared by workspace-aware agents")
+    else:
+        logger.info(
+            f"Prompt prefix {prompt_prefix.prefix_hash[:12]} (~{prompt_prefix.est_tokens} tokens) below the "
+            f"{PROMPT_CACHE_MIN_TOKENS}-token provider cache minimum - agents inline workspace blocks"
+        )
     logger.info("")
 
     # Use workspace as memory (compatible with existing agent interfaces)
@@ -528,8 +655,13 @@ def build_video_package(
 
     # Step 2: Fetch trending topics (Phase A: quality filtering applied automatically)
     logger.info(f"Step 2: Fetching trending topics (vertical: {vertical_id})...")
+    trace_step(f"Step 2: Fetching trending topics (vertical: {vertical_id})")
 
-    if use_real_trends:
+    if trends is not None:
+        # Shared snapshot (batch generation): copy so this run cannot alter it
+        trends = list(trends)
+        logger.info(f"✓ Using shared trend snapshot ({len(trends)} quality-filtered trends)")
+    elif use_real_trends:
         logger.info("  Using REAL trend APIs (YouTube + Reddit + Hacker News)")
         logger.info("  Phase A filters: spam detection + quality thresholds + deduplication")
         trends = fetch_trends(vertical_id=vertical_id, use_real_apis=True)
@@ -545,6 +677,7 @@ def build_video_package(
     # Step 2.5: LLM Curation (Phase B - OPTIONAL)
     if use_llm_curation and len(trends) > 10:
         logger.info("Step 2.5: Running LLM curation (Phase B)...")
+        trace_step("Step 2.5: Running LLM curation (Phase B)")
         logger.info(f"  Input: {len(trends)} quality-filtered trends")
         logger.info("  LLM will evaluate trends for: educational value, brand fit, timing, virality")
         logger.info("  Output: Top 10 curated trends")
@@ -581,6 +714,7 @@ def build_video_package(
 
     # Step 3: TrendHunter - select best topic (Phase A source weighting applied)
     logger.info("Step 3: Running TrendHunter to select best topic...")
+    trace_step("Step 3: Running TrendHunter to select best topic")
     logger.info("  Phase A source weighting: Reddit 4x > Channels 3x > HN 2x > YouTube 1x")
     logger.info("  Enhanced scoring: Real statistics (views, engagement, recency)")
     logger.info("  Language boost: +0.15 for content matching workspace language")
@@ -624,6 +758,7 @@ def build_video_package(
 
     if use_ai_selection and len(top_candidates) >= 3:
         logger.info("Step 3.2: Running AI-assisted final selection (Phase C)...")
+        trace_step("Step 3.2: Running AI-assisted final selection (Phase C)")
         logger.info(f"  Evaluating top {len(top_candidates)} candidates with LLM")
 
         try:
@@ -842,9 +977,13 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
     else:
         logger.info("Step 3.2: AI-assisted selection disabled (use_ai_selection=False)")
 
+    # Final result of each validation gate (aggregated into a report after Gate 4)
+    gate_results = {}
+
     # Step 3.3: Editorial Strategist - AI-driven strategic decision (NEW)
     logger.info("=" * 70)
     logger.info("Step 3.3: Running Editorial Strategist (AI-driven strategy)...")
+    trace_step("Step 3.3: Running Editorial Strategist (AI-driven strategy)")
     logger.info("=" * 70)
 
     # Find the selected trend from top_candidates
@@ -900,7 +1039,6 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
 
         # Import AgentCoordinator and AgentContext
         from yt_autopilot.core.agent_coordinator import AgentCoordinator, AgentContext
-        import uuid
 
         # Create AgentContext with all pipeline state
         context = AgentContext(
@@ -908,7 +1046,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
             video_plan=video_plan,
             llm_generate_fn=llm_generate_fn,
             workspace_id=workspace_id,
-            execution_id=str(uuid.uuid4()),
+            execution_id=execution_id,
             selected_trend=selected_trend,
             top_candidates=top_candidates,
             performance_history=performance_history,
@@ -1038,6 +1176,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
             )
 
             log_validation_result(gate1_result, gate_number=1)
+            gate_results["gate_1"] = gate1_result
 
             if not gate1_result.is_valid:
                 blocking_issues = gate1_result.get_blocking_issues()
@@ -1066,6 +1205,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
     # Step 3.6: Duration Strategist - AI-driven duration for monetization (NEW)
     logger.info("=" * 70)
     logger.info("Step 3.6: Running Duration Strategist (AI-driven monetization)...")
+    trace_step("Step 3.6: Running Duration Strategist (AI-driven monetization)")
     logger.info("=" * 70)
 
     if selected_trend and editorial_decision:
@@ -1100,6 +1240,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
     # Step 3.6.5: Format Reconciler - Arbitrate duration divergences (Fase 2 Sprint 1)
     logger.info("=" * 70)
     logger.info("Step 3.6.5: Running Format Reconciler (duration arbitration)...")
+    trace_step("Step 3.6.5: Running Format Reconciler (duration arbitration)")
     logger.info("=" * 70)
 
     # Phase C - P0: Initialize timeline (single source of truth for duration)
@@ -1146,6 +1287,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
             )
 
             log_validation_result(gate2_result, gate_number=2)
+            gate_results["gate_2"] = gate2_result
 
             if not gate2_result.is_valid:
                 blocking_issues = gate2_result.get_blocking_issues()
@@ -1214,6 +1356,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
     # Step 3.7: Content Depth Strategist - AI-driven bullets count optimization (MOVED BEFORE NARRATIVE)
     logger.info("=" * 70)
     logger.info("Step 3.7: Running Content Depth Strategist (bullets count optimization)...")
+    trace_step("Step 3.7: Running Content Depth Strategist (bullets count optimization)")
     logger.info("=" * 70)
 
     if editorial_decision and duration_strategy:
@@ -1258,6 +1401,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
     # Step 3.7.5: Narrative Architect - AI-driven emotional storytelling (WITH bullet constraint)
     logger.info("=" * 70)
     logger.info("Step 3.7.5: Running Narrative Architect (emotional storytelling)...")
+    trace_step("Step 3.7.5: Running Narrative Architect (emotional storytelling)")
     logger.info("=" * 70)
 
     if editorial_decision and duration_strategy:
@@ -1285,7 +1429,8 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
             narrative_arc=narrative_arc,
             target_duration=timeline.reconciled_duration if timeline else duration_strategy['target_duration_seconds'],
             target_language=workspace.get('target_language', 'en'),
-            llm_generate_fn=llm_generate_fn
+            llm_generate_fn=llm_generate_fn,
+            llm_stream_fn=llm_stream_fn
         )
     else:
         logger.warning("Skipping Narrative Architect (no editorial/duration strategy)")
@@ -1294,6 +1439,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
     # Step 3.7.6: CTA Strategist - Strategic CTA placement (Fase 2 Sprint 1)
     logger.info("=" * 70)
     logger.info("Step 3.7.6: Running CTA Strategist (mid-roll CTA placement)...")
+    trace_step("Step 3.7.6: Running CTA Strategist (mid-roll CTA placement)")
     logger.info("=" * 70)
 
     if editorial_decision and duration_strategy and narrative_arc:
@@ -1345,7 +1491,6 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
             regenerate_script_with_cta_fix
         )
         from yt_autopilot.core.config import load_validation_thresholds
-        from yt_autopilot.core.logger import log_fallback
 
         # Load quality validation thresholds
         format_type = duration_strategy.get('format_type') if duration_strategy else None
@@ -1453,6 +1598,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
     # NOTE: If editorial_decision is available, use its serie_concept instead of auto-detection
     logger.info("=" * 70)
     logger.info("Step 3.8: Detecting series format...")
+    trace_step("Step 3.8: Detecting series format")
     logger.info("=" * 70)
 
     if editorial_decision:
@@ -1484,6 +1630,7 @@ Return ONLY a JSON object. ALL text fields MUST be in {language_instruction}."""
 
     # Step 4: ScriptWriter - generate script (NEW: with LLM integration)
     logger.info("Step 4: Running ScriptWriter to generate script...")
+    trace_step("Step 4: Running ScriptWriter to generate script")
 
     # NEW (Step 06-fullrun): Call LLM for creative script suggestion
     logger.info("  Step 4a: Calling LLM for creative script generation...")
@@ -1619,16 +1766,37 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
     """.strip()
 
     # Generate LLM suggestion (same for both narrator-aware and legacy paths)
-    llm_suggestion = llm_generate_fn(
-        role="script_writer",
-        task=llm_task,
-        context=llm_context,
-        style_hints={
-            "language": video_plan.language,
-            "brand_tone": brand_tone,
-            "target_audience": video_plan.target_audience
-        }
-    )
+    script_style_hints = {
+        "language": video_plan.language,
+        "brand_tone": brand_tone,
+        "target_audience": video_plan.target_audience
+    }
+    llm_suggestion = None
+    if llm_stream_fn:
+        llm_suggestion = stream_llm_suggestion(
+            llm_stream_fn,
+            task=llm_task,
+            context=llm_context,
+            style_hints=script_style_hints,
+            target_language=target_language,
+            target_duration_seconds=timeline.reconciled_duration if timeline else duration_strategy['target_duration_seconds']
+        )
+        if llm_suggestion is not None:
+            llm_suggestion = enforce_language(
+                llm_suggestion,
+                role="script_writer",
+                target_language=target_language,
+                llm_generate_fn=generate_text,
+                context=llm_context,
+                component_name="pipeline"
+            )
+    if llm_suggestion is None:
+        llm_suggestion = llm_generate_fn(
+            role="script_writer",
+            task=llm_task,
+            context=llm_context,
+            style_hints=script_style_hints
+        )
 
     logger.info(f"  ✓ LLM suggestion received ({len(llm_suggestion)} chars)")
 
@@ -1703,7 +1871,8 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
                     target_duration=target_duration,
                     target_language=workspace.get('target_language', 'en'),
                     llm_generate_fn=llm_generate_fn,
-                    max_attempts=3  # More attempts than initial expansion (was 2)
+                    max_attempts=3,  # More attempts than initial expansion (was 2)
+                    llm_stream_fn=llm_stream_fn
                 )
 
                 # Regenerate script with expanded narrative
@@ -1815,6 +1984,7 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
                     for issue in blocking_issues[:3]:  # Show first 3 issues
                         logger.warning(f"   • {issue.message}")
 
+        gate_results["gate_3"] = gate3_result
         logger.info("✅ Gate 3 validation passed - Script quality verified")
     else:
         logger.info("⚙️ Gate 3 (Post-Script) disabled in config - skipping validation")
@@ -1876,6 +2046,7 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
 
     # Step 5: VisualPlanner - create visual scenes
     logger.info("Step 5: Running VisualPlanner to create visual plan...")
+    trace_step("Step 5: Running VisualPlanner to create visual plan")
     # Step 09: Pass workspace_config for visual brand manual (color palette enforcement)
     # MONETIZATION REFACTOR: Pass duration_strategy for format-aware scene generation
     # Phase C - P2.2: Pass Timeline object for duration enforcement
@@ -1937,6 +2108,7 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
         )
 
         log_validation_result(gate4_result, gate_number=4)
+        gate_results["gate_4"] = gate4_result
 
         if not gate4_result.is_valid:
             blocking_issues = gate4_result.get_blocking_issues()
@@ -1968,11 +2140,16 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
     else:
         logger.info("⚙️ Gate 4 (Post-Visual) disabled in config - skipping validation")
 
+    if gate_results:
+        from yt_autopilot.core.pipeline_validator import PipelineValidationReport, log_validation_report
+        log_validation_report(PipelineValidationReport.from_results(gate_results))
+
     logger.info("")
     # ========== END GATE 4 ==========
 
     # Step 6: SeoManager - optimize metadata
     logger.info("Step 6: Running SeoManager to optimize metadata...")
+    trace_step("Step 6: Running SeoManager to optimize metadata")
     publishing = generate_publishing_package(video_plan, script)
     logger.info(f"✓ Publishing package created")
     logger.info(f"  Title: '{publishing.final_title}' ({len(publishing.final_title)} chars)")
@@ -1981,6 +2158,7 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
 
     # Step 7: QualityReviewer - first pass
     logger.info("Step 7: Running QualityReviewer (first pass)...")
+    trace_step("Step 7: Running QualityReviewer (first pass)")
     approved, reason = review(video_plan, script, visual_plan, publishing, memory, llm_generate_fn=llm_generate_fn)
 
     if approved:
@@ -1991,6 +2169,7 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
 
         # Step 8: Attempt ONE revision
         logger.info("Step 8: Attempting revision to address feedback...")
+        trace_step("Step 8: Attempting revision to address feedback")
 
         # Improve script based on feedback
         revised_script = _attempt_script_improvement(script, reason, video_plan, memory)
@@ -2064,6 +2243,7 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
 
     # Step 8: Monetization QA - final validation (NEW: Monetization Refactor)
     logger.info("Step 8: Running Monetization QA (YouTube monetization readiness)...")
+    trace_step("Step 8: Running Monetization QA (YouTube monetization readiness)")
 
     monetization_approved, monetization_feedback, monetization_scores = validate_monetization_readiness(
         plan=video_plan,
@@ -2196,6 +2376,7 @@ IMPORTANTE - STILE CREATOR (Step 07.2):
 
     # Step 9: Package APPROVED - update workspace
     logger.info("Step 9: Package APPROVED - updating workspace configuration...")
+    trace_step("Step 9: Updating workspace configuration")
 
     # Add title to recent titles to avoid repetition
     update_workspace_recent_titles(workspace_id, publishing.final_title, max_titles=50)
@@ -0,0 +1,292 @@
+"""
+Generation Daemon: resident worker that runs queued video generation jobs.
+
+`run.py generate` is a cold process: it imports the whole agent/service
+stack, loads provider SDKs, series formats and the embedding model, then
+exits. The daemon pays that cost once and then takes jobs from the durable
+job queue (io/job_queue.py) one at a time, in the same process.
+
+Warm state kept across jobs:
+- Pipeline, agents and services modules (imported once)
+- Provider SDK modules for every configured LLM key (openai / anthropic)
+- Embedding model used by the content index (sentence-transformers or the
+  hashed fallback)
+- Series formats (core/series_manager caches parsed YAML by file mtime)
+- Vertical configs
+
+Scheduling (optional, APScheduler):
+- `--schedule WORKSPACE_ID="CRON"` enqueues a job for that workspace on a
+  5-field crontab schedule (e.g. "0 8 * * *"); enqueueing is idempotent per
+  workspace, so a slow pipeline never builds a backlog
+- Without APScheduler installed, schedules are skipped (log_fallback) and the
+  daemon still drains jobs enqueued with `run.py jobs enqueue`
+
+Stopping:
+- SIGINT/SIGTERM: finish the current job, then exit
+- Second signal: abort; the running job goes back to the queue
+
+Usage:
+    python3 run.py daemon --schedule tech_ai_creator="0 8 * * *"
+    python3 run.py jobs enqueue --workspace-id gym_fitness_pro
+    python3 run.py jobs status
+"""
+
+import os
+import signal
+import socket
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from yt_autopilot.core.logger import logger, log_fallback
+from yt_autopilot.io import job_queue
+
+
+# Seconds between queue polls while idle
+DAEMON_POLL_SECONDS = 5
+
+# Seconds between heartbeats for the running job (must stay well below
+# job_queue.JOB_STALE_SECONDS)
+HEARTBEAT_SECONDS = 30
+
+# Days ahead proposed as publish date for approved scripts (same as run.py generate)
+PROPOSED_PUBLISH_DAYS = 2
+
+
+def warm_up() -> Dict[str, float]:
+    """
+    Loads the state every generation job needs, once per process.
+
+    Returns:
+        Component name -> load time in ms
+    """
+    timings = {}
+
+    def _timed(name, fn):
+        started = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            log_fallback(
+                component="GENERATION_DAEMON_WARMUP",
+                fallback_type="WARMUP_SKIPPED",
+                reason=f"{name} could not be preloaded: {e}",
+                impact="LOW"
+            )
+        timings[name] = (time.perf_counter() - started) * 1000
+
+    def _pipeline():
+        import yt_autopilot.pipeline.build_video_package  # noqa: F401 (agents + services)
+
+    def _llm_sdks():
+        from yt_autopilot.core.config import get_llm_openai_key, get_llm_anthropic_key
+        if get_llm_openai_key():
+            import openai  # noqa: F401
+        if get_llm_anthropic_key():
+            import anthropic  # noqa: F401
+
+    def _embedder():
+        from yt_autopilot.io.content_index import _get_embedder
+        _get_embedder()
+
+    def _series_formats():
+        from yt_autopilot.core.series_manager import list_available_series, load_format
+        for serie_id in list_available_series():
+            load_format(serie_id)
+
+    def _vertical_configs():
+        from yt_autopilot.core.config import get_vertical_configs
+        get_vertical_configs()
+
+    _timed("pipeline", _pipeline)
+    _timed("llm_sdks", _llm_sdks)
+    _timed("embedder", _embedder)
+    _timed("series_formats", _series_formats)
+    _timed("vertical_configs", _vertical_configs)
+    return timings
+
+
+def run_generation_job(job: Dict[str, Any], trends: Optional[List[Any]] = None) -> Dict[str, Any]:
+    """
+    Runs the pipeline for one job and saves approved scripts for review.
+
+    Args:
+        job: Claimed job (workspace_id, params)
+        trends: Shared trend snapshot for the workspace's vertical (batch generation)
+
+    Returns:
+        Result summary (status, title, script_id, duration_seconds)
+    """
+    from yt_autopilot.pipeline.build_video_package import build_video_package
+    from yt_autopilot.io.datastore import save_script_draft
+
+    started = time.perf_counter()
+    params = job["params"]
+    package = build_video_package(
+        workspace_id=job["workspace_id"],
+        use_real_trends=params.get("use_real_trends", True),
+        use_llm_curation=params.get("use_llm_curation", False),
+        trends=trends,
+        trace=params.get("trace", False)
+    )
+
+    script_id = None
+    if package.status == "APPROVED":
+        proposed_datetime = (datetime.utcnow() + timedelta(days=PROPOSED_PUBLISH_DAYS)).isoformat() + "Z"
+        script_id = save_script_draft(
+            ready=package,
+            publish_datetime_iso=proposed_datetime,
+            workspace_id=job["workspace_id"]
+        )
+
+    return {
+        "status": package.status,
+        "title": package.video_plan.working_title,
+        "script_id": script_id,
+        "rejection_reason": getattr(package, "rejection_reason", None),
+        "duration_seconds": round(time.perf_counter() - started, 1),
+    }
+
+
+def parse_schedules(specs: List[str]) -> List[Tuple[str, str]]:
+    """
+    Parses `WORKSPACE_ID=CRON` schedule specs.
+
+    Args:
+        specs: e.g. ['tech_ai_creator=0 8 * * *']
+
+    Returns:
+        List of (workspace_id, crontab expression)
+
+    Raises:
+        ValueError: If a spec has no workspace id or cron expression is not 5 fields
+    """
+    schedules = []
+    for spec in specs:
+        workspace_id, _, cron = spec.partition("=")
+        workspace_id, cron = workspace_id.strip(), cron.strip().strip('"\'')
+        if not workspace_id or len(cron.split()) != 5:
+            raise ValueError(f"Invalid schedule '{spec}' (expected WORKSPACE_ID=\"m h dom mon dow\")")
+        schedules.append((workspace_id, cron))
+    return schedules
+
+
+def _start_scheduler(schedules: List[Tuple[str, str]], params: Dict[str, Any]):
+    """Starts APScheduler jobs that enqueue generation jobs (None if unavailable)."""
+    if not schedules:
+        return None
+    try:
+        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.triggers.cron import CronTrigger
+    except ImportError:
+        log_fallback(
+            component="GENERATION_DAEMON_SCHEDULER",
+            fallback_type="APSCHEDULER_MISSING",
+            reason="APScheduler not installed - schedules ignored, only queued jobs are processed",
+            impact="MEDIUM"
+        )
+        return None
+
+    scheduler = BackgroundScheduler()
+    for workspace_id, cron in schedules:
+        scheduler.add_job(
+            job_queue.enqueue_job,
+            CronTrigger.from_crontab(cron),
+            kwargs={"workspace_id": workspace_id, "params": params, "source": "schedule"},
+            id=f"generate:{workspace_id}",
+            replace_existing=True
+        )
+        logger.info(f"  ⏰ Scheduled {workspace_id}: {cron}")
+    scheduler.start()
+    return scheduler
+
+
+def _heartbeat_until(job_id: str, done: threading.Event) -> None:
+    while not done.wait(HEARTBEAT_SECONDS):
+        job_queue.heartbeat_job(job_id)
+
+
+def run_daemon(
+    schedules: Optional[List[Tuple[str, str]]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    poll_seconds: float = DAEMON_POLL_SECONDS,
+    max_jobs: Optional[int] = None,
+    exit_when_idle: bool = False
+) -> int:
+    """
+    Processes queued generation jobs until stopped.
+
+    Args:
+        schedules: (workspace_id, crontab) pairs to enqueue periodically
+        params: build_video_package options for scheduled jobs
+        poll_seconds: Idle wait between queue polls
+        max_jobs: Exit after this many jobs (None = run forever)
+        exit_when_idle: Exit as soon as the queue is empty (drain mode)
+
+    Returns:
+        Number of jobs processed
+    """
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    stop = threading.Event()
+
+    def _on_signal(signum, frame):
+        if stop.is_set():
+            raise KeyboardInterrupt
+        logger.info("Stop requested - finishing current job (signal again to abort)")
+        stop.set()
+
+    previous_handlers = {
+        sig: signal.signal(sig, _on_signal) for sig in (signal.SIGINT, signal.SIGTERM)
+    }
+
+    logger.info("=" * 70)
+    logger.info(f"GENERATION DAEMON {worker}")
+    logger.info("=" * 70)
+    timings = warm_up()
+    logger.info("  Warm-up: " + ", ".join(f"{name} {ms:.0f}ms" for name, ms in timings.items()))
+    scheduler = _start_scheduler(schedules or [], params or {})
+
+    processed = 0
+    try:
+        while not stop.is_set() and (max_jobs is None or processed < max_jobs):
+            job_queue.recover_stale_jobs()
+            job = job_queue.claim_job(worker)
+            if job is None:
+                if exit_when_idle:
+                    break
+                stop.wait(poll_seconds)
+                continue
+
+            logger.info(f"▶ Job {job['job_id'][:8]} - workspace {job['workspace_id']} "
+                        f"(attempt {job['attempts']}, source {job['source']})")
+            done = threading.Event()
+            threading.Thread(target=_heartbeat_until, args=(job["job_id"], done), daemon=True).start()
+            try:
+                result = run_generation_job(job)
+            except KeyboardInterrupt:
+                job_queue.release_job(job["job_id"])
+                logger.warning(f"Job {job['job_id'][:8]} aborted - returned to queue")
+                raise
+            except Exception as e:
+                job_queue.fail_job(job["job_id"], f"{type(e).__name__}: {e}")
+                logger.error(f"✗ Job {job['job_id'][:8]} failed: {e}")
+                logger.debug(traceback.format_exc())
+            else:
+                job_queue.complete_job(job["job_id"], result)
+                logger.info(f"✓ Job {job['job_id'][:8]} {result['status']} in {result['duration_seconds']}s: "
+                            f"{result['title']}")
+            finally:
+                done.set()
+            processed += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if scheduler is not None:
+            scheduler.shutdown(wait=False)
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+
+    logger.info(f"Generation daemon stopped after {processed} job(s)")
+    return processed
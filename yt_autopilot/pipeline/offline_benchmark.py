@@ -0,0 +1,546 @@
+"""
+Offline Benchmark: times build_video_package from recorded cassettes.
+
+Live runs cannot be compared: LLM latency, provider load and trend APIs
+change from one run to the next. The benchmark records one cassette per
+pipeline path (services/cassette.py) and then times replayed runs with no
+network at all, so two code versions can be compared on identical inputs.
+
+Paths:
+- linear: the default build_video_package flow
+- coordinator: the AgentCoordinator flow (use_coordinator=True)
+
+Each benchmark run:
+- Replays the path's cassette (latency_scale 0 = pure pipeline CPU time,
+  1.0 = recorded LLM/trend latency added back)
+- Blocks outbound connections (a run that still reaches the network shows
+  up as "blocked" in the report)
+- Restores the workspace config afterwards (approved runs update recent
+  titles, which would change the next run's prompts)
+- Writes LLM usage records to a temporary directory, not data/llm_usage.jsonl
+
+Warm-up runs are timed and reported separately (imports, series formats and
+validator memo caches make the first run in a process slower).
+
+Fixture cassettes (tests/fixtures/cassettes, name "offline") are recorded
+by record_fixture_cassettes(): fake providers (services/llm_fake_providers)
+answer each role with canned output in the format its agent parses, and the
+real trend sources return canned candidates, so the benchmark and its test
+run without API keys and both paths go through all validation gates to
+APPROVED. The coordinator path currently fails inside AgentCoordinator and
+finishes on the linear flow (build_video_package's own fallback); the
+cassette records that as-is. Record your own for realistic runs.
+
+Usage:
+    from yt_autopilot.pipeline.offline_benchmark import record_cassettes, run_benchmark
+
+    record_cassettes("tech_ai_creator")          # live run per path (API keys needed)
+    record_fixture_cassettes()                   # regenerate the committed fixtures
+    report = run_benchmark("tech_ai_creator", repeats=5)
+    for path, result in report["paths"].items():
+        print(path, result["median_seconds"])
+
+CLI:
+    python3 run.py bench record --workspace-id tech_ai_creator
+    python3 run.py bench replay --workspace-id tech_ai_creator --repeats 5 --latency-scale 1.0
+    python3 run.py bench replay --fixture
+"""
+
+import json
+import os
+import re
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from yt_autopilot.core.logger import logger, log_fallback
+
+
+# Pipeline path name -> build_video_package(use_coordinator=...)
+BENCHMARK_PATHS = {
+    "linear": False,
+    "coordinator": True,
+}
+
+# Timed runs per path (after warm-up)
+BENCHMARK_REPEATS = 3
+
+# Untimed-in-stats runs per path before the timed ones
+BENCHMARK_WARMUP = 1
+
+# Committed cassettes (fake providers, mock trends) for keyless runs and tests
+FIXTURE_CASSETTE_DIR = Path(__file__).resolve().parent.parent.parent / "tests" / "fixtures" / "cassettes"
+FIXTURE_CASSETTE_NAME = "offline"
+
+# Workspace the fixture cassettes are recorded for
+FIXTURE_WORKSPACE_ID = "tech_ai_creator"
+
+
+def get_cassette_name(name: str, path: str) -> str:
+    """Cassette name for one pipeline path of a benchmark (e.g. tech_ai_creator-linear)."""
+    return f"{name}-{path}"
+
+
+@contextmanager
+def _preserved_workspace(workspace_id: str) -> Iterator[None]:
+    """Restores the workspace config (recent titles, ...) when the block exits."""
+    from yt_autopilot.core.workspace_manager import load_workspace_config, save_workspace_config
+
+    saved_config = load_workspace_config(workspace_id)
+    try:
+        yield
+    finally:
+        save_workspace_config(workspace_id, saved_config)
+
+
+@contextmanager
+def _isolated_usage_log() -> Iterator[None]:
+    """Sends llm_usage records to a throwaway directory."""
+    saved = os.environ.get("LLM_USAGE_DIR")
+    with tempfile.TemporaryDirectory(prefix="bench-usage-") as usage_dir:
+        os.environ["LLM_USAGE_DIR"] = usage_dir
+        try:
+            yield
+        finally:
+            if saved is None:
+                os.environ.pop("LLM_USAGE_DIR", None)
+            else:
+                os.environ["LLM_USAGE_DIR"] = saved
+
+
+def _validate_paths(paths: Sequence[str]) -> List[str]:
+    unknown = [path for path in paths if path not in BENCHMARK_PATHS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark path(s): {', '.join(unknown)} "
+                         f"(available: {', '.join(BENCHMARK_PATHS)})")
+    return list(dict.fromkeys(paths))
+
+
+def record_cassettes(
+    workspace_id: str,
+    name: Optional[str] = None,
+    use_real_trends: bool = True,
+    use_llm_curation: bool = False,
+    paths: Sequence[str] = tuple(BENCHMARK_PATHS)
+) -> Dict[str, str]:
+    """
+    Runs the pipeline live once per path and records a cassette for each.
+
+    Args:
+        workspace_id: Workspace to generate for
+        name: Cassette name prefix (default: workspace_id)
+        use_real_trends: Record real trend-source responses (False = mock trends)
+        use_llm_curation: Use LLM trend curation (Phase B)
+        paths: Pipeline paths to record (keys of BENCHMARK_PATHS)
+
+    Returns:
+        path -> cassette file
+
+    Raises:
+        ValueError: If a path is unknown
+    """
+    from yt_autopilot.pipeline.build_video_package import build_video_package
+    from yt_autopilot.services.cassette import Cassette, recording
+
+    name = name or workspace_id
+    files = {}
+    for path in _validate_paths(paths):
+        logger.info("=" * 70)
+        logger.info(f"BENCHMARK RECORD: {workspace_id} / {path}")
+        logger.info("=" * 70)
+        cassette = Cassette(meta={
+            "workspace_id": workspace_id,
+            "path": path,
+            "use_real_trends": use_real_trends,
+            "use_llm_curation": use_llm_curation,
+        })
+        started = time.perf_counter()
+        with _preserved_workspace(workspace_id), recording(cassette):
+            try:
+                package = build_video_package(
+                    workspace_id=workspace_id,
+                    use_real_trends=use_real_trends,
+                    use_llm_curation=use_llm_curation,
+                    use_coordinator=BENCHMARK_PATHS[path]
+                )
+                cassette.meta["status"] = package.status
+            except Exception as e:
+                # A failing run is still saved: replaying it reproduces the failure offline
+                cassette.meta["status"] = "FAILED"
+                cassette.meta["error"] = f"{type(e).__name__}: {e}"
+                logger.error(f"✗ Benchmark record ({path}) failed: {cassette.meta['error']}")
+        cassette.meta["live_seconds"] = round(time.perf_counter() - started, 2)
+        files[path] = str(cassette.save(get_cassette_name(name, path)))
+    return files
+
+
+def _replay_run(cassette: Any, path: str, latency_scale: float) -> Dict[str, Any]:
+    """One timed, offline pipeline run from a cassette."""
+    from yt_autopilot.pipeline.build_video_package import build_video_package
+    from yt_autopilot.services.cassette import replaying, block_network
+
+    meta = cassette.meta
+    status, error = None, None
+    with _preserved_workspace(meta["workspace_id"]), _isolated_usage_log(), \
+            block_network() as network, replaying(cassette, latency_scale=latency_scale):
+        started = time.perf_counter()
+        try:
+            package = build_video_package(
+                workspace_id=meta["workspace_id"],
+                use_real_trends=meta.get("use_real_trends", True),
+                use_llm_curation=meta.get("use_llm_curation", False),
+                use_coordinator=BENCHMARK_PATHS[path]
+            )
+            status = package.status
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.error(f"✗ Benchmark run ({path}) failed: {error}")
+        seconds = time.perf_counter() - started
+
+    return {
+        "seconds": round(seconds, 3),
+        "status": status or "FAILED",
+        "error": error,
+        "network_blocked": network["blocked"],
+        **cassette.stats(),
+    }
+
+
+def run_benchmark(
+    name: str,
+    repeats: int = BENCHMARK_REPEATS,
+    warmup: int = BENCHMARK_WARMUP,
+    latency_scale: float = 0.0,
+    paths: Sequence[str] = tuple(BENCHMARK_PATHS),
+    cassette_dir: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Times replayed pipeline runs for each path.
+
+    Args:
+        name: Cassette name prefix used when recording (usually the workspace id)
+        repeats: Timed runs per path
+        warmup: Runs per path before the timed ones (reported as warmup_seconds)
+        latency_scale: Simulated service latency (0 = none, 1.0 = as recorded)
+        paths: Pipeline paths to benchmark (keys of BENCHMARK_PATHS)
+        cassette_dir: Directory to load cassettes from (default: data/cassettes
+            or $CASSETTE_DIR; FIXTURE_CASSETTE_DIR for the committed ones)
+
+    Returns:
+        Report: paths (path -> runs, warmup_seconds, min/median/mean/max_seconds,
+        statuses, replay counters of the last run), latency_scale, repeats
+
+    Raises:
+        ValueError: If a path is unknown
+        FileNotFoundError: If a path has no recorded cassette
+    """
+    from yt_autopilot.services.cassette import Cassette
+
+    cassettes = {
+        path: Cassette.load(
+            Path(cassette_dir) / f"{get_cassette_name(name, path)}.json" if cassette_dir
+            else get_cassette_name(name, path)
+        )
+        for path in _validate_paths(paths)
+    }
+
+    report: Dict[str, Any] = {"name": name, "repeats": repeats, "warmup": warmup,
+                              "latency_scale": latency_scale, "paths": {}}
+    for path, cassette in cassettes.items():
+        logger.info("=" * 70)
+        logger.info(f"BENCHMARK REPLAY: {name} / {path} ({warmup} warm-up + {repeats} timed run(s))")
+        logger.info("=" * 70)
+        warmup_runs = [_replay_run(cassette, path, latency_scale) for _ in range(warmup)]
+        runs = [_replay_run(cassette, path, latency_scale) for _ in range(repeats)]
+
+        last = runs[-1] if runs else (warmup_runs[-1] if warmup_runs else {})
+        if last.get("llm_misses") or last.get("trend_misses"):
+            log_fallback(
+                component="OFFLINE_BENCHMARK",
+                fallback_type="CASSETTE_MISSES",
+                reason=f"{path}: {last['llm_misses']} LLM and {last['trend_misses']} trend calls were not "
+                       f"in the cassette (code changed since recording? re-record with 'run.py bench record')",
+                impact="MEDIUM"
+            )
+
+        seconds = [run["seconds"] for run in runs]
+        report["paths"][path] = {
+            "cassette": cassette.meta,
+            "runs": runs,
+            "warmup_seconds": [run["seconds"] for run in warmup_runs],
+            "min_seconds": min(seconds) if seconds else None,
+            "median_seconds": round(statistics.median(seconds), 3) if seconds else None,
+            "mean_seconds": round(statistics.mean(seconds), 3) if seconds else None,
+            "max_seconds": max(seconds) if seconds else None,
+            "statuses": sorted({run["status"] for run in warmup_runs + runs}),
+            "replay": {key: value for key, value in last.items() if key not in ("seconds", "status", "error")},
+        }
+    return report
+
+
+# Canned results of the real trend sources fetch_trends() calls for tech_ai
+# (function name -> (keyword, source, momentum) tuples)
+_FIXTURE_TRENDS = {
+    "fetch_reddit_trending": [("AI coding assistants for small teams", "reddit_programming", 0.8)],
+    "fetch_reddit_rising": [],
+    "fetch_hackernews_top": [("Open source AI agents for developers", "hackernews", 0.7)],
+    "fetch_youtube_channels_trending": [],
+}
+
+_FIXTURE_HOOK = "Your team can ship twice as fast with one AI habit. Here's how."
+
+_FIXTURE_CTA = "Comment SETUP and I'll send you my AI coding checklist"
+
+# Narration the fixture voiceovers are cut from
+_FIXTURE_SENTENCES = [
+    "Small teams ship faster when an AI assistant drafts the boring parts of the code.",
+    "You describe the function in plain words, and the assistant writes a first version in seconds.",
+    "But here's the thing: the draft is only as good as the context you give it.",
+    "Open the files that matter, name the edge cases, and the suggestions get sharper right away.",
+    "One team we followed cut their review time in half by asking the assistant to write tests first.",
+    "You might be thinking this replaces developers, but it really removes the repetitive typing.",
+    "The real gain comes from pairing: you decide the design, and the tool fills in the details.",
+    "Treat every suggestion like a pull request from a new colleague and read it before you merge.",
+    "Security matters too, so keep secrets out of prompts and check licenses on generated snippets.",
+    "Start with one workflow, such as writing migrations or docs, and measure the hours you save.",
+    "After two weeks, compare cycle time, bug count and how tired the team feels on Friday.",
+    "Most teams find the biggest win in onboarding, because newcomers can ask the codebase questions.",
+    "Keep a shared prompt library so good instructions spread across the whole team.",
+    "When the assistant gets stuck, split the task into smaller steps and try again.",
+    "That habit alone turns a clever demo into a reliable part of your daily routine.",
+]
+
+# Role -> fixed fixture response (JSON roles are serialized on use)
+_FIXTURE_RESPONSES: Dict[str, Any] = {
+    "audience_inference": "English-speaking developers and small tech teams looking for practical AI coding tools",
+    "content_strategist": {
+        "selected_index": 0,
+        "title": "AI coding assistants for small teams",
+        "reasoning": "Strong momentum on Reddit and Hacker News, and a practical fit for our tech audience.",
+        "duplicate_analysis": "No semantic duplicates detected among recent videos.",
+        "reproducibility_analysis": "Fully reproducible solo with a screen recording.",
+        "skipped_candidates": [],
+    },
+    "editorial_strategist": {
+        "serie_concept": "tutorial",
+        "format": "tutorial",
+        "angle": "education",
+        "duration_target": 180,
+        "duration_breakdown": {"hook": 15, "context": 45, "insight": 100, "cta": 20},
+        "monetization_path": "comment_trigger",
+        "cta_specific": _FIXTURE_CTA,
+        "reasoning_summary": "A tutorial suits a practical tools topic. Three minutes leaves room for a real workflow.",
+        "performance_context": "Tutorials retain viewers best in this vertical.",
+    },
+    "duration_strategist": {
+        "target_duration_seconds": 180,
+        "format_type": "mid",
+        "reasoning": "The topic supports a focused three-minute walkthrough with pre-roll ads.",
+        "monetization_strategy": "ads",
+        "content_depth_score": 0.7,
+        "viral_potential_score": 0.4,
+        "alternative_formats": [],
+    },
+    "format_reconciler": {
+        "final_duration": 180,
+        "format_type": "mid",
+        "reasoning": "Both strategists agree on three minutes, which fits the tutorial structure.",
+        "arbitration_source": "compromise",
+        "editorial_weight": 0.5,
+        "duration_weight": 0.5,
+    },
+    "format_consistency_validator": {
+        "is_consistent": True,
+        "inconsistencies": [],
+        "auto_fix_suggestions": [],
+        "reasoning": "Title, duration and aspect ratio are consistent.",
+    },
+    "content_depth_strategist": {
+        "recommended_bullets": 4,
+        "time_per_bullet": [35, 40, 40, 35],
+        "depth_scores": [0.5, 0.7, 0.7, 0.6],
+        "pacing_guidance": "Quick context, two practical deep dives, then an actionable takeaway.",
+        "reasoning": "Four bullets give each step about forty seconds, enough to show a real example.",
+        "adequacy_score": 0.85,
+    },
+    "content_type_detector": {
+        "content_type": "tutorial",
+        "script_style": "sequential",
+        "guidelines": ["Show one step at a time", "Use a concrete example", "End each step with a result"],
+        "avoid": ["Vague claims", "Jargon without explanation"],
+        "example_bullet_format": "Step: action and the result it gives",
+        "reasoning": "The topic teaches a practical workflow.",
+    },
+    "script_writer_hook_optimizer": _FIXTURE_HOOK,
+    "seo_title_generator": "5 Ways AI Coding Assistants Make Small Teams Ship Faster",
+    "seo_manager_tag_generator": {
+        "tags": ["ai coding assistant", "ai for developers", "small dev teams", "developer productivity",
+                 "ai pair programming", "coding workflow", "software engineering", "code review tips"],
+    },
+    "cinematographer": {
+        "veo_prompt": "Medium shot of a developer at a bright desk, laptop screen showing code suggestions "
+                      "appearing line by line, soft window light, shallow depth of field, slow push-in, "
+                      "modern tech aesthetic, clean composition with space for text on the left.",
+        "text_overlays": [{"text": "2x faster", "timing_start": 1, "timing_duration": 2,
+                           "position": "top_center", "style": "bold", "purpose": "stat"}],
+        "broll_notes": [{"timing_start": 2, "timing_duration": 3,
+                         "description": "Screen recording of an AI suggestion being accepted in an editor",
+                         "source_type": "screen_recording", "purpose": "demonstration"}],
+    },
+    "compliance_reviewer": {
+        "hate_speech_violation": False,
+        "hate_speech_reasoning": "No hateful content.",
+        "medical_claims_violation": False,
+        "medical_claims_reasoning": "No medical claims.",
+        "copyright_violation": False,
+        "copyright_reasoning": "No copyrighted material referenced.",
+        "overall_compliant": True,
+        "summary": "Compliant educational tech content.",
+    },
+    "monetization_qa": {
+        "approved": True,
+        "overall_score": 0.82,
+        "category_scores": {
+            "policy_compliance": 0.95, "content_duration_coherence": 0.8, "monetization_potential": 0.78,
+            "engagement_optimization": 0.8, "narrative_quality": 0.8, "seo_discovery": 0.76,
+            "subscriber_loyalty_impact": 0.75,
+        },
+        "strengths": ["Clear practical value", "Specific CTA", "Duration fits the topic"],
+        "issues": [],
+        "monetization_forecast": {"estimated_cpm_tier": "high", "retention_forecast": "good",
+                                  "virality_potential": "medium", "revenue_readiness": "optimized"},
+        "recommendation": "APPROVE",
+        "feedback_summary": "A focused tutorial with a clear payoff and a specific call to action.",
+    },
+}
+
+
+def _fixture_narration(words: int) -> str:
+    """At least `words` words of English narration."""
+    sentences: List[str] = []
+    while sum(len(sentence.split()) for sentence in sentences) < words:
+        sentences.append(_FIXTURE_SENTENCES[len(sentences) % len(_FIXTURE_SENTENCES)])
+    return " ".join(sentences)
+
+
+def _prompt_int(pattern: str, prompt: str, default: int) -> int:
+    match = re.search(pattern, prompt)
+    return int(match.group(1)) if match else default
+
+
+def _fixture_response(role: str, prompt: str) -> str:
+    """
+    Fake-provider response for the fixture recording.
+
+    Sized from the prompt where the agent checks lengths (narrative acts,
+    script voiceover), so scripts match the reconciled duration.
+    """
+    if role == "narrative_architect":
+        content_acts = _prompt_int(r"EXACTLY (\d+) content acts", prompt, 4)
+        words = _prompt_int(r"TARGET WORD COUNT: (\d+) words", prompt, 450) // (content_acts + 2)
+        act_names = ["Hook"] + [f"Content_{i}" for i in range(1, content_acts + 1)] + ["Payoff_CTA"]
+        acts = []
+        for act_name in act_names:
+            if act_name == "Hook":
+                voiceover = f"{_FIXTURE_HOOK} {_fixture_narration(words - len(_FIXTURE_HOOK.split()))}"
+            else:
+                voiceover = _fixture_narration(words)
+            acts.append({
+                "act_name": act_name,
+                "duration_seconds": round(len(voiceover.split()) / 2.5),
+                "emotional_beat": "curiosity",
+                "voiceover": voiceover,
+                "retention_tactic": "open loop",
+            })
+        return json.dumps({
+            "voice_personality": "Enthusiastic Guide (energetic, practical)",
+            "narrative_structure": acts,
+            "retention_hooks": ["But here's the thing"],
+            "pacing_notes": "Fast hook, steady middle, warm close.",
+            "emotional_journey": "curiosity → confidence",
+        })
+
+    duration = _prompt_int(r"TARGET DURATION: (\d+)s", prompt, _prompt_int(r"Duration: (\d+)s", prompt, 180))
+    if role == "script_writer":
+        bullets = _prompt_int(r"EXACTLY (\d+) bullets", prompt, 4)
+        return "\n".join([
+            "HOOK:", _FIXTURE_HOOK, "",
+            "BULLETS:", *[f"- {sentence}" for sentence in _FIXTURE_SENTENCES[:bullets]], "",
+            "CTA:", f"{_FIXTURE_CTA}!", "",
+            "VOICEOVER:", _fixture_narration(int(duration * 2.5)),
+        ])
+    if role == "cta_strategist":
+        return json.dumps({
+            "main_cta": _FIXTURE_CTA,
+            "mid_roll_ctas": [{"timestamp": duration // 2, "cta": "Pause here and pick one task to automate",
+                               "type": "pause_and_reflect"}],
+            "funnel_path": "video → checklist → community",
+            "reasoning": "The mid-roll lands after the first example, when viewers are most engaged.",
+            "cta_count": 2,
+        })
+
+    response = _FIXTURE_RESPONSES.get(role)
+    if response is None:
+        return _fixture_narration(30)
+    return response if isinstance(response, str) else json.dumps(response)
+
+
+@contextmanager
+def _fixture_trend_sources() -> Iterator[None]:
+    """Replaces the real trend sources with the canned _FIXTURE_TRENDS."""
+    import importlib
+    from yt_autopilot.core.schemas import TrendCandidate
+    from yt_autopilot.services.cassette import TREND_SOURCE_FUNCTIONS
+
+    def canned(function_name: str):
+        def fetch(*args: Any, **kwargs: Any) -> List[TrendCandidate]:
+            return [
+                TrendCandidate(keyword=keyword, why_hot="Top story in the community this week",
+                               region="global", language="en", momentum_score=momentum, source=source,
+                               cpm_estimate=15.0, keyword_match_count=2)
+                for keyword, source, momentum in _FIXTURE_TRENDS[function_name]
+            ]
+        return fetch
+
+    originals = []
+    for module_name, function_name in TREND_SOURCE_FUNCTIONS:
+        if function_name in _FIXTURE_TRENDS:
+            module = importlib.import_module(module_name)
+            originals.append((module, function_name, getattr(module, function_name)))
+            setattr(module, function_name, canned(function_name))
+    try:
+        yield
+    finally:
+        for module, function_name, original in originals:
+            setattr(module, function_name, original)
+
+
+def record_fixture_cassettes(paths: Sequence[str] = tuple(BENCHMARK_PATHS)) -> Dict[str, str]:
+    """
+    Re-records the committed fixture cassettes (FIXTURE_CASSETTE_DIR).
+
+    Runs record_cassettes() with fake providers answering from
+    _fixture_response() and the trend sources returning _FIXTURE_TRENDS, so
+    no API keys or network are needed. Re-run after prompts or agent output
+    parsing change.
+
+    Returns:
+        path -> cassette file
+    """
+    from yt_autopilot.services.llm_fake_providers import FakeProvider, LatencyDistribution, fake_providers
+
+    saved_dir = os.environ.get("CASSETTE_DIR")
+    os.environ["CASSETTE_DIR"] = str(FIXTURE_CASSETTE_DIR)
+    try:
+        provider = FakeProvider("openai", LatencyDistribution.constant(5), response=_fixture_response)
+        with fake_providers(provider, hedging=False), _fixture_trend_sources():
+            return record_cassettes(FIXTURE_WORKSPACE_ID, name=FIXTURE_CASSETTE_NAME,
+                                    use_real_trends=True, paths=paths)
+    finally:
+        if saved_dir is None:
+            os.environ.pop("CASSETTE_DIR", None)
+        else:
+            os.environ["CASSETTE_DIR"] = saved_dir
@@ -15,10 +15,16 @@ Available services:
 - reference_image_generator: Generate visual references with DALL-E 3 (Phase 1)
 """
 
-from yt_autopilot.services.llm_router import generate_text
-from yt_autopilot.services.trend_source import fetch_trends
-from yt_autopilot.services.youtube_analytics import fetch_video_metrics
-from yt_autopilot.services.reference_image_generator import generate_scene_reference_images
+import importlib
+
+# Re-exports are imported on first access, so importing one service (e.g.
+# yt_autopilot.services.llm_usage) does not load every provider SDK.
+_LAZY_EXPORTS = {
+    "generate_text": "yt_autopilot.services.llm_router",
+    "fetch_trends": "yt_autopilot.services.trend_source",
+    "fetch_video_metrics": "yt_autopilot.services.youtube_analytics",
+    "generate_scene_reference_images": "yt_autopilot.services.reference_image_generator",
+}
 
 __all__ = [
     "generate_text",
@@ -26,3 +32,13 @@ __all__ = [
     "fetch_video_metrics",
     "generate_scene_reference_images",
 ]
+
+
+def __getattr__(name):
+    """Resolves re-exports on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,536 @@
+"""
+Cassettes: Record/replay of LLM calls and trend-source responses.
+
+A pipeline run depends on live LLM providers and trend APIs, so two runs of
+build_video_package never see the same inputs. A cassette captures what those
+services returned during one run and serves it back later, which makes the
+run repeatable offline (benchmarks, regression checks, debugging a prompt).
+
+Record mode (recording()):
+- Every llm_router provider in PROVIDERS / STREAM_PROVIDERS is wrapped; each
+  successful call is stored with role, prompt key, text, model, usage and
+  latency. Hedging is disabled while recording so each prompt is answered
+  exactly once
+- The trend-source functions in TREND_SOURCE_FUNCTIONS are wrapped; their
+  TrendCandidate lists (or raised errors) are stored per call arguments.
+  fetch_trends() itself still runs, so quality filters are replayed too
+
+Replay mode (replaying()):
+- The provider registry is replaced by one "cassette" provider that answers
+  from the recording: exact prompt match first, then the next unused call of
+  the same role in recording order (prompts embed dates and ids that differ
+  between runs). Unmatched calls fail like an unavailable provider, so the
+  router falls back exactly as it would without API keys
+- Trend-source functions return the recorded lists
+- latency_scale simulates service latency: 0 = instant, 1.0 = recorded timing
+
+block_network() turns any outbound network connection into an OSError, to prove
+a replayed run is fully offline.
+
+Files: data/cassettes/<name>.json (or $CASSETTE_DIR)
+
+Usage:
+    from yt_autopilot.services.cassette import Cassette, recording, replaying
+
+    cassette = Cassette(meta={"workspace_id": "tech_ai_creator"})
+    with recording(cassette):
+        build_video_package("tech_ai_creator")
+    path = cassette.save("tech_ai_creator")
+
+    with replaying(Cassette.load(path), latency_scale=1.0) as replay:
+        build_video_package("tech_ai_creator")
+    print(replay.stats())
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from yt_autopilot.core.logger import logger, log_fallback
+from yt_autopilot.services.llm_routing import ProviderAttempt, reset_router
+
+
+CASSETTE_DIR = "data/cassettes"
+
+CASSETTE_VERSION = 1
+
+# Name of the provider that serves replayed LLM calls
+REPLAY_PROVIDER = "cassette"
+
+# (module, function) of every trend source fetch_trends() calls
+TREND_SOURCE_FUNCTIONS: Tuple[Tuple[str, str], ...] = (
+    ("yt_autopilot.services.trend_source", "_fetch_youtube_trending"),
+    ("yt_autopilot.services.trend_source", "_fetch_youtube_search"),
+    ("yt_autopilot.services.trend_source", "_fetch_youtube_scrape"),
+    ("yt_autopilot.services.reddit_trend_source", "fetch_reddit_trending"),
+    ("yt_autopilot.services.reddit_trend_source", "fetch_reddit_rising"),
+    ("yt_autopilot.services.hackernews_trend_source", "fetch_hackernews_top"),
+    ("yt_autopilot.services.hackernews_trend_source", "fetch_hackernews_best"),
+    ("yt_autopilot.services.youtube_channels_source", "fetch_youtube_channels_trending"),
+)
+
+# Characters per chunk when a replayed call is streamed
+REPLAY_CHUNK_CHARS = 24
+
+
+def get_cassette_path(name: str) -> Path:
+    """Returns data/cassettes/<name>.json (or under $CASSETTE_DIR)."""
+    return Path(os.getenv("CASSETTE_DIR", CASSETTE_DIR)) / f"{name}.json"
+
+
+def _prompt_key(role: str, prompt: str, system_prefix: Optional[str]) -> str:
+    digest = hashlib.sha256(f"{role}\0{system_prefix or ''}\0{prompt}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _call_key(source: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    return json.dumps({"source": source, "args": list(args), "kwargs": kwargs}, sort_keys=True, default=str)
+
+
+def _sleep_scaled(latency_ms: float, scale: float, attempt: Optional[ProviderAttempt] = None) -> bool:
+    """
+    Sleeps latency_ms * scale in small slices.
+
+    Returns:
+        False if the attempt was cancelled while sleeping
+    """
+    deadline = time.monotonic() + latency_ms * scale / 1000
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+        if attempt is not None:
+            if attempt.cancelled.wait(min(remaining, 0.01)):
+                return False
+        else:
+            time.sleep(min(remaining, 0.01))
+
+
+class Cassette:
+    """
+    Recorded LLM calls and trend-source responses of one run.
+
+    Entries are appended in call order. Replay marks entries as used, so a
+    cassette serves each recorded call once; rewind() starts over.
+    """
+
+    def __init__(self, meta: Optional[Dict[str, Any]] = None):
+        self.meta: Dict[str, Any] = dict(meta or {})
+        self.recorded_at: Optional[str] = None
+        self.llm_calls: List[Dict[str, Any]] = []
+        self.trend_calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._used_llm: set = set()
+        self._used_trends: set = set()
+        self._stats = {"llm_hits": 0, "llm_fuzzy_hits": 0, "llm_misses": 0, "trend_hits": 0, "trend_misses": 0}
+
+    # ---------------------------------------------------------------- record
+
+    def add_llm_call(
+        self,
+        role: str,
+        prompt: str,
+        system_prefix: Optional[str],
+        text: str,
+        provider: str,
+        model: Optional[str],
+        usage: Dict[str, int],
+        latency_ms: float,
+        streamed: bool = False
+    ) -> None:
+        with self._lock:
+            self.llm_calls.append({
+                "key": _prompt_key(role, prompt, system_prefix),
+                "role": role,
+                "provider": provider,
+                "model": model,
+                "text": text,
+                "usage": dict(usage or {}),
+                "latency_ms": round(latency_ms, 1),
+                "streamed": streamed,
+            })
+
+    def add_trend_call(
+        self,
+        source: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        trends: Optional[List[Any]],
+        latency_ms: float,
+        error: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            self.trend_calls.append({
+                "key": _call_key(source, args, kwargs),
+                "source": source,
+                "trends": [trend.model_dump(mode="json") for trend in trends] if trends is not None else None,
+                "error": error,
+                "latency_ms": round(latency_ms, 1),
+            })
+
+    # ---------------------------------------------------------------- replay
+
+    def take_llm_call(self, role: str, prompt: str, system_prefix: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Next unused recorded call for this prompt (or, failing that, this role).
+
+        Returns:
+            The recorded entry, or None if the cassette has no call left for the role
+        """
+        key = _prompt_key(role, prompt, system_prefix)
+        with self._lock:
+            for match_key in ("key", "role"):
+                wanted = key if match_key == "key" else role
+                for index, entry in enumerate(self.llm_calls):
+                    if index not in self._used_llm and entry[match_key] == wanted:
+                        self._used_llm.add(index)
+                        self._stats["llm_hits" if match_key == "key" else "llm_fuzzy_hits"] += 1
+                        return entry
+            self._stats["llm_misses"] += 1
+        return None
+
+    def take_trend_call(self, source: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Next recorded response for this source and arguments.
+
+        A call recorded once is served again when the run repeats it (e.g.
+        several fetch_trends() calls for the same vertical).
+        """
+        key = _call_key(source, args, kwargs)
+        with self._lock:
+            matches = [index for index, entry in enumerate(self.trend_calls) if entry["key"] == key]
+            if not matches:
+                self._stats["trend_misses"] += 1
+                return None
+            unused = [index for index in matches if index not in self._used_trends]
+            index = unused[0] if unused else matches[-1]
+            self._used_trends.add(index)
+            self._stats["trend_hits"] += 1
+            return self.trend_calls[index]
+
+    def rewind(self) -> None:
+        """Makes every recorded entry available again and resets replay stats."""
+        with self._lock:
+            self._used_llm.clear()
+            self._used_trends.clear()
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Replay counters plus recorded/unused entry counts."""
+        with self._lock:
+            return {
+                **self._stats,
+                "llm_recorded": len(self.llm_calls),
+                "llm_unused": len(self.llm_calls) - len(self._used_llm),
+                "trend_recorded": len(self.trend_calls),
+            }
+
+    # ---------------------------------------------------------------- files
+
+    def save(self, name: str) -> Path:
+        """
+        Writes the cassette to data/cassettes/<name>.json.
+
+        Returns:
+            Path of the written file
+        """
+        path = get_cassette_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {
+                "version": CASSETTE_VERSION,
+                "recorded_at": self.recorded_at or datetime.now().isoformat(),
+                "meta": self.meta,
+                "llm_calls": self.llm_calls,
+                "trend_calls": self.trend_calls,
+            }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        logger.info(f"✓ Cassette saved: {path} ({len(data['llm_calls'])} LLM calls, "
+                    f"{len(data['trend_calls'])} trend calls)")
+        return path
+
+    @classmethod
+    def load(cls, path_or_name: Any) -> "Cassette":
+        """
+        Reads a cassette by path or by name (data/cassettes/<name>.json).
+
+        Raises:
+            FileNotFoundError: If the cassette does not exist
+            ValueError: If the file is not a cassette of a supported version
+        """
+        path = Path(path_or_name)
+        if not path.exists() and path.suffix != ".json":
+            path = get_cassette_path(str(path_or_name))
+        if not path.exists():
+            raise FileNotFoundError(f"Cassette not found: {path}")
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')} in {path}")
+
+        cassette = cls(meta=data.get("meta"))
+        cassette.recorded_at = data.get("recorded_at")
+        cassette.llm_calls = data.get("llm_calls", [])
+        cassette.trend_calls = data.get("trend_calls", [])
+        return cassette
+
+
+# ============================================================================
+# Record / replay wrappers
+# ============================================================================
+
+def _recording_provider(name: str, call_fn: Callable[..., Optional[str]], cassette: Cassette):
+    def _call(api_key, role, prompt, attempt=None, system_prefix=None):
+        started = time.monotonic()
+        prefix_kwargs = {"system_prefix": system_prefix} if system_prefix else {}
+        text = call_fn(api_key, role, prompt, attempt, **prefix_kwargs)
+        if text and not (attempt and attempt.cancelled.is_set()):
+            cassette.add_llm_call(
+                role, prompt, system_prefix, text,
+                provider=name,
+                model=attempt.model if attempt else None,
+                usage=attempt.usage if attempt else {},
+                latency_ms=(time.monotonic() - started) * 1000
+            )
+        return text
+    return _call
+
+
+def _recording_stream(name: str, stream_fn: Callable[..., Iterator[str]], cassette: Cassette):
+    def _stream(api_key, role, prompt, attempt=None, system_prefix=None):
+        started = time.monotonic()
+        prefix_kwargs = {"system_prefix": system_prefix} if system_prefix else {}
+        chunks = []
+        for delta in stream_fn(api_key, role, prompt, attempt, **prefix_kwargs):
+            chunks.append(delta or "")
+            yield delta
+        # Only complete streams are recorded (consumer closing early raises GeneratorExit above)
+        text = "".join(chunks)
+        if text:
+            cassette.add_llm_call(
+                role, prompt, system_prefix, text,
+                provider=name,
+                model=attempt.model if attempt else None,
+                usage=attempt.usage if attempt else {},
+                latency_ms=(time.monotonic() - started) * 1000,
+                streamed=True
+            )
+    return _stream
+
+
+class _ReplayProvider:
+    """llm_router provider that answers from a cassette (PROVIDERS / STREAM_PROVIDERS signatures)."""
+
+    def __init__(self, cassette: Cassette, latency_scale: float):
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+
+    def __call__(self, api_key, role, prompt, attempt=None, system_prefix=None) -> Optional[str]:
+        entry = self.cassette.take_llm_call(role, prompt, system_prefix)
+        if entry is None:
+            log_fallback(
+                component="CASSETTE_REPLAY",
+                fallback_type="LLM_CALL_NOT_RECORDED",
+                reason=f"No recorded LLM call left for role '{role}'",
+                impact="MEDIUM"
+            )
+            return None
+        if self.latency_scale and not _sleep_scaled(entry["latency_ms"], self.latency_scale, attempt):
+            return None
+        if attempt is not None:
+            attempt.model = entry["model"]
+            attempt.usage = dict(entry["usage"])
+        return entry["text"]
+
+    def stream(self, api_key, role, prompt, attempt=None, system_prefix=None) -> Iterator[str]:
+        text = self(api_key, role, prompt, attempt, system_prefix)
+        if not text:
+            return
+        for start in range(0, len(text), REPLAY_CHUNK_CHARS):
+            yield text[start:start + REPLAY_CHUNK_CHARS]
+
+
+def _recording_source(source: str, fn: Callable[..., List[Any]], cassette: Cassette):
+    def _fetch(*args, **kwargs):
+        started = time.monotonic()
+        try:
+            trends = fn(*args, **kwargs)
+        except Exception as e:
+            cassette.add_trend_call(source, args, kwargs, None, (time.monotonic() - started) * 1000,
+                                    error=f"{type(e).__name__}: {e}")
+            raise
+        cassette.add_trend_call(source, args, kwargs, trends, (time.monotonic() - started) * 1000)
+        return trends
+    return _fetch
+
+
+def _replaying_source(source: str, cassette: Cassette, latency_scale: float):
+    from yt_autopilot.core.schemas import TrendCandidate
+
+    def _fetch(*args, **kwargs):
+        entry = cassette.take_trend_call(source, args, kwargs)
+        if entry is None:
+            log_fallback(
+                component="CASSETTE_REPLAY",
+                fallback_type="TREND_CALL_NOT_RECORDED",
+                reason=f"No recorded response for {source}({kwargs or args})",
+                impact="MEDIUM"
+            )
+            return []
+        if latency_scale:
+            _sleep_scaled(entry["latency_ms"], latency_scale)
+        if entry["error"]:
+            raise RuntimeError(f"Recorded failure: {entry['error']}")
+        return [TrendCandidate(**trend) for trend in entry["trends"]]
+    return _fetch
+
+
+@contextmanager
+def _patched_trend_sources(wrap: Callable[[str, Callable[..., Any]], Callable[..., Any]]) -> Iterator[None]:
+    """Replaces every importable TREND_SOURCE_FUNCTIONS entry with wrap(source, fn)."""
+    originals = []
+    for module_name, function_name in TREND_SOURCE_FUNCTIONS:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            # fetch_trends() skips the source too (same import fails there)
+            continue
+        original = getattr(module, function_name)
+        originals.append((module, function_name, original))
+        setattr(module, function_name, wrap(f"{module_name.rsplit('.', 1)[-1]}.{function_name}", original))
+    try:
+        yield
+    finally:
+        for module, function_name, original in originals:
+            setattr(module, function_name, original)
+
+
+@contextmanager
+def _swapped_providers(
+    providers: Dict[str, Tuple[Callable[[], Optional[str]], Callable[..., Optional[str]]]],
+    stream_providers: Dict[str, Callable[..., Iterator[str]]]
+) -> Iterator[None]:
+    """Installs a provider registry with hedging off (same restore logic as fake_providers())."""
+    from yt_autopilot.services import llm_router
+
+    saved_registry = dict(llm_router.PROVIDERS)
+    saved_stream_registry = dict(llm_router.STREAM_PROVIDERS)
+    saved_hedging = os.environ.get("LLM_HEDGING_ENABLED")
+
+    llm_router.PROVIDERS.clear()
+    llm_router.PROVIDERS.update(providers)
+    llm_router.STREAM_PROVIDERS.clear()
+    llm_router.STREAM_PROVIDERS.update(stream_providers)
+    os.environ["LLM_HEDGING_ENABLED"] = "0"
+    reset_router()
+
+    try:
+        yield
+    finally:
+        llm_router.PROVIDERS.clear()
+        llm_router.PROVIDERS.update(saved_registry)
+        llm_router.STREAM_PROVIDERS.clear()
+        llm_router.STREAM_PROVIDERS.update(saved_stream_registry)
+        if saved_hedging is None:
+            os.environ.pop("LLM_HEDGING_ENABLED", None)
+        else:
+            os.environ["LLM_HEDGING_ENABLED"] = saved_hedging
+        reset_router()
+
+
+@contextmanager
+def recording(cassette: Cassette) -> Iterator[Cassette]:
+    """
+    Records every LLM provider call and trend-source response into `cassette`.
+
+    Uses the providers configured in llm_router (real API keys). Hedging is
+    off for the duration of the block.
+    """
+    from yt_autopilot.services import llm_router
+
+    providers = {
+        name: (get_key, _recording_provider(name, call_fn, cassette))
+        for name, (get_key, call_fn) in llm_router.PROVIDERS.items()
+    }
+    stream_providers = {
+        name: _recording_stream(name, stream_fn, cassette)
+        for name, stream_fn in llm_router.STREAM_PROVIDERS.items()
+    }
+    cassette.recorded_at = datetime.now().isoformat()
+    with _swapped_providers(providers, stream_providers), \
+            _patched_trend_sources(lambda source, fn: _recording_source(source, fn, cassette)):
+        yield cassette
+
+
+@contextmanager
+def replaying(cassette: Cassette, latency_scale: float = 0.0) -> Iterator[Cassette]:
+    """
+    Serves LLM calls and trend-source responses from `cassette`.
+
+    Args:
+        cassette: Recorded cassette (rewound on entry)
+        latency_scale: Simulated latency as a fraction of the recorded latency
+            (0 = instant, 1.0 = as recorded)
+    """
+    cassette.rewind()
+    provider = _ReplayProvider(cassette, latency_scale)
+    with _swapped_providers({REPLAY_PROVIDER: (lambda: "replay", provider)}, {REPLAY_PROVIDER: provider.stream}), \
+            _patched_trend_sources(lambda source, fn: _replaying_source(source, cassette, latency_scale)):
+        yield cassette
+
+
+@contextmanager
+def block_network() -> Iterator[Dict[str, int]]:
+    """
+    Makes outbound IPv4/IPv6 connections fail with OSError for the duration of the block.
+
+    Hugging Face libraries are switched to offline mode so cached models still
+    load. Unix sockets are not affected.
+
+    Yields:
+        Counter dict; "blocked" is the number of refused connection attempts
+    """
+    counter = {"blocked": 0}
+    original_connect = socket.socket.connect
+    original_connect_ex = socket.socket.connect_ex
+    saved_env = {name: os.environ.get(name) for name in ("HF_HUB_OFFLINE", "TRANSFORMERS_OFFLINE")}
+
+    def _refuse(sock, address):
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            counter["blocked"] += 1
+            raise OSError(f"Network access blocked during offline run (connect to {address})")
+        return None
+
+    def _connect(sock, address):
+        _refuse(sock, address)
+        return original_connect(sock, address)
+
+    def _connect_ex(sock, address):
+        _refuse(sock, address)
+        return original_connect_ex(sock, address)
+
+    socket.socket.connect = _connect
+    socket.socket.connect_ex = _connect_ex
+    for name in saved_env:
+        os.environ[name] = "1"
+    try:
+        yield counter
+    finally:
+        socket.socket.connect = original_connect
+        socket.socket.connect_ex = original_connect_ex
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
@@ -0,0 +1,133 @@
+"""
+LLM Concurrency Budget: caps in-flight provider calls, across processes.
+
+llm_router holds one budget slot for every provider request it sends
+(generate_text attempts, including hedged ones, and stream_text streams).
+Without a budget installed calls are unlimited, as before.
+
+Budget sources:
+- Batch generation (pipeline/batch_generation.py) creates one
+  multiprocessing semaphore and installs it in every pool worker, so N
+  workspaces generated in parallel never exceed one global provider limit
+- Single-process runs: LLM_MAX_CONCURRENCY=<n> installs a local budget
+
+A hedged attempt that is cancelled while waiting for a slot gives up without
+calling the provider.
+
+Usage:
+    from yt_autopilot.services.llm_budget import create_llm_budget, install_llm_budget
+
+    budget = create_llm_budget(8, mp_context)      # parent process
+    install_llm_budget(budget, 8)                  # each worker (pool initializer)
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from yt_autopilot.core.logger import logger
+
+
+# Cancellation check interval while waiting for a slot
+LLM_BUDGET_POLL_SECONDS = 0.25
+
+_budget: Optional[Any] = None
+_budget_size: Optional[int] = None
+_env_checked = False
+_stats = {"calls": 0, "waited_calls": 0, "wait_ms": 0.0}
+_state_lock = threading.Lock()
+
+
+def create_llm_budget(max_concurrent: int, mp_context: Optional[Any] = None) -> Any:
+    """
+    Creates a budget semaphore that can be shared with child processes.
+
+    Args:
+        max_concurrent: Max provider calls in flight across all processes
+        mp_context: multiprocessing context the pool uses (default: multiprocessing)
+
+    Returns:
+        BoundedSemaphore to pass to install_llm_budget() in each worker
+    """
+    return (mp_context or multiprocessing).BoundedSemaphore(max_concurrent)
+
+
+def install_llm_budget(semaphore: Any, max_concurrent: int) -> None:
+    """
+    Makes llm_router calls in this process take slots from `semaphore`.
+
+    Args:
+        semaphore: Semaphore from create_llm_budget() (or threading.BoundedSemaphore)
+        max_concurrent: Its size (for logs and stats)
+    """
+    global _budget, _budget_size, _env_checked
+    with _state_lock:
+        _budget = semaphore
+        _budget_size = max_concurrent
+        _env_checked = True
+
+
+def _get_budget() -> Optional[Any]:
+    """Installed budget, or one built from LLM_MAX_CONCURRENCY on first use."""
+    global _budget, _budget_size, _env_checked
+    with _state_lock:
+        if not _env_checked:
+            _env_checked = True
+            value = os.getenv("LLM_MAX_CONCURRENCY", "").strip()
+            if value.isdigit() and int(value) > 0:
+                _budget_size = int(value)
+                _budget = threading.BoundedSemaphore(_budget_size)
+                logger.info(f"LLM concurrency budget: {_budget_size} calls in flight (LLM_MAX_CONCURRENCY)")
+        return _budget
+
+
+@contextmanager
+def llm_slot(
+    cancelled: Optional[threading.Event] = None,
+    trace_args: Optional[Dict[str, Any]] = None
+) -> Iterator[bool]:
+    """
+    Holds one budget slot for the duration of a provider call.
+
+    Args:
+        cancelled: Event set when the caller no longer needs the call (hedge loser)
+        trace_args: Args of the call's trace span (receives llm_budget_wait_ms)
+
+    Yields:
+        True if the call may proceed, False if `cancelled` was set while waiting
+    """
+    budget = _get_budget()
+    if budget is None:
+        yield True
+        return
+
+    started = time.monotonic()
+    # Positional args: threading uses `blocking`, multiprocessing `block`
+    acquired = budget.acquire(False)
+    while not acquired:
+        if cancelled is not None and cancelled.is_set():
+            yield False
+            return
+        acquired = budget.acquire(True, LLM_BUDGET_POLL_SECONDS)
+
+    wait_ms = (time.monotonic() - started) * 1000
+    with _state_lock:
+        _stats["calls"] += 1
+        if wait_ms >= 1:
+            _stats["waited_calls"] += 1
+            _stats["wait_ms"] += wait_ms
+    if trace_args is not None and wait_ms >= 1:
+        trace_args["llm_budget_wait_ms"] = round(wait_ms, 1)
+    try:
+        yield True
+    finally:
+        budget.release()
+
+
+def get_llm_budget_stats() -> Dict[str, Any]:
+    """Slot usage in this process: budget size, calls, calls that waited, total wait."""
+    with _state_lock:
+        return {"max_concurrent": _budget_size, **_stats, "wait_ms": round(_stats["wait_ms"], 1)}
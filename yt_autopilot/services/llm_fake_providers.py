@@ -0,0 +1,230 @@
+"""
+Fake LLM Providers: Local harness for exercising llm_router without API keys.
+
+Replaces the llm_router provider registry with in-process fake providers whose
+latency and error behaviour follow configurable distributions. Used to test
+hedging, failover and health-based routing deterministically (seeded RNG),
+and to benchmark routing policies offline.
+
+Usage:
+    from yt_autopilot.services.llm_fake_providers import (
+        FakeProvider, LatencyDistribution, fake_providers
+    )
+    from yt_autopilot.services.llm_router import generate_text
+
+    slow = FakeProvider("openai", LatencyDistribution.spiky(base_ms=200, spike_ms=5000, spike_prob=0.2))
+    fast = FakeProvider("anthropic", LatencyDistribution.lognormal(median_ms=300, sigma=0.3))
+
+    with fake_providers(slow, fast):
+        for _ in range(20):
+            generate_text(role="seo_title_generator", task="title", context="AI tools")
+
+    print(slow.stats(), fast.stats())
+"""
+
+import math
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Union
+
+from yt_autopilot.services.llm_routing import ProviderAttempt, reset_router
+
+
+class LatencyDistribution:
+    """
+    Latency sampler (milliseconds). Build with the classmethod constructors.
+    """
+
+    def __init__(self, sampler: Callable[[random.Random], float], description: str):
+        self._sampler = sampler
+        self.description = description
+
+    def sample_ms(self, rng: random.Random) -> float:
+        return max(0.0, self._sampler(rng))
+
+    def __repr__(self) -> str:
+        return f"LatencyDistribution({self.description})"
+
+    @classmethod
+    def constant(cls, ms: float) -> "LatencyDistribution":
+        return cls(lambda rng: ms, f"constant {ms}ms")
+
+    @classmethod
+    def uniform(cls, low_ms: float, high_ms: float) -> "LatencyDistribution":
+        return cls(lambda rng: rng.uniform(low_ms, high_ms), f"uniform {low_ms}-{high_ms}ms")
+
+    @classmethod
+    def lognormal(cls, median_ms: float, sigma: float = 0.5) -> "LatencyDistribution":
+        """Long-tailed latency typical of LLM APIs (median_ms, log-space sigma)."""
+        mu = math.log(median_ms)
+        return cls(lambda rng: rng.lognormvariate(mu, sigma), f"lognormal median={median_ms}ms sigma={sigma}")
+
+    @classmethod
+    def spiky(cls, base_ms: float, spike_ms: float, spike_prob: float) -> "LatencyDistribution":
+        """Mostly base_ms, occasionally spike_ms (queueing / cold starts)."""
+        return cls(
+            lambda rng: spike_ms if rng.random() < spike_prob else base_ms,
+            f"spiky base={base_ms}ms spike={spike_ms}ms p={spike_prob}"
+        )
+
+
+class FakeProvider:
+    """
+    In-process provider with simulated latency and failures.
+
+    Compatible with the llm_router provider call signature
+    (api_key, role, prompt, attempt, system_prefix) → Optional[str]. Sleeps in
+    small slices so router cancellation (hedge lost) is honoured promptly.
+    A system_prefix seen before is reported as cached tokens (prompt cache).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        latency: LatencyDistribution,
+        error_rate: float = 0.0,
+        response: Union[str, Callable[[str, str], str], None] = None,
+        seed: int = 0
+    ):
+        self.name = name
+        self.latency = latency
+        self.error_rate = error_rate
+        self.response = response
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.cancellations = 0
+        self._seen_prefixes = set()
+
+    def _sample(self):
+        with self._lock:
+            self.calls += 1
+            return self.latency.sample_ms(self._rng), self._rng.random() < self.error_rate
+
+    def __call__(
+        self,
+        api_key: str,
+        role: str,
+        prompt: str,
+        attempt: Optional[ProviderAttempt] = None,
+        system_prefix: Optional[str] = None
+    ) -> Optional[str]:
+        latency_ms, fails = self._sample()
+
+        deadline = time.monotonic() + latency_ms / 1000
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if attempt and attempt.cancelled.wait(min(remaining, 0.01)):
+                with self._lock:
+                    self.cancellations += 1
+                return None
+            if not attempt:
+                time.sleep(min(remaining, 0.01))
+
+        with self._lock:
+            if fails:
+                self.failures += 1
+            else:
+                self.successes += 1
+
+        if fails:
+            return None
+        if callable(self.response):
+            text = self.response(role, prompt)
+        elif self.response is not None:
+            text = self.response
+        else:
+            text = f"[{self.name}] response for {role}"
+
+        if attempt:
+            # Rough 4-chars-per-token estimate so usage accounting sees realistic numbers
+            prefix_tokens = len(system_prefix or "") // 4
+            with self._lock:
+                cached = prefix_tokens if system_prefix in self._seen_prefixes else 0
+                if system_prefix:
+                    self._seen_prefixes.add(system_prefix)
+            attempt.model = f"fake-{self.name}"
+            attempt.usage = {
+                "prompt_tokens": len(prompt) // 4 + prefix_tokens,
+                "completion_tokens": len(text or "") // 4,
+                "cached_tokens": cached,
+            }
+        return text
+
+    def stream(
+        self,
+        api_key: str,
+        role: str,
+        prompt: str,
+        attempt: Optional[ProviderAttempt] = None,
+        system_prefix: Optional[str] = None,
+        chunk_chars: int = 24,
+        chunk_delay_ms: float = 0.0
+    ) -> Iterator[str]:
+        """
+        Streaming variant: full latency before the first chunk, then the
+        response in chunk_chars pieces (llm_router.STREAM_PROVIDERS signature).
+        """
+        text = self(api_key, role, prompt, attempt, system_prefix)
+        if not text:
+            return
+        for start in range(0, len(text), chunk_chars):
+            if chunk_delay_ms:
+                time.sleep(chunk_delay_ms / 1000)
+            yield text[start:start + chunk_chars]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "successes": self.successes,
+                "failures": self.failures,
+                "cancellations": self.cancellations,
+            }
+
+
+@contextmanager
+def fake_providers(*providers: FakeProvider, hedging: bool = True) -> Iterator[None]:
+    """
+    Routes llm_router.generate_text and stream_text through fake providers for the duration of the block.
+
+    Provider order = default preference order. Router health windows are reset
+    on entry and exit so fake latencies never leak into real routing.
+
+    Args:
+        *providers: FakeProvider instances (unique names)
+        hedging: Enable hedged requests (sets LLM_HEDGING_ENABLED)
+    """
+    from yt_autopilot.services import llm_router
+
+    saved_registry = dict(llm_router.PROVIDERS)
+    saved_stream_registry = dict(llm_router.STREAM_PROVIDERS)
+    saved_hedging = os.environ.get("LLM_HEDGING_ENABLED")
+
+    llm_router.PROVIDERS.clear()
+    llm_router.STREAM_PROVIDERS.clear()
+    for provider in providers:
+        llm_router.PROVIDERS[provider.name] = (lambda: "fake-key", provider)
+        llm_router.STREAM_PROVIDERS[provider.name] = provider.stream
+    os.environ["LLM_HEDGING_ENABLED"] = "1" if hedging else "0"
+    reset_router()
+
+    try:
+        yield
+    finally:
+        llm_router.PROVIDERS.clear()
+        llm_router.PROVIDERS.update(saved_registry)
+        llm_router.STREAM_PROVIDERS.clear()
+        llm_router.STREAM_PROVIDERS.update(saved_stream_registry)
+        if saved_hedging is None:
+            os.environ.pop("LLM_HEDGING_ENABLED", None)
+        else:
+            os.environ["LLM_HEDGING_ENABLED"] = saved_hedging
+        reset_router()
@@ -11,9 +11,50 @@ Architecture Decision:
 - This maintains agent purity: agents remain deterministic pure functions
 
 Provider Priority:
-1. Anthropic Claude (if LLM_ANTHROPIC_API_KEY is set)
-2. OpenAI GPT (if LLM_OPENAI_API_KEY is set)
-3. Fallback to deterministic placeholder if no keys or API fails
+1. OpenAI GPT (if LLM_OPENAI_API_KEY is set)
+2. Anthropic Claude (if LLM_ANTHROPIC_API_KEY is set)
+3. Fallback to deterministic placeholder if no keys or all providers fail
+
+Routing (services/llm_routing.py):
+- Providers are re-ranked by a rolling latency/error window
+- Per-role latency SLOs; after the primary's p95 latency a hedged request is
+  sent to the next provider and the slower response is cancelled
+- A failed provider fails over to the next one immediately
+- Set LLM_HEDGING_ENABLED=0 to disable hedging (failover stays active)
+
+Usage Accounting (services/llm_usage.py):
+- Every call (including deterministic fallbacks) appends one record with
+  provider, model, token counts, cache hits, latency and estimated cost
+- Workspace/execution/agent/retry attribution comes from
+  core/run_context.llm_call_scope
+- Report: python3 run.py usage
+
+Prompt Prefix (core/prompt_prefix.py):
+- Inside a pipeline run the stable per-workspace CHANNEL PROFILE is sent as the
+  first part of every request whose prompt references it (OpenAI: first system
+  message, Anthropic: system block with cache_control) so providers can serve
+  it from their prompt cache; other calls are sent without it
+- Only the variable task/context suffix changes between calls
+
+Streaming (stream_text):
+- Yields text deltas as the provider produces them (long-form scripts)
+- Consumers can stop early by closing the iterator (e.g. wrong language,
+  runaway length): the provider stream is closed and no more tokens are billed
+- Failover happens only before the first delta; no hedging (a hedged stream
+  would double the cost of the longest calls)
+- A provider error after the first delta, or a stream cut off by its finish
+  reason (e.g. max tokens), raises StreamInterrupted to the consumer (the
+  partial text is unusable); the attempt counts as failed
+- Set LLM_STREAMING_ENABLED=0 to make the pipeline use generate_text only
+
+Concurrency Budget (services/llm_budget.py):
+- Every provider request (hedged attempts and streams included) holds one
+  budget slot; batch generation shares one budget across its worker processes
+- LLM_MAX_CONCURRENCY=<n> caps a single process; unlimited by default
+
+Tracing (core/tracing.py):
+- Traced runs get one span per generate_text/stream_text call (provider,
+  tokens, hedging) with one child span per provider attempt
 
 Usage:
     from yt_autopilot.services.llm_router import generate_text
@@ -24,9 +65,14 @@ Usage:
         context="Topic: AI video generation tools",
         style_hints={"brand_tone": "casual", "target_audience": "tech enthusiasts"}
     )
+
+    for delta in stream_text(role="script_writer", task="...", context="..."):
+        print(delta, end="")
 """
 
-from typing import Dict, Any, Optional
+import os
+import time
+from typing import Dict, Any, Optional, Callable, Iterator, List, Tuple
 from yt_autopilot.core.logger import logger, truncate_for_log, log_fallback
 from yt_autopilot.core.config import (
     get_llm_anthropic_key,
@@ -34,6 +80,55 @@ from yt_autopilot.core.config import (
     LOG_TRUNCATE_TASK,
     LOG_TRUNCATE_CONTENT
 )
+from yt_autopilot.core.prompt_prefix import get_prompt_prefix_for
+from yt_autopilot.core.tracing import span, annotate_span, current_span_id, get_active_tracer
+from yt_autopilot.core.stream_guard import LLM_FALLBACK_MARKER, StreamInterrupted
+from yt_autopilot.services.llm_routing import get_router, ProviderAttempt
+from yt_autopilot.services.llm_budget import llm_slot
+from yt_autopilot.services.llm_usage import record_llm_call
+
+
+# Models requested from each provider. Responses report dated snapshot names
+# (e.g. "gpt-4o-2024-08-06"); the requested name is the cost-lookup fallback.
+OPENAI_MODEL = "gpt-4o"  # Latest GPT-4 optimized model
+ANTHROPIC_MODEL = "claude-3-5-sonnet-20241220"  # Latest Claude model (updated from deprecated 20241022)
+REQUESTED_MODELS: Dict[str, str] = {
+    "openai": OPENAI_MODEL,
+    "anthropic": ANTHROPIC_MODEL,
+}
+
+# Provider registry: name → (api key getter, call function), in default preference order.
+# Call functions take (api_key, role, prompt, attempt) and return text or None;
+# prompts referencing the run's CHANNEL PROFILE also pass system_prefix=<its text>.
+# The fake-provider harness (services/llm_fake_providers.py) swaps this registry in tests.
+PROVIDERS: Dict[str, Tuple[Callable[[], Optional[str]], Callable[..., Optional[str]]]] = {}
+
+# Streaming registry: name → stream function (api_key, role, prompt, attempt) → Iterator[str].
+# Shares API key getters with PROVIDERS; providers without an entry are skipped by stream_text().
+STREAM_PROVIDERS: Dict[str, Callable[..., Iterator[str]]] = {}
+
+# Finish/stop reasons of a stream that ended normally (OpenAI, Anthropic); any
+# other reason (e.g. "length", "max_tokens") means the text was cut off
+STREAM_COMPLETE_REASONS = ("stop", "end_turn", "stop_sequence")
+
+
+def is_streaming_enabled() -> bool:
+    """
+    Returns True unless streaming is disabled via LLM_STREAMING_ENABLED=0.
+    """
+    return os.getenv("LLM_STREAMING_ENABLED", "1").strip().lower() not in ("0", "false", "no")
+
+
+def _available_providers() -> List[Tuple[str, str]]:
+    """
+    Returns (provider_name, api_key) for every provider with a configured key.
+    """
+    available = []
+    for name, (get_key, _) in PROVIDERS.items():
+        api_key = get_key()
+        if api_key:
+            available.append((name, api_key))
+    return available
 
 
 def generate_text(
@@ -58,9 +153,10 @@ def generate_text(
         On failure: Returns fallback string "[LLM_FALLBACK] <summary>"
 
     Behavior:
-        1. Try Anthropic Claude if LLM_ANTHROPIC_API_KEY is set
-        2. Fall back to OpenAI GPT if LLM_OPENAI_API_KEY is set
-        3. Return graceful fallback if both fail or no keys
+        1. Rank configured providers (OpenAI, Anthropic) by rolling health window
+        2. Call the primary; hedge with the next provider after its p95 latency
+           (bounded by the role SLO), failover immediately on error
+        3. Return graceful fallback if all fail or no keys
 
     Example:
         >>> result = generate_text(
@@ -71,58 +167,350 @@ def generate_text(
         ... )
         >>> print(result)
         "Want to automate your YouTube channel with AI? Here's how..."
-
-    TODO (Future Enhancement):
-        - Per-agent model selection (e.g., ScriptWriter → GPT-4, SeoManager → Claude)
-        - Token usage tracking and logging
-        - Caching frequently used prompts
-        - Streaming support for long-form generation
     """
+    with span(f"llm:{role}", cat="llm"):
+        return _generate_text(role, task, context, style_hints)
+
+
+def _generate_text(
+    role: str,
+    task: str,
+    context: str,
+    style_hints: Optional[Dict[str, Any]]
+) -> str:
+    """generate_text() body, inside its trace span."""
     logger.info(f"LLM Router: Generating text for role={role}, task={truncate_for_log(task, LOG_TRUNCATE_TASK)}")
+    started_at = time.monotonic()
+
+    full_prompt = _build_full_prompt(task, context, style_hints)
+    prompt_prefix = get_prompt_prefix_for(full_prompt)
+    system_prefix = prompt_prefix.text if prompt_prefix else None
+
+    providers = _available_providers()
+
+    if providers:
+        logger.info(f"  Calling {' → '.join(name for name, _ in providers)} (latency-aware routing)...")
+
+        calls = [
+            (name, _bind_provider_call(name, api_key, role, full_prompt, system_prefix))
+            for name, api_key in providers
+        ]
+        outcome = get_router().execute(role, calls, deferred_start=True)
+
+        if outcome:
+            result = outcome.text
+            logger.info(f"  ✓ {outcome.provider} succeeded ({len(result)} chars)")
+            if prompt_prefix:
+                prompt_prefix.record_call(outcome.attempt.usage.get("cached_tokens", 0))
+            _record_usage(
+                role=role,
+                provider=outcome.provider,
+                model=outcome.attempt.model,
+                started_at=started_at,
+                usage=outcome.attempt.usage,
+                hedged=outcome.hedged,
+                failed_providers=outcome.failed_providers
+            )
+            return result
 
-    # Build style context if provided
-    style_context = ""
-    if style_hints:
-        style_context = "\n\nStyle Guidelines:\n"
-        for key, value in style_hints.items():
-            style_context += f"- {key}: {value}\n"
+        # 🚨 CRITICAL: Log provider fallback for visibility
+        log_fallback(
+            component="LLM_ROUTER",
+            fallback_type="ALL_PROVIDERS_FAILED",
+            reason=f"All providers failed or returned None ({', '.join(name for name, _ in providers)})",
+            impact="CRITICAL"
+        )
+        logger.warning("  ✗ All LLM providers failed, using deterministic fallback...")
+    else:
+        # No key configured - graceful fallback
+        # 🚨 CRITICAL: Log no provider fallback for visibility
+        log_fallback(
+            component="LLM_ROUTER",
+            fallback_type="NO_PROVIDER",
+            reason="No LLM API keys configured (LLM_OPENAI_API_KEY / LLM_ANTHROPIC_API_KEY missing)",
+            impact="CRITICAL"
+        )
+        logger.warning("  No LLM provider available - returning fallback")
+
+    fallback = _generate_fallback(role, task, context)
+    logger.info(f"  Fallback generated: {truncate_for_log(fallback, LOG_TRUNCATE_CONTENT)}")
+    _record_usage(
+        role=role,
+        provider="fallback",
+        model=None,
+        started_at=started_at,
+        failed_providers=[name for name, _ in providers],
+        status="fallback"
+    )
+    return fallback
 
-    # Build full prompt
-    full_prompt = f"Task: {task}\n\nContext:\n{context}{style_context}"
 
-    # Use OpenAI GPT as primary provider (Fase 1-BIS-2: Anthropic removed, will be re-added in future for per-agent selection)
-    openai_key = get_llm_openai_key()
-    if openai_key:
-        logger.info("  Calling OpenAI GPT...")
-        result = _call_openai(openai_key, role, full_prompt)
-        if result:
-            logger.info(f"  ✓ OpenAI GPT succeeded ({len(result)} chars)")
-            return result
-        else:
-            # 🚨 CRITICAL: Log OpenAI fallback for visibility
-            log_fallback(
-                component="LLM_ROUTER",
-                fallback_type="OPENAI_FAILED",
-                reason="OpenAI API call failed or returned None",
-                impact="CRITICAL"
+def stream_text(
+    role: str,
+    task: str,
+    context: str,
+    style_hints: Optional[Dict[str, Any]] = None
+) -> Iterator[str]:
+    """
+    Streams generated text as deltas (same prompt format as generate_text).
+
+    Providers are tried in health-ranked order until one produces output.
+    Closing the returned iterator aborts the provider stream.
+
+    Args:
+        role: Agent role identifier (e.g., "script_writer")
+        task: High-level instruction for the LLM
+        context: Specific content to process
+        style_hints: Optional dict with branding/style info
+
+    Yields:
+        Text deltas. If no provider works, yields the deterministic fallback once.
+
+    Raises:
+        StreamInterrupted: If the provider stream broke after yielding text
+
+    Example:
+        >>> chunks = []
+        >>> for delta in stream_text("script_writer", "write script", "Topic: AI"):
+        ...     chunks.append(delta)
+        >>> script = "".join(chunks)
+    """
+    # activate=False: a generator runs in its consumer's context, so the span
+    # must not become the parent of the consumer's own spans between deltas
+    with span(f"llm_stream:{role}", cat="llm", activate=False):
+        yield from _stream_text(role, task, context, style_hints)
+
+
+def _stream_text(
+    role: str,
+    task: str,
+    context: str,
+    style_hints: Optional[Dict[str, Any]]
+) -> Iterator[str]:
+    """stream_text() body, inside its trace span."""
+    logger.info(f"LLM Router: Streaming text for role={role}, task={truncate_for_log(task, LOG_TRUNCATE_TASK)}")
+    started_at = time.monotonic()
+
+    full_prompt = _build_full_prompt(task, context, style_hints)
+    prompt_prefix = get_prompt_prefix_for(full_prompt)
+    prefix_kwargs = {"system_prefix": prompt_prefix.text} if prompt_prefix else {}
+
+    providers = dict(
+        (name, api_key) for name, api_key in _available_providers() if name in STREAM_PROVIDERS
+    )
+    router = get_router()
+    failed_providers: List[str] = []
+
+    for name in router.rank(list(providers), role):
+        attempt = ProviderAttempt(name, role)
+        first_delta_ms: Optional[float] = None
+        chars = 0
+
+        # The budget slot is held until the stream ends or the consumer closes it
+        with llm_slot():
+            attempt.mark_started()
+            deltas = STREAM_PROVIDERS[name](providers[name], role, full_prompt, attempt, **prefix_kwargs)
+            try:
+                for delta in deltas:
+                    if not delta:
+                        continue
+                    if first_delta_ms is None:
+                        first_delta_ms = attempt.elapsed_ms
+                        logger.info(f"  ✓ {name} streaming (first delta after {first_delta_ms:.0f}ms)")
+                    chars += len(delta)
+                    yield delta
+            except StreamInterrupted as e:
+                logger.error(f"  ✗ {name} stream interrupted after {chars} chars: {e}")
+                router.health(name).record(attempt.elapsed_ms, ok=False)
+                _record_usage(
+                    role=role,
+                    provider=name,
+                    model=attempt.model,
+                    started_at=started_at,
+                    usage=attempt.usage,
+                    failed_providers=failed_providers,
+                    streamed=True,
+                    first_delta_ms=first_delta_ms,
+                    status="interrupted"
+                )
+                raise
+            except GeneratorExit:
+                # Consumer stopped early: close the provider stream so no more tokens are generated
+                if hasattr(deltas, "close"):
+                    deltas.close()
+                logger.info(f"  ⏹ {name} stream aborted by consumer after {chars} chars")
+                _record_usage(
+                    role=role,
+                    provider=name,
+                    model=attempt.model,
+                    started_at=started_at,
+                    usage=attempt.usage,
+                    failed_providers=failed_providers,
+                    streamed=True,
+                    first_delta_ms=first_delta_ms,
+                    status="aborted"
+                )
+                raise
+
+        router.health(name).record(attempt.elapsed_ms, ok=first_delta_ms is not None)
+
+        if first_delta_ms is not None:
+            logger.info(f"  ✓ {name} stream complete ({chars} chars)")
+            if prompt_prefix:
+                prompt_prefix.record_call(attempt.usage.get("cached_tokens", 0))
+            _record_usage(
+                role=role,
+                provider=name,
+                model=attempt.model,
+                started_at=started_at,
+                usage=attempt.usage,
+                failed_providers=failed_providers,
+                streamed=True,
+                first_delta_ms=first_delta_ms
             )
-            logger.warning("  ✗ OpenAI GPT failed, using deterministic fallback...")
+            return
+
+        failed_providers.append(name)
 
-    # No key or provider failed - graceful fallback
-    # 🚨 CRITICAL: Log no provider fallback for visibility
     log_fallback(
         component="LLM_ROUTER",
-        fallback_type="NO_PROVIDER",
-        reason="No LLM API keys configured (LLM_OPENAI_API_KEY missing)",
+        fallback_type="STREAM_UNAVAILABLE",
+        reason=(
+            f"All streaming providers failed ({', '.join(failed_providers)})"
+            if failed_providers else "No streaming-capable LLM provider configured"
+        ),
         impact="CRITICAL"
     )
-    logger.warning("  No LLM provider available - returning fallback")
     fallback = _generate_fallback(role, task, context)
-    logger.info(f"  Fallback generated: {truncate_for_log(fallback, LOG_TRUNCATE_CONTENT)}")
-    return fallback
+    _record_usage(
+        role=role,
+        provider="fallback",
+        model=None,
+        started_at=started_at,
+        failed_providers=failed_providers,
+        streamed=True,
+        status="fallback"
+    )
+    yield fallback
+
+
+def _build_full_prompt(task: str, context: str, style_hints: Optional[Dict[str, Any]]) -> str:
+    """
+    Builds the provider prompt: task, context and optional style guidelines.
+    """
+    # Build style context if provided
+    style_context = ""
+    if style_hints:
+        style_context = "\n\nStyle Guidelines:\n"
+        for key, value in style_hints.items():
+            style_context += f"- {key}: {value}\n"
+
+    return f"Task: {task}\n\nContext:\n{context}{style_context}"
 
 
-def _call_anthropic(api_key: str, role: str, prompt: str) -> Optional[str]:
+def _record_usage(role: str, provider: str, model: Optional[str], started_at: float, **kwargs) -> None:
+    """
+    Writes the usage record for one generate_text call.
+
+    Accounting must never break generation: write errors are logged and ignored.
+    """
+    if not kwargs.get("streamed"):
+        # Stream spans are not the current span (see stream_text), so only calls are annotated
+        usage = kwargs.get("usage") or {}
+        annotate_span(
+            provider=provider,
+            model=model,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            cached_tokens=usage.get("cached_tokens", 0),
+            hedged=kwargs.get("hedged", False),
+            failed_providers=kwargs.get("failed_providers") or [],
+            status=kwargs.get("status", "ok")
+        )
+    try:
+        record_llm_call(
+            role=role,
+            provider=provider,
+            model=model,
+            latency_ms=(time.monotonic() - started_at) * 1000,
+            requested_model=REQUESTED_MODELS.get(provider),
+            **kwargs
+        )
+    except Exception as e:
+        log_fallback(
+            component="LLM_ROUTER",
+            fallback_type="USAGE_NOT_RECORDED",
+            reason=f"Usage log write failed: {e}",
+            impact="LOW"
+        )
+
+
+def _bind_provider_call(
+    provider: str,
+    api_key: str,
+    role: str,
+    prompt: str,
+    system_prefix: Optional[str] = None
+) -> Callable[[ProviderAttempt], Optional[str]]:
+    """
+    Binds a registered provider call to one prompt for the routing engine.
+
+    The call marks its attempt started once it holds a budget slot, so it is
+    meant for LatencyRouter.execute(..., deferred_start=True).
+    """
+    _, call_fn = PROVIDERS[provider]
+    prefix_kwargs = {"system_prefix": system_prefix} if system_prefix else {}
+    # Attempts run on the routing executor: carry the trace over explicitly
+    tracer, parent_span_id = get_active_tracer(), current_span_id()
+
+    def _call(attempt: ProviderAttempt) -> Optional[str]:
+        with span(f"attempt:{provider}", cat="llm_attempt", parent_id=parent_span_id, tracer=tracer) as attempt_span, \
+                llm_slot(attempt.cancelled, trace_args=attempt_span) as acquired:
+            if not acquired:
+                # Hedge loser cancelled while waiting for a budget slot
+                return None
+            # Latency and the hedge timer count from here, not from the slot wait
+            attempt.mark_started()
+            text = call_fn(api_key, role, prompt, attempt, **prefix_kwargs)
+            if attempt_span is not None:
+                attempt_span.update(ok=bool(text), cancelled=attempt.cancelled.is_set())
+            return text
+
+    return _call
+
+
+def _openai_messages(role: str, prompt: str, system_prefix: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Builds OpenAI chat messages. The stable prefix comes first so OpenAI's
+    automatic prompt caching (longest common prefix) can reuse it across roles.
+    """
+    messages = []
+    if system_prefix:
+        messages.append({"role": "system", "content": system_prefix})
+    messages.append({
+        "role": "system",
+        "content": f"You are a helpful AI assistant acting as a {role} for a YouTube automation system."
+    })
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+def _anthropic_system_kwargs(system_prefix: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Builds the Anthropic system parameter: the stable prefix as a cached block.
+    """
+    if not system_prefix:
+        return {}
+    return {"system": [{"type": "text", "text": system_prefix, "cache_control": {"type": "ephemeral"}}]}
+
+
+def _call_anthropic(
+    api_key: str,
+    role: str,
+    prompt: str,
+    attempt: Optional[ProviderAttempt] = None,
+    system_prefix: Optional[str] = None
+) -> Optional[str]:
     """
     Call Anthropic Claude API.
 
@@ -130,6 +518,9 @@ def _call_anthropic(api_key: str, role: str, prompt: str) -> Optional[str]:
         api_key: Anthropic API key
         role: Agent role (for logging)
         prompt: Full prompt text
+        attempt: Optional routing handle (closing the client cancels the request,
+                 attempt.timeout_s bounds it; model and token usage are reported back on it)
+        system_prefix: Optional stable CHANNEL PROFILE prefix (prompt-cached)
 
     Returns:
         Generated text or None on failure
@@ -138,11 +529,13 @@ def _call_anthropic(api_key: str, role: str, prompt: str) -> Optional[str]:
         import anthropic
 
         client = anthropic.Anthropic(api_key=api_key)
+        if attempt:
+            attempt.on_cancel(client.close)
 
         # Call Claude with appropriate model
         # Using Claude 3.5 Sonnet for balance of speed and quality
         response = client.messages.create(
-            model="claude-3-5-sonnet-20241220",  # Latest Claude model (updated from deprecated 20241022)
+            model=ANTHROPIC_MODEL,
             max_tokens=2048,
             temperature=0.7,  # Moderate creativity
             messages=[
@@ -150,9 +543,21 @@ def _call_anthropic(api_key: str, role: str, prompt: str) -> Optional[str]:
                     "role": "user",
                     "content": prompt
                 }
-            ]
+            ],
+            **_anthropic_system_kwargs(system_prefix),
+            **({"timeout": attempt.timeout_s} if attempt else {})
         )
 
+        if attempt:
+            attempt.model = response.model
+            usage = getattr(response, "usage", None)
+            if usage:
+                attempt.usage = {
+                    "prompt_tokens": (usage.input_tokens or 0) + (getattr(usage, "cache_read_input_tokens", 0) or 0),
+                    "completion_tokens": usage.output_tokens or 0,
+                    "cached_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+                }
+
         # Extract text from response
         if response.content and len(response.content) > 0:
             text = response.content[0].text
@@ -171,6 +576,9 @@ def _call_anthropic(api_key: str, role: str, prompt: str) -> Optional[str]:
         logger.error("  Anthropic SDK not installed - run: pip install anthropic")
         return None
     except Exception as e:
+        if attempt and attempt.cancelled.is_set():
+            logger.debug(f"  Anthropic request cancelled (hedge lost): {e}")
+            return None
         # 🚨 Log Anthropic API error fallback
         log_fallback(
             component="LLM_ROUTER_ANTHROPIC",
@@ -182,7 +590,13 @@ def _call_anthropic(api_key: str, role: str, prompt: str) -> Optional[str]:
         return None
 
 
-def _call_openai(api_key: str, role: str, prompt: str) -> Optional[str]:
+def _call_openai(
+    api_key: str,
+    role: str,
+    prompt: str,
+    attempt: Optional[ProviderAttempt] = None,
+    system_prefix: Optional[str] = None
+) -> Optional[str]:
     """
     Call OpenAI GPT API.
 
@@ -190,6 +604,9 @@ def _call_openai(api_key: str, role: str, prompt: str) -> Optional[str]:
         api_key: OpenAI API key
         role: Agent role (for logging)
         prompt: Full prompt text
+        attempt: Optional routing handle (closing the client cancels the request,
+                 attempt.timeout_s bounds it; model and token usage are reported back on it)
+        system_prefix: Optional stable CHANNEL PROFILE prefix (prompt-cached)
 
     Returns:
         Generated text or None on failure
@@ -198,25 +615,30 @@ def _call_openai(api_key: str, role: str, prompt: str) -> Optional[str]:
         import openai
 
         client = openai.OpenAI(api_key=api_key)
+        if attempt:
+            attempt.on_cancel(client.close)
 
         # Call GPT with appropriate model
         # Using GPT-4o for best quality/speed balance
         response = client.chat.completions.create(
-            model="gpt-4o",  # Latest GPT-4 optimized model
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"You are a helpful AI assistant acting as a {role} for a YouTube automation system."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
+            model=OPENAI_MODEL,
+            messages=_openai_messages(role, prompt, system_prefix),
             max_tokens=2048,
-            temperature=0.7  # Moderate creativity
+            temperature=0.7,  # Moderate creativity
+            **({"timeout": attempt.timeout_s} if attempt else {})
         )
 
+        if attempt:
+            attempt.model = response.model
+            usage = getattr(response, "usage", None)
+            if usage:
+                details = getattr(usage, "prompt_tokens_details", None)
+                attempt.usage = {
+                    "prompt_tokens": usage.prompt_tokens or 0,
+                    "completion_tokens": usage.completion_tokens or 0,
+                    "cached_tokens": (getattr(details, "cached_tokens", 0) or 0) if details else 0,
+                }
+
         # Extract text from response
         if response.choices and len(response.choices) > 0:
             text = response.choices[0].message.content
@@ -236,6 +658,9 @@ def _call_openai(api_key: str, role: str, prompt: str) -> Optional[str]:
         logger.error("  OpenAI SDK not installed - run: pip install openai")
         return None
     except Exception as e:
+        if attempt and attempt.cancelled.is_set():
+            logger.debug(f"  OpenAI request cancelled (hedge lost): {e}")
+            return None
         # 🚨 CRITICAL: Log OpenAI API error fallback
         log_fallback(
             component="LLM_ROUTER_OPENAI",
@@ -247,6 +672,172 @@ def _call_openai(api_key: str, role: str, prompt: str) -> Optional[str]:
         return None
 
 
+def _stream_anthropic(
+    api_key: str,
+    role: str,
+    prompt: str,
+    attempt: Optional[ProviderAttempt] = None,
+    system_prefix: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Stream Anthropic Claude API output (same model/settings as _call_anthropic).
+
+    Yields:
+        Text deltas; nothing on failure before the first delta (errors are logged)
+
+    Raises:
+        StreamInterrupted: On a failure or truncated finish after the first delta
+    """
+    yielded = False
+    try:
+        import anthropic
+
+        client = anthropic.Anthropic(api_key=api_key)
+        if attempt:
+            attempt.on_cancel(client.close)
+
+        with client.messages.stream(
+            model=ANTHROPIC_MODEL,
+            max_tokens=2048,
+            temperature=0.7,
+            messages=[{"role": "user", "content": prompt}],
+            **_anthropic_system_kwargs(system_prefix),
+            **({"timeout": attempt.timeout_s} if attempt else {})
+        ) as stream:
+            for text in stream.text_stream:
+                yielded = True
+                yield text
+
+            final = stream.get_final_message()
+            if yielded and final.stop_reason not in STREAM_COMPLETE_REASONS:
+                raise StreamInterrupted(f"Anthropic stream ended with stop_reason={final.stop_reason}")
+            if attempt:
+                attempt.model = final.model
+                usage = final.usage
+                cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+                attempt.usage = {
+                    "prompt_tokens": (usage.input_tokens or 0) + cache_read,
+                    "completion_tokens": usage.output_tokens or 0,
+                    "cached_tokens": cache_read,
+                }
+
+    except ImportError:
+        log_fallback(
+            component="LLM_ROUTER_ANTHROPIC",
+            fallback_type="SDK_NOT_INSTALLED",
+            reason="anthropic package not installed",
+            impact="HIGH"
+        )
+        logger.error("  Anthropic SDK not installed - run: pip install anthropic")
+    except StreamInterrupted:
+        raise
+    except Exception as e:
+        if attempt and attempt.cancelled.is_set() and not yielded:
+            logger.debug(f"  Anthropic stream cancelled: {e}")
+            return
+        log_fallback(
+            component="LLM_ROUTER_ANTHROPIC",
+            fallback_type="STREAM_ERROR",
+            reason=str(e),
+            impact="HIGH"
+        )
+        logger.error(f"  Anthropic streaming error: {e}")
+        if yielded:
+            raise StreamInterrupted(f"Anthropic stream failed mid-response: {e}") from e
+
+
+def _stream_openai(
+    api_key: str,
+    role: str,
+    prompt: str,
+    attempt: Optional[ProviderAttempt] = None,
+    system_prefix: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Stream OpenAI GPT API output (same model/settings as _call_openai).
+
+    Yields:
+        Text deltas; nothing on failure before the first delta (errors are logged)
+
+    Raises:
+        StreamInterrupted: On a failure or truncated finish after the first delta
+    """
+    yielded = False
+    try:
+        import openai
+
+        client = openai.OpenAI(api_key=api_key)
+        if attempt:
+            attempt.on_cancel(client.close)
+
+        stream = client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=_openai_messages(role, prompt, system_prefix),
+            max_tokens=2048,
+            temperature=0.7,
+            stream=True,
+            stream_options={"include_usage": True},
+            **({"timeout": attempt.timeout_s} if attempt else {})
+        )
+
+        finish_reason = None
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].finish_reason:
+                    finish_reason = chunk.choices[0].finish_reason
+                if attempt and chunk.usage:
+                    attempt.model = chunk.model
+                    details = getattr(chunk.usage, "prompt_tokens_details", None)
+                    attempt.usage = {
+                        "prompt_tokens": chunk.usage.prompt_tokens or 0,
+                        "completion_tokens": chunk.usage.completion_tokens or 0,
+                        "cached_tokens": (getattr(details, "cached_tokens", 0) or 0) if details else 0,
+                    }
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yielded = True
+                    yield chunk.choices[0].delta.content
+        finally:
+            stream.close()
+
+        if yielded and finish_reason not in STREAM_COMPLETE_REASONS:
+            raise StreamInterrupted(f"OpenAI stream ended with finish_reason={finish_reason}")
+
+    except ImportError:
+        log_fallback(
+            component="LLM_ROUTER_OPENAI",
+            fallback_type="SDK_NOT_INSTALLED",
+            reason="openai package not installed",
+            impact="CRITICAL"
+        )
+        logger.error("  OpenAI SDK not installed - run: pip install openai")
+    except StreamInterrupted:
+        raise
+    except Exception as e:
+        if attempt and attempt.cancelled.is_set() and not yielded:
+            logger.debug(f"  OpenAI stream cancelled: {e}")
+            return
+        log_fallback(
+            component="LLM_ROUTER_OPENAI",
+            fallback_type="STREAM_ERROR",
+            reason=str(e),
+            impact="CRITICAL"
+        )
+        logger.error(f"  OpenAI streaming error: {e}")
+        if yielded:
+            raise StreamInterrupted(f"OpenAI stream failed mid-response: {e}") from e
+
+
+PROVIDERS.update({
+    "openai": (get_llm_openai_key, _call_openai),
+    "anthropic": (get_llm_anthropic_key, _call_anthropic),
+})
+
+STREAM_PROVIDERS.update({
+    "openai": _stream_openai,
+    "anthropic": _stream_anthropic,
+})
+
+
 def _generate_fallback(role: str, task: str, context: str) -> str:
     """
     Generate deterministic fallback text when LLM providers are unavailable.
@@ -265,7 +856,7 @@ def _generate_fallback(role: str, task: str, context: str) -> str:
     # Extract key information from context for minimal fallback
     context_preview = truncate_for_log(context.replace("\n", " "), LOG_TRUNCATE_CONTENT)
 
-    fallback = f"[LLM_FALLBACK] {task}\n\nBased on: {context_preview}"
+    fallback = f"{LLM_FALLBACK_MARKER} {task}\n\nBased on: {context_preview}"
 
     return fallback
 
@@ -290,34 +881,3 @@ def _generate_fallback(role: str, task: str, context: str) -> str:
 #     This allows optimization of cost vs quality per use case.
 #     """
 #     pass
-#
-# TODO: Token Usage Tracking
-#
-# Track and log token consumption for cost monitoring:
-#
-# def log_token_usage(role: str, provider: str, input_tokens: int, output_tokens: int):
-#     """Log token usage to datastore for cost analysis."""
-#     pass
-#
-# TODO: Prompt Caching
-#
-# Cache frequently used prompts (e.g., system prompts, style guidelines):
-#
-# _prompt_cache = {}
-#
-# def get_cached_prompt(cache_key: str) -> Optional[str]:
-#     """Retrieve cached prompt to save tokens."""
-#     return _prompt_cache.get(cache_key)
-#
-# TODO: Rate Limiting
-#
-# Implement rate limiting to avoid API quotas:
-#
-# from time import sleep
-# from datetime import datetime
-#
-# _last_call_time = {}
-#
-# def rate_limit(provider: str, min_interval_seconds: float = 0.1):
-#     """Ensure minimum interval between API calls."""
-#     pass
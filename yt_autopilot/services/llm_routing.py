@@ -0,0 +1,465 @@
+"""
+LLM Routing Engine: Latency-aware provider selection with hedged requests.
+
+Used by services/llm_router.generate_text() to decide which provider serves a
+call and when to fire a backup request.
+
+Routing Model:
+- Every provider keeps a rolling window of recent calls (latency + success)
+- Providers are ranked by health: error rate first, then p95 latency
+- Each role has a latency SLO (ROLE_LATENCY_SLO_MS, default DEFAULT_LATENCY_SLO_MS)
+- Hedging: if the primary has not answered after its p95 latency
+  (clamped to [MIN_HEDGE_DELAY_MS, role SLO]), the next provider is called in parallel.
+  The first successful response wins, the loser is cancelled.
+  A cancelled loser still records its elapsed time as a censored sample (a
+  lower bound on its latency), so a provider that keeps losing hedges sees
+  its p95 rise instead of only keeping the calls it won.
+- Failover: if an attempt fails, the next provider is called immediately
+- Deferred start: calls that first wait for a budget slot (llm_budget) pass
+  deferred_start=True and call attempt.mark_started() once they hold it.
+  Slot wait is then neither hedged against nor recorded as provider latency.
+
+Cancellation:
+    Provider calls receive a ProviderAttempt. Providers register a cancel callback
+    (e.g. closing their HTTP client) so the losing request is aborted instead of
+    running to completion in the background. Closing a client is best effort,
+    so two more bounds apply to a losing attempt:
+    - Its router worker returns as soon as the attempt is cancelled; the
+      provider call finishes on its own daemon thread, so repeated hedges
+      never fill the router's worker pool
+    - Providers pass attempt.timeout_s to their SDK as the per-request
+      timeout, which bounds how long that thread can live
+
+Usage:
+    from yt_autopilot.services.llm_routing import get_router
+
+    outcome = get_router().execute(
+        role="script_writer",
+        calls=[("openai", openai_call), ("anthropic", anthropic_call)]
+    )
+    if outcome:
+        print(outcome.provider, outcome.attempt.usage, outcome.text)
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from yt_autopilot.core.logger import logger
+
+
+# Latency SLOs per role (milliseconds). Long-form generation gets more headroom.
+DEFAULT_LATENCY_SLO_MS = 20000
+ROLE_LATENCY_SLO_MS: Dict[str, int] = {
+    "script_writer": 45000,
+    "narrative_expansion_specialist": 45000,
+    "narrative_architect": 30000,
+    "visual_planner": 30000,
+    "editorial_strategist": 25000,
+    "content_strategist": 25000,
+    "language_corrector": 15000,
+    "audience_inference": 8000,
+    "enum_validator": 8000,
+    "content_type_detector": 8000,
+    "seo_title_generator": 10000,
+    "seo_manager_tag_generator": 10000,
+    "script_writer_hook_optimizer": 10000,
+}
+
+# Hedge never fires earlier than this (avoids doubling every fast call)
+MIN_HEDGE_DELAY_MS = 1500
+
+# Rolling window per provider
+HEALTH_WINDOW_SIZE = 50
+MIN_SAMPLES_FOR_STATS = 5
+
+# Providers above this error rate are ranked after healthy ones
+UNHEALTHY_ERROR_RATE = 0.5
+
+MAX_CONCURRENT_ATTEMPTS = 16
+
+# Per-request timeout of a provider call, as a multiple of the role SLO
+ATTEMPT_TIMEOUT_SLO_MULTIPLIER = 3
+
+# How often a router worker checks whether its attempt was cancelled
+CANCEL_POLL_SECONDS = 0.05
+
+
+def get_role_slo_ms(role: str) -> int:
+    """
+    Returns the latency SLO for a role.
+
+    Args:
+        role: Agent role identifier (e.g. "script_writer")
+
+    Returns:
+        SLO in milliseconds (ROLE_LATENCY_SLO_MS entry or DEFAULT_LATENCY_SLO_MS)
+    """
+    return ROLE_LATENCY_SLO_MS.get(role, DEFAULT_LATENCY_SLO_MS)
+
+
+def is_hedging_enabled() -> bool:
+    """
+    Returns True unless hedged requests are disabled via LLM_HEDGING_ENABLED=0.
+    """
+    return os.getenv("LLM_HEDGING_ENABLED", "1").strip().lower() not in ("0", "false", "no")
+
+
+class ProviderAttempt:
+    """
+    Handle for one in-flight provider call.
+
+    Providers call on_cancel() to register cleanup (e.g. client.close) that
+    aborts the request when the router cancels this attempt, pass timeout_s
+    to their SDK as the per-request timeout, and fill in model/usage from the
+    provider response for usage accounting.
+
+    The latency clock (started_at, elapsed_ms) runs from mark_started(), i.e.
+    from when the request can actually go out.
+    """
+
+    def __init__(self, provider: str, role: str):
+        self.provider = provider
+        self.role = role
+        self.model: Optional[str] = None
+        self.usage: Dict[str, int] = {}
+        self.timeout_s = get_role_slo_ms(role) * ATTEMPT_TIMEOUT_SLO_MULTIPLIER / 1000
+        self.started_at = time.monotonic()
+        self.started = threading.Event()
+        self.cancelled = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Registers a cancel callback (runs immediately if already cancelled)."""
+        with self._lock:
+            if not self.cancelled.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def cancel(self) -> None:
+        """Marks the attempt cancelled and runs registered callbacks (best effort)."""
+        with self._lock:
+            if self.cancelled.is_set():
+                return
+            self.cancelled.set()
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"  Cancel callback for {self.provider} failed: {e}")
+
+    def mark_started(self) -> None:
+        """Starts the latency clock (e.g. once a budget slot is acquired)."""
+        self.started_at = time.monotonic()
+        self.started.set()
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Milliseconds since mark_started() (0 before)."""
+        if not self.started.is_set():
+            return 0.0
+        return (time.monotonic() - self.started_at) * 1000
+
+
+class ProviderHealth:
+    """
+    Rolling latency/error window for one provider.
+    """
+
+    def __init__(self, name: str, window_size: int = HEALTH_WINDOW_SIZE):
+        self.name = name
+        self._samples: Deque[Tuple[float, bool]] = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        with self._lock:
+            self._samples.append((latency_ms, ok))
+
+    def record_censored(self, latency_ms: float) -> None:
+        """
+        Records a cancelled attempt that ran for at least latency_ms.
+
+        The true latency is unknown but no lower, so it is kept as a latency
+        sample (not an error): it pulls the percentiles toward the slow tail
+        that the provider's won calls alone would hide.
+        """
+        self.record(latency_ms, ok=True)
+
+    @property
+    def sample_count(self) -> int:
+        return len(self._samples)
+
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self._samples:
+                return 0.0
+            return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Latency percentile over successful calls in the window.
+
+        Returns:
+            Latency in ms, or None if fewer than MIN_SAMPLES_FOR_STATS successes
+        """
+        with self._lock:
+            latencies = sorted(latency for latency, ok in self._samples if ok)
+        if len(latencies) < MIN_SAMPLES_FOR_STATS:
+            return None
+        index = min(len(latencies) - 1, int(round(percentile * (len(latencies) - 1))))
+        return latencies[index]
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        return {
+            "samples": self.sample_count,
+            "error_rate": self.error_rate(),
+            "p50_ms": self.latency_percentile(0.50),
+            "p95_ms": self.latency_percentile(0.95),
+        }
+
+
+ProviderCall = Callable[[ProviderAttempt], Optional[str]]
+
+
+class RoutingOutcome:
+    """
+    Result of LatencyRouter.execute(): winning text plus routing metadata.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        attempt: ProviderAttempt,
+        hedged: bool,
+        failed_providers: List[str]
+    ):
+        self.text = text
+        self.attempt = attempt
+        self.provider = attempt.provider
+        self.hedged = hedged
+        self.failed_providers = failed_providers
+
+
+class LatencyRouter:
+    """
+    Executes LLM calls across providers with health ranking, hedging and failover.
+    """
+
+    def __init__(self, max_workers: int = MAX_CONCURRENT_ATTEMPTS):
+        self._health: Dict[str, ProviderHealth] = {}
+        self._health_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-attempt")
+
+    @staticmethod
+    def _run_attempt(call: ProviderCall, attempt: ProviderAttempt) -> Optional[str]:
+        """
+        Runs a provider call on its own daemon thread and waits for it or for cancellation.
+
+        A cancelled (hedge-losing) attempt returns None at once and frees this
+        router worker; the provider call itself ends when its client is closed
+        or its per-request timeout (attempt.timeout_s) expires.
+        """
+        done = threading.Event()
+        result: Dict[str, object] = {}
+
+        def _target() -> None:
+            try:
+                result["text"] = call(attempt)
+            except BaseException as e:
+                result["error"] = e
+            finally:
+                done.set()
+
+        threading.Thread(target=_target, name=f"llm-call-{attempt.provider}", daemon=True).start()
+        while not done.wait(CANCEL_POLL_SECONDS):
+            if attempt.cancelled.is_set():
+                return None
+        if "error" in result:
+            raise result["error"]
+        return result.get("text")
+
+    def health(self, provider: str) -> ProviderHealth:
+        with self._health_lock:
+            if provider not in self._health:
+                self._health[provider] = ProviderHealth(provider)
+            return self._health[provider]
+
+    def health_report(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Snapshot of every provider's rolling window (for logging/CLI)."""
+        with self._health_lock:
+            providers = list(self._health)
+        return {name: self.health(name).snapshot() for name in providers}
+
+    def rank(self, providers: List[str], role: str) -> List[str]:
+        """
+        Orders providers for a role: healthy before unhealthy, then by p95 vs SLO.
+
+        Providers without enough samples keep their configured order, so the
+        default preference (first in list) holds until stats say otherwise.
+        """
+        slo = get_role_slo_ms(role)
+
+        def sort_key(item: Tuple[int, str]) -> Tuple[int, int, float, int]:
+            position, name = item
+            health = self.health(name)
+            unhealthy = health.sample_count >= MIN_SAMPLES_FOR_STATS and \
+                health.error_rate() > UNHEALTHY_ERROR_RATE
+            p95 = health.latency_percentile(0.95)
+            over_slo = p95 is not None and p95 > slo
+            return (int(unhealthy), int(over_slo), p95 if over_slo else 0.0, position)
+
+        return [name for _, name in sorted(enumerate(providers), key=sort_key)]
+
+    def hedge_delay_ms(self, provider: str, role: str) -> float:
+        """
+        Delay before firing a hedged request: primary p95, clamped to [MIN_HEDGE_DELAY_MS, SLO].
+
+        Without stats the role SLO is used (hedge only when the SLO is at risk).
+        """
+        slo = get_role_slo_ms(role)
+        p95 = self.health(provider).latency_percentile(0.95)
+        if p95 is None:
+            return float(slo)
+        return float(min(slo, max(MIN_HEDGE_DELAY_MS, p95)))
+
+    def execute(
+        self,
+        role: str,
+        calls: List[Tuple[str, ProviderCall]],
+        hedge: Optional[bool] = None,
+        deferred_start: bool = False
+    ) -> Optional[RoutingOutcome]:
+        """
+        Runs a call against ranked providers until one succeeds.
+
+        Args:
+            role: Agent role (selects the latency SLO)
+            calls: (provider_name, call_fn) pairs in default preference order.
+                   call_fn(attempt) returns text or None on failure.
+            hedge: Override hedging (default: is_hedging_enabled())
+            deferred_start: Calls invoke attempt.mark_started() themselves once
+                they may send (e.g. after acquiring a budget slot). Until then
+                the hedge timer does not run and no latency is recorded.
+
+        Returns:
+            RoutingOutcome for the first successful attempt, or None if all failed
+        """
+        if not calls:
+            return None
+
+        hedge = is_hedging_enabled() if hedge is None else hedge
+        call_map = dict(calls)
+        queue = self.rank([name for name, _ in calls], role)
+
+        pending: Dict[Future, ProviderAttempt] = {}
+        # Attempt whose hedge is armed, and the delay from its start
+        hedge_attempt: Optional[ProviderAttempt] = None
+        hedge_delay_s = 0.0
+        hedged = False
+        failed_providers: List[str] = []
+
+        def launch(provider: str) -> None:
+            nonlocal hedge_attempt, hedge_delay_s
+            attempt = ProviderAttempt(provider, role)
+            if not deferred_start:
+                attempt.mark_started()
+            future = self._executor.submit(self._run_attempt, call_map[provider], attempt)
+            pending[future] = attempt
+            if hedge and queue and len(pending) == 1:
+                hedge_attempt = attempt
+                hedge_delay_s = self.hedge_delay_ms(provider, role) / 1000
+            else:
+                hedge_attempt = None
+
+        def hedge_due_in() -> Optional[float]:
+            """Seconds until the armed hedge fires (None: not started yet)."""
+            if not hedge_attempt.started.is_set():
+                return None
+            return hedge_attempt.started_at + hedge_delay_s - time.monotonic()
+
+        launch(queue.pop(0))
+
+        while pending:
+            timeout = None
+            if hedge_attempt is not None:
+                due_in = hedge_due_in()
+                # Still waiting for its budget slot: check again shortly
+                timeout = CANCEL_POLL_SECONDS if due_in is None else max(0.0, due_in)
+
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                due_in = hedge_due_in()
+                if due_in is None or due_in > 0:
+                    continue
+
+                # Primary is slower than its p95: fire hedged request
+                slow_provider = hedge_attempt.provider
+                backup = queue.pop(0)
+                logger.info(
+                    f"  ⏱ {slow_provider} slower than hedge delay for role={role} - "
+                    f"hedging with {backup}"
+                )
+                launch(backup)
+                hedge_attempt = None
+                hedged = True
+                continue
+
+            for future in done:
+                attempt = pending.pop(future)
+                try:
+                    text = future.result()
+                except Exception as e:
+                    logger.warning(f"  {attempt.provider} attempt raised: {e}")
+                    text = None
+
+                if attempt.cancelled.is_set():
+                    continue
+
+                if attempt.started.is_set():
+                    # Never-started attempts (no budget slot) say nothing about the provider
+                    self.health(attempt.provider).record(attempt.elapsed_ms, ok=bool(text))
+
+                if text:
+                    for loser_future, loser in pending.items():
+                        if loser.started.is_set():
+                            self.health(loser.provider).record_censored(loser.elapsed_ms)
+                        loser.cancel()
+                        loser_future.cancel()
+                        logger.debug(f"  Cancelled losing {loser.provider} attempt ({loser.elapsed_ms:.0f}ms)")
+                    return RoutingOutcome(text, attempt, hedged, failed_providers)
+
+                failed_providers.append(attempt.provider)
+
+            # Failover: nothing in flight (or hedge slot freed) and providers remain
+            if queue and len(pending) == 0:
+                launch(queue.pop(0))
+
+        return None
+
+
+_router: Optional[LatencyRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_router() -> LatencyRouter:
+    """Returns the process-wide LatencyRouter (health windows are shared)."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = LatencyRouter()
+        return _router
+
+
+def reset_router() -> None:
+    """Drops all rolling health windows (used by the fake-provider harness)."""
+    global _router
+    with _router_lock:
+        _router = None
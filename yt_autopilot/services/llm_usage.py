@@ -0,0 +1,328 @@
+"""
+LLM Usage Accounting: Per-call token, latency and cost records.
+
+Every llm_router.generate_text() call appends one record to an append-only
+usage log. Attribution (workspace, execution, agent, retry reason) comes from
+core/run_context.llm_call_scope, set by the pipeline and AgentCoordinator.
+
+Storage:
+- data/llm_usage.jsonl: one JSON record per LLM call (append-only)
+- data/llm_usage_rollup.json: aggregated counters per
+  (day, workspace, agent, provider, model), folded in incrementally from the
+  last processed byte offset of the log
+
+Record fields:
+    ts, day, workspace_id, execution_id, agent, role, provider, model,
+    prompt_tokens, completion_tokens, cached_tokens, latency_ms, cache_hit,
+    retry_reason, hedged, failed_providers, cost_usd, status,
+    streamed, first_delta_ms
+
+Usage:
+    from yt_autopilot.services.llm_usage import summarize_usage
+
+    for row in summarize_usage(group_by=("workspace_id", "agent"), since_day="2025-11-01"):
+        print(row["agent"], row["calls"], row["cost_usd"])
+
+CLI:
+    python3 run.py usage [--by workspace agent day provider model] [--days N] [--workspace-id ID]
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from yt_autopilot.core.config import get_config
+from yt_autopilot.core.logger import logger, log_fallback
+from yt_autopilot.core.run_context import get_llm_call_scope
+
+
+# USD per 1M tokens: (input, cached input, output).
+# Keys are model name prefixes: the longest matching key prices dated
+# snapshots such as "gpt-4o-2024-08-06".
+MODEL_PRICING_PER_MTOK: Dict[str, tuple] = {
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "claude-3-5-sonnet": (3.00, 0.30, 15.00),
+}
+
+ROLLUP_KEY_FIELDS = ("day", "workspace_id", "agent", "provider", "model")
+ROLLUP_COUNTERS = (
+    "calls", "prompt_tokens", "completion_tokens", "cached_tokens",
+    "latency_ms", "cost_usd", "cache_hits", "retries", "hedged", "fallbacks", "aborted"
+)
+
+_write_lock = threading.Lock()
+
+# Models already reported as unpriced (log_fallback once per model and process)
+_unpriced_models = set()
+
+
+def _get_usage_paths() -> tuple:
+    """Returns (usage log path, rollup path) under data/ (or $LLM_USAGE_DIR)."""
+    usage_dir = os.getenv("LLM_USAGE_DIR")
+    data_dir = Path(usage_dir) if usage_dir else get_config()["PROJECT_ROOT"] / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir / "llm_usage.jsonl", data_dir / "llm_usage_rollup.json"
+
+
+def _lookup_pricing(model: Optional[str]) -> Optional[tuple]:
+    """Pricing of the longest MODEL_PRICING_PER_MTOK key that prefixes `model`."""
+    if not model:
+        return None
+    matches = [key for key in MODEL_PRICING_PER_MTOK if model.startswith(key)]
+    return MODEL_PRICING_PER_MTOK[max(matches, key=len)] if matches else None
+
+
+def estimate_cost_usd(
+    model: Optional[str],
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_tokens: int = 0,
+    requested_model: Optional[str] = None
+) -> float:
+    """
+    Estimates the USD cost of one call from MODEL_PRICING_PER_MTOK.
+
+    Args:
+        model: Model name reported by the provider (dated snapshots match by prefix)
+        prompt_tokens: Input tokens (including cached ones)
+        completion_tokens: Output tokens
+        cached_tokens: Input tokens served from the provider prompt cache
+        requested_model: Model name sent to the provider (priced if `model` is not)
+
+    Returns:
+        Estimated cost in USD (0.0 if neither model is priced, logged once per model)
+    """
+    pricing = _lookup_pricing(model) or _lookup_pricing(requested_model)
+    if not pricing:
+        unpriced = model or requested_model
+        if unpriced and unpriced not in _unpriced_models:
+            _unpriced_models.add(unpriced)
+            log_fallback(
+                component="LLM_USAGE",
+                fallback_type="MODEL_NOT_PRICED",
+                reason=f"No MODEL_PRICING_PER_MTOK entry for model '{unpriced}' - cost recorded as $0",
+                impact="LOW"
+            )
+        return 0.0
+
+    input_price, cached_price, output_price = pricing
+    uncached = max(0, prompt_tokens - cached_tokens)
+    return (uncached * input_price + cached_tokens * cached_price + completion_tokens * output_price) / 1_000_000
+
+
+def record_llm_call(
+    role: str,
+    provider: str,
+    model: Optional[str],
+    latency_ms: float,
+    usage: Optional[Dict[str, int]] = None,
+    hedged: bool = False,
+    failed_providers: Optional[List[str]] = None,
+    status: str = "ok",
+    streamed: bool = False,
+    first_delta_ms: Optional[float] = None,
+    requested_model: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Appends one LLM call record to the usage log.
+
+    Attribution fields (workspace_id, execution_id, agent, retry_reason) are read
+    from the current llm_call_scope. agent defaults to role outside any agent scope.
+
+    Args:
+        role: llm_router role
+        provider: Provider that served the call ("openai", "anthropic", "fallback", ...)
+        model: Model name reported by the provider
+        latency_ms: Wall time of the generate_text call
+        usage: Token counts {prompt_tokens, completion_tokens, cached_tokens}
+        hedged: True if a hedged request was fired
+        failed_providers: Providers that failed before the winner answered
+        status: "ok", "fallback", "aborted" (stream closed early by the consumer)
+            or "interrupted" (stream broke after yielding text)
+        streamed: True for llm_router.stream_text calls
+        first_delta_ms: Time to first streamed delta (streamed calls only)
+        requested_model: Model name sent to the provider (cost fallback when
+            the reported model is not priced)
+
+    Returns:
+        The written record
+    """
+    scope = get_llm_call_scope()
+    usage = usage or {}
+    failed_providers = failed_providers or []
+    now = datetime.now()
+
+    prompt_tokens = int(usage.get("prompt_tokens", 0) or 0)
+    completion_tokens = int(usage.get("completion_tokens", 0) or 0)
+    cached_tokens = int(usage.get("cached_tokens", 0) or 0)
+
+    retry_reason = scope.get("retry_reason")
+    if not retry_reason and failed_providers:
+        retry_reason = f"failover:{','.join(failed_providers)}"
+
+    record = {
+        "ts": now.isoformat(),
+        "day": now.strftime("%Y-%m-%d"),
+        "workspace_id": scope.get("workspace_id"),
+        "execution_id": scope.get("execution_id"),
+        "agent": scope.get("agent") or role,
+        "role": role,
+        "provider": provider,
+        "model": model,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "cached_tokens": cached_tokens,
+        "latency_ms": round(latency_ms, 1),
+        "cache_hit": cached_tokens > 0,
+        "retry_reason": retry_reason,
+        "hedged": hedged,
+        "failed_providers": failed_providers,
+        "cost_usd": round(
+            estimate_cost_usd(model, prompt_tokens, completion_tokens, cached_tokens, requested_model), 6
+        ),
+        "status": status,
+        "streamed": streamed,
+        "first_delta_ms": round(first_delta_ms, 1) if first_delta_ms is not None else None
+    }
+
+    log_path, _ = _get_usage_paths()
+    with _write_lock:
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    logger.debug(
+        f"  LLM usage: {record['agent']}/{role} via {provider} - "
+        f"{prompt_tokens}+{completion_tokens} tokens, {latency_ms:.0f}ms, ${record['cost_usd']:.4f}"
+    )
+    return record
+
+
+def _fold_record(groups: Dict[str, Dict[str, Any]], record: Dict[str, Any]) -> None:
+    """Adds one usage record to the rollup counters."""
+    key = "|".join(str(record.get(f) or "") for f in ROLLUP_KEY_FIELDS)
+    group = groups.get(key)
+    if group is None:
+        group = {f: record.get(f) for f in ROLLUP_KEY_FIELDS}
+        group.update({c: 0 for c in ROLLUP_COUNTERS})
+        group["max_latency_ms"] = 0.0
+        groups[key] = group
+    else:
+        for counter in ROLLUP_COUNTERS:
+            group.setdefault(counter, 0)  # Rollups written before a counter existed
+
+    group["calls"] += 1
+    group["prompt_tokens"] += record.get("prompt_tokens", 0)
+    group["completion_tokens"] += record.get("completion_tokens", 0)
+    group["cached_tokens"] += record.get("cached_tokens", 0)
+    group["latency_ms"] += record.get("latency_ms", 0.0)
+    group["cost_usd"] += record.get("cost_usd", 0.0)
+    group["cache_hits"] += int(bool(record.get("cache_hit")))
+    group["retries"] += int(bool(record.get("retry_reason")))
+    group["hedged"] += int(bool(record.get("hedged")))
+    group["fallbacks"] += int(record.get("status") == "fallback")
+    group["aborted"] += int(record.get("status") in ("aborted", "interrupted"))
+    group["max_latency_ms"] = max(group["max_latency_ms"], record.get("latency_ms", 0.0))
+
+
+def load_usage_rollup(rebuild: bool = False) -> List[Dict[str, Any]]:
+    """
+    Returns rollup groups, folding in only log lines appended since the last call.
+
+    Args:
+        rebuild: Recompute from the start of the log
+
+    Returns:
+        List of rollup group dicts (one per day/workspace/agent/provider/model)
+    """
+    log_path, rollup_path = _get_usage_paths()
+
+    rollup = {"offset": 0, "groups": {}}
+    if not rebuild and rollup_path.exists():
+        try:
+            with open(rollup_path, "r", encoding="utf-8") as f:
+                rollup = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Usage rollup unreadable ({e}) - rebuilding from log")
+            rollup = {"offset": 0, "groups": {}}
+
+    if not log_path.exists():
+        return list(rollup["groups"].values())
+
+    # Log truncated/rotated since last fold: start over
+    if log_path.stat().st_size < rollup["offset"]:
+        rollup = {"offset": 0, "groups": {}}
+
+    new_records = 0
+    with open(log_path, "r", encoding="utf-8") as f:
+        f.seek(rollup["offset"])
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            if not line.endswith("\n"):
+                break  # Partial line from a concurrent writer: fold it next time
+            rollup["offset"] = f.tell()
+            if not line.strip():
+                continue
+            try:
+                _fold_record(rollup["groups"], json.loads(line))
+                new_records += 1
+            except json.JSONDecodeError:
+                logger.warning("Skipping malformed usage record")
+
+    if new_records or rebuild:
+        tmp_path = rollup_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(rollup, f, ensure_ascii=False)
+        os.replace(tmp_path, rollup_path)
+
+    return list(rollup["groups"].values())
+
+
+def summarize_usage(
+    group_by: Sequence[str] = ("workspace_id", "agent", "day"),
+    since_day: Optional[str] = None,
+    workspace_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Aggregates usage rollups by the given dimensions.
+
+    Args:
+        group_by: Dimensions among ROLLUP_KEY_FIELDS
+        since_day: Only include days >= this YYYY-MM-DD
+        workspace_id: Only include this workspace
+
+    Returns:
+        Rows sorted by descending cost, then latency; each row has the group_by
+        fields plus counters and avg_latency_ms
+    """
+    rows: Dict[tuple, Dict[str, Any]] = {}
+
+    for group in load_usage_rollup():
+        if since_day and (group.get("day") or "") < since_day:
+            continue
+        if workspace_id and group.get("workspace_id") != workspace_id:
+            continue
+
+        key = tuple(group.get(f) for f in group_by)
+        row = rows.get(key)
+        if row is None:
+            row = {f: group.get(f) for f in group_by}
+            row.update({c: 0 for c in ROLLUP_COUNTERS})
+            row["max_latency_ms"] = 0.0
+            rows[key] = row
+
+        for counter in ROLLUP_COUNTERS:
+            row[counter] += group.get(counter, 0)
+        row["max_latency_ms"] = max(row["max_latency_ms"], group.get("max_latency_ms", 0.0))
+
+    result = list(rows.values())
+    for row in result:
+        row["avg_latency_ms"] = row["latency_ms"] / row["calls"] if row["calls"] else 0.0
+
+    result.sort(key=lambda r: (r["cost_usd"], r["latency_ms"]), reverse=True)
+    return result
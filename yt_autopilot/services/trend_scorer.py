@@ -11,7 +11,7 @@ the channel while maintaining brand consistency.
 
 from typing import List, Dict, Optional
 from yt_autopilot.core.schemas import TrendCandidate
-from yt_autopilot.core.logger import logger
+from yt_autopilot.core.logger import logger, log_fallback
 
 
 def calculate_trend_score(
@@ -55,7 +55,9 @@ def calculate_trend_score(
     competition_component = _score_competition(trend) * 0.15
 
     # Component 5: Historical Performance (0-100, weight 10%)
-    historical_component = _score_historical_match(trend, historical_data) * 0.10
+    historical_component = _score_historical_match(
+        trend, historical_data, workspace_id=memory.get("workspace_id")
+    ) * 0.10
 
     # Total composite score
     total_score = (
@@ -172,38 +174,105 @@ def _score_competition(trend: TrendCandidate) -> float:
     return competition_map.get(trend.competition_level, 50.0)
 
 
+def _find_historical_match_id(
+    trend: TrendCandidate,
+    workspace_id: str,
+    known_ids: Dict[str, Dict]
+) -> Optional[str]:
+    """
+    Finds the most similar past video via the workspace content index.
+
+    Args:
+        trend: TrendCandidate without an explicit historical_match
+        workspace_id: Workspace whose content index is queried
+        known_ids: Historical records keyed by video/script internal ID
+
+    Returns:
+        Internal ID of the nearest past video present in known_ids
+        (similarity >= HISTORICAL_MATCH_THRESHOLD), or None
+    """
+    try:
+        from yt_autopilot.io.content_index import (
+            get_content_index,
+            HISTORICAL_MATCH_THRESHOLD,
+            KIND_TITLE,
+            KIND_WORKING_TITLE
+        )
+
+        matches = get_content_index(workspace_id).search(
+            trend.keyword,
+            top_k=5,
+            kinds=[KIND_TITLE, KIND_WORKING_TITLE],
+            min_score=HISTORICAL_MATCH_THRESHOLD
+        )
+    except Exception as e:
+        log_fallback(
+            component="TREND_SCORER_HISTORY",
+            fallback_type="EXPLICIT_MATCH_ONLY",
+            reason=f"Content index unavailable: {e}",
+            impact="LOW"
+        )
+        return None
+
+    for match in matches:
+        for id_field in ("video_internal_id", "script_internal_id"):
+            match_id = match.get(id_field)
+            if match_id and match_id in known_ids:
+                logger.debug(
+                    f"Historical match for '{trend.keyword[:40]}': '{match['text'][:40]}' "
+                    f"(score: {match['score']:.2f})"
+                )
+                return match_id
+
+    return None
+
+
 def _score_historical_match(
     trend: TrendCandidate,
-    historical_data: Optional[List[Dict]]
+    historical_data: Optional[List[Dict]],
+    workspace_id: Optional[str] = None
 ) -> float:
     """
     Scores based on performance of similar past videos (0-100 scale).
 
+    Uses trend.historical_match when set; otherwise, if workspace_id is given,
+    the nearest past video from the workspace content index.
+
     Args:
         trend: TrendCandidate with optional historical_match ID
         historical_data: List of past video performance dicts
+        workspace_id: Optional workspace for semantic matching
 
     Returns:
         Score 0-100 (100 = similar video performed excellently)
     """
-    if not historical_data or not trend.historical_match:
+    if not historical_data:
         return 50.0  # Neutral if no historical data
 
-    # Find matching historical video
+    videos_by_id = {}
     for video in historical_data:
-        if video.get("video_internal_id") == trend.historical_match:
-            # Score based on actual CPM performance
-            actual_cpm = video.get("cpm_actual", 0.0)
-            if actual_cpm > 20.0:
-                return 100.0  # Excellent
-            elif actual_cpm > 10.0:
-                return 75.0   # Good
-            elif actual_cpm > 5.0:
-                return 50.0   # Average
-            else:
-                return 25.0   # Below average
-
-    return 50.0  # Neutral if no match found
+        for id_field in ("video_internal_id", "script_internal_id"):
+            if video.get(id_field):
+                videos_by_id[video[id_field]] = video
+
+    match_id = trend.historical_match
+    if not match_id and workspace_id:
+        match_id = _find_historical_match_id(trend, workspace_id, videos_by_id)
+
+    video = videos_by_id.get(match_id) if match_id else None
+    if video is None:
+        return 50.0  # Neutral if no match found
+
+    # Score based on actual CPM performance
+    actual_cpm = video.get("cpm_actual", 0.0)
+    if actual_cpm > 20.0:
+        return 100.0  # Excellent
+    elif actual_cpm > 10.0:
+        return 75.0   # Good
+    elif actual_cpm > 5.0:
+        return 50.0   # Average
+    else:
+        return 25.0   # Below average
 
 
 def rank_trends(